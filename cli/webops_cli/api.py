@@ -687,13 +687,15 @@ class WebOpsAPIClient:
     def get_deployment_logs(
         self: Self,
         name: str,
-        tail: Optional[int] = None
+        tail: Optional[int] = None,
+        after_id: Optional[int] = None
     ) -> Dict[str, Any]:
         """Get deployment logs.
         
         Args:
             name: Deployment name.
             tail: Number of lines to retrieve from end of log.
+            after_id: Only return logs newer than this log id (for following).
             
         Returns:
             Dictionary containing log data.
@@ -709,6 +711,8 @@ class WebOpsAPIClient:
         params = {}
         if validated_tail:
             params['tail'] = validated_tail
+        if after_id is not None:
+            params['after_id'] = int(after_id)
         
         permission = Permission.DEPLOYMENT_LOGS if self.enable_security else None
         return self._request('GET', f'/api/deployments/{validated_name}/logs/', permission, params=params)
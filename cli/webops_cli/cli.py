@@ -392,32 +392,35 @@ def logs(name: str, tail: Optional[int], follow: bool) -> None:
     try:
         if follow:
             console.print(f"[cyan]Following logs for {validated_name}...[/cyan] (Ctrl+C to stop)\n")
-            last_log_count = 0
+            after_id = None
+            result = client.get_deployment_logs(validated_name, tail=validated_tail or 100)
 
             while True:
-                result = client.get_deployment_logs(validated_name, tail=validated_tail)
-                logs_list = result.get('logs', [])
-
-                # Only show new logs
-                if len(logs_list) > last_log_count:
-                    for log in logs_list[last_log_count:]:
-                        level_color = {
-                            'info': 'cyan',
-                            'warning': 'yellow',
-                            'error': 'red',
-                            'success': 'green'
-                        }.get(log['level'], 'white')
-
-                        console.print(f"[{level_color}]{log['created_at']}[/{level_color}] {log['message']}")
-
-                    last_log_count = len(logs_list)
-
-                time.sleep(2)
+                for log in result.get('logs', []):
+                    level_color = {
+                        'info': 'cyan',
+                        'warning': 'yellow',
+                        'error': 'red',
+                        'success': 'green'
+                    }.get(log['level'], 'white')
+
+                    console.print(f"[{level_color}]{log['created_at']}[/{level_color}] {log['message']}")
+
+                # Only fetch logs newer than the last one shown
+                after_id = result.get('next_after_id') or after_id
+
+                if not result.get('has_more'):
+                    time.sleep(2)
+                result = client.get_deployment_logs(validated_name, after_id=after_id or 0)
         else:
             with console.status(f"[cyan]Fetching logs for {validated_name}...", spinner="dots"):
                 result = client.get_deployment_logs(validated_name, tail=validated_tail)
+                logs_list = result.get('logs', [])
 
-            logs_list = result.get('logs', [])
+                # Without a tail the full log is returned one page at a time
+                while not validated_tail and result.get('has_more'):
+                    result = client.get_deployment_logs(validated_name, after_id=result['next_after_id'])
+                    logs_list.extend(result.get('logs', []))
 
             if not logs_list:
                 console.print("[yellow]No logs found.[/yellow]")
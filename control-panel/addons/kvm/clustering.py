@@ -11,7 +11,7 @@ from django.utils import timezone
 from django.core.cache import cache
 
 from .models import ComputeNode, VMPlan, VMDeployment
-from .resource_manager import ResourceManager
+from .resource_manager import ClusterSnapshot, ResourceManager
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +36,10 @@ class ClusterManager:
         """
         Schedule a VM on the best compute node.
 
+        Node capacities and allocations are loaded in one query and every
+        node is scored from that snapshot, so placement costs the same
+        number of queries however large the cluster is.
+
         Args:
             plan: VM resource plan
             strategy: Scheduling strategy ('balanced', 'packed', 'spread')
@@ -44,131 +48,82 @@ class ClusterManager:
         Returns:
             Selected compute node or None
         """
-        nodes = ComputeNode.objects.filter(is_active=True)
+        snapshot = ClusterSnapshot.load()
 
-        if not nodes:
+        if not snapshot:
             logger.error("No active compute nodes available")
             return None
 
-        # Filter nodes that can fit the plan
-        candidate_nodes = []
-        for node in nodes:
-            if node.can_fit_plan(plan):
-                # Check node health
-                if self.is_node_healthy(node):
-                    candidate_nodes.append(node)
+        # Nodes that can fit the plan and are healthy
+        candidates = [
+            i for i, fits in enumerate(snapshot.fits(plan))
+            if fits and self.is_node_healthy(snapshot.nodes[i])
+        ]
 
-        if not candidate_nodes:
+        if not candidates:
             logger.warning(f"No nodes have resources for plan: {plan.name}")
             return None
 
         # Apply affinity rules if provided
         if affinity_rules:
-            candidate_nodes = self._apply_affinity_rules(
-                candidate_nodes,
-                affinity_rules
-            )
+            candidates = self._apply_affinity_rules(snapshot, candidates, affinity_rules)
 
         # Select node based on strategy
         if strategy == 'balanced':
-            return self._schedule_balanced(candidate_nodes, plan)
+            return self._schedule_balanced(snapshot, candidates)
         elif strategy == 'packed':
-            return self._schedule_packed(candidate_nodes, plan)
+            return self._schedule_packed(snapshot, candidates)
         elif strategy == 'spread':
-            return self._schedule_spread(candidate_nodes)
+            return self._schedule_spread(snapshot, candidates)
         else:
             logger.warning(f"Unknown strategy: {strategy}, using balanced")
-            return self._schedule_balanced(candidate_nodes, plan)
+            return self._schedule_balanced(snapshot, candidates)
 
-    def _schedule_balanced(
-        self,
-        nodes: List[ComputeNode],
-        plan: VMPlan
-    ) -> ComputeNode:
+    def _schedule_balanced(self, snapshot: ClusterSnapshot, candidates: List[int]) -> ComputeNode:
         """
         Balanced scheduling: Distribute load evenly across nodes.
 
         Selects node with most available resources (percentage-wise).
         """
-        best_node = None
-        best_score = -1
-
-        for node in nodes:
-            # Calculate utilization percentages
-            cpu_util = 1 - (node.available_vcpus() / (node.total_vcpus * node.cpu_overcommit_ratio))
-            mem_util = 1 - (node.available_memory_mb() / (node.total_memory_mb * node.memory_overcommit_ratio))
-            disk_util = 1 - (node.available_disk_gb() / node.total_disk_gb)
-
-            # Average utilization (lower is better for balanced)
-            avg_util = (cpu_util + mem_util + disk_util) / 3
-
-            # Invert score (prefer nodes with lower utilization)
-            score = 1 - avg_util
-
-            if score > best_score:
-                best_score = score
-                best_node = node
+        free = snapshot.free_fraction()
+        best_node = snapshot.nodes[max(candidates, key=free.__getitem__)]
 
         logger.info(f"Balanced scheduling selected: {best_node.hostname}")
         return best_node
 
-    def _schedule_packed(
-        self,
-        nodes: List[ComputeNode],
-        plan: VMPlan
-    ) -> ComputeNode:
+    def _schedule_packed(self, snapshot: ClusterSnapshot, candidates: List[int]) -> ComputeNode:
         """
         Packed scheduling: Fill up nodes before using new ones (bin packing).
 
-        Selects node with least available resources (to pack VMs).
+        Selects node with least available resources (to pack VMs),
+        measured against the raw hardware totals.
         """
-        best_node = None
-        min_available = float('inf')
-
-        for node in nodes:
-            # Calculate total available resources (normalized)
-            available = (
-                (node.available_vcpus() / node.total_vcpus) +
-                (node.available_memory_mb() / node.total_memory_mb) +
-                (node.available_disk_gb() / node.total_disk_gb)
-            ) / 3
-
-            if available < min_available:
-                min_available = available
-                best_node = node
+        free = snapshot.free_fraction(overcommitted=False)
+        best_node = snapshot.nodes[min(candidates, key=free.__getitem__)]
 
         logger.info(f"Packed scheduling selected: {best_node.hostname}")
         return best_node
 
-    def _schedule_spread(self, nodes: List[ComputeNode]) -> ComputeNode:
+    def _schedule_spread(self, snapshot: ClusterSnapshot, candidates: List[int]) -> ComputeNode:
         """
         Spread scheduling: Distribute VMs across as many nodes as possible.
 
         Selects node with fewest VMs.
         """
-        best_node = None
-        min_vms = float('inf')
+        best = min(candidates, key=snapshot.vm_counts.__getitem__)
+        best_node = snapshot.nodes[best]
 
-        for node in nodes:
-            vm_count = VMDeployment.objects.filter(
-                compute_node=node,
-                deployment__status__in=['running', 'deploying']
-            ).count()
-
-            if vm_count < min_vms:
-                min_vms = vm_count
-                best_node = node
-
-        logger.info(f"Spread scheduling selected: {best_node.hostname} ({min_vms} VMs)")
+        logger.info(f"Spread scheduling selected: {best_node.hostname} ({snapshot.vm_counts[best]} VMs)")
         return best_node
 
     def _apply_affinity_rules(
         self,
-        nodes: List[ComputeNode],
+        snapshot: ClusterSnapshot,
+        candidates: List[int],
         rules: Dict[str, Any]
-    ) -> List[ComputeNode]:
+    ) -> List[int]:
         """
-        Apply affinity/anti-affinity rules to filter nodes.
+        Apply affinity/anti-affinity rules to filter candidate nodes.
 
         Rules format:
         {
@@ -177,54 +132,45 @@ class ClusterManager:
             'same_node_as': deployment_id,    # Same node as another VM
             'different_node_from': deployment_id,  # Different node
         }
+
+        Returns:
+            Indexes into ``snapshot.nodes``; all candidates if the rules
+            would leave none
         """
-        filtered_nodes = nodes.copy()
+        nodes = snapshot.nodes
+        filtered = list(candidates)
 
         # Anti-affinity: Remove nodes from list
         if 'anti_affinity' in rules:
-            avoid_hostnames = rules['anti_affinity']
-            filtered_nodes = [
-                n for n in filtered_nodes
-                if n.hostname not in avoid_hostnames
-            ]
+            avoid_hostnames = set(rules['anti_affinity'])
+            filtered = [i for i in filtered if nodes[i].hostname not in avoid_hostnames]
 
         # Affinity: Prefer specific nodes
         if 'affinity' in rules:
-            prefer_hostnames = rules['affinity']
-            preferred = [
-                n for n in filtered_nodes
-                if n.hostname in prefer_hostnames
-            ]
+            prefer_hostnames = set(rules['affinity'])
+            preferred = [i for i in filtered if nodes[i].hostname in prefer_hostnames]
             if preferred:
-                filtered_nodes = preferred
+                filtered = preferred
 
         # Same node as another VM
         if 'same_node_as' in rules:
-            try:
-                ref_vm = VMDeployment.objects.get(
-                    deployment_id=rules['same_node_as']
-                )
-                filtered_nodes = [
-                    n for n in filtered_nodes
-                    if n == ref_vm.compute_node
-                ]
-            except VMDeployment.DoesNotExist:
-                pass
+            node_id = self._node_of_deployment(rules['same_node_as'])
+            if node_id is not None:
+                filtered = [i for i in filtered if nodes[i].id == node_id]
 
         # Different node from another VM
         if 'different_node_from' in rules:
-            try:
-                ref_vm = VMDeployment.objects.get(
-                    deployment_id=rules['different_node_from']
-                )
-                filtered_nodes = [
-                    n for n in filtered_nodes
-                    if n != ref_vm.compute_node
-                ]
-            except VMDeployment.DoesNotExist:
-                pass
-
-        return filtered_nodes if filtered_nodes else nodes
+            node_id = self._node_of_deployment(rules['different_node_from'])
+            if node_id is not None:
+                filtered = [i for i in filtered if nodes[i].id != node_id]
+
+        return filtered if filtered else candidates
+
+    def _node_of_deployment(self, deployment_id) -> Optional[int]:
+        """Compute node id hosting a deployment's VM, or None."""
+        return VMDeployment.objects.filter(
+            deployment_id=deployment_id
+        ).values_list('compute_node_id', flat=True).first()
 
     def is_node_healthy(self, node: ComputeNode) -> bool:
         """
@@ -336,23 +282,20 @@ class ClusterManager:
         Returns:
             List of planned migrations
         """
-        nodes = ComputeNode.objects.filter(is_active=True)
+        snapshot = ClusterSnapshot.load()
 
-        if nodes.count() < 2:
+        if len(snapshot) < 2:
             logger.info("Cluster has fewer than 2 nodes, nothing to rebalance")
             return []
 
         # Calculate current utilization per node
         node_stats = []
-        for node in nodes:
-            total_vcpus = node.total_vcpus * node.cpu_overcommit_ratio
-            total_memory = node.total_memory_mb * node.memory_overcommit_ratio
-
-            available_vcpus = node.available_vcpus()
-            available_memory = node.available_memory_mb()
+        for i, node in enumerate(snapshot.nodes):
+            total_vcpus = snapshot.capacity['vcpus'][i]
+            total_memory = snapshot.capacity['memory_mb'][i]
 
-            cpu_util = 1 - (available_vcpus / total_vcpus) if total_vcpus > 0 else 0
-            mem_util = 1 - (available_memory / total_memory) if total_memory > 0 else 0
+            cpu_util = 1 - (snapshot.free['vcpus'][i] / total_vcpus) if total_vcpus > 0 else 0
+            mem_util = 1 - (snapshot.free['memory_mb'][i] / total_memory) if total_memory > 0 else 0
 
             avg_util = (cpu_util + mem_util) / 2
 
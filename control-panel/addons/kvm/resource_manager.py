@@ -5,11 +5,95 @@ Handles resource allocation and tracking across compute nodes.
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
 from .models import ComputeNode, VMPlan
 
 logger = logging.getLogger(__name__)
 
+# Deployment states that hold a node's CPU/memory, and its disk
+ACTIVE_STATUSES = ['running', 'deploying']
+DISK_STATUSES = ['running', 'deploying', 'stopped']
+
+RESOURCES = ('vcpus', 'memory_mb', 'disk_gb')
+
+
+class ClusterSnapshot:
+    """
+    Capacity and allocations of compute nodes, loaded in one query.
+
+    Resources are kept column-wise (one list per resource, indexed like
+    ``nodes``), so nodes are filtered and scored in a single pass with no
+    per-node queries. Capacities include the overcommit ratios and match
+    ComputeNode.available_vcpus() and friends.
+    """
+
+    def __init__(self, nodes: List[ComputeNode]):
+        self.nodes = nodes
+        self.capacity = {
+            'vcpus': [int(n.total_vcpus * n.cpu_overcommit_ratio) for n in nodes],
+            'memory_mb': [int(n.total_memory_mb * n.memory_overcommit_ratio) for n in nodes],
+            'disk_gb': [n.total_disk_gb for n in nodes],
+        }
+        self.free = {
+            resource: [
+                max(0, capacity - getattr(node, f'allocated_{resource}'))
+                for capacity, node in zip(self.capacity[resource], nodes)
+            ]
+            for resource in RESOURCES
+        }
+        self.vm_counts = [node.vm_count for node in nodes]
+
+    @classmethod
+    def load(cls, queryset=None) -> 'ClusterSnapshot':
+        """
+        Load nodes with their allocations annotated.
+
+        Args:
+            queryset: ComputeNode queryset (default: active nodes)
+        """
+        if queryset is None:
+            queryset = ComputeNode.objects.filter(is_active=True)
+
+        active = Q(vm_deployments__deployment__status__in=ACTIVE_STATUSES)
+        holding_disk = Q(vm_deployments__deployment__status__in=DISK_STATUSES)
+        nodes = queryset.annotate(
+            allocated_vcpus=Coalesce(Sum('vm_deployments__vcpus', filter=active), 0),
+            allocated_memory_mb=Coalesce(Sum('vm_deployments__memory_mb', filter=active), 0),
+            allocated_disk_gb=Coalesce(Sum('vm_deployments__disk_gb', filter=holding_disk), 0),
+            vm_count=Count('vm_deployments', filter=active),
+        )
+        return cls(list(nodes))
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def fits(self, plan: VMPlan) -> List[bool]:
+        """Whether each node has room for ``plan``."""
+        return [
+            cpu >= plan.vcpus and mem >= plan.memory_mb and disk >= plan.disk_gb
+            for cpu, mem, disk in zip(self.free['vcpus'], self.free['memory_mb'], self.free['disk_gb'])
+        ]
+
+    def free_fraction(self, overcommitted: bool = True) -> List[float]:
+        """
+        Mean fraction of CPU, memory and disk still free on each node.
+
+        Args:
+            overcommitted: Divide by the overcommitted capacity; with False,
+                divide by the raw ``total_*`` hardware figures instead
+        """
+        if overcommitted:
+            capacity = self.capacity
+        else:
+            capacity = {r: [getattr(node, f'total_{r}') for node in self.nodes] for r in RESOURCES}
+        fractions = [
+            [free / total if total > 0 else 0.0 for free, total in zip(self.free[r], capacity[r])]
+            for r in RESOURCES
+        ]
+        return [sum(column) / len(RESOURCES) for column in zip(*fractions)]
+
 
 class ResourceManager:
     """
@@ -28,21 +112,20 @@ class ResourceManager:
         Returns:
             ComputeNode or None if no suitable node found
         """
-        # Get all active nodes
-        nodes = ComputeNode.objects.filter(is_active=True)
+        snapshot = ClusterSnapshot.load()
 
         suitable_nodes = []
-        for node in nodes:
-            if node.can_fit_plan(plan):
+        for i, fits in enumerate(snapshot.fits(plan)):
+            if fits:
                 # Calculate "score" based on remaining resources after allocation
-                remaining_vcpus = node.available_vcpus() - plan.vcpus
-                remaining_memory = node.available_memory_mb() - plan.memory_mb
-                remaining_disk = node.available_disk_gb() - plan.disk_gb
+                remaining_vcpus = snapshot.free['vcpus'][i] - plan.vcpus
+                remaining_memory = snapshot.free['memory_mb'][i] - plan.memory_mb
+                remaining_disk = snapshot.free['disk_gb'][i] - plan.disk_gb
 
                 # Lower score = less wasted space (better fit)
                 score = remaining_vcpus + (remaining_memory / 1024) + remaining_disk
 
-                suitable_nodes.append((node, score))
+                suitable_nodes.append((snapshot.nodes[i], score))
 
         if not suitable_nodes:
             logger.warning(f"No compute node available for plan: {plan.name}")
@@ -63,17 +146,16 @@ class ResourceManager:
         Returns:
             Dictionary with cluster resource statistics
         """
-        from django.db.models import Sum
-
-        nodes = ComputeNode.objects.filter(is_active=True)
+        snapshot = ClusterSnapshot.load()
+        nodes = snapshot.nodes
 
         total_vcpus = sum(node.total_vcpus for node in nodes)
         total_memory_mb = sum(node.total_memory_mb for node in nodes)
         total_disk_gb = sum(node.total_disk_gb for node in nodes)
 
-        available_vcpus = sum(node.available_vcpus() for node in nodes)
-        available_memory_mb = sum(node.available_memory_mb() for node in nodes)
-        available_disk_gb = sum(node.available_disk_gb() for node in nodes)
+        available_vcpus = sum(snapshot.free['vcpus'])
+        available_memory_mb = sum(snapshot.free['memory_mb'])
+        available_disk_gb = sum(snapshot.free['disk_gb'])
 
         allocated_vcpus = total_vcpus - available_vcpus
         allocated_memory_mb = total_memory_mb - available_memory_mb
@@ -81,8 +163,8 @@ class ResourceManager:
 
         return {
             'nodes': {
-                'total': nodes.count(),
-                'active': nodes.filter(is_active=True).count(),
+                'total': len(nodes),
+                'active': len(nodes),
             },
             'vcpus': {
                 'total': total_vcpus,
@@ -0,0 +1,157 @@
+"""
+Tests for snapshot-based KVM VM scheduling.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase
+
+from addons.kvm.clustering import ClusterManager
+from addons.kvm.models import ComputeNode, VMPlan
+from addons.kvm.resource_manager import ACTIVE_STATUSES, DISK_STATUSES, ClusterSnapshot
+
+
+def make_node(node_id, hostname, vms=(), **fields):
+    """
+    Unsaved ComputeNode annotated like ClusterSnapshot.load() does.
+
+    ``vms`` are (status, vcpus, memory_mb, disk_gb) tuples; CPU and memory
+    count for ACTIVE_STATUSES and disk for DISK_STATUSES, as in load().
+    """
+    defaults = dict(total_vcpus=8, total_memory_mb=16384, total_disk_gb=200,
+                    cpu_overcommit_ratio=2.0, memory_overcommit_ratio=1.0)
+    defaults.update(fields)
+    node = ComputeNode(id=node_id, hostname=hostname, **defaults)
+    node.test_vms = [SimpleNamespace(status=s, vcpus=c, memory_mb=m, disk_gb=d) for s, c, m, d in vms]
+    node.allocated_vcpus = sum(vm.vcpus for vm in node.test_vms if vm.status in ACTIVE_STATUSES)
+    node.allocated_memory_mb = sum(vm.memory_mb for vm in node.test_vms if vm.status in ACTIVE_STATUSES)
+    node.allocated_disk_gb = sum(vm.disk_gb for vm in node.test_vms if vm.status in DISK_STATUSES)
+    node.vm_count = sum(1 for vm in node.test_vms if vm.status in ACTIVE_STATUSES)
+    return node
+
+
+def fake_vm_filter(compute_node, deployment__status__in):
+    """Stand-in for VMDeployment.objects.filter() used by available_*()."""
+    vms = [vm for vm in compute_node.test_vms if vm.status in deployment__status__in]
+    queryset = MagicMock()
+    queryset.aggregate.side_effect = lambda agg: {
+        agg.default_alias: sum(getattr(vm, agg.default_alias[:-len('__sum')]) for vm in vms) or None
+    }
+    return queryset
+
+
+class ClusterSnapshotTest(SimpleTestCase):
+    """Test the column-wise capacity snapshot."""
+
+    def test_free_resources_match_node_methods(self):
+        """Annotated allocations give the same figures as ComputeNode.available_*()."""
+        nodes = [
+            make_node(1, 'idle'),
+            make_node(2, 'busy', vms=[
+                ('running', 4, 4096, 40),
+                ('deploying', 2, 2048, 20),
+                ('stopped', 8, 8192, 50),
+                ('failed', 16, 16384, 100),
+            ]),
+            make_node(3, 'full', total_vcpus=2, cpu_overcommit_ratio=1.5, vms=[('running', 6, 32768, 500)]),
+        ]
+        snapshot = ClusterSnapshot(nodes)
+
+        with patch('addons.kvm.models.VMDeployment.objects.filter', side_effect=fake_vm_filter):
+            expected = {
+                'vcpus': [node.available_vcpus() for node in nodes],
+                'memory_mb': [node.available_memory_mb() for node in nodes],
+                'disk_gb': [node.available_disk_gb() for node in nodes],
+            }
+
+        self.assertEqual(snapshot.free, expected)
+        self.assertEqual(snapshot.free['vcpus'], [16, 10, 0])
+        self.assertEqual(snapshot.vm_counts, [0, 2, 1])
+
+    def test_fits(self):
+        """A node fits a plan only if every resource has room."""
+        snapshot = ClusterSnapshot([
+            make_node(1, 'roomy'),
+            make_node(2, 'no-disk', vms=[('stopped', 1, 512, 195)]),
+        ])
+        plan = VMPlan(name='small', vcpus=2, memory_mb=2048, disk_gb=10)
+
+        self.assertEqual(snapshot.fits(plan), [True, False])
+
+
+class ScheduleVMTest(SimpleTestCase):
+    """Test node selection of ClusterManager.schedule_vm."""
+
+    def setUp(self):
+        self.plan = VMPlan(name='small', vcpus=1, memory_mb=512, disk_gb=10)
+        self.manager = ClusterManager()
+        patcher = patch.object(ClusterManager, 'is_node_healthy', return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _schedule(self, nodes, **kwargs):
+        with patch('addons.kvm.clustering.ClusterSnapshot.load', return_value=ClusterSnapshot(nodes)):
+            node = self.manager.schedule_vm(self.plan, **kwargs)
+        return node.hostname if node else None
+
+    def test_balanced_picks_most_free(self):
+        """Balanced placement prefers the least utilised node."""
+        nodes = [
+            make_node(1, 'half', vms=[('running', 8, 8192, 100)]),
+            make_node(2, 'quarter', vms=[('running', 4, 4096, 50)]),
+        ]
+        self.assertEqual(self._schedule(nodes, strategy='balanced'), 'quarter')
+        self.assertEqual(self._schedule(nodes, strategy='unknown'), 'quarter')
+
+    def test_packed_picks_least_free_of_raw_totals(self):
+        """
+        Packed placement measures free resources against raw hardware totals.
+
+        Against overcommitted capacity 'dense' would look fuller (8/32 vCPUs
+        free against 8/16), but relative to its 8 physical cores it still
+        has the most room, so 'small' is packed first.
+        """
+        nodes = [
+            make_node(1, 'dense', cpu_overcommit_ratio=4.0, vms=[('running', 24, 0, 0)]),
+            make_node(2, 'small', total_vcpus=16, cpu_overcommit_ratio=1.0, vms=[('running', 8, 0, 0)]),
+        ]
+        snapshot = ClusterSnapshot(nodes)
+        self.assertLess(snapshot.free_fraction()[0], snapshot.free_fraction()[1])
+
+        self.assertEqual(self._schedule(nodes, strategy='packed'), 'small')
+
+    def test_spread_picks_fewest_vms(self):
+        """Spread placement prefers the node running the fewest VMs."""
+        nodes = [
+            make_node(1, 'two', vms=[('running', 1, 512, 10), ('deploying', 1, 512, 10)]),
+            make_node(2, 'one-big', vms=[('running', 6, 8192, 100), ('stopped', 1, 512, 10)]),
+        ]
+        self.assertEqual(self._schedule(nodes, strategy='spread'), 'one-big')
+
+    def test_nodes_without_room_skipped(self):
+        """Nodes that cannot fit the plan are never selected."""
+        nodes = [
+            make_node(1, 'full', vms=[('running', 16, 16384, 200)]),
+            make_node(2, 'busy', vms=[('running', 12, 12288, 150)]),
+        ]
+        self.assertEqual(self._schedule(nodes, strategy='balanced'), 'busy')
+        self.assertIsNone(self._schedule(nodes[:1]))
+
+    def test_affinity_rules(self):
+        """Anti-affinity and affinity narrow the candidates, but never to none."""
+        nodes = [make_node(1, 'a'), make_node(2, 'b', vms=[('running', 1, 512, 10)]), make_node(3, 'c')]
+
+        self.assertEqual(self._schedule(nodes, strategy='spread', affinity_rules={'affinity': ['b']}), 'b')
+        self.assertEqual(
+            self._schedule(nodes, strategy='spread', affinity_rules={'anti_affinity': ['a', 'c']}), 'b'
+        )
+        self.assertEqual(
+            self._schedule(nodes, strategy='spread', affinity_rules={'anti_affinity': ['a', 'b', 'c']}), 'a'
+        )
+
+        with patch.object(ClusterManager, '_node_of_deployment', return_value=3):
+            self.assertEqual(self._schedule(nodes, affinity_rules={'same_node_as': 42}), 'c')
+            self.assertEqual(
+                self._schedule(nodes, strategy='spread', affinity_rules={'different_node_from': 42}), 'a'
+            )
@@ -1,7 +1,8 @@
 """
 Rate limiting for addon API endpoints.
 
-Implements token bucket algorithm with configurable limits:
+Uses the shared rate limit engine (GCRA, one atomic Redis round trip per
+check) with configurable limits:
 - Per-user rate limits
 - Per-IP rate limits
 - Endpoint-specific limits
@@ -11,14 +12,15 @@ Implements token bucket algorithm with configurable limits:
 import time
 import hashlib
 from functools import wraps
-from typing import Optional, Tuple, Callable
+from typing import Tuple, Callable
 from dataclasses import dataclass
 
-from django.core.cache import cache
 from django.http import JsonResponse, HttpRequest
 from django.conf import settings
 import logging
 
+from apps.core.common.utils.rate_limit import Limit, get_rate_limit_engine
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,9 +33,9 @@ class RateLimitConfig:
 
 class RateLimiter:
     """
-    Token bucket rate limiter with Redis/cache backend.
+    Per-endpoint rate limiter on the shared rate limit engine.
 
-    Falls back to in-memory if cache unavailable.
+    Falls back to in-memory limits if Redis is unavailable.
     """
 
     # Default rate limits (can be overridden in settings)
@@ -65,7 +67,7 @@ class RateLimiter:
         # Hash to keep keys short
         hash_input = f"{identifier}:{endpoint}"
         hash_value = hashlib.md5(hash_input.encode()).hexdigest()[:12]
-        return f"ratelimit:{endpoint}:{hash_value}"
+        return f"addons:{endpoint}:{hash_value}"
 
     def _get_identifier(self, request: HttpRequest) -> str:
         """
@@ -106,6 +108,7 @@ class RateLimiter:
         Returns:
             Tuple of (allowed: bool, info: dict)
             info contains: limit, remaining, reset_time
+            (and retry_after when denied)
         """
         if not self.enabled:
             return True, {'limit': float('inf'), 'remaining': float('inf'), 'reset': 0}
@@ -122,60 +125,16 @@ class RateLimiter:
         cache_key = self._get_cache_key(identifier, endpoint)
 
         try:
-            # Get current bucket state
-            now = time.time()
-            bucket = cache.get(cache_key)
-
-            if bucket is None:
-                # Initialize new bucket
-                bucket = {
-                    'tokens': config.requests - 1,  # Consume one token
-                    'last_update': now,
-                    'limit': config.requests,
-                    'window': config.window,
-                }
-                cache.set(cache_key, bucket, config.window)
-
-                return True, {
-                    'limit': config.requests,
-                    'remaining': bucket['tokens'],
-                    'reset': int(now + config.window),
-                }
-
-            # Refill tokens based on time passed
-            time_passed = now - bucket['last_update']
-            refill_rate = config.requests / config.window
-            new_tokens = min(
-                config.requests,
-                bucket['tokens'] + (time_passed * refill_rate)
-            )
-
-            # Check if we have tokens available
-            if new_tokens >= 1:
-                # Consume one token
-                bucket['tokens'] = new_tokens - 1
-                bucket['last_update'] = now
-
-                # Calculate reset time
-                reset_time = int(now + (config.window - time_passed))
-
-                # Update cache
-                cache.set(cache_key, bucket, config.window)
-
-                return True, {
-                    'limit': config.requests,
-                    'remaining': int(bucket['tokens']),
-                    'reset': reset_time,
-                }
-            else:
-                # Rate limit exceeded
-                reset_time = int(bucket['last_update'] + config.window)
-
-                return False, {
-                    'limit': config.requests,
-                    'remaining': 0,
-                    'reset': reset_time,
-                }
+            result = get_rate_limit_engine().hit(cache_key, Limit(config.requests, config.window))
+
+            info = {
+                'limit': config.requests,
+                'remaining': result.remaining,
+                'reset': result.reset,
+            }
+            if not result.allowed:
+                info['retry_after'] = result.retry_after
+            return result.allowed, info
 
         except Exception as e:
             # If cache fails, allow request but log error
@@ -218,7 +177,7 @@ def rate_limit(endpoint: str = 'default'):
             allowed, info = rate_limiter.check_rate_limit(request, endpoint)
 
             if not allowed:
-                retry_after = rate_limiter.get_retry_after(info['reset'])
+                retry_after = info.get('retry_after', rate_limiter.get_retry_after(info['reset']))
 
                 response = JsonResponse({
                     'error': 'Rate limit exceeded',
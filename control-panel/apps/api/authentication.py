@@ -13,37 +13,49 @@ from django.http import JsonResponse
 from django.contrib.auth.models import User
 from django.utils import timezone
 from .models import APIToken
+from .token_cache import cache_token, get_cached_token, last_used_recorder
 
 
 def get_user_from_token(token_string: str) -> Optional[User]:
     """
     Get user from API token.
 
+    Validated tokens are served from a short-lived cache and
+    ``last_used`` is updated in coalesced batches (see token_cache).
+    The user itself is always loaded fresh, so inactive users are
+    rejected even while their token is cached.
+
     Args:
         token_string: The API token string
 
     Returns:
         User instance if valid token, None otherwise
     """
-    try:
-        token = APIToken.objects.select_related('user').get(
-            token=token_string,
-            is_active=True
-        )
-
-        # Check if token is expired
-        if token.expires_at and token.expires_at < timezone.now():
+    entry = get_cached_token(token_string)
+
+    if entry is None:
+        try:
+            token = APIToken.objects.get(
+                token=token_string,
+                is_active=True
+            )
+        except APIToken.DoesNotExist:
             return None
+        entry = cache_token(token)
 
-        # Update last used timestamp
-        token.last_used = timezone.now()
-        token.save(update_fields=['last_used'])
-
-        return token.user
+    # Check if token is expired
+    if entry['expires_at'] and entry['expires_at'] < timezone.now():
+        return None
 
-    except APIToken.DoesNotExist:
+    user = User.objects.filter(pk=entry['user_id'], is_active=True).first()
+    if user is None:
         return None
 
+    # Update last used timestamp
+    last_used_recorder.touch(entry['token_id'])
+
+    return user
+
 
 def api_authentication_required(view_func):
     """
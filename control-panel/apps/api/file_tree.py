@@ -0,0 +1,170 @@
+"""
+Lazy directory listings for the deployment file browser.
+
+The file tree API returns one directory level at a time, paginated with
+a cursor, instead of the whole checkout (node_modules and virtualenvs
+make that megabytes). Listings are read with ``os.scandir`` and cached
+per directory, keyed by the directory's mtime, so expanding the same
+folders again does not touch the disk. File sizes are only read for the
+entries of the requested page.
+"""
+
+import base64
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+MAX_DEPTH = 3
+MAX_CACHED_LISTINGS = 512
+
+# (is_file, name): directories first, then files, each by name
+SortKey = Tuple[int, str]
+
+_listings: 'OrderedDict[str, Tuple[int, List[SortKey]]]' = OrderedDict()
+_listings_lock = threading.Lock()
+
+
+def list_directory(path: Path) -> List[SortKey]:
+    """
+    Sorted visible entries of a directory.
+
+    Hidden entries are skipped. The listing is cached until the
+    directory's mtime changes (an entry is added, removed or renamed).
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        Sort keys ``(is_file, name)`` of the entries
+    """
+    key = str(path)
+    mtime = os.stat(path).st_mtime_ns
+
+    with _listings_lock:
+        cached = _listings.get(key)
+        if cached and cached[0] == mtime:
+            _listings.move_to_end(key)
+            return cached[1]
+
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            entries.append((0 if is_dir else 1, entry.name))
+    entries.sort()
+
+    with _listings_lock:
+        _listings[key] = (mtime, entries)
+        _listings.move_to_end(key)
+        while len(_listings) > MAX_CACHED_LISTINGS:
+            _listings.popitem(last=False)
+    return entries
+
+
+def encode_cursor(sort_key: SortKey) -> str:
+    return base64.urlsafe_b64encode(f"{sort_key[0]}/{sort_key[1]}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        kind, name = base64.urlsafe_b64decode(cursor.encode()).decode().split('/', 1)
+        return int(kind), name
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def _after(entries: List[SortKey], cursor: Optional[SortKey]) -> int:
+    """Index of the first entry after ``cursor`` (binary search)."""
+    if cursor is None:
+        return 0
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if entries[mid] <= cursor:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def list_page(
+    repo_path: Path,
+    directory: Path,
+    cursor: Optional[SortKey] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    depth: int = 1,
+    with_stat: bool = False
+) -> Dict[str, Any]:
+    """
+    One page of a directory, optionally with nested levels.
+
+    Args:
+        repo_path: Repository root; node paths are relative to it
+        directory: Directory to list
+        cursor: Sort key of the last entry of the previous page
+        limit: Maximum entries in this page (and in each nested level)
+        depth: Levels to include; directories below ``depth`` have no
+            ``children`` and are loaded when expanded
+        with_stat: Include ``size`` and ``modified`` of each entry
+
+    Returns:
+        Dict with ``tree``, ``has_more`` and ``next_cursor``
+    """
+    entries = list_directory(directory)
+    start = _after(entries, cursor)
+    page = entries[start:start + limit]
+    has_more = start + limit < len(entries)
+
+    tree = []
+    for is_file, name in page:
+        item = directory / name
+        node: Dict[str, Any] = {
+            'name': name,
+            'path': str(item.relative_to(repo_path)),
+            'type': 'file' if is_file else 'directory',
+        }
+
+        if with_stat:
+            try:
+                stat = item.stat()
+                node['size'] = stat.st_size if is_file else None
+                node['modified'] = int(stat.st_mtime)
+            except OSError:
+                node['size'] = node['modified'] = None
+
+        if not is_file and depth > 1:
+            try:
+                child = list_page(repo_path, item, limit=limit, depth=depth - 1, with_stat=with_stat)
+                node['children'] = child['tree']
+                node['has_more'] = child['has_more']
+                node['next_cursor'] = child['next_cursor']
+            except (PermissionError, FileNotFoundError):
+                node['children'] = []
+                node['has_more'] = False
+                node['next_cursor'] = None
+
+        tree.append(node)
+
+    return {
+        'tree': tree,
+        'has_more': has_more,
+        'next_cursor': encode_cursor(page[-1]) if has_more and page else None,
+    }
+
+
+def clear_listing_cache() -> None:
+    with _listings_lock:
+        _listings.clear()
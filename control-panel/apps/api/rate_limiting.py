@@ -4,14 +4,17 @@ Rate limiting middleware and decorators for WebOps API.
 "Security Best Practices" section
 """
 
-import time
+import logging
 from typing import Dict, Tuple, Optional
-from django.core.cache import cache
 from django.http import JsonResponse
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import never_cache
 from functools import wraps
 
+from apps.core.common.utils.rate_limit import Limit, get_rate_limit_engine
+
+logger = logging.getLogger(__name__)
+
 
 def get_client_ip(request) -> str:
     """
@@ -39,7 +42,12 @@ class RateLimitExceeded(Exception):
 
 
 class RateLimiter:
-    """Token bucket rate limiter implementation."""
+    """
+    Rate limiter with a sustained and a burst limit.
+
+    Both limits are checked and consumed in one atomic operation of the
+    shared rate limit engine (one Redis round trip).
+    """
     
     def __init__(self, 
                  max_requests: int = 100, 
@@ -59,12 +67,9 @@ class RateLimiter:
         self.window_seconds = window_seconds
         self.burst_requests = burst_requests
         self.burst_window = burst_window
-    
-    def get_cache_keys(self, identifier: str) -> Tuple[str, str]:
-        """Get cache keys for rate limiting."""
-        return (
-            f"rate_limit:{identifier}:{self.window_seconds}",
-            f"burst_limit:{identifier}:{self.burst_window}"
+        self.limits = (
+            Limit(requests=max_requests, window=window_seconds),
+            Limit(requests=burst_requests, window=burst_window),
         )
     
     def is_allowed(self, identifier: str) -> Tuple[bool, Dict[str, int]]:
@@ -77,52 +82,16 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, info_dict)
         """
-        now = int(time.time())
-        rate_key, burst_key = self.get_cache_keys(identifier)
-        
-        # Check main rate limit
-        rate_data = cache.get(rate_key, {'count': 0, 'reset_time': now + self.window_seconds})
-        
-        # Reset if window expired
-        if now >= rate_data['reset_time']:
-            rate_data = {'count': 0, 'reset_time': now + self.window_seconds}
-        
-        # Check burst limit
-        burst_data = cache.get(burst_key, {'count': 0, 'reset_time': now + self.burst_window})
-        
-        # Reset burst if window expired
-        if now >= burst_data['reset_time']:
-            burst_data = {'count': 0, 'reset_time': now + self.burst_window}
-        
-        # Check limits
-        rate_exceeded = rate_data['count'] >= self.max_requests
-        burst_exceeded = burst_data['count'] >= self.burst_requests
-        
-        if rate_exceeded or burst_exceeded:
-            retry_after = min(
-                rate_data['reset_time'] - now if rate_exceeded else float('inf'),
-                burst_data['reset_time'] - now if burst_exceeded else float('inf')
-            )
-            return False, {
-                'retry_after': int(retry_after),
-                'limit': self.max_requests,
-                'remaining': max(0, self.max_requests - rate_data['count']),
-                'reset': rate_data['reset_time']
-            }
-        
-        # Increment counters
-        rate_data['count'] += 1
-        burst_data['count'] += 1
-        
-        # Save to cache
-        cache.set(rate_key, rate_data, timeout=self.window_seconds)
-        cache.set(burst_key, burst_data, timeout=self.burst_window)
-        
-        return True, {
-            'limit': self.max_requests,
-            'remaining': max(0, self.max_requests - rate_data['count']),
-            'reset': rate_data['reset_time']
+        result = get_rate_limit_engine().hit(f"api:{identifier}", *self.limits)
+
+        info = {
+            'limit': result.limit,
+            'remaining': result.remaining,
+            'reset': result.reset
         }
+        if not result.allowed:
+            info['retry_after'] = result.retry_after
+        return result.allowed, info
 
 
 # Pre-configured rate limiters
@@ -240,10 +209,8 @@ class RateLimitMiddleware:
         # Check global rate limit
         allowed, info = self.global_limiter.is_allowed(identifier)
         
-        print(f"Rate limit check for {identifier} on {request.path}: allowed={allowed}")
-        
         if not allowed:
-            print(f"Rate limit exceeded for {identifier}")
+            logger.warning(f"Rate limit exceeded for {identifier} on {request.path}")
 
             # Check if request expects JSON (API request)
             if request.path.startswith('/api/') or request.META.get('HTTP_ACCEPT', '').startswith('application/json'):
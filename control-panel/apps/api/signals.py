@@ -0,0 +1,20 @@
+"""
+Signal handlers for the API app.
+
+Keeps the API token cache consistent: any save (revoke, toggle, rotation,
+soft delete) or delete of a token drops its cached validation.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import APIToken
+from .token_cache import invalidate_token
+
+
+@receiver(post_save, sender=APIToken)
+@receiver(post_delete, sender=APIToken)
+def invalidate_cached_token(sender, instance: APIToken, **kwargs) -> None:
+    """Drop a changed or deleted token from the authentication cache."""
+    if instance.token:
+        invalidate_token(instance.token)
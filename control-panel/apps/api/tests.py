@@ -92,3 +92,109 @@ class APIDeploymentAdapterTests(TestCase):
     def test_authentication_required(self):
         resp = self.client.get(reverse('api_deployment_list'))
         self.assertEqual(resp.status_code, 401)
+
+
+class APITokenCacheTests(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.user = User.objects.create_user(username='tokenuser', password='pass')
+        self.token = APIToken.objects.create(user=self.user, name='cli-token')
+
+    def test_cached_token_only_loads_user(self):
+        from apps.api.authentication import get_user_from_token
+
+        self.assertEqual(get_user_from_token(self.token.token), self.user)
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_from_token(self.token.token), self.user)
+
+    def test_deactivated_user_is_rejected_while_cached(self):
+        from apps.api.authentication import get_user_from_token
+
+        self.assertEqual(get_user_from_token(self.token.token), self.user)
+        self.user.is_active = False
+        self.user.save()
+
+        self.assertIsNone(get_user_from_token(self.token.token))
+
+    def test_revoked_token_is_rejected_immediately(self):
+        from apps.api.authentication import get_user_from_token
+
+        self.assertEqual(get_user_from_token(self.token.token), self.user)
+        self.token.is_active = False
+        self.token.save()
+
+        self.assertIsNone(get_user_from_token(self.token.token))
+
+    def test_last_used_coalesced_and_written_in_batch(self):
+        from apps.api.token_cache import LastUsedRecorder
+
+        other = APIToken.objects.create(user=self.user, name='ws-token')
+        recorder = LastUsedRecorder(interval=60, flush_delay=60)
+
+        self.assertTrue(recorder.touch(self.token.pk))
+        self.assertFalse(recorder.touch(self.token.pk))
+        self.assertTrue(recorder.touch(other.pk))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(recorder.flush(), 2)
+        self.token.refresh_from_db()
+        self.assertIsNotNone(self.token.last_used)
+
+
+class FileTreeListingTests(TestCase):
+    def setUp(self):
+        import tempfile
+        from pathlib import Path
+        from apps.api import file_tree
+
+        file_tree.clear_listing_cache()
+        self.repo = Path(tempfile.mkdtemp())
+        (self.repo / 'src' / 'app').mkdir(parents=True)
+        (self.repo / 'src' / 'app' / 'views.py').write_text('x = 1\n')
+        (self.repo / '.git').mkdir()
+        for name in ('a.txt', 'b.txt', 'c.txt'):
+            (self.repo / name).write_text(name)
+
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.repo, ignore_errors=True)
+
+    def test_pages_follow_cursor(self):
+        from apps.api import file_tree
+
+        first = file_tree.list_page(self.repo, self.repo, limit=2)
+        self.assertEqual([n['name'] for n in first['tree']], ['src', 'a.txt'])
+        self.assertTrue(first['has_more'])
+        self.assertNotIn('children', first['tree'][0])
+
+        cursor = file_tree.decode_cursor(first['next_cursor'])
+        second = file_tree.list_page(self.repo, self.repo, cursor=cursor, limit=2)
+        self.assertEqual([n['name'] for n in second['tree']], ['b.txt', 'c.txt'])
+        self.assertFalse(second['has_more'])
+        self.assertIsNone(second['next_cursor'])
+
+    def test_depth_and_stat(self):
+        from apps.api import file_tree
+
+        page = file_tree.list_page(self.repo, self.repo / 'src', depth=2, with_stat=True)
+        app = page['tree'][0]
+        self.assertEqual(app['path'], 'src/app')
+        self.assertEqual(app['children'][0]['path'], 'src/app/views.py')
+        self.assertEqual(app['children'][0]['size'], 6)
+
+    def test_listing_cached_until_directory_changes(self):
+        import os
+        from unittest import mock
+        from apps.api import file_tree
+
+        file_tree.list_directory(self.repo)
+        with mock.patch.object(file_tree.os, 'scandir', wraps=os.scandir) as scandir:
+            file_tree.list_directory(self.repo)
+            self.assertEqual(scandir.call_count, 0)
+
+            (self.repo / 'd.txt').write_text('d')
+            stat = os.stat(self.repo)
+            os.utime(self.repo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+            self.assertIn((1, 'd.txt'), file_tree.list_directory(self.repo))
+            self.assertEqual(scandir.call_count, 1)
@@ -0,0 +1,164 @@
+"""
+Caching for API token authentication.
+
+CLI polling loops and the deployment status WebSocket authenticate many
+times per minute with the same token. Instead of one SELECT and one
+UPDATE per request:
+- Validated tokens are cached in the shared cache for a short TTL and
+  invalidated whenever the token is saved or deleted (revoked, toggled,
+  rotated). Only the user id is cached; the user is loaded per request so
+  deactivation and permission changes apply immediately
+- ``last_used`` is written at most once per interval per token; pending
+  timestamps are buffered and written with one ``bulk_update``
+"""
+
+import atexit
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from .models import APIToken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOKEN_CACHE_TTL = 60
+DEFAULT_LAST_USED_INTERVAL = 60
+LAST_USED_FLUSH_DELAY = 5.0
+
+
+def _cache_key(token_string: str) -> str:
+    # Raw tokens never become cache keys
+    return f"api_token:{hashlib.sha256(token_string.encode()).hexdigest()}"
+
+
+def get_cached_token(token_string: str) -> Optional[Dict[str, Any]]:
+    """Cached validation entry for a token, or None on a miss."""
+    try:
+        return cache.get(_cache_key(token_string))
+    except Exception as e:
+        logger.warning(f"API token cache unavailable: {e}")
+        return None
+
+
+def cache_token(token: APIToken) -> Dict[str, Any]:
+    """
+    Cache a validated token.
+
+    Args:
+        token: Active APIToken
+
+    Returns:
+        The cached entry (token_id, user_id, expires_at)
+    """
+    entry = {
+        'token_id': token.pk,
+        'user_id': token.user_id,
+        'expires_at': token.expires_at,
+    }
+
+    ttl = getattr(settings, 'API_TOKEN_CACHE_TTL', DEFAULT_TOKEN_CACHE_TTL)
+    if token.expires_at:
+        ttl = min(ttl, int((token.expires_at - timezone.now()).total_seconds()))
+    if ttl > 0:
+        try:
+            cache.set(_cache_key(token.token), entry, timeout=ttl)
+        except Exception as e:
+            logger.warning(f"API token cache unavailable: {e}")
+    return entry
+
+
+def invalidate_token(token_string: str) -> None:
+    """Drop a token from the cache so the next request re-validates it."""
+    try:
+        cache.delete(_cache_key(token_string))
+    except Exception as e:
+        logger.warning(f"Failed to invalidate cached API token: {e}")
+
+
+class LastUsedRecorder:
+    """
+    Coalesces ``last_used`` updates of API tokens.
+
+    A token is recorded at most once per ``interval`` seconds across all
+    processes (guarded by ``cache.add``). Recorded timestamps are written
+    together ``flush_delay`` seconds after the first one.
+    """
+
+    def __init__(self, interval: Optional[int] = None, flush_delay: float = LAST_USED_FLUSH_DELAY) -> None:
+        self.interval = (
+            interval if interval is not None
+            else getattr(settings, 'API_TOKEN_LAST_USED_INTERVAL', DEFAULT_LAST_USED_INTERVAL)
+        )
+        self.flush_delay = flush_delay
+        self._pending: Dict[int, datetime] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def touch(self, token_id: int) -> bool:
+        """
+        Note that a token was used now.
+
+        Returns:
+            True if the use was recorded, False if coalesced away
+        """
+        try:
+            if not cache.add(f"api_token_used:{token_id}", 1, timeout=self.interval):
+                return False
+        except Exception:
+            # Without the shared guard, fall back to the in-process buffer
+            pass
+
+        with self._lock:
+            self._pending[token_id] = timezone.now()
+            if self._timer is None:
+                self._timer = threading.Timer(self.flush_delay, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        return True
+
+    def flush(self) -> int:
+        """
+        Write pending ``last_used`` timestamps.
+
+        Returns:
+            Number of tokens updated
+        """
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not batch:
+            return 0
+
+        tokens = [APIToken(pk=pk, last_used=last_used) for pk, last_used in batch.items()]
+        APIToken.objects.bulk_update(tokens, ['last_used'])
+        return len(tokens)
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to update API token last_used: {e}")
+        finally:
+            # The timer thread owns its own database connection
+            connection.close()
+
+
+last_used_recorder = LastUsedRecorder()
+
+
+@atexit.register
+def _flush_last_used() -> None:
+    try:
+        last_used_recorder.flush()
+    except Exception:
+        pass
@@ -218,12 +218,20 @@ def deployment_env_unset(request, name):
 @api_require_ownership(ApplicationDeployment, ownership_field='deployed_by', lookup_field='deployment_id')
 def deployment_files_tree(request, deployment_id):
     """
-    Get the file tree structure for a deployment.
+    Get one level of the file tree of a deployment.
 
     GET /api/deployments/{deployment_id}/files/tree/?path=/optional/subpath
+
+    Query parameters:
+        path: Directory to list (default: repository root)
+        cursor: next_cursor of the previous page
+        limit: Entries per page (default 200, max 1000)
+        depth: Levels to include (default 1, max 3)
+        stat: Include size and modified time if 1
     """
     try:
         from apps.deployments.services import DeploymentService
+        from . import file_tree
 
         # SECURITY FIX: Ownership verified by decorator
         deployment = ApplicationDeployment.objects.get(id=deployment_id, deployed_by=request.user)
@@ -232,6 +240,7 @@ def deployment_files_tree(request, deployment_id):
         
         if not repo_path.exists():
             return JsonResponse({'error': 'Repository not found'}, status=404)
+        repo_path = repo_path.resolve()
         
         # Get the requested path, default to root
         requested_path = request.GET.get('path', '/')
@@ -239,39 +248,34 @@ def deployment_files_tree(request, deployment_id):
             requested_path = repo_path
         else:
             # Ensure the path is within the repo
-            requested_path = repo_path / requested_path.lstrip('/')
-            if not requested_path.exists() or not str(requested_path).startswith(str(repo_path)):
+            requested_path = (repo_path / requested_path.lstrip('/')).resolve()
+            if not requested_path.is_dir() or not requested_path.is_relative_to(repo_path):
                 return JsonResponse({'error': 'Invalid path'}, status=400)
-        
-        # Build file tree
-        def build_tree(path):
-            tree = []
-            try:
-                for item in path.iterdir():
-                    # Skip hidden files and directories
-                    if item.name.startswith('.'):
-                        continue
-                        
-                    node = {
-                        'name': item.name,
-                        'path': str(item.relative_to(repo_path)),
-                        'type': 'directory' if item.is_dir() else 'file'
-                    }
-                    
-                    if item.is_dir():
-                        node['children'] = build_tree(item)
-                    
-                    tree.append(node)
-            except PermissionError:
-                pass
-            return tree
-        
-        tree = build_tree(requested_path)
+
+        try:
+            cursor = request.GET.get('cursor')
+            cursor = file_tree.decode_cursor(cursor) if cursor else None
+            limit = min(max(int(request.GET.get('limit', file_tree.DEFAULT_PAGE_SIZE)), 1), file_tree.MAX_PAGE_SIZE)
+            depth = min(max(int(request.GET.get('depth', 1)), 1), file_tree.MAX_DEPTH)
+        except ValueError as e:
+            return JsonResponse({'error': f'Invalid parameter: {e}'}, status=400)
+
+        try:
+            page = file_tree.list_page(
+                repo_path,
+                requested_path,
+                cursor=cursor,
+                limit=limit,
+                depth=depth,
+                with_stat=request.GET.get('stat') in ('1', 'true')
+            )
+        except PermissionError:
+            page = {'tree': [], 'has_more': False, 'next_cursor': None}
         
         return JsonResponse({
             'success': True,
             'path': str(requested_path.relative_to(repo_path)),
-            'tree': tree
+            **page
         })
         
     except ApplicationDeployment.DoesNotExist:
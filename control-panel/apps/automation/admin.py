@@ -19,18 +19,18 @@ class WorkflowAdmin(admin.ModelAdmin):
     list_display = ['name', 'owner', 'status_badge', 'trigger_type', 'total_executions', 'success_rate', 'last_executed_at', 'created_at']
     list_filter = ['status', 'trigger_type', 'created_at']
     search_fields = ['name', 'description', 'owner__username']
-    readonly_fields = ['total_executions', 'successful_executions', 'failed_executions', 'last_executed_at', 'average_duration_ms', 'created_at', 'updated_at']
+    readonly_fields = ['next_run_at', 'total_executions', 'successful_executions', 'failed_executions', 'last_executed_at', 'average_duration_ms', 'created_at', 'updated_at']
 
     fieldsets = (
         ('Basic Information', {
             'fields': ('name', 'description', 'owner', 'status', 'trigger_type')
         }),
         ('Schedule', {
-            'fields': ('schedule_cron',),
+            'fields': ('schedule_cron', 'missed_run_policy', 'next_run_at'),
             'classes': ('collapse',)
         }),
         ('Settings', {
-            'fields': ('timeout_seconds', 'retry_on_failure', 'max_retries')
+            'fields': ('timeout_seconds', 'retry_on_failure', 'max_retries', 'max_parallel_nodes')
         }),
         ('Statistics', {
             'fields': ('total_executions', 'successful_executions', 'failed_executions', 'last_executed_at', 'average_duration_ms'),
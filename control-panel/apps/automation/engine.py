@@ -9,11 +9,13 @@ This module handles the execution of automation workflows by:
 - Logging execution details
 """
 
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from django.utils import timezone
 from django.db import transaction
 import logging
+import threading
 import traceback
 import time
 
@@ -24,9 +26,23 @@ from .models import (
     WorkflowExecution
 )
 from .node_executors import NodeExecutorRegistry
+from .expressions import evaluate_expression
+from .streaming import close_streams, summarize_streams
+from .plan import (
+    WorkflowPlan,
+    compile_transform,
+    compile_workflow_plan,
+    get_plan_version,
+    topological_order
+)
 
 logger = logging.getLogger(__name__)
 
+# Compiled plans kept per engine, and the age after which they are rebuilt
+# even without an invalidation (guards against per-process cache backends)
+MAX_CACHED_PLANS = 256
+PLAN_MAX_AGE_SECONDS = 300
+
 
 class WorkflowExecutionEngine:
     """
@@ -36,6 +52,8 @@ class WorkflowExecutionEngine:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.node_executor_registry = NodeExecutorRegistry()
+        self._plans = OrderedDict()
+        self._plans_lock = threading.Lock()
 
     def execute_workflow(
         self,
@@ -67,6 +85,7 @@ class WorkflowExecutionEngine:
             input_data=input_data,
             trigger_data={'timestamp': timezone.now().isoformat()}
         )
+        node_data = {'input': input_data}
 
         try:
             # Update status to running
@@ -75,65 +94,29 @@ class WorkflowExecutionEngine:
 
             start_time = time.time()
 
-            # Get execution order
-            execution_order = self._get_execution_order(workflow)
-            if execution_order is None:
+            # Get compiled plan (execution order, edge index, executors)
+            plan = self.get_workflow_plan(workflow)
+            if plan.has_cycles:
                 raise ValueError("Workflow contains cycles or is invalid")
+            execution_order = plan.order
+
+            # Execute nodes in order, fanning out independent nodes when allowed.
+            # Streams hold cursors bound to the opening thread, so streaming
+            # workflows always run sequentially.
+            if workflow.max_parallel_nodes > 1 and not plan.has_streaming_nodes:
+                node_logs = self._execute_nodes_parallel(
+                    workflow, plan, node_data, execution
+                )
+            else:
+                node_logs = self._execute_nodes_sequential(
+                    workflow, plan, node_data, execution
+                )
 
-            # Execute nodes in order
-            node_data = {'input': input_data}
-            node_logs = []
-
-            for node in execution_order:
-                if not node.enabled:
-                    node_logs.append({
-                        'node_id': node.node_id,
-                        'node_label': node.label,
-                        'status': 'skipped',
-                        'reason': 'Node disabled'
-                    })
-                    continue
-
-                # Get input data from predecessors
-                node_input = self._get_node_input(node, node_data, workflow)
-
-                # Execute node
-                node_result = self._execute_node(node, node_input, execution)
-
-                # Store node output
-                node_data[node.node_id] = node_result['output']
-
-                # Log node execution
-                node_logs.append({
-                    'node_id': node.node_id,
-                    'node_label': node.label,
-                    'node_type': node.node_type,
-                    'status': node_result['status'],
-                    'duration_ms': node_result.get('duration_ms', 0),
-                    'error': node_result.get('error'),
-                    'timestamp': timezone.now().isoformat()
-                })
-
-                # Check for errors
-                if node_result['status'] == 'error':
-                    # Handle node failure with retry logic
-                    if self._should_retry_node(node, node_result, execution):
-                        # Retry the node
-                        retry_result = self._retry_node(node, node_input, execution)
-                        if retry_result['status'] == 'error':
-                            # Still failed after retry
-                            if not workflow.retry_on_failure:
-                                raise Exception(f"Node {node.label} failed after retry: {retry_result.get('error')}")
-                            node_result = retry_result
-                        else:
-                            # Retry succeeded
-                            node_result = retry_result
-                            node_data[node.node_id] = node_result['output']
-                    elif not workflow.retry_on_failure:
-                        raise Exception(f"Node {node.label} failed: {node_result.get('error')}")
-
-            # Calculate final output (from last nodes)
-            output_data = self._get_final_output(execution_order, node_data)
+            # Calculate final output (from last nodes), storing streamed
+            # outputs as a row count plus a bounded sample
+            output_data = summarize_streams(
+                self._get_final_output(execution_order, node_data)
+            )
 
             # Mark as successful
             duration_ms = int((time.time() - start_time) * 1000)
@@ -144,37 +127,8 @@ class WorkflowExecutionEngine:
             execution.node_logs = node_logs
             execution.save()
 
-            # Update workflow statistics atomically
-            from django.db.models import F
-            from django.db import transaction
-            
-            with transaction.atomic():
-                # Lock the workflow row to prevent race conditions
-                workflow = Workflow.objects.select_for_update().get(pk=workflow.pk)
-                
-                # Update statistics atomically
-                workflow.total_executions = F('total_executions') + 1
-                workflow.successful_executions = F('successful_executions') + 1
-                workflow.last_executed_at = timezone.now()
-                
-                # Calculate new average duration
-                # We need to fetch the current values first for the calculation
-                current_total = workflow.total_executions
-                current_avg = workflow.average_duration_ms
-                
-                # Save the atomic updates
-                workflow.save()
-                
-                # Refresh to get the updated values
-                workflow.refresh_from_db()
-                
-                # Now update the average duration
-                new_avg = (
-                    (current_avg * (workflow.total_executions - 1) + duration_ms)
-                    / workflow.total_executions
-                )
-                workflow.average_duration_ms = new_avg
-                workflow.save()
+            # Workflow statistics are folded in from execution records
+            # periodically (see stats.py) instead of locking the workflow row
 
             self.logger.info(f"Workflow {workflow.name} executed successfully in {duration_ms}ms")
 
@@ -186,84 +140,266 @@ class WorkflowExecutionEngine:
             execution.error_traceback = traceback.format_exc()
             execution.save()
 
-            # Update workflow statistics atomically
-            from django.db.models import F
-            from django.db import transaction
-            
-            with transaction.atomic():
-                # Lock the workflow row to prevent race conditions
-                workflow = Workflow.objects.select_for_update().get(pk=workflow.pk)
-                
-                # Update statistics atomically
-                workflow.total_executions = F('total_executions') + 1
-                workflow.failed_executions = F('failed_executions') + 1
-                
-                workflow.save()
-
             self.logger.error(f"Workflow {workflow.name} execution failed: {e}")
             self.logger.error(traceback.format_exc())
 
+        finally:
+            # Release cursors of streams no node consumed
+            close_streams(node_data)
+
         return execution
 
-    def _get_execution_order(self, workflow: Workflow) -> Optional[List[WorkflowNode]]:
+    def _execute_nodes_sequential(
+        self,
+        workflow: Workflow,
+        plan: WorkflowPlan,
+        node_data: Dict[str, Any],
+        execution: WorkflowExecution
+    ) -> List[Dict[str, Any]]:
         """
-        Get topological ordering of nodes for execution.
+        Execute nodes one at a time in topological order.
 
-        Returns None if workflow contains cycles.
+        Returns:
+            List of node log entries in execution order
+        """
+        node_logs = []
+
+        for node in plan.order:
+            if not node.enabled:
+                node_logs.append(self._skipped_node_log(node))
+                continue
+
+            # Get input data from predecessors
+            node_input = self._get_node_input(node, node_data, plan)
+
+            log_entry, output = self._run_node(workflow, plan, node, node_input, execution)
+            node_data[node.node_id] = output
+            node_logs.append(log_entry)
+
+        return node_logs
+
+    def _execute_nodes_parallel(
+        self,
+        workflow: Workflow,
+        plan: WorkflowPlan,
+        node_data: Dict[str, Any],
+        execution: WorkflowExecution
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute nodes level by level on a bounded thread pool.
+
+        Every node whose predecessors have all finished is dispatched to the
+        pool, with at most ``workflow.max_parallel_nodes`` running at once.
+        Input resolution and bookkeeping stay on the calling thread, so
+        ``node_data`` is never mutated concurrently. If a node fails fatally
+        no further nodes are dispatched; in-flight nodes are allowed to finish
+        and the first failure is raised.
+
+        Returns:
+            List of node log entries in topological order
         """
         from collections import deque
-        
-        # Optimize query with prefetch_related
-        nodes = list(workflow.nodes.all())
-        connections = list(workflow.connections.select_related('source_node', 'target_node').all())
+        from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+        execution_order = plan.order
+        remaining = {node_id: len(edges) for node_id, edges in plan.incoming.items()}
+        node_map = {node.node_id: node for node in execution_order}
+        ready = deque(node for node in execution_order if remaining[node.node_id] == 0)
+        logs_by_node = {}
+        failure = None
+
+        def release(node_id: str) -> None:
+            for successor_id in plan.successors[node_id]:
+                remaining[successor_id] -= 1
+                if remaining[successor_id] == 0:
+                    ready.append(node_map[successor_id])
+
+        with ThreadPoolExecutor(
+            max_workers=workflow.max_parallel_nodes,
+            thread_name_prefix=f'workflow-{workflow.pk}'
+        ) as pool:
+            running = {}
+
+            while ready or running:
+                while ready and failure is None:
+                    node = ready.popleft()
+                    if not node.enabled:
+                        logs_by_node[node.node_id] = self._skipped_node_log(node)
+                        release(node.node_id)
+                        continue
+
+                    node_input = self._get_node_input(node, node_data, plan)
+                    future = pool.submit(
+                        self._run_node_in_thread, workflow, plan, node, node_input, execution
+                    )
+                    running[future] = node
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    try:
+                        log_entry, output = future.result()
+                    except Exception as e:
+                        if failure is None:
+                            failure = e
+                        continue
+
+                    node_data[node.node_id] = output
+                    logs_by_node[node.node_id] = log_entry
+                    release(node.node_id)
+
+        if failure is not None:
+            raise failure
+
+        return [
+            logs_by_node[node.node_id]
+            for node in execution_order
+            if node.node_id in logs_by_node
+        ]
 
-        # Build adjacency list
-        adjacency = {node.node_id: [] for node in nodes}
-        in_degree = {node.node_id: 0 for node in nodes}
+    def _run_node_in_thread(
+        self,
+        workflow: Workflow,
+        plan: WorkflowPlan,
+        node: WorkflowNode,
+        node_input: Dict[str, Any],
+        execution: WorkflowExecution
+    ) -> Tuple[Dict[str, Any], Any]:
+        """
+        Run a node from a pool thread, releasing the thread's DB connection.
+        """
+        from django.db import connections
 
-        for conn in connections:
-            adjacency[conn.source_node.node_id].append(conn.target_node.node_id)
-            in_degree[conn.target_node.node_id] += 1
+        try:
+            return self._run_node(workflow, plan, node, node_input, execution)
+        finally:
+            connections.close_all()
 
-        # Kahn's algorithm for topological sort using deque for O(1) operations
-        queue = deque([node_id for node_id, degree in in_degree.items() if degree == 0])
-        result = []
+    def _run_node(
+        self,
+        workflow: Workflow,
+        plan: WorkflowPlan,
+        node: WorkflowNode,
+        node_input: Dict[str, Any],
+        execution: WorkflowExecution
+    ) -> Tuple[Dict[str, Any], Any]:
+        """
+        Execute a node, applying node retries and the workflow failure policy.
+
+        Returns:
+            Tuple of (node log entry, node output)
+
+        Raises:
+            Exception: If the node failed and the workflow does not tolerate failures
+        """
+        executor = plan.executors.get(node.node_id)
+        node_result = self._execute_node(node, node_input, execution, executor)
+        output = node_result['output']
+
+        log_entry = {
+            'node_id': node.node_id,
+            'node_label': node.label,
+            'node_type': node.node_type,
+            'status': node_result['status'],
+            'duration_ms': node_result.get('duration_ms', 0),
+            'error': node_result.get('error'),
+            'timestamp': timezone.now().isoformat()
+        }
+
+        # Check for errors
+        if node_result['status'] == 'error':
+            # Handle node failure with retry logic
+            if self._should_retry_node(node, node_result, execution):
+                # Retry the node
+                retry_result = self._retry_node(node, node_input, execution, executor)
+                if retry_result['status'] == 'error':
+                    # Still failed after retry
+                    if not workflow.retry_on_failure:
+                        raise Exception(f"Node {node.label} failed after retry: {retry_result.get('error')}")
+                else:
+                    # Retry succeeded
+                    output = retry_result['output']
+            elif not workflow.retry_on_failure:
+                raise Exception(f"Node {node.label} failed: {node_result.get('error')}")
+
+        return log_entry, output
+
+    def _skipped_node_log(self, node: WorkflowNode) -> Dict[str, Any]:
+        """Build the log entry for a disabled node."""
+        return {
+            'node_id': node.node_id,
+            'node_label': node.label,
+            'status': 'skipped',
+            'reason': 'Node disabled'
+        }
+
+    def get_workflow_plan(self, workflow: Workflow) -> WorkflowPlan:
+        """
+        Get the compiled execution plan for a workflow.
 
-        while queue:
-            node_id = queue.popleft()  # O(1) operation with deque
-            result.append(node_id)
+        Plans are reused until a node or connection of the workflow changes,
+        an executor is registered, or the plan exceeds PLAN_MAX_AGE_SECONDS.
+        """
+        version = get_plan_version(workflow.pk)
+        generation = self.node_executor_registry.generation
+
+        with self._plans_lock:
+            plan = self._plans.get(workflow.pk)
+            if (
+                plan is not None
+                and plan.version == version
+                and plan.registry_generation == generation
+                and time.monotonic() - plan.compiled_at < PLAN_MAX_AGE_SECONDS
+            ):
+                self._plans.move_to_end(workflow.pk)
+                return plan
+
+        plan = compile_workflow_plan(workflow, self.node_executor_registry, version)
+
+        with self._plans_lock:
+            self._plans[workflow.pk] = plan
+            self._plans.move_to_end(workflow.pk)
+            while len(self._plans) > MAX_CACHED_PLANS:
+                self._plans.popitem(last=False)
+
+        return plan
+
+    def _get_execution_order(self, workflow: Workflow) -> Optional[List[WorkflowNode]]:
+        """
+        Get topological ordering of nodes for execution.
+
+        Always reads the current graph; execution uses the cached plan instead.
+
+        Returns None if workflow contains cycles.
+        """
+        nodes = list(workflow.nodes.all())
+        connections = list(workflow.connections.select_related('source_node', 'target_node').all())
 
-            for neighbor in adjacency[node_id]:
-                in_degree[neighbor] -= 1
-                if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+        order, cycle_node_ids = topological_order(nodes, connections)
 
         # Check for cycles and provide detailed information
-        if len(result) != len(nodes):
-            # Find nodes involved in cycles
-            cycle_nodes = [node_id for node_id in in_degree if in_degree[node_id] > 0]
+        if order is None:
             node_labels = [next((n.label for n in nodes if n.node_id == node_id), node_id)
-                          for node_id in cycle_nodes]
-            
+                          for node_id in cycle_node_ids]
+
             self.logger.error(f"Workflow contains cycles involving nodes: {', '.join(node_labels)}")
             return None
 
-        # Convert node IDs back to node objects
-        node_map = {node.node_id: node for node in nodes}
-        return [node_map[node_id] for node_id in result]
+        return order
 
     def _get_node_input(
         self,
         node: WorkflowNode,
         node_data: Dict[str, Any],
-        workflow: Workflow
+        plan: WorkflowPlan
     ) -> Dict[str, Any]:
         """
         Get input data for a node from its predecessors.
         """
-        # Get incoming connections (optimized by using cached connections from execution_order)
-        # In a real implementation, we'd pass the connections list to avoid another query
-        incoming = [conn for conn in workflow.connections.all() if conn.target_node_id == node.id]
+        incoming = plan.incoming.get(node.node_id)
 
         if not incoming:
             # No incoming connections, use workflow input
@@ -273,11 +409,11 @@ class WorkflowExecutionEngine:
         merged_input = {}
 
         for conn in incoming:
-            source_data = node_data.get(conn.source_node.node_id, {})
+            source_data = node_data.get(conn.source_node_id, {})
 
-            # Apply transformation if specified
+            # Apply pre-parsed transformation if specified
             if conn.transform:
-                source_data = self._apply_transformation(source_data, conn.transform)
+                source_data = conn.transform(source_data)
 
             # Check condition if specified
             if conn.condition:
@@ -296,7 +432,8 @@ class WorkflowExecutionEngine:
         self,
         node: WorkflowNode,
         input_data: Dict[str, Any],
-        execution: WorkflowExecution
+        execution: WorkflowExecution,
+        executor=None
     ) -> Dict[str, Any]:
         """
         Execute a single node.
@@ -307,8 +444,9 @@ class WorkflowExecutionEngine:
         start_time = time.time()
 
         try:
-            # Get node executor
-            executor = self.node_executor_registry.get_executor(node.node_type)
+            # Get node executor unless the plan already bound one
+            if executor is None:
+                executor = self.node_executor_registry.get_executor(node.node_type)
 
             # Execute node with timeout
             output = executor.execute(node, input_data, execution)
@@ -365,30 +503,11 @@ class WorkflowExecutionEngine:
     ) -> Any:
         """
         Apply data transformation.
+
+        Execution applies transforms pre-parsed in the workflow plan; this
+        parses and applies one ad hoc.
         """
-        # Simple transformation support
-        transform_type = transform.get('type')
-
-        if transform_type == 'jmespath':
-            # JMESPath query
-            import jmespath
-            query = transform.get('query')
-            return jmespath.search(query, data)
-
-        elif transform_type == 'jsonpath':
-            # JSONPath query
-            from jsonpath_ng import parse
-            expr = parse(transform.get('query'))
-            matches = [match.value for match in expr.find(data)]
-            return matches[0] if len(matches) == 1 else matches
-
-        elif transform_type == 'template':
-            # Template-based transformation
-            from string import Template
-            template = Template(transform.get('template'))
-            return template.safe_substitute(data)
-
-        return data
+        return compile_transform(transform)(data)
 
     def _evaluate_condition(
         self,
@@ -484,7 +603,13 @@ class WorkflowExecutionEngine:
         # Default to retry for unknown errors if retries are enabled
         return True
     
-    def _retry_node(self, node: WorkflowNode, input_data: Dict[str, Any], execution: WorkflowExecution) -> Dict[str, Any]:
+    def _retry_node(
+        self,
+        node: WorkflowNode,
+        input_data: Dict[str, Any],
+        execution: WorkflowExecution,
+        executor=None
+    ) -> Dict[str, Any]:
         """
         Retry a node execution with exponential backoff.
         """
@@ -504,114 +629,17 @@ class WorkflowExecutionEngine:
         self.logger.info(f"Retrying node {node.label} (attempt {retry_count + 1}) after {delay:.2f}s delay")
         
         # Execute the node again
-        return self._execute_node(node, input_data, execution)
+        return self._execute_node(node, input_data, execution, executor)
 
     def _safe_eval_expression(self, expression: str, data: Any) -> bool:
         """
         Safely evaluate a simple expression without using eval().
-        
+
         Supports basic comparisons and logical operations on data fields.
+        The expression is compiled once and cached, see
+        ``expressions.compile_expression``.
         """
-        import ast
-        import operator
-        
-        # Define safe operators
-        operators = {
-            ast.Eq: operator.eq,
-            ast.NotEq: operator.ne,
-            ast.Lt: operator.lt,
-            ast.LtE: operator.le,
-            ast.Gt: operator.gt,
-            ast.GtE: operator.ge,
-            ast.And: lambda a, b: a and b,
-            ast.Or: lambda a, b: a or b,
-            ast.Not: lambda a: not a,
-            ast.In: lambda a, b: a in b,
-            ast.NotIn: lambda a, b: a not in b,
-        }
-        
-        def _eval(node):
-            if isinstance(node, ast.BoolOp):
-                result = True
-                if isinstance(node.op, ast.And):
-                    for value in node.values:
-                        result = result and _eval(value)
-                        if not result:
-                            break
-                elif isinstance(node.op, ast.Or):
-                    for value in node.values:
-                        result = result or _eval(value)
-                        if result:
-                            break
-                return result
-                
-            elif isinstance(node, ast.UnaryOp):
-                if isinstance(node.op, ast.Not):
-                    return not _eval(node.operand)
-                else:
-                    raise ValueError(f"Unsupported unary operator: {node.op}")
-                    
-            elif isinstance(node, ast.Compare):
-                left = _eval(node.left)
-                for op, right in zip(node.ops, node.comparators):
-                    right_val = _eval(right)
-                    if not isinstance(op, (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn)):
-                        raise ValueError(f"Unsupported comparison operator: {op}")
-                    if not operators[type(op)](left, right_val):
-                        return False
-                    left = right_val
-                return True
-                
-            elif isinstance(node, ast.Name):
-                # Allow access to 'data' variable
-                if node.id == 'data':
-                    return data
-                else:
-                    raise ValueError(f"Unknown variable: {node.id}")
-                    
-            elif isinstance(node, ast.Constant):
-                return node.value
-                
-            elif isinstance(node, ast.Attribute):
-                # Allow simple attribute access on data
-                if isinstance(node.value, ast.Name) and node.value.id == 'data':
-                    if isinstance(data, dict):
-                        return data.get(node.attr)
-                    else:
-                        return getattr(data, node.attr, None)
-                else:
-                    raise ValueError("Only attribute access on 'data' is allowed")
-                    
-            elif isinstance(node, ast.Subscript):
-                # Allow dictionary/list access on data
-                if isinstance(node.value, ast.Name) and node.value.id == 'data':
-                    data_val = data
-                    if isinstance(node.slice, ast.Constant):
-                        key = node.slice.value
-                    elif isinstance(node.slice, ast.Name):
-                        key = _eval(node.slice)
-                    else:
-                        raise ValueError("Only simple indexing is allowed")
-                    
-                    if isinstance(data_val, dict):
-                        return data_val.get(key)
-                    elif isinstance(data_val, (list, tuple)):
-                        return data_val[key] if isinstance(key, int) else None
-                    else:
-                        return None
-                else:
-                    raise ValueError("Only subscript access on 'data' is allowed")
-                    
-            else:
-                raise ValueError(f"Unsupported expression: {ast.dump(node)}")
-        
-        try:
-            # Parse the expression
-            tree = ast.parse(expression, mode='eval')
-            return _eval(tree.body)
-        except Exception as e:
-            self.logger.error(f"Expression evaluation error: {e}")
-            return False
+        return evaluate_expression(expression, data, 'data')
 
 
 # Singleton instance
@@ -0,0 +1,193 @@
+"""
+Safe expression compiler for filter and condition expressions.
+
+Expressions are parsed and checked against a whitelist of AST nodes once,
+then turned into a tree of closures that can be applied to many values
+without re-parsing. Compiled expressions are kept in an LRU cache keyed by
+expression text and the name of the variable they operate on.
+
+Supported syntax:
+- Comparisons (==, !=, <, <=, >, >=, in, not in), including chains
+- Boolean operators (and, or, not)
+- Constants
+- The bound variable, attribute access and simple subscripts on it
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Iterable, List
+import ast
+import logging
+import operator
+
+logger = logging.getLogger(__name__)
+
+EXPRESSION_CACHE_SIZE = 512
+
+COMPARISON_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+
+
+def _compile_node(node: ast.AST, variable: str) -> Callable[[Any], Any]:
+    """Validate an AST node and compile it into a closure of the bound value."""
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(value, variable) for value in node.values]
+
+        if isinstance(node.op, ast.And):
+            def evaluate_and(value):
+                result = True
+                for operand in operands:
+                    result = operand(value)
+                    if not result:
+                        break
+                return result
+            return evaluate_and
+
+        def evaluate_or(value):
+            result = False
+            for operand in operands:
+                result = operand(value)
+                if result:
+                    break
+            return result
+        return evaluate_or
+
+    elif isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, ast.Not):
+            raise ValueError(f"Unsupported unary operator: {node.op}")
+        operand = _compile_node(node.operand, variable)
+        return lambda value: not operand(value)
+
+    elif isinstance(node, ast.Compare):
+        left = _compile_node(node.left, variable)
+        comparisons = []
+        for op, right in zip(node.ops, node.comparators):
+            if type(op) not in COMPARISON_OPERATORS:
+                raise ValueError(f"Unsupported comparison operator: {op}")
+            comparisons.append((COMPARISON_OPERATORS[type(op)], _compile_node(right, variable)))
+
+        if len(comparisons) == 1:
+            compare, right = comparisons[0]
+            return lambda value: bool(compare(left(value), right(value)))
+
+        def evaluate_compare(value):
+            left_val = left(value)
+            for compare, right in comparisons:
+                right_val = right(value)
+                if not compare(left_val, right_val):
+                    return False
+                left_val = right_val
+            return True
+        return evaluate_compare
+
+    elif isinstance(node, ast.Name):
+        if node.id != variable:
+            raise ValueError(f"Unknown variable: {node.id}")
+        return lambda value: value
+
+    elif isinstance(node, ast.Constant):
+        constant = node.value
+        return lambda value: constant
+
+    elif isinstance(node, ast.Attribute):
+        if not (isinstance(node.value, ast.Name) and node.value.id == variable):
+            raise ValueError(f"Only attribute access on '{variable}' is allowed")
+        attr = node.attr
+
+        def evaluate_attribute(value):
+            if isinstance(value, dict):
+                return value.get(attr)
+            return getattr(value, attr, None)
+        return evaluate_attribute
+
+    elif isinstance(node, ast.Subscript):
+        if not (isinstance(node.value, ast.Name) and node.value.id == variable):
+            raise ValueError(f"Only subscript access on '{variable}' is allowed")
+
+        if isinstance(node.slice, ast.Constant):
+            key = node.slice.value
+            get_key = lambda value: key
+        elif isinstance(node.slice, ast.Name):
+            get_key = _compile_node(node.slice, variable)
+        else:
+            raise ValueError("Only simple indexing is allowed")
+
+        def evaluate_subscript(value):
+            key_val = get_key(value)
+            if isinstance(value, dict):
+                return value.get(key_val)
+            elif isinstance(value, (list, tuple)):
+                return value[key_val] if isinstance(key_val, int) else None
+            return None
+        return evaluate_subscript
+
+    raise ValueError(f"Unsupported expression: {ast.dump(node)}")
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression: str, variable: str = 'item') -> Callable[[Any], Any]:
+    """
+    Compile an expression into a reusable predicate.
+
+    Args:
+        expression: Expression text, e.g. ``item["value"] > 5``
+        variable: Name the expression uses for the value it is applied to
+
+    Returns:
+        Callable taking the value and returning the expression result
+
+    Raises:
+        SyntaxError: If the expression cannot be parsed
+        ValueError: If the expression uses anything outside the whitelist
+    """
+    tree = ast.parse(expression, mode='eval')
+    return _compile_node(tree.body, variable)
+
+
+def evaluate_expression(expression: str, value: Any, variable: str = 'item') -> Any:
+    """
+    Evaluate an expression against a single value.
+
+    Any compile or evaluation error is logged and treated as a falsy result.
+    """
+    try:
+        return compile_expression(expression, variable)(value)
+    except Exception as e:
+        logger.error(f"Expression evaluation error: {e}")
+        return False
+
+
+def filter_many(expression: str, items: Iterable[Any], variable: str = 'item') -> List[Any]:
+    """
+    Return the items for which the expression is truthy.
+
+    The expression is compiled once for the whole batch. Items whose
+    evaluation raises are excluded, as are all items if the expression
+    itself is invalid.
+    """
+    try:
+        predicate = compile_expression(expression, variable)
+    except Exception as e:
+        logger.error(f"Filter expression evaluation error: {e}")
+        return []
+
+    matched = []
+    failures = 0
+    for item in items:
+        try:
+            if predicate(item):
+                matched.append(item)
+        except Exception:
+            failures += 1
+
+    if failures:
+        logger.warning(f"Filter expression failed on {failures} item(s): {expression}")
+
+    return matched
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0003_alter_workflownode_node_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflow',
+            name='max_parallel_nodes',
+            field=models.PositiveIntegerField(default=1, help_text='Maximum nodes executed concurrently (1 = sequential execution)'),
+        ),
+    ]
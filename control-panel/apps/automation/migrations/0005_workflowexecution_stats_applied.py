@@ -0,0 +1,28 @@
+# Generated by Django 5.0.1 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0004_workflow_max_parallel_nodes'),
+    ]
+
+    operations = [
+        # Existing executions were already counted on their workflow
+        migrations.AddField(
+            model_name='workflowexecution',
+            name='stats_applied',
+            field=models.BooleanField(default=True),
+        ),
+        migrations.AlterField(
+            model_name='workflowexecution',
+            name='stats_applied',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='workflowexecution',
+            index=models.Index(condition=models.Q(('stats_applied', False)), fields=['workflow'], name='automation_exec_unfolded_idx'),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.0.1 on 2026-10-16 11:00
+
+import logging
+
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+
+def populate_next_run_at(apps, schema_editor):
+    from datetime import datetime
+    from django.utils import timezone
+
+    try:
+        from croniter import croniter
+    except ImportError:
+        logger.warning("croniter is not installed; next_run_at left empty for scheduled workflows")
+        return
+
+    Workflow = apps.get_model('automation', 'Workflow')
+    now = timezone.now()
+
+    scheduled = Workflow.objects.filter(status='active', trigger_type='schedule').exclude(schedule_cron='')
+    for workflow in scheduled:
+        try:
+            next_run_at = croniter(workflow.schedule_cron, now).get_next(datetime)
+        except (ValueError, KeyError):
+            continue
+        Workflow.objects.filter(pk=workflow.pk).update(next_run_at=next_run_at)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('automation', '0005_workflowexecution_stats_applied'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflow',
+            name='next_run_at',
+            field=models.DateTimeField(blank=True, db_index=True, help_text='Next scheduled fire time (maintained by the scheduler)', null=True),
+        ),
+        migrations.AddField(
+            model_name='workflow',
+            name='missed_run_policy',
+            field=models.CharField(choices=[('run_once', 'Run Once'), ('skip', 'Skip')], default='run_once', help_text='What to do with runs missed while the scheduler was down', max_length=20),
+        ),
+        migrations.RunPython(populate_next_run_at, migrations.RunPython.noop),
+    ]
@@ -31,6 +31,10 @@ class Workflow(BaseModel):
         WEBHOOK = 'webhook', 'Webhook'
         EVENT = 'event', 'Event-Based'
 
+    class MissedRunPolicy(models.TextChoices):
+        RUN_ONCE = 'run_once', 'Run Once'
+        SKIP = 'skip', 'Skip'
+
     name = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='workflows')
@@ -45,6 +49,18 @@ class Workflow(BaseModel):
         blank=True,
         help_text='Cron expression for scheduled workflows'
     )
+    next_run_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        help_text='Next scheduled fire time (maintained by the scheduler)'
+    )
+    missed_run_policy = models.CharField(
+        max_length=20,
+        choices=MissedRunPolicy.choices,
+        default=MissedRunPolicy.RUN_ONCE,
+        help_text='What to do with runs missed while the scheduler was down'
+    )
 
     # Visual canvas data
     canvas_data = models.JSONField(
@@ -63,6 +79,10 @@ class Workflow(BaseModel):
     timeout_seconds = models.IntegerField(default=300, help_text='Workflow timeout in seconds')
     retry_on_failure = models.BooleanField(default=True)
     max_retries = models.IntegerField(default=3)
+    max_parallel_nodes = models.PositiveIntegerField(
+        default=1,
+        help_text='Maximum nodes executed concurrently (1 = sequential execution)'
+    )
 
     class Meta:
         db_table = 'automation_workflows'
@@ -261,6 +281,9 @@ class WorkflowExecution(BaseModel):
         help_text='Execution log for each node'
     )
 
+    # Whether this outcome has been folded into the workflow statistics
+    stats_applied = models.BooleanField(default=False)
+
     class Meta:
         db_table = 'automation_workflow_executions'
         verbose_name = 'Workflow Execution'
@@ -269,6 +292,11 @@ class WorkflowExecution(BaseModel):
         indexes = [
             models.Index(fields=['workflow', '-started_at']),
             models.Index(fields=['status']),
+            models.Index(
+                fields=['workflow'],
+                name='automation_exec_unfolded_idx',
+                condition=models.Q(stats_applied=False)
+            ),
         ]
 
     def __str__(self) -> str:
@@ -11,6 +11,9 @@ import requests
 import logging
 from django.conf import settings
 
+from .expressions import evaluate_expression, filter_many
+from .streaming import RowStream, DEFAULT_STREAM_BATCH_SIZE, STREAM_SAMPLE_SIZE, fetch_batches
+
 logger = logging.getLogger(__name__)
 
 
@@ -315,10 +318,14 @@ class DatabaseQueryExecutor(BaseNodeExecutor):
         # Safe parameter substitution - never use string formatting for SQL
         final_query, final_params = self._prepare_query_with_params(query, input_data, params)
 
+        is_select = final_query.strip().upper().startswith('SELECT')
+        if config.get('stream') and is_select:
+            return self._execute_streaming(node, final_query, final_params)
+
         with connection.cursor() as cursor:
             cursor.execute(final_query, final_params)
 
-            if final_query.strip().upper().startswith('SELECT'):
+            if is_select:
                 columns = [col[0] for col in cursor.description]
                 results = [
                     dict(zip(columns, row))
@@ -327,6 +334,36 @@ class DatabaseQueryExecutor(BaseNodeExecutor):
                 return {'data': results, 'count': len(results)}
             else:
                 return {'affected_rows': cursor.rowcount}
+
+    def _execute_streaming(self, node, query: str, params: list) -> Dict[str, Any]:
+        """
+        Execute a SELECT and return its rows as a stream of batches.
+
+        Uses a server-side cursor where the backend supports one, so rows are
+        fetched ``batch_size`` at a time instead of all at once. The query runs
+        immediately so errors surface on this node.
+        """
+        from django.db import connection
+
+        config = node.config
+        batch_size = int(config.get('batch_size', DEFAULT_STREAM_BATCH_SIZE))
+        sample_size = int(config.get('sample_size', STREAM_SAMPLE_SIZE))
+
+        cursor = connection.chunked_cursor()
+        try:
+            cursor.execute(query, params)
+        except Exception:
+            cursor.close()
+            raise
+
+        return {
+            'data': RowStream(
+                fetch_batches(cursor, batch_size),
+                on_close=cursor.close,
+                sample_size=sample_size
+            ),
+            'streamed': True
+        }
     
     def _prepare_query_with_params(self, query: str, input_data: Dict[str, Any], params: list) -> tuple:
         """
@@ -467,6 +504,9 @@ class TransformExecutor(BaseNodeExecutor):
         config = node.config
         transform_type = config.get('transform_type', 'jmespath')
 
+        if isinstance(input_data.get('data'), RowStream):
+            return self._execute_streaming(config, transform_type, input_data)
+
         if transform_type == 'jmespath':
             import jmespath
             query = config.get('query')
@@ -486,6 +526,48 @@ class TransformExecutor(BaseNodeExecutor):
             return self._safe_execute_transform(code, input_data)
 
         return {'data': input_data}
+
+    def _execute_streaming(
+        self,
+        config: Dict[str, Any],
+        transform_type: str,
+        input_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Transform a row stream batch by batch.
+
+        Query transforms see the usual input with ``data`` set to the current
+        batch and must produce a list per batch; Python transforms are applied
+        to each row.
+        """
+        stream = input_data['data']
+
+        if transform_type in ('jmespath', 'jsonpath'):
+            query = config.get('query')
+            if transform_type == 'jmespath':
+                import jmespath
+                search = jmespath.compile(query).search
+            else:
+                from jsonpath_ng import parse
+                expr = parse(query)
+                search = lambda data: [match.value for match in expr.find(data)]
+
+            def transform_batch(batch):
+                result = search({**input_data, 'data': batch})
+                if result is None:
+                    return []
+                return result if isinstance(result, list) else [result]
+
+        elif transform_type == 'python':
+            code = config.get('code')
+
+            def transform_batch(batch):
+                return [self._safe_execute_transform(code, row)['data'] for row in batch]
+
+        else:
+            return {'data': stream, 'streamed': True}
+
+        return {'data': stream.map_batches(transform_batch), 'streamed': True}
     
     def _safe_execute_transform(self, code: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -626,13 +708,18 @@ class FilterExecutor(BaseNodeExecutor):
             expression = config.get('expression')
             data_list = input_data.get('data', [])
 
+            if isinstance(data_list, RowStream):
+                # Filter lazily, one batch at a time
+                filtered_stream = data_list.map_batches(
+                    lambda batch: filter_many(expression, batch, 'item')
+                )
+                return {'data': filtered_stream, 'streamed': True}
+
             if not isinstance(data_list, list):
                 data_list = [data_list]
 
-            filtered = [
-                item for item in data_list
-                if self._safe_eval_filter(expression, item)
-            ]
+            # Expression is validated and compiled once for the whole list
+            filtered = filter_many(expression, data_list, 'item')
 
             return {'data': filtered, 'count': len(filtered)}
 
@@ -641,109 +728,11 @@ class FilterExecutor(BaseNodeExecutor):
     def _safe_eval_filter(self, expression: str, item: Any) -> bool:
         """
         Safely evaluate a filter expression without using eval().
-        
-        Supports basic comparisons on item fields.
+
+        Supports basic comparisons on item fields. The expression is compiled
+        once and cached, see ``expressions.compile_expression``.
         """
-        import ast
-        import operator
-        
-        # Define safe operators
-        operators = {
-            ast.Eq: operator.eq,
-            ast.NotEq: operator.ne,
-            ast.Lt: operator.lt,
-            ast.LtE: operator.le,
-            ast.Gt: operator.gt,
-            ast.GtE: operator.ge,
-            ast.And: lambda a, b: a and b,
-            ast.Or: lambda a, b: a or b,
-            ast.Not: lambda a: not a,
-            ast.In: lambda a, b: a in b,
-            ast.NotIn: lambda a, b: a not in b,
-        }
-        
-        def _eval(node):
-            if isinstance(node, ast.BoolOp):
-                result = True
-                if isinstance(node.op, ast.And):
-                    for value in node.values:
-                        result = result and _eval(value)
-                        if not result:
-                            break
-                elif isinstance(node.op, ast.Or):
-                    for value in node.values:
-                        result = result or _eval(value)
-                        if result:
-                            break
-                return result
-                
-            elif isinstance(node, ast.UnaryOp):
-                if isinstance(node.op, ast.Not):
-                    return not _eval(node.operand)
-                else:
-                    raise ValueError(f"Unsupported unary operator: {node.op}")
-                    
-            elif isinstance(node, ast.Compare):
-                left = _eval(node.left)
-                for op, right in zip(node.ops, node.comparators):
-                    right_val = _eval(right)
-                    if not isinstance(op, (ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn)):
-                        raise ValueError(f"Unsupported comparison operator: {op}")
-                    if not operators[type(op)](left, right_val):
-                        return False
-                    left = right_val
-                return True
-                
-            elif isinstance(node, ast.Name):
-                # Allow access to 'item' variable
-                if node.id == 'item':
-                    return item
-                else:
-                    raise ValueError(f"Unknown variable: {node.id}")
-                    
-            elif isinstance(node, ast.Constant):
-                return node.value
-                
-            elif isinstance(node, ast.Attribute):
-                # Allow simple attribute access on item
-                if isinstance(node.value, ast.Name) and node.value.id == 'item':
-                    if isinstance(item, dict):
-                        return item.get(node.attr)
-                    else:
-                        return getattr(item, node.attr, None)
-                else:
-                    raise ValueError("Only attribute access on 'item' is allowed")
-                    
-            elif isinstance(node, ast.Subscript):
-                # Allow dictionary/list access on item
-                if isinstance(node.value, ast.Name) and node.value.id == 'item':
-                    item_val = item
-                    if isinstance(node.slice, ast.Constant):
-                        key = node.slice.value
-                    elif isinstance(node.slice, ast.Name):
-                        key = _eval(node.slice)
-                    else:
-                        raise ValueError("Only simple indexing is allowed")
-                    
-                    if isinstance(item_val, dict):
-                        return item_val.get(key)
-                    elif isinstance(item_val, (list, tuple)):
-                        return item_val[key] if isinstance(key, int) else None
-                    else:
-                        return None
-                else:
-                    raise ValueError("Only subscript access on 'item' is allowed")
-                    
-            else:
-                raise ValueError(f"Unsupported expression: {ast.dump(node)}")
-        
-        try:
-            # Parse the expression
-            tree = ast.parse(expression, mode='eval')
-            return _eval(tree.body)
-        except Exception as e:
-            logger.error(f"Filter expression evaluation error: {e}")
-            return False
+        return evaluate_expression(expression, item, 'item')
 
 
 # =============================================================================
@@ -931,17 +920,17 @@ class DatabaseWriteExecutor(BaseNodeExecutor):
             raise ValueError("Direct string formatting in SQL queries is not allowed for security reasons")
 
         with connection.cursor() as cursor:
-            if isinstance(data, list):
+            if isinstance(data, RowStream):
+                # Streamed input: one executemany per batch
+                inserted = 0
+                for batch in data.iter_batches():
+                    cursor.executemany(query, [self._row_params(item) for item in batch])
+                    inserted += len(batch)
+                return {'inserted': inserted}
+            elif isinstance(data, list):
                 # Batch insert with proper parameterization
                 for item in data:
-                    if isinstance(item, dict):
-                        # For dict items, extract values in the order they appear in the query
-                        # This is a simplified approach - in production, you'd want more robust handling
-                        values = list(item.values())
-                        cursor.execute(query, values)
-                    else:
-                        # For simple values, use as-is
-                        cursor.execute(query, [item] if not isinstance(item, (list, tuple)) else item)
+                    cursor.execute(query, self._row_params(item))
                 return {'inserted': len(data)}
             else:
                 if isinstance(data, dict):
@@ -953,6 +942,15 @@ class DatabaseWriteExecutor(BaseNodeExecutor):
                     cursor.execute(query, [data] if not isinstance(data, (list, tuple)) else data)
                 return {'affected_rows': cursor.rowcount}
 
+    def _row_params(self, item: Any) -> list:
+        """Convert a row into query parameters."""
+        if isinstance(item, dict):
+            # For dict items, extract values in the order they appear in the query
+            # This is a simplified approach - in production, you'd want more robust handling
+            return list(item.values())
+        # For simple values, use as-is
+        return [item] if not isinstance(item, (list, tuple)) else item
+
 
 # =============================================================================
 # AGENT INTEGRATION EXECUTORS
@@ -1275,6 +1273,8 @@ class NodeExecutorRegistry:
     """Registry for node executors."""
 
     def __init__(self):
+        # Bumped on every registration so compiled plans can rebind executors
+        self.generation = 0
         self._executors = {
             # Data Sources
             'google_docs': GoogleDocsExecutor(),
@@ -1339,6 +1339,7 @@ class NodeExecutorRegistry:
     def register_executor(self, node_type: str, executor: BaseNodeExecutor):
         """Register custom executor."""
         self._executors[node_type] = executor
+        self.generation += 1
 
 
 class PassthroughExecutor(BaseNodeExecutor):
@@ -0,0 +1,205 @@
+"""
+Compiled workflow execution plans.
+
+A plan captures everything the engine needs to run a workflow that only
+changes when the graph is edited:
+- Topological node order
+- Incoming-edge index and successor lists
+- Executor bindings per node
+- Pre-parsed connection transforms
+- Whether any node streams its output
+
+Plans are cached per process and invalidated through a version token kept
+in the shared cache, which is bumped whenever a node or connection of the
+workflow is saved or deleted (see ``signals.py``).
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+PLAN_VERSION_KEY = 'automation:workflow_plan_version:{workflow_id}'
+
+
+@dataclass
+class CompiledConnection:
+    """Incoming edge of a node with its transform parsed ahead of time."""
+
+    source_node_id: str
+    source_handle: str
+    condition: Dict[str, Any]
+    transform: Optional[Callable[[Any], Any]] = None
+
+
+@dataclass
+class WorkflowPlan:
+    """Immutable execution plan for one version of a workflow graph."""
+
+    workflow_id: int
+    version: str
+    registry_generation: int
+    compiled_at: float
+    order: Optional[List[Any]]
+    incoming: Dict[str, List[CompiledConnection]] = field(default_factory=dict)
+    successors: Dict[str, List[str]] = field(default_factory=dict)
+    executors: Dict[str, Any] = field(default_factory=dict)
+    has_streaming_nodes: bool = False
+
+    @property
+    def has_cycles(self) -> bool:
+        return self.order is None
+
+
+def topological_order(nodes: List[Any], connections: List[Any]) -> Tuple[Optional[List[Any]], List[str]]:
+    """
+    Order nodes with Kahn's algorithm.
+
+    Args:
+        nodes: WorkflowNode instances
+        connections: WorkflowConnection instances with source/target nodes loaded
+
+    Returns:
+        Tuple of (ordered nodes or None if the graph has cycles, ids of nodes left in cycles)
+    """
+    adjacency = {node.node_id: [] for node in nodes}
+    in_degree = {node.node_id: 0 for node in nodes}
+
+    for conn in connections:
+        adjacency[conn.source_node.node_id].append(conn.target_node.node_id)
+        in_degree[conn.target_node.node_id] += 1
+
+    queue = deque([node_id for node_id, degree in in_degree.items() if degree == 0])
+    result = []
+
+    while queue:
+        node_id = queue.popleft()
+        result.append(node_id)
+
+        for neighbor in adjacency[node_id]:
+            in_degree[neighbor] -= 1
+            if in_degree[neighbor] == 0:
+                queue.append(neighbor)
+
+    if len(result) != len(nodes):
+        return None, [node_id for node_id in in_degree if in_degree[node_id] > 0]
+
+    node_map = {node.node_id: node for node in nodes}
+    return [node_map[node_id] for node_id in result], []
+
+
+def compile_transform(transform: Dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Parse a connection transform into a reusable callable.
+
+    Supports the same transform types as the engine: ``jmespath``,
+    ``jsonpath`` and ``template``. Unknown types pass data through.
+    """
+    transform_type = transform.get('type')
+
+    if transform_type == 'jmespath':
+        import jmespath
+        return jmespath.compile(transform.get('query')).search
+
+    elif transform_type == 'jsonpath':
+        from jsonpath_ng import parse
+        expr = parse(transform.get('query'))
+
+        def apply_jsonpath(data: Any) -> Any:
+            matches = [match.value for match in expr.find(data)]
+            return matches[0] if len(matches) == 1 else matches
+
+        return apply_jsonpath
+
+    elif transform_type == 'template':
+        from string import Template
+        return Template(transform.get('template')).safe_substitute
+
+    return lambda data: data
+
+
+def compile_workflow_plan(workflow, registry, version: str) -> WorkflowPlan:
+    """
+    Build an execution plan from the current nodes and connections.
+
+    Args:
+        workflow: Workflow instance
+        registry: NodeExecutorRegistry used to bind executors
+        version: Plan version token the plan is valid for
+
+    Returns:
+        WorkflowPlan instance (``order`` is None if the graph has cycles)
+    """
+    import time
+
+    nodes = list(workflow.nodes.all())
+    connections = list(workflow.connections.select_related('source_node', 'target_node').all())
+
+    order, cycle_node_ids = topological_order(nodes, connections)
+    if order is None:
+        labels = [next((n.label for n in nodes if n.node_id == node_id), node_id)
+                  for node_id in cycle_node_ids]
+        logger.error(f"Workflow contains cycles involving nodes: {', '.join(labels)}")
+
+    incoming = {node.node_id: [] for node in nodes}
+    successors = {node.node_id: [] for node in nodes}
+    for conn in connections:
+        source_id = conn.source_node.node_id
+        target_id = conn.target_node.node_id
+        successors[source_id].append(target_id)
+        incoming[target_id].append(CompiledConnection(
+            source_node_id=source_id,
+            source_handle=conn.source_handle,
+            condition=conn.condition or {},
+            transform=compile_transform(conn.transform) if conn.transform else None
+        ))
+
+    return WorkflowPlan(
+        workflow_id=workflow.pk,
+        version=version,
+        registry_generation=registry.generation,
+        compiled_at=time.monotonic(),
+        order=order,
+        incoming=incoming,
+        successors=successors,
+        executors={node.node_id: registry.get_executor(node.node_type) for node in nodes},
+        has_streaming_nodes=any((node.config or {}).get('stream') for node in nodes)
+    )
+
+
+def get_plan_version(workflow_id: int) -> str:
+    """
+    Get the current plan version token for a workflow.
+
+    A fresh token is minted when none is cached, so an evicted token only
+    ever causes a recompile, never a stale plan.
+    """
+    key = PLAN_VERSION_KEY.format(workflow_id=workflow_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key) or ''
+    return version
+
+
+def invalidate_workflow_plan(workflow_id: int) -> None:
+    """
+    Invalidate cached plans for a workflow in every process.
+
+    The token is bumped immediately and again once the surrounding
+    transaction commits, so a plan compiled from pre-commit data by another
+    process cannot outlive the edit.
+    """
+    key = PLAN_VERSION_KEY.format(workflow_id=workflow_id)
+
+    def bump() -> None:
+        cache.set(key, uuid.uuid4().hex, None)
+
+    bump()
+    transaction.on_commit(bump)
@@ -0,0 +1,117 @@
+"""
+Cron scheduling for scheduled workflows.
+
+Every active scheduled workflow stores its next fire time in the indexed
+``Workflow.next_run_at`` column, so finding due workflows is one range
+query instead of evaluating every cron expression each minute.
+
+A run counts as missed when it is picked up more than
+``SCHEDULE_GRACE_SECONDS`` after its slot (e.g. beat was down). What
+happens then is decided by the workflow's ``missed_run_policy``:
+- ``run_once``: fire a single catch-up run for all missed slots
+- ``skip``: drop the missed slots and wait for the next one
+
+Either way ``next_run_at`` moves to the first slot after now, so a backlog
+never fires more than once.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import logging
+
+from django.utils import timezone
+
+from .models import Workflow
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_GRACE_SECONDS = 120
+DUE_BATCH_SIZE = 500
+
+
+def compute_next_run(schedule_cron: str, after: datetime) -> Optional[datetime]:
+    """
+    Get the first cron slot strictly after ``after``.
+
+    Returns:
+        Next fire time, or None if the expression is invalid or croniter
+        is not installed
+    """
+    try:
+        from croniter import croniter
+    except ImportError:
+        logger.warning("croniter is not installed; scheduled workflows will not run")
+        return None
+
+    try:
+        return croniter(schedule_cron, after).get_next(datetime)
+    except (ValueError, KeyError) as e:
+        logger.warning(f"Invalid cron expression '{schedule_cron}': {e}")
+        return None
+
+
+def is_schedulable(workflow: Workflow) -> bool:
+    """Whether the workflow should have a next run time."""
+    return (
+        workflow.status == Workflow.Status.ACTIVE
+        and workflow.trigger_type == Workflow.TriggerType.SCHEDULE
+        and bool(workflow.schedule_cron)
+    )
+
+
+def refresh_next_run(workflow: Workflow, now: Optional[datetime] = None) -> None:
+    """
+    Recompute ``next_run_at`` from the current schedule (does not save).
+    """
+    if is_schedulable(workflow):
+        workflow.next_run_at = compute_next_run(workflow.schedule_cron, now or timezone.now())
+    else:
+        workflow.next_run_at = None
+
+
+def dispatch_due_workflows(now: Optional[datetime] = None, batch_size: int = DUE_BATCH_SIZE) -> List[Dict[str, Any]]:
+    """
+    Claim due workflows, advance their schedules and return the runs to start.
+
+    Each workflow is claimed with a compare-and-set on ``next_run_at``, so
+    concurrent beat workers never fire the same slot twice.
+
+    Returns:
+        List of dicts with workflow_id, name, scheduled_for and missed
+    """
+    now = now or timezone.now()
+    runs = []
+
+    due = (
+        Workflow.objects.filter(
+            next_run_at__lte=now,
+            status=Workflow.Status.ACTIVE,
+            trigger_type=Workflow.TriggerType.SCHEDULE
+        )
+        .order_by('next_run_at')
+        .values('id', 'name', 'schedule_cron', 'next_run_at', 'missed_run_policy')[:batch_size]
+    )
+
+    for row in due:
+        scheduled_for = row['next_run_at']
+        next_run_at = compute_next_run(row['schedule_cron'], now)
+
+        claimed = Workflow.objects.filter(
+            pk=row['id'], next_run_at=scheduled_for
+        ).update(next_run_at=next_run_at)
+        if not claimed:
+            continue
+
+        missed = (now - scheduled_for).total_seconds() > SCHEDULE_GRACE_SECONDS
+        if missed and row['missed_run_policy'] == Workflow.MissedRunPolicy.SKIP:
+            logger.info(f"Skipping missed run of {row['name']} scheduled for {scheduled_for.isoformat()}")
+            continue
+
+        runs.append({
+            'workflow_id': row['id'],
+            'name': row['name'],
+            'scheduled_for': scheduled_for,
+            'missed': missed,
+        })
+
+    return runs
@@ -0,0 +1,51 @@
+"""
+Signal handlers for the automation app.
+
+- Invalidates compiled workflow plans whenever the workflow graph changes
+- Keeps ``Workflow.next_run_at`` in step with the schedule configuration
+"""
+
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Workflow, WorkflowNode, WorkflowConnection
+from .plan import invalidate_workflow_plan
+from .scheduling import is_schedulable, refresh_next_run
+
+
+@receiver([post_save, post_delete], sender=WorkflowNode)
+@receiver([post_save, post_delete], sender=WorkflowConnection)
+def invalidate_plan_on_graph_change(sender, instance, **kwargs):
+    """Drop cached execution plans when a node or connection changes."""
+    invalidate_workflow_plan(instance.workflow_id)
+
+
+@receiver(pre_save, sender=Workflow)
+def refresh_next_run_on_schedule_change(sender, instance, update_fields=None, **kwargs):
+    """Recompute the next fire time when the schedule is enabled or edited."""
+    schedule_fields = {'status', 'trigger_type', 'schedule_cron'}
+    if update_fields is not None and not schedule_fields & set(update_fields):
+        return
+
+    previous_next_run_at = instance.next_run_at
+    if not is_schedulable(instance):
+        instance.next_run_at = None
+    elif instance.pk:
+        # The scheduler advances next_run_at with queryset updates, so the
+        # stored value wins over a possibly stale in-memory one
+        stored = (
+            Workflow.objects.filter(pk=instance.pk)
+            .values('schedule_cron', 'next_run_at')
+            .first()
+        )
+        if stored and stored['next_run_at'] and stored['schedule_cron'] == instance.schedule_cron:
+            instance.next_run_at = stored['next_run_at']
+        else:
+            refresh_next_run(instance)
+    elif instance.next_run_at is None:
+        refresh_next_run(instance)
+
+    # A save limited to update_fields would not write next_run_at
+    if update_fields is not None and 'next_run_at' not in update_fields \
+            and instance.pk and instance.next_run_at != previous_next_run_at:
+        Workflow.objects.filter(pk=instance.pk).update(next_run_at=instance.next_run_at)
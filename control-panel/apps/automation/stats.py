@@ -0,0 +1,144 @@
+"""
+Aggregated workflow execution statistics.
+
+Executions are not counted on the Workflow row when they finish. Each
+finished WorkflowExecution is left with ``stats_applied=False`` and a
+periodic task folds all pending executions into the Workflow counters with
+one UPDATE per workflow. Readers that need up-to-the-second numbers combine
+the folded counters with the still-pending executions.
+
+The average duration is the mean over successful executions.
+"""
+
+from typing import Any, Dict
+import logging
+
+from django.db import transaction
+from django.db.models import Count, Sum, Max, Q, F, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from .models import Workflow, WorkflowExecution
+
+logger = logging.getLogger(__name__)
+
+FOLD_BATCH_SIZE = 5000
+
+FINISHED_STATUSES = [WorkflowExecution.Status.SUCCESS, WorkflowExecution.Status.FAILED]
+
+
+def _pending_executions():
+    return WorkflowExecution.objects.filter(stats_applied=False, status__in=FINISHED_STATUSES)
+
+
+def _aggregate():
+    success = Q(status=WorkflowExecution.Status.SUCCESS)
+    return dict(
+        total=Count('id'),
+        successful=Count('id', filter=success),
+        failed=Count('id', filter=Q(status=WorkflowExecution.Status.FAILED)),
+        duration_sum=Sum('duration_ms', filter=success),
+        last_success=Max('completed_at', filter=success),
+    )
+
+
+def fold_pending_statistics(batch_size: int = FOLD_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Fold a batch of pending execution outcomes into Workflow counters.
+
+    Rows are claimed with ``SKIP LOCKED`` where supported, so concurrent
+    folds never double count.
+
+    Returns:
+        Dict with the number of executions and workflows folded
+    """
+    with transaction.atomic():
+        pending_ids = list(
+            _pending_executions()
+            .select_for_update(skip_locked=True)
+            .order_by('id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not pending_ids:
+            return {'executions': 0, 'workflows': 0}
+
+        per_workflow = (
+            WorkflowExecution.objects.filter(id__in=pending_ids)
+            .order_by()
+            .values('workflow_id')
+            .annotate(**_aggregate())
+        )
+
+        per_workflow = list(per_workflow)
+
+        # Lock the counters so the running mean is computed from values no
+        # concurrent writer can change before the UPDATE below
+        folded = {
+            current['pk']: current
+            for current in Workflow.objects.select_for_update()
+            .filter(pk__in=[row['workflow_id'] for row in per_workflow])
+            .order_by('pk')
+            .values('pk', 'successful_executions', 'average_duration_ms')
+        }
+
+        workflows = 0
+        for row in per_workflow:
+            updates = {
+                'total_executions': F('total_executions') + row['total'],
+                'successful_executions': F('successful_executions') + row['successful'],
+                'failed_executions': F('failed_executions') + row['failed'],
+            }
+            current = folded.get(row['workflow_id'])
+            if row['successful'] and current is not None:
+                # Running mean over successful executions
+                successful = current['successful_executions']
+                updates['average_duration_ms'] = int(
+                    (current['average_duration_ms'] * successful + (row['duration_sum'] or 0))
+                    / (successful + row['successful'])
+                )
+            if row['last_success']:
+                last_success = Value(row['last_success'])
+                updates['last_executed_at'] = Greatest(
+                    Coalesce(F('last_executed_at'), last_success), last_success
+                )
+
+            Workflow.objects.filter(pk=row['workflow_id']).update(**updates)
+            workflows += 1
+
+        WorkflowExecution.objects.filter(id__in=pending_ids).update(stats_applied=True)
+
+    logger.debug(f"Folded {len(pending_ids)} executions into {workflows} workflows")
+    return {'executions': len(pending_ids), 'workflows': workflows}
+
+
+def get_workflow_statistics(workflow: Workflow) -> Dict[str, Any]:
+    """
+    Get near-real-time statistics for a workflow.
+
+    Combines the folded counters on the Workflow row with executions that
+    have finished but not been folded yet (a single aggregate query).
+    """
+    pending = _pending_executions().filter(workflow=workflow).aggregate(**_aggregate())
+
+    folded_successful = workflow.successful_executions
+    successful = folded_successful + pending['successful']
+    total = workflow.total_executions + pending['total']
+
+    average_duration_ms = workflow.average_duration_ms
+    if pending['successful']:
+        average_duration_ms = int(
+            (workflow.average_duration_ms * folded_successful + (pending['duration_sum'] or 0))
+            / successful
+        )
+
+    last_executed_at = workflow.last_executed_at
+    if pending['last_success'] and (last_executed_at is None or pending['last_success'] > last_executed_at):
+        last_executed_at = pending['last_success']
+
+    return {
+        'total_executions': total,
+        'successful_executions': successful,
+        'failed_executions': workflow.failed_executions + pending['failed'],
+        'success_rate': (successful / total * 100) if total > 0 else 0,
+        'average_duration_ms': average_duration_ms,
+        'last_executed_at': last_executed_at,
+    }
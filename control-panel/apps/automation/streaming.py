@@ -0,0 +1,181 @@
+"""
+Streaming data flow between workflow nodes.
+
+Source nodes configured with ``stream: true`` return a RowStream instead of
+a materialised list. Downstream nodes that understand streams (Filter,
+Transform, Database Write) wrap or drain it batch by batch, so at most one
+batch per stage is held in memory. When the execution is recorded, every
+stream is reduced to a row count plus a bounded sample.
+
+Streams are single-pass: a stream can be consumed by exactly one
+downstream node.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STREAM_BATCH_SIZE = 1000
+STREAM_SAMPLE_SIZE = 20
+
+
+class RowStream:
+    """
+    Single-pass stream of rows produced in batches.
+
+    Tracks how many rows flowed through it and keeps the first rows as a
+    sample, so a summary can be recorded after downstream nodes consumed it.
+    """
+
+    def __init__(
+        self,
+        batches: Iterable[List[Any]],
+        on_close: Optional[Callable[[], None]] = None,
+        sample_size: int = STREAM_SAMPLE_SIZE
+    ):
+        self._batches = batches
+        self._on_close = on_close
+        self._consumed = False
+        self._closed = False
+        self.sample_size = sample_size
+        self.row_count = 0
+        self.sample = []
+
+    @property
+    def consumed(self) -> bool:
+        return self._consumed
+
+    def iter_batches(self) -> Iterator[List[Any]]:
+        """
+        Iterate over non-empty batches of rows.
+
+        Raises:
+            ValueError: If the stream has already been consumed
+        """
+        if self._consumed:
+            raise ValueError("Row stream has already been consumed by another node")
+        self._consumed = True
+        return self._generate_batches()
+
+    def _generate_batches(self) -> Iterator[List[Any]]:
+        try:
+            for batch in self._batches:
+                if not isinstance(batch, list):
+                    batch = list(batch)
+                if not batch:
+                    continue
+
+                self.row_count += len(batch)
+                if len(self.sample) < self.sample_size:
+                    self.sample.extend(batch[:self.sample_size - len(self.sample)])
+
+                yield batch
+        finally:
+            self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        for batch in self.iter_batches():
+            yield from batch
+
+    def map_batches(self, func: Callable[[List[Any]], Iterable[Any]]) -> 'RowStream':
+        """
+        Return a new stream applying ``func`` to each batch of this one.
+
+        This stream is consumed by the returned one.
+        """
+        return RowStream(
+            (func(batch) for batch in self.iter_batches()),
+            on_close=self.close,
+            sample_size=self.sample_size
+        )
+
+    def drain(self) -> None:
+        """Consume the stream if nobody has, so its counters are complete."""
+        if not self._consumed:
+            for _ in self.iter_batches():
+                pass
+
+    def summarize(self) -> dict:
+        """
+        Summarise the stream for storage, draining it if nobody consumed it.
+        """
+        self.drain()
+
+        return {
+            'streamed': True,
+            'row_count': self.row_count,
+            'sample': self.sample,
+        }
+
+    def close(self) -> None:
+        """Release the underlying source (e.g. a server-side cursor)."""
+        if self._closed:
+            return
+        self._closed = True
+
+        close = getattr(self._batches, 'close', None)
+        if close is not None:
+            close()
+        if self._on_close is not None:
+            self._on_close()
+
+
+def find_streams(value: Any) -> Iterator[RowStream]:
+    """
+    Yield every RowStream inside a node output.
+    """
+    if isinstance(value, RowStream):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from find_streams(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from find_streams(item)
+
+
+def summarize_streams(value: Any) -> Any:
+    """
+    Replace every RowStream inside a node output with its summary.
+
+    Unconsumed streams are drained first, which also pulls rows through the
+    upstream streams they wrap, so upstream counts are complete regardless
+    of the order outputs are summarised in.
+    """
+    for stream in list(find_streams(value)):
+        stream.drain()
+
+    def replace(item: Any) -> Any:
+        if isinstance(item, RowStream):
+            return item.summarize()
+        if isinstance(item, dict):
+            return {key: replace(child) for key, child in item.items()}
+        if isinstance(item, list):
+            return [replace(child) for child in item]
+        return item
+
+    return replace(value)
+
+
+def close_streams(value: Any) -> None:
+    """
+    Close every RowStream inside a node output without draining it.
+    """
+    for stream in find_streams(value):
+        stream.close()
+
+
+def fetch_batches(cursor, batch_size: int) -> Iterator[List[dict]]:
+    """
+    Yield rows from an executed cursor as lists of dicts.
+
+    The cursor is not closed here; pass ``cursor.close`` as the stream's
+    ``on_close`` so it is released even if iteration never starts.
+    """
+    columns = [col[0] for col in cursor.description]
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        yield [dict(zip(columns, row)) for row in rows]
@@ -10,7 +10,7 @@ import logging
 import traceback
 
 from .models import Workflow, WorkflowExecution
-from .engine import WorkflowExecutionEngine
+from .engine import workflow_engine
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +48,8 @@ def execute_workflow_async(
             except User.DoesNotExist:
                 logger.warning(f"User with ID {triggered_by_id} not found")
         
-        # Execute workflow
-        engine = WorkflowExecutionEngine()
-        execution = engine.execute_workflow(
+        # Execute workflow on the shared engine so compiled plans are reused
+        execution = workflow_engine.execute_workflow(
             workflow=workflow,
             input_data=input_data or {},
             triggered_by=triggered_by,
@@ -97,38 +96,34 @@ def execute_scheduled_workflows():
     This task should be scheduled to run periodically (e.g., every minute).
     """
     from django.utils import timezone
-    from croniter import croniter
+    from .scheduling import dispatch_due_workflows
     
     now = timezone.now()
     executed_count = 0
     
-    # Get all active scheduled workflows
-    scheduled_workflows = Workflow.objects.filter(
-        status=Workflow.Status.ACTIVE,
-        trigger_type=Workflow.TriggerType.SCHEDULE,
-        schedule_cron__isnull=False
-    )
-    
-    for workflow in scheduled_workflows:
+    # Due workflows come from one indexed range query on next_run_at;
+    # their schedules are advanced before the runs are queued
+    for run in dispatch_due_workflows(now):
         try:
-            # Check if workflow should run now
-            cron = croniter(workflow.schedule_cron, now)
-            next_run = cron.get_next(timezone.datetime)
-            
-            # If the next run time is very close to now (within 1 minute), execute it
-            if 0 <= (next_run - now).total_seconds() <= 60:
-                logger.info(f"Executing scheduled workflow: {workflow.name}")
-                
-                # Execute asynchronously
-                execute_workflow_async.delay(
-                    workflow_id=workflow.id,
-                    trigger_type='schedule'
+            if run['missed']:
+                logger.info(
+                    f"Executing missed run of scheduled workflow {run['name']} "
+                    f"(scheduled for {run['scheduled_for'].isoformat()})"
                 )
-                
-                executed_count += 1
-                
+            else:
+                logger.info(f"Executing scheduled workflow: {run['name']}")
+            
+            # Execute asynchronously
+            execute_workflow_async.delay(
+                workflow_id=run['workflow_id'],
+                input_data={'scheduled_for': run['scheduled_for'].isoformat()},
+                trigger_type='schedule'
+            )
+            
+            executed_count += 1
+            
         except Exception as e:
-            logger.error(f"Error checking scheduled workflow {workflow.name}: {e}")
+            logger.error(f"Error dispatching scheduled workflow {run['name']}: {e}")
     
     return {
         'executed_count': executed_count,
@@ -136,6 +131,32 @@ def execute_scheduled_workflows():
     }
 
 
+@shared_task
+def fold_workflow_statistics():
+    """
+    Fold finished execution outcomes into workflow statistics.
+
+    This task should be scheduled to run periodically (e.g., every minute).
+    """
+    from .stats import fold_pending_statistics, FOLD_BATCH_SIZE
+
+    folded_executions = 0
+    folded_workflows = 0
+
+    # Drain the backlog in batches so a burst does not hold one long transaction
+    while True:
+        result = fold_pending_statistics()
+        folded_executions += result['executions']
+        folded_workflows += result['workflows']
+        if result['executions'] < FOLD_BATCH_SIZE:
+            break
+
+    return {
+        'folded_executions': folded_executions,
+        'folded_workflows': folded_workflows
+    }
+
+
 @shared_task(bind=True, max_retries=2)
 def retry_failed_execution(self, execution_id: int) -> Dict[str, Any]:
     """
@@ -178,8 +199,7 @@ def retry_failed_execution(self, execution_id: int) -> Dict[str, Any]:
             }
         
         # Execute the workflow again with the same input
-        engine = WorkflowExecutionEngine()
-        new_execution = engine.execute_workflow(
+        new_execution = workflow_engine.execute_workflow(
             workflow=execution.workflow,
             input_data=execution.input_data,
             triggered_by=execution.triggered_by,
@@ -220,10 +240,12 @@ def cleanup_old_executions():
     """
     Clean up old workflow execution logs.
     
-    Keeps only the last 1000 executions per workflow.
+    Keeps only the last 1000 executions per workflow. Finished executions
+    not yet folded into the workflow statistics are kept until they are.
     """
     from django.utils import timezone
     from datetime import timedelta
+    from .stats import FINISHED_STATUSES
     
     cutoff_date = timezone.now() - timedelta(days=30)
     cleaned_count = 0
@@ -236,6 +258,9 @@ def cleanup_old_executions():
         old_executions = WorkflowExecution.objects.filter(
             workflow=workflow,
             started_at__lt=cutoff_date
+        ).exclude(
+            stats_applied=False,
+            status__in=FINISHED_STATUSES
         )
         
         # Keep the last 1000 executions even if they're old
@@ -0,0 +1,176 @@
+"""
+Tests for the workflow execution engine scheduling and plan caching.
+"""
+
+import threading
+import time
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+from apps.automation.models import Workflow, WorkflowNode, WorkflowConnection, WorkflowExecution
+from apps.automation.engine import WorkflowExecutionEngine
+from apps.automation.node_executors import BaseNodeExecutor
+
+
+class SlowExecutor(BaseNodeExecutor):
+    """Executor that sleeps and records how many nodes run at once."""
+
+    def __init__(self, delay=0.2, fail_on=None):
+        self.delay = delay
+        self.fail_on = fail_on or set()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def execute(self, node, input_data, execution):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if node.node_id in self.fail_on:
+                raise RuntimeError(f"{node.node_id} exploded")
+            return {node.node_id: True, 'seen': sorted(k for k in input_data if k != 'seen')}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class ParallelExecutionTest(TestCase):
+    """Test level-parallel execution of independent nodes."""
+
+    def setUp(self):
+        """Set up a fan-out/fan-in workflow: five sources feeding one sink."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+
+        self.workflow = Workflow.objects.create(
+            name='Fan-in Workflow',
+            owner=self.user,
+            retry_on_failure=False,
+            max_parallel_nodes=3
+        )
+
+        self.sink = WorkflowNode.objects.create(
+            workflow=self.workflow,
+            node_id='sink',
+            node_type='slow',
+            label='Sink'
+        )
+        for index in range(5):
+            source = WorkflowNode.objects.create(
+                workflow=self.workflow,
+                node_id=f'source_{index}',
+                node_type='slow',
+                label=f'Source {index}'
+            )
+            WorkflowConnection.objects.create(
+                workflow=self.workflow,
+                source_node=source,
+                target_node=self.sink
+            )
+
+        self.executor = SlowExecutor()
+        self.engine = WorkflowExecutionEngine()
+        self.engine.node_executor_registry.register_executor('slow', self.executor)
+
+    def test_independent_nodes_run_concurrently_within_cap(self):
+        """Sources run in parallel but never above max_parallel_nodes."""
+        execution = self.engine.execute_workflow(self.workflow)
+
+        self.assertEqual(execution.status, WorkflowExecution.Status.SUCCESS)
+        self.assertEqual(self.executor.peak, 3)
+        self.assertEqual(
+            execution.output_data['sink']['seen'],
+            [f'source_{index}' for index in range(5)]
+        )
+
+    def test_node_logs_follow_topological_order(self):
+        """Logs are reported in execution order regardless of completion order."""
+        execution = self.engine.execute_workflow(self.workflow)
+
+        sequential_order = [
+            node.node_id for node in self.engine._get_execution_order(self.workflow)
+        ]
+        self.assertEqual([log['node_id'] for log in execution.node_logs], sequential_order)
+        self.assertEqual(execution.node_logs[-1]['node_id'], 'sink')
+
+    def test_sequential_when_cap_is_one(self):
+        """A cap of one keeps the original one-node-at-a-time behaviour."""
+        self.workflow.max_parallel_nodes = 1
+        self.workflow.save()
+
+        execution = self.engine.execute_workflow(self.workflow)
+
+        self.assertEqual(execution.status, WorkflowExecution.Status.SUCCESS)
+        self.assertEqual(self.executor.peak, 1)
+
+    def test_failure_stops_dispatch_of_dependents(self):
+        """A fatal node failure fails the run and its dependents never start."""
+        self.executor.fail_on = {'source_2'}
+
+        execution = self.engine.execute_workflow(self.workflow)
+
+        self.assertEqual(execution.status, WorkflowExecution.Status.FAILED)
+        self.assertIn('source_2 exploded', execution.error_message)
+        self.assertEqual(self.executor.active, 0)
+
+
+class WorkflowPlanCacheTest(TestCase):
+    """Test compiled plan reuse and invalidation."""
+
+    def setUp(self):
+        """Set up a two-node workflow."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.workflow = Workflow.objects.create(name='Plan Workflow', owner=self.user)
+        self.source = WorkflowNode.objects.create(
+            workflow=self.workflow, node_id='a', node_type='slow', label='A'
+        )
+        self.target = WorkflowNode.objects.create(
+            workflow=self.workflow, node_id='b', node_type='slow', label='B'
+        )
+        WorkflowConnection.objects.create(
+            workflow=self.workflow, source_node=self.source, target_node=self.target
+        )
+        self.engine = WorkflowExecutionEngine()
+        self.engine.node_executor_registry.register_executor('slow', SlowExecutor(delay=0))
+
+    def test_plan_is_reused_without_queries(self):
+        """A second lookup serves the cached plan without touching the DB."""
+        plan = self.engine.get_workflow_plan(self.workflow)
+
+        with self.assertNumQueries(0):
+            self.assertIs(self.engine.get_workflow_plan(self.workflow), plan)
+
+        self.assertEqual([node.node_id for node in plan.order], ['a', 'b'])
+        self.assertEqual(plan.incoming['b'][0].source_node_id, 'a')
+
+    def test_plan_invalidated_when_graph_changes(self):
+        """Adding a node produces a fresh plan."""
+        plan = self.engine.get_workflow_plan(self.workflow)
+
+        WorkflowNode.objects.create(
+            workflow=self.workflow, node_id='c', node_type='slow', label='C'
+        )
+
+        new_plan = self.engine.get_workflow_plan(self.workflow)
+        self.assertIsNot(new_plan, plan)
+        self.assertEqual(len(new_plan.order), 3)
+
+    def test_plan_rebinds_executors_after_registration(self):
+        """Registering an executor invalidates bound executors."""
+        plan = self.engine.get_workflow_plan(self.workflow)
+        replacement = SlowExecutor(delay=0)
+
+        self.engine.node_executor_registry.register_executor('slow', replacement)
+
+        self.assertIs(self.engine.get_workflow_plan(self.workflow).executors['a'], replacement)
+        self.assertIsNot(plan.executors['a'], replacement)
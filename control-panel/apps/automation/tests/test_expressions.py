@@ -0,0 +1,71 @@
+"""
+Tests for the safe expression compiler.
+"""
+
+from django.test import SimpleTestCase
+
+from apps.automation.expressions import compile_expression, evaluate_expression, filter_many
+
+
+class CompileExpressionTest(SimpleTestCase):
+    """Test expression compilation, safety and caching."""
+
+    def test_rejects_expressions_outside_whitelist(self):
+        """Calls, imports and foreign names are rejected at compile time."""
+        dangerous_expressions = [
+            '__import__("os").system("ls")',
+            'eval("1")',
+            'open("/etc/passwd").read()',
+            'other["value"] > 1',
+            'item["value"] + 1 > 2',
+        ]
+
+        for expr in dangerous_expressions:
+            with self.assertRaises(ValueError):
+                compile_expression(expr, 'item')
+
+    def test_compiled_expression_is_cached(self):
+        """The same expression text compiles to the same predicate."""
+        first = compile_expression('item["value"] > 5', 'item')
+        second = compile_expression('item["value"] > 5', 'item')
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, compile_expression('item["value"] > 6', 'item'))
+
+    def test_comparisons_and_boolean_operators(self):
+        """Comparison chains and boolean operators evaluate like Python."""
+        item = {'value': 7, 'tags': ['a'], 'name': 'x'}
+
+        self.assertTrue(evaluate_expression('1 < item["value"] < 10', item))
+        self.assertFalse(evaluate_expression('1 < item["value"] < 5', item))
+        self.assertTrue(evaluate_expression('"a" in item["tags"] and item.name == "x"', item))
+        self.assertFalse(evaluate_expression('item["value"] > 10 or item.name == "y"', item))
+        self.assertTrue(evaluate_expression('item["value"] > 10 or item.name == "x"', item))
+        self.assertTrue(evaluate_expression('not item["missing"]', item))
+
+    def test_evaluation_errors_are_falsy(self):
+        """Runtime errors and invalid syntax evaluate to False."""
+        self.assertFalse(evaluate_expression('item["value"] > 5', {'value': 'text'}))
+        self.assertFalse(evaluate_expression('item[', {}))
+
+
+class FilterManyTest(SimpleTestCase):
+    """Test batched filtering."""
+
+    def test_filters_items(self):
+        """Only matching items are returned, in order."""
+        items = [{'value': value} for value in range(10)]
+
+        result = filter_many('item["value"] >= 7', items)
+
+        self.assertEqual(result, [{'value': 7}, {'value': 8}, {'value': 9}])
+
+    def test_skips_items_that_fail(self):
+        """Items whose evaluation raises are excluded."""
+        items = [{'value': 3}, {'value': 'text'}, {'value': 9}]
+
+        self.assertEqual(filter_many('item["value"] > 5', items), [{'value': 9}])
+
+    def test_invalid_expression_matches_nothing(self):
+        """An invalid expression filters out everything."""
+        self.assertEqual(filter_many('open("x")', [{'value': 1}]), [])
@@ -0,0 +1,106 @@
+"""
+Tests for the indexed cron scheduler.
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from apps.automation.models import Workflow
+from apps.automation.scheduling import dispatch_due_workflows
+
+
+class NextRunMaintenanceTest(TestCase):
+    """Test that next_run_at follows the schedule configuration."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.workflow = Workflow.objects.create(
+            name='Scheduled Workflow',
+            owner=self.user,
+            status=Workflow.Status.ACTIVE,
+            trigger_type=Workflow.TriggerType.SCHEDULE,
+            schedule_cron='*/5 * * * *'
+        )
+
+    def test_next_run_set_on_create(self):
+        """Active scheduled workflows get their next slot on save."""
+        self.assertIsNotNone(self.workflow.next_run_at)
+        self.assertGreater(self.workflow.next_run_at, timezone.now())
+        self.assertEqual(self.workflow.next_run_at.minute % 5, 0)
+
+    def test_pausing_clears_next_run(self):
+        """Paused workflows drop out of the index."""
+        self.workflow.status = Workflow.Status.PAUSED
+        self.workflow.save(update_fields=['status'])
+
+        self.workflow.refresh_from_db()
+        self.assertIsNone(self.workflow.next_run_at)
+
+    def test_stale_instance_does_not_rewind_schedule(self):
+        """Saving an old copy keeps the scheduler's next_run_at."""
+        stale = Workflow.objects.get(pk=self.workflow.pk)
+        advanced = self.workflow.next_run_at + timedelta(minutes=5)
+        Workflow.objects.filter(pk=self.workflow.pk).update(next_run_at=advanced)
+
+        stale.name = 'Renamed'
+        stale.save()
+
+        self.workflow.refresh_from_db()
+        self.assertEqual(self.workflow.next_run_at, advanced)
+
+
+class DispatchDueWorkflowsTest(TestCase):
+    """Test claiming due workflows and missed-run handling."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.now = timezone.now()
+
+    def _scheduled(self, next_run_at, policy=Workflow.MissedRunPolicy.RUN_ONCE):
+        workflow = Workflow.objects.create(
+            name='Scheduled Workflow',
+            owner=self.user,
+            status=Workflow.Status.ACTIVE,
+            trigger_type=Workflow.TriggerType.SCHEDULE,
+            schedule_cron='* * * * *',
+            missed_run_policy=policy
+        )
+        Workflow.objects.filter(pk=workflow.pk).update(next_run_at=next_run_at)
+        return workflow
+
+    def test_due_workflow_fires_once(self):
+        """A due slot is claimed once and the schedule moves past now."""
+        workflow = self._scheduled(self.now - timedelta(seconds=10))
+        self._scheduled(self.now + timedelta(minutes=1))
+
+        runs = dispatch_due_workflows(self.now)
+
+        self.assertEqual([run['workflow_id'] for run in runs], [workflow.pk])
+        self.assertFalse(runs[0]['missed'])
+        self.assertEqual(dispatch_due_workflows(self.now), [])
+
+        workflow.refresh_from_db()
+        self.assertGreater(workflow.next_run_at, self.now)
+
+    def test_missed_runs_fire_single_catch_up(self):
+        """A backlog of missed slots produces one catch-up run."""
+        self._scheduled(self.now - timedelta(hours=3))
+
+        runs = dispatch_due_workflows(self.now)
+
+        self.assertEqual(len(runs), 1)
+        self.assertTrue(runs[0]['missed'])
+
+    def test_missed_runs_can_be_skipped(self):
+        """The skip policy advances the schedule without running."""
+        workflow = self._scheduled(self.now - timedelta(hours=3), Workflow.MissedRunPolicy.SKIP)
+
+        self.assertEqual(dispatch_due_workflows(self.now), [])
+
+        workflow.refresh_from_db()
+        self.assertGreater(workflow.next_run_at, self.now)
@@ -0,0 +1,86 @@
+"""
+Tests for batched workflow statistics.
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from apps.automation.models import Workflow, WorkflowExecution
+from apps.automation.engine import WorkflowExecutionEngine
+from apps.automation.stats import fold_pending_statistics, get_workflow_statistics
+from apps.automation.tasks import cleanup_old_executions, fold_workflow_statistics
+
+
+class WorkflowStatisticsTest(TestCase):
+    """Test folding execution outcomes into workflow counters."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.workflow = Workflow.objects.create(name='Stats Workflow', owner=self.user)
+
+    def _execution(self, status, duration_ms, completed_at=None):
+        return WorkflowExecution.objects.create(
+            workflow=self.workflow,
+            status=status,
+            duration_ms=duration_ms,
+            completed_at=completed_at or timezone.now()
+        )
+
+    def test_execution_does_not_touch_workflow_row(self):
+        """Finishing an execution leaves the folded counters alone."""
+        execution = WorkflowExecutionEngine().execute_workflow(self.workflow)
+
+        self.workflow.refresh_from_db()
+        self.assertEqual(self.workflow.total_executions, 0)
+        self.assertFalse(execution.stats_applied)
+        self.assertEqual(get_workflow_statistics(self.workflow)['total_executions'], 1)
+
+    def test_fold_updates_counters_once(self):
+        """Pending executions are folded in exactly once."""
+        latest = timezone.now()
+        self._execution(WorkflowExecution.Status.SUCCESS, 100, latest - timedelta(minutes=1))
+        self._execution(WorkflowExecution.Status.SUCCESS, 300, latest)
+        self._execution(WorkflowExecution.Status.FAILED, 50)
+        self._execution(WorkflowExecution.Status.RUNNING, 0)
+
+        self.assertEqual(fold_pending_statistics(), {'executions': 3, 'workflows': 1})
+        self.assertEqual(fold_pending_statistics(), {'executions': 0, 'workflows': 0})
+
+        self.workflow.refresh_from_db()
+        self.assertEqual(self.workflow.total_executions, 3)
+        self.assertEqual(self.workflow.successful_executions, 2)
+        self.assertEqual(self.workflow.failed_executions, 1)
+        self.assertEqual(self.workflow.average_duration_ms, 200)
+        self.assertEqual(self.workflow.last_executed_at, latest)
+
+    def test_live_statistics_combine_folded_and_pending(self):
+        """Readers see folded counters plus executions not folded yet."""
+        self._execution(WorkflowExecution.Status.SUCCESS, 100)
+        fold_workflow_statistics()
+        self._execution(WorkflowExecution.Status.SUCCESS, 300)
+        self._execution(WorkflowExecution.Status.FAILED, 10)
+
+        self.workflow.refresh_from_db()
+        stats = get_workflow_statistics(self.workflow)
+
+        self.assertEqual(stats['total_executions'], 3)
+        self.assertEqual(stats['successful_executions'], 2)
+        self.assertEqual(stats['failed_executions'], 1)
+        self.assertEqual(stats['average_duration_ms'], 200)
+        self.assertAlmostEqual(stats['success_rate'], 200 / 3)
+
+    def test_cleanup_keeps_unfolded_executions(self):
+        """Old executions are only deleted once their outcome is folded."""
+        folded = self._execution(WorkflowExecution.Status.SUCCESS, 100)
+        pending = self._execution(WorkflowExecution.Status.FAILED, 50)
+        WorkflowExecution.objects.filter(pk=folded.pk).update(stats_applied=True)
+        WorkflowExecution.objects.update(started_at=timezone.now() - timedelta(days=31))
+
+        self.assertEqual(cleanup_old_executions()['cleaned_count'], 1)
+
+        self.assertFalse(WorkflowExecution.objects.filter(pk=folded.pk).exists())
+        self.assertTrue(WorkflowExecution.objects.filter(pk=pending.pk).exists())
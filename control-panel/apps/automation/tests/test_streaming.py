@@ -0,0 +1,88 @@
+"""
+Tests for streaming data flow between automation nodes.
+"""
+
+from django.test import TestCase, SimpleTestCase
+from django.contrib.auth.models import User
+
+from apps.automation.models import Workflow, WorkflowNode, WorkflowConnection, WorkflowExecution
+from apps.automation.engine import WorkflowExecutionEngine
+from apps.automation.streaming import RowStream, summarize_streams
+
+
+class RowStreamTest(SimpleTestCase):
+    """Test the single-pass row stream."""
+
+    def test_map_batches_and_summary(self):
+        """Wrapped streams pull batches lazily and record counts and samples."""
+        source = RowStream(([i, i + 1] for i in range(0, 10, 2)), sample_size=3)
+        evens = source.map_batches(lambda batch: [row for row in batch if row % 2 == 0])
+
+        summary = summarize_streams({'source': source, 'evens': evens})
+
+        self.assertEqual(summary['evens'], {'streamed': True, 'row_count': 5, 'sample': [0, 2, 4]})
+        self.assertEqual(summary['source']['row_count'], 10)
+        self.assertEqual(summary['source']['sample'], [0, 1, 2])
+
+    def test_stream_is_single_pass(self):
+        """A stream cannot be consumed twice."""
+        stream = RowStream([[1, 2]])
+        self.assertEqual(list(stream), [1, 2])
+
+        with self.assertRaises(ValueError):
+            list(stream)
+
+    def test_close_runs_once_without_iterating(self):
+        """Closing an unconsumed stream releases its source."""
+        closed = []
+        stream = RowStream([[1]], on_close=lambda: closed.append(True))
+
+        stream.close()
+        stream.close()
+
+        self.assertEqual(closed, [True])
+
+
+class StreamingWorkflowTest(TestCase):
+    """Test a streamed database query feeding a filter."""
+
+    def setUp(self):
+        """Set up a query → filter workflow over the users table."""
+        self.user = User.objects.create_user(username='owner', password='testpass123')
+        for index in range(6):
+            User.objects.create_user(username=f'user{index}', password='testpass123')
+
+        self.workflow = Workflow.objects.create(name='Stream Workflow', owner=self.user)
+        source = WorkflowNode.objects.create(
+            workflow=self.workflow,
+            node_id='users',
+            node_type=WorkflowNode.NodeType.DATA_SOURCE_DATABASE,
+            label='Users',
+            config={
+                'query': 'SELECT username FROM auth_user ORDER BY id',
+                'params': [],
+                'stream': True,
+                'batch_size': 2,
+                'sample_size': 2
+            }
+        )
+        target = WorkflowNode.objects.create(
+            workflow=self.workflow,
+            node_id='filtered',
+            node_type=WorkflowNode.NodeType.PROCESSOR_FILTER,
+            label='Filtered',
+            config={'filter_type': 'expression', 'expression': 'item["username"] != "owner"'}
+        )
+        WorkflowConnection.objects.create(
+            workflow=self.workflow, source_node=source, target_node=target
+        )
+
+    def test_only_summaries_are_stored(self):
+        """Outputs are stored as row counts and bounded samples."""
+        execution = WorkflowExecutionEngine().execute_workflow(self.workflow)
+
+        self.assertEqual(execution.status, WorkflowExecution.Status.SUCCESS)
+        filtered = execution.output_data['filtered']['data']
+        self.assertEqual(filtered['row_count'], 6)
+        self.assertEqual(filtered['sample'], [{'username': 'user0'}, {'username': 'user1'}])
+        self.assertEqual(execution.output_data['users']['data']['row_count'], 7)
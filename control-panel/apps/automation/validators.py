@@ -9,6 +9,7 @@ import re
 import logging
 
 from .models import Workflow, WorkflowNode, WorkflowConnection
+from .expressions import compile_expression
 
 logger = logging.getLogger(__name__)
 
@@ -157,6 +158,11 @@ class WorkflowValidator:
                 expression = config.get('expression')
                 if not expression:
                     errors.append(f"Filter node '{node.node_id}' has no expression configured")
+                else:
+                    try:
+                        compile_expression(expression, 'item')
+                    except (SyntaxError, ValueError) as e:
+                        errors.append(f"Filter node '{node.node_id}' has an invalid expression: {e}")
         
         return errors
     
@@ -27,6 +27,7 @@ from .models import (
     DataSourceCredential
 )
 from .engine import workflow_engine
+from .stats import get_workflow_statistics
 
 
 # =============================================================================
@@ -325,9 +326,15 @@ def execution_list(request, workflow_id):
 
     executions = workflow.executions.order_by('-started_at')[:50]
 
+    stats = get_workflow_statistics(workflow)
+
     context = {
         'workflow': workflow,
         'executions': executions,
+        'total_executions': stats['total_executions'],
+        'successful_executions': stats['successful_executions'],
+        'failed_executions': stats['failed_executions'],
+        'avg_duration': stats['average_duration_ms'] / 1000 if stats['average_duration_ms'] else None,
     }
 
     return render(request, 'automation/execution_list.html', context)
@@ -521,20 +528,20 @@ def api_workflow_status(request, workflow_id):
     """API: Get workflow status and statistics."""
     workflow = get_object_or_404(Workflow, pk=workflow_id, owner=request.user)
 
+    # Folded counters plus executions not yet folded in
+    stats = get_workflow_statistics(workflow)
+
     data = {
         'id': workflow.id,
         'name': workflow.name,
         'status': workflow.status,
         'trigger_type': workflow.trigger_type,
-        'total_executions': workflow.total_executions,
-        'successful_executions': workflow.successful_executions,
-        'failed_executions': workflow.failed_executions,
-        'success_rate': (
-            (workflow.successful_executions / workflow.total_executions * 100)
-            if workflow.total_executions > 0 else 0
-        ),
-        'average_duration_ms': workflow.average_duration_ms,
-        'last_executed_at': workflow.last_executed_at.isoformat() if workflow.last_executed_at else None,
+        'total_executions': stats['total_executions'],
+        'successful_executions': stats['successful_executions'],
+        'failed_executions': stats['failed_executions'],
+        'success_rate': stats['success_rate'],
+        'average_duration_ms': stats['average_duration_ms'],
+        'last_executed_at': stats['last_executed_at'].isoformat() if stats['last_executed_at'] else None,
         'node_count': workflow.nodes.count(),
         'connection_count': workflow.connections.count(),
     }
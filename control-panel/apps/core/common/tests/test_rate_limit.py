@@ -0,0 +1,75 @@
+"""
+Tests for the rate limiting engine.
+"""
+
+from django.core.cache.backends.locmem import LocMemCache
+from django.test import SimpleTestCase
+
+from apps.api.rate_limiting import RateLimiter
+from apps.core.common.utils.rate_limit import LocalBackend, Limit, RateLimitEngine
+
+
+class FailingBackend:
+    """Backend standing in for an unreachable Redis."""
+
+    def hit(self, keys, limits, now_ms):
+        raise ConnectionError("Connection refused")
+
+
+class RateLimitEngineTests(SimpleTestCase):
+    """Test GCRA limits on the local backend."""
+
+    def setUp(self):
+        self.engine = RateLimitEngine(LocalBackend(LocMemCache('rate-limit-tests', {})))
+        self.now = 1_700_000_000.0
+
+    def test_burst_up_to_limit_then_deny(self):
+        """A full window's worth of requests is allowed at once, then denied."""
+        limit = Limit(requests=3, window=60)
+
+        results = [self.engine.hit('client', limit, now=self.now) for _ in range(4)]
+
+        self.assertEqual([r.allowed for r in results], [True, True, True, False])
+        self.assertEqual([r.remaining for r in results], [2, 1, 0, 0])
+        self.assertEqual(results[3].retry_after, 20)
+
+    def test_requests_replenish_over_window(self):
+        """One request is regained per window / requests seconds."""
+        limit = Limit(requests=2, window=60)
+        self.engine.hit('client', limit, now=self.now)
+        self.engine.hit('client', limit, now=self.now)
+
+        self.assertFalse(self.engine.hit('client', limit, now=self.now + 29).allowed)
+        self.assertTrue(self.engine.hit('client', limit, now=self.now + 30).allowed)
+
+    def test_denied_request_consumes_no_limit(self):
+        """When one limit denies, the other limits are left untouched."""
+        sustained = Limit(requests=10, window=3600)
+        burst = Limit(requests=1, window=60)
+
+        self.assertTrue(self.engine.hit('client', sustained, burst, now=self.now).allowed)
+        denied = self.engine.hit('client', sustained, burst, now=self.now)
+
+        self.assertFalse(denied.allowed)
+        self.assertEqual(denied.remaining, 9)
+        self.assertEqual(denied.retry_after, 60)
+
+    def test_unreachable_backend_falls_back_to_local(self):
+        """Limits keep working per process while Redis is down."""
+        engine = RateLimitEngine(FailingBackend(), fallback=LocalBackend(LocMemCache('rate-limit-fallback', {})))
+        limit = Limit(requests=1, window=60)
+
+        self.assertTrue(engine.hit('client', limit, now=self.now).allowed)
+        self.assertFalse(engine.hit('client', limit, now=self.now).allowed)
+
+    def test_api_limiter_reports_retry_after(self):
+        """The API limiter exposes the engine result in its info dict."""
+        limiter = RateLimiter(max_requests=1, window_seconds=3600)
+
+        allowed, info = limiter.is_allowed('engine-test-client')
+        self.assertTrue(allowed)
+        self.assertEqual(info['remaining'], 0)
+
+        allowed, info = limiter.is_allowed('engine-test-client')
+        self.assertFalse(allowed)
+        self.assertGreater(info['retry_after'], 0)
@@ -8,6 +8,7 @@ from .encryption import generate_password, generate_secret_key, encrypt_value, d
 from .network import generate_port, validate_repo_url, get_client_ip
 from .validation import validate_domain_name, sanitize_deployment_name
 from .formatting import format_bytes, format_uptime
+from .rate_limit import Limit, RateLimitResult, get_rate_limit_engine
 
 __all__ = [
     'generate_password',
@@ -21,4 +22,7 @@ __all__ = [
     'sanitize_deployment_name',
     'format_bytes',
     'format_uptime',
+    'Limit',
+    'RateLimitResult',
+    'get_rate_limit_engine',
 ]
\ No newline at end of file
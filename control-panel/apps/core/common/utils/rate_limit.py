@@ -0,0 +1,221 @@
+"""
+Rate limiting engine for WebOps.
+
+Shared by the API and addon rate limiters. Limits use GCRA (generic cell
+rate algorithm): each key stores one number, the theoretical arrival time
+(TAT) of the next request. A request is allowed if it does not arrive
+more than one window ahead of the TAT, which allows ``requests`` requests
+per ``window`` seconds spread over a sliding window, with bursts up to
+the full limit.
+
+Backends:
+- Redis (when the default cache is Redis): one Lua script checks and
+  updates all limits of a request atomically, in one round trip
+- Local: the process-local default cache (LocMemCache) behind a lock,
+  for single-node installs without Redis, and a private LocMemCache as
+  the fallback while Redis is unreachable
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'ratelimit'
+
+# Check every limit first and only consume from all of them if all allow
+# the request, so a denied request never uses up quota.
+# KEYS: one per limit. ARGV: now_ms, then emission_ms and window_ms per limit.
+# Returns: allowed, retry_after_ms, then the TAT of each limit.
+GCRA_SCRIPT = """
+local now = tonumber(ARGV[1])
+local retry = 0
+local tats = {}
+for i = 1, #KEYS do
+    local emission = tonumber(ARGV[2 * i])
+    local window = tonumber(ARGV[2 * i + 1])
+    local tat = tonumber(redis.call('GET', KEYS[i]) or now)
+    if tat < now then
+        tat = now
+    end
+    local allow_at = tat + emission - window
+    if allow_at > now then
+        retry = math.max(retry, allow_at - now)
+    end
+    tats[i] = tat
+end
+if retry > 0 then
+    return {0, retry, unpack(tats)}
+end
+for i = 1, #KEYS do
+    tats[i] = tats[i] + tonumber(ARGV[2 * i])
+    redis.call('SET', KEYS[i], tats[i], 'PX', math.max(1, math.ceil(tats[i] - now)))
+end
+return {1, 0, unpack(tats)}
+"""
+
+
+@dataclass(frozen=True)
+class Limit:
+    """Allow ``requests`` requests per ``window`` seconds."""
+    requests: int
+    window: int
+
+    @property
+    def window_ms(self) -> int:
+        return int(self.window * 1000)
+
+    @property
+    def emission_ms(self) -> float:
+        """Time one request adds to the TAT."""
+        return self.window_ms / max(1, self.requests)
+
+
+@dataclass
+class RateLimitResult:
+    """Outcome of a rate limit check, reported against the first limit."""
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: int         # Unix time at which the first limit is fully replenished
+    retry_after: int   # Seconds until a retry can succeed (0 if allowed)
+
+
+class LocalBackend:
+    """
+    GCRA state in a process-local Django cache (LocMemCache).
+
+    Updates are serialized by a process lock, so they are atomic for all
+    threads of one process.
+    """
+
+    def __init__(self, cache=None) -> None:
+        if cache is None:
+            from django.core.cache.backends.locmem import LocMemCache
+            cache = LocMemCache('webops-rate-limit', {})
+        self.cache = cache
+        self._lock = threading.Lock()
+
+    def hit(self, keys: Sequence[str], limits: Sequence[Limit], now_ms: int) -> Tuple[bool, float, List[float]]:
+        with self._lock:
+            stored = self.cache.get_many(keys)
+            tats = [max(stored.get(key, now_ms), now_ms) for key in keys]
+            retry = max(tat + limit.emission_ms - limit.window_ms - now_ms for tat, limit in zip(tats, limits))
+            if retry > 0:
+                return False, retry, tats
+
+            tats = [tat + limit.emission_ms for tat, limit in zip(tats, limits)]
+            for key, tat in zip(keys, tats):
+                self.cache.set(key, tat, timeout=max(1, math.ceil((tat - now_ms) / 1000)))
+            return True, 0, tats
+
+
+class RedisBackend:
+    """GCRA state in Redis, updated by a Lua script."""
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.script = client.register_script(GCRA_SCRIPT)
+
+    def hit(self, keys: Sequence[str], limits: Sequence[Limit], now_ms: int) -> Tuple[bool, float, List[float]]:
+        args = [now_ms]
+        for limit in limits:
+            args.extend([limit.emission_ms, limit.window_ms])
+        allowed, retry, *tats = self.script(keys=list(keys), args=args)
+        return bool(allowed), float(retry), [float(tat) for tat in tats]
+
+
+def _redis_client():
+    """Redis client behind the default cache, or None if it is not Redis."""
+    from django.conf import settings
+
+    backend = settings.CACHES.get('default', {}).get('BACKEND', '')
+    if backend.startswith('django_redis.'):
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    if backend == 'django.core.cache.backends.redis.RedisCache':
+        from django.core.cache import cache
+        return cache._cache.get_client(write=True)
+    return None
+
+
+class RateLimitEngine:
+    """
+    Checks and consumes rate limits on the configured backend.
+
+    Falls back to a local backend if Redis cannot be reached, so
+    limiting degrades to per-process instead of failing requests.
+    """
+
+    def __init__(self, backend=None, fallback: Optional[LocalBackend] = None) -> None:
+        self.backend = backend or LocalBackend()
+        self.fallback = fallback or (LocalBackend() if isinstance(self.backend, RedisBackend) else None)
+
+    def hit(self, key: str, *limits: Limit, now: Optional[float] = None) -> RateLimitResult:
+        """
+        Count one request for ``key`` against all ``limits``.
+
+        Args:
+            key: Identifier of the client/endpoint being limited
+            limits: Limits to enforce; the first one is reported
+            now: Current Unix time (default: time.time())
+
+        Returns:
+            RateLimitResult
+        """
+        now_ms = int((time.time() if now is None else now) * 1000)
+        keys = [f"{KEY_PREFIX}:{key}:{limit.requests}/{limit.window}" for limit in limits]
+
+        try:
+            allowed, retry_ms, tats = self.backend.hit(keys, limits, now_ms)
+        except Exception as e:
+            if self.fallback is None:
+                raise
+            logger.warning(f"Rate limit backend unavailable, using local limits: {e}")
+            allowed, retry_ms, tats = self.fallback.hit(keys, limits, now_ms)
+
+        primary, tat = limits[0], tats[0]
+        remaining = int((primary.window_ms - (tat - now_ms)) // primary.emission_ms)
+        return RateLimitResult(
+            allowed=allowed,
+            limit=primary.requests,
+            remaining=max(0, min(primary.requests, remaining)),
+            reset=math.ceil(tat / 1000),
+            retry_after=math.ceil(retry_ms / 1000) if not allowed else 0,
+        )
+
+
+_engine: Optional[RateLimitEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_rate_limit_engine() -> RateLimitEngine:
+    """Process-wide engine, on Redis if the default cache is Redis."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                from django.core.cache import caches
+
+                backend = None
+                try:
+                    client = _redis_client()
+                    if client is not None:
+                        backend = RedisBackend(client)
+                except Exception as e:
+                    logger.warning(f"Redis rate limiting unavailable, using local limits: {e}")
+                if backend is None:
+                    backend = LocalBackend(caches['default'])
+                _engine = RateLimitEngine(backend)
+    return _engine
+
+
+def reset_rate_limit_engine() -> None:
+    """Forget the engine, e.g. after the cache settings changed."""
+    global _engine
+    with _engine_lock:
+        _engine = None
@@ -18,6 +18,7 @@ from .base import (
 )
 
 from .factory import DatabaseFactory, adapter_registry
+from .pool import AdapterPoolRegistry, adapter_pools
 
 __all__ = [
     'DatabaseAdapter',
@@ -31,4 +32,6 @@ __all__ = [
     'ConfigurationException',
     'DatabaseFactory',
     'adapter_registry',
+    'AdapterPoolRegistry',
+    'adapter_pools',
 ]
\ No newline at end of file
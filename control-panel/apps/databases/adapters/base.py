@@ -5,7 +5,7 @@ Base adapter interface and exceptions for database abstraction.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -39,6 +39,10 @@ class ConfigurationException(DatabaseException):
     pass
 
 
+# Rows fetched per round trip when streaming query results
+DEFAULT_STREAM_BATCH_SIZE = 1000
+
+
 # ═══════════════════════════════════════════════════════════════
 # Configuration Models
 # ═══════════════════════════════════════════════════════════════
@@ -118,6 +122,10 @@ class DatabaseAdapter(ABC):
     All concrete adapters MUST implement this interface.
     """
 
+    # Whether a connected adapter may be reused by later requests
+    # (possibly on other threads) through the adapter pool registry
+    POOLABLE = True
+
     def __init__(self, config: ConnectionConfig):
         """
         Initialize adapter with configuration.
@@ -171,6 +179,49 @@ class DatabaseAdapter(ABC):
         """
         pass
 
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Execute a read query and yield its rows in batches.
+
+        Adapters override this to fetch batches from a server-side cursor,
+        so large results are never held in memory at once. This default
+        runs execute_query() and splits its result.
+
+        Args:
+            query: SQL/query string
+            parameters: Query parameters (for parameterized queries)
+            batch_size: Rows per batch
+
+        Yields:
+            Lists of up to batch_size rows
+
+        Raises:
+            QueryExecutionException: If query fails
+        """
+        result = self.execute_query(query, parameters)
+        rows = result.data or []
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    def iter_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a read query and yield its rows one at a time.
+
+        Rows are fetched batch_size at a time through stream_query().
+        """
+        for batch in self.stream_query(query, parameters, batch_size):
+            yield from batch
+
     @abstractmethod
     def start_transaction(self) -> None:
         """
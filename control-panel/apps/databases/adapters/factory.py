@@ -5,9 +5,11 @@ Database adapter factory and registry.
 """
 
 import logging
-from typing import Dict, Type, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Type, Optional
 
 from .base import DatabaseAdapter, ConnectionConfig, DatabaseType, ConfigurationException
+from .pool import AdapterPoolRegistry, adapter_pools
 from .postgresql import PostgreSQLAdapter
 from .mongodb import MongoDBAdapter
 from .sqlite import SQLiteAdapter
@@ -105,14 +107,20 @@ class DatabaseFactory:
     based on configuration.
     """
 
-    def __init__(self, registry: Optional[AdapterRegistry] = None):
+    def __init__(
+        self,
+        registry: Optional[AdapterRegistry] = None,
+        pools: Optional[AdapterPoolRegistry] = None
+    ):
         """
         Initialize factory.
 
         Args:
             registry: Adapter registry (uses global if not provided)
+            pools: Adapter pool registry (uses global if not provided)
         """
         self.registry = registry or adapter_registry
+        self.pools = pools or adapter_pools
 
     def create_adapter(self, config: ConnectionConfig) -> DatabaseAdapter:
         """
@@ -138,6 +146,53 @@ class DatabaseFactory:
                 f"Failed to create {config.db_type.value} adapter: {e}"
             )
 
+    def acquire_adapter(self, config: ConnectionConfig) -> DatabaseAdapter:
+        """
+        Lease a connected adapter, reusing a pooled one when available.
+
+        Args:
+            config: Connection configuration
+
+        Returns:
+            Connected adapter; pass it to release_adapter() when done
+
+        Raises:
+            ConfigurationException: If adapter cannot be created
+            ConnectionException: If it cannot connect
+        """
+        return self.pools.acquire(config, self.create_adapter)
+
+    def release_adapter(self, adapter: DatabaseAdapter, discard: bool = False) -> None:
+        """
+        Return a leased adapter to its pool.
+
+        Args:
+            adapter: Adapter from acquire_adapter()
+            discard: Disconnect it instead (e.g. after a connection error)
+        """
+        self.pools.release(adapter, discard=discard)
+
+    @contextmanager
+    def pooled_adapter(self, config: ConnectionConfig) -> Iterator[DatabaseAdapter]:
+        """
+        Connected adapter from the pool for the duration of the block.
+
+        Example:
+            with DatabaseFactory().pooled_adapter(config) as adapter:
+                adapter.execute_query("SELECT 1")
+        """
+        with self.pools.lease(config, self.create_adapter) as adapter:
+            yield adapter
+
+    def get_pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Usage metrics of the adapter pools.
+
+        Returns:
+            Dictionary mapping pool ids to idle/in-use counts and counters
+        """
+        return self.pools.stats()
+
     def get_available_databases(self) -> Dict[DatabaseType, Dict[str, str]]:
         """
         Get list of available database types.
@@ -4,8 +4,10 @@ MongoDB database adapter.
 "Database Models" section
 """
 
+import json
 import logging
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     from pymongo import MongoClient
@@ -14,6 +16,7 @@ except ImportError:
     MongoClient = None
 
 from .base import (
+    DEFAULT_STREAM_BATCH_SIZE,
     DatabaseAdapter,
     ConnectionConfig,
     QueryResult,
@@ -135,6 +138,47 @@ class MongoDBAdapter(DatabaseAdapter):
             logger.error(f"MongoDB query failed: {e}")
             raise QueryExecutionException(f"MongoDB query failed: {e}")
 
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a 'find' operation with a batched cursor.
+
+        The server returns batch_size documents per getMore. Other
+        operations are executed normally.
+        """
+        if self.db is None:
+            raise ConnectionException("Not connected to database")
+
+        query_dict = json.loads(query)
+        if query_dict.get('operation') != 'find':
+            yield from super().stream_query(query, parameters, batch_size)
+            return
+
+        collection_name = query_dict.get('collection')
+        if not collection_name:
+            raise QueryExecutionException("Collection name required")
+
+        cursor = None
+        try:
+            cursor = self.db[collection_name].find(query_dict.get('filter', {})).batch_size(batch_size)
+            while True:
+                batch = [dict(doc) for doc in islice(cursor, batch_size)]
+                if not batch:
+                    break
+                yield batch
+
+        except PyMongoError as e:
+            logger.error(f"MongoDB query failed: {e}")
+            raise QueryExecutionException(f"MongoDB query failed: {e}")
+
+        finally:
+            if cursor is not None:
+                cursor.close()
+
     def start_transaction(self) -> None:
         """Start MongoDB transaction (requires replica set)."""
         if self._in_transaction:
@@ -5,15 +5,16 @@ MySQL database adapter.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     import pymysql
-    from pymysql.cursors import DictCursor
+    from pymysql.cursors import DictCursor, SSDictCursor
 except ImportError:
     pymysql = None
 
 from .base import (
+    DEFAULT_STREAM_BATCH_SIZE,
     DatabaseAdapter,
     ConnectionConfig,
     QueryResult,
@@ -115,6 +116,44 @@ class MySQLAdapter(DatabaseAdapter):
             if cursor:
                 cursor.close()
 
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a SELECT through an unbuffered SSDictCursor.
+
+        Rows are read from the socket as they are consumed. The connection
+        cannot run other queries until the iterator is exhausted or closed.
+        """
+        if not self.connection:
+            raise ConnectionException("Not connected to database")
+
+        cursor = None
+        try:
+            cursor = self.connection.cursor(SSDictCursor)
+            if parameters:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield list(rows)
+
+        except pymysql.Error as e:
+            logger.error(f"Query execution failed: {e}")
+            raise QueryExecutionException(f"MySQL query failed: {e}")
+
+        finally:
+            if cursor:
+                # Drains any unread rows so the connection is usable again
+                cursor.close()
+
     def start_transaction(self) -> None:
         """Begin transaction."""
         if self._in_transaction:
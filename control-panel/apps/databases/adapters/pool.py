@@ -0,0 +1,284 @@
+"""
+Process-wide pools of connected database adapters.
+
+"Database Models" section
+
+DatabaseFactory.create_adapter() builds a new adapter (and with it a new
+psycopg2 pool or Mongo client) every time, so connections never outlived
+a request. The registry here keeps connected adapters per connection
+configuration and leases them out exclusively:
+- Pools are keyed by a hash of the ConnectionConfig (credentials included)
+- At most ``max_idle`` idle adapters are kept per pool; adapters idle for
+  longer than ``idle_timeout`` are disconnected
+- Adapters idle for longer than ``health_check_interval`` are checked
+  with health_check() before reuse
+- Each pool counts creations, reuses, evictions and failed health checks
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .base import ConnectionConfig, DatabaseAdapter, QueryExecutionException
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IDLE = 2
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_HEALTH_CHECK_INTERVAL = 30.0
+SWEEP_INTERVAL = 60.0
+
+
+def config_key(config: ConnectionConfig) -> str:
+    """Stable hash identifying a connection configuration."""
+    fields = json.dumps(dataclasses.asdict(config), sort_keys=True, default=str)
+    return hashlib.sha256(fields.encode()).hexdigest()
+
+
+def _setting(name: str, default: Any) -> Any:
+    from django.conf import settings
+    return getattr(settings, name, default)
+
+
+class AdapterPool:
+    """Idle connected adapters for one connection configuration."""
+
+    def __init__(
+        self,
+        config: ConnectionConfig,
+        max_idle: int,
+        idle_timeout: float,
+        health_check_interval: float,
+    ):
+        self.config = config
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.idle: List[Tuple[DatabaseAdapter, float]] = []
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.counters = {
+            'acquired': 0,
+            'created': 0,
+            'reused': 0,
+            'evicted': 0,
+            'failed_health_checks': 0,
+            'discarded': 0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'db_type': self.config.db_type.value,
+            'host': self.config.host,
+            'database': self.config.database,
+            'idle': len(self.idle),
+            'in_use': self.in_use,
+            **self.counters,
+        }
+
+
+class AdapterPoolRegistry:
+    """
+    Leases connected adapters, reusing idle ones for the same configuration.
+
+    An adapter is used by one caller at a time; callers must release it
+    (or use lease()) when done.
+    """
+
+    def __init__(
+        self,
+        max_idle: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+    ):
+        self._max_idle = max_idle
+        self._idle_timeout = idle_timeout
+        self._health_check_interval = health_check_interval
+        self._pools: Dict[str, AdapterPool] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def _pool_for(self, key: str, config: ConnectionConfig) -> AdapterPool:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = AdapterPool(
+                config,
+                max_idle=self._max_idle if self._max_idle is not None
+                else _setting('DATABASE_ADAPTER_POOL_MAX_IDLE', DEFAULT_MAX_IDLE),
+                idle_timeout=self._idle_timeout if self._idle_timeout is not None
+                else _setting('DATABASE_ADAPTER_POOL_IDLE_TIMEOUT', DEFAULT_IDLE_TIMEOUT),
+                health_check_interval=self._health_check_interval if self._health_check_interval is not None
+                else _setting('DATABASE_ADAPTER_POOL_HEALTH_CHECK_INTERVAL', DEFAULT_HEALTH_CHECK_INTERVAL),
+            )
+            self._pools[key] = pool
+        return pool
+
+    def acquire(
+        self,
+        config: ConnectionConfig,
+        create: Callable[[ConnectionConfig], DatabaseAdapter]
+    ) -> DatabaseAdapter:
+        """
+        Lease a connected adapter for ``config``.
+
+        Args:
+            config: Connection configuration
+            create: Builds a new (unconnected) adapter, e.g.
+                DatabaseFactory.create_adapter
+
+        Returns:
+            Connected adapter; pass it to release() when done
+
+        Raises:
+            ConnectionException: If a new adapter cannot connect
+        """
+        key = config_key(config)
+        now = time.monotonic()
+        if now - self._last_sweep > SWEEP_INTERVAL:
+            self.evict_idle(now)
+
+        while True:
+            with self._lock:
+                pool = self._pool_for(key, config)
+                pool.counters['acquired'] += 1
+                pool.in_use += 1
+                pool.last_used = now
+                if not pool.idle:
+                    break
+                adapter, idle_since = pool.idle.pop()
+
+            if now - idle_since < pool.health_check_interval or adapter.health_check():
+                with self._lock:
+                    pool.counters['reused'] += 1
+                return adapter
+
+            logger.info(f"Discarding unhealthy {config.db_type.value} adapter for {config.database}")
+            with self._lock:
+                pool.counters['failed_health_checks'] += 1
+                pool.counters['acquired'] -= 1
+                pool.in_use -= 1
+            self._disconnect(adapter)
+
+        try:
+            adapter = create(config)
+            adapter.connect()
+        except Exception:
+            with self._lock:
+                pool.in_use -= 1
+            raise
+
+        adapter._pool_key = key
+        with self._lock:
+            pool.counters['created'] += 1
+        return adapter
+
+    def release(self, adapter: DatabaseAdapter, discard: bool = False) -> None:
+        """
+        Return a leased adapter.
+
+        Args:
+            adapter: Adapter from acquire()
+            discard: Disconnect it instead of keeping it for reuse
+        """
+        if adapter._in_transaction:
+            # Never hand out an adapter with an open transaction
+            try:
+                adapter.rollback_transaction()
+            except Exception:
+                discard = True
+
+        with self._lock:
+            pool = self._pools.get(getattr(adapter, '_pool_key', None))
+            if pool is not None:
+                pool.in_use = max(0, pool.in_use - 1)
+                pool.last_used = time.monotonic()
+            keep = (
+                pool is not None
+                and not discard
+                and getattr(adapter, 'POOLABLE', True)
+                and len(pool.idle) < pool.max_idle
+            )
+            if keep:
+                pool.idle.append((adapter, time.monotonic()))
+            elif pool is not None:
+                pool.counters['discarded'] += 1
+
+        if not keep:
+            self._disconnect(adapter)
+
+    @contextmanager
+    def lease(
+        self,
+        config: ConnectionConfig,
+        create: Callable[[ConnectionConfig], DatabaseAdapter]
+    ) -> Iterator[DatabaseAdapter]:
+        """
+        Lease an adapter for the duration of the block.
+
+        The adapter is kept for reuse unless the block fails with anything
+        other than a query error.
+        """
+        adapter = self.acquire(config, create)
+        discard = False
+        try:
+            yield adapter
+        except QueryExecutionException:
+            raise
+        except BaseException:
+            discard = True
+            raise
+        finally:
+            self.release(adapter, discard=discard)
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """
+        Disconnect adapters idle for longer than their pool's idle timeout.
+
+        Returns:
+            Number of adapters evicted
+        """
+        now = time.monotonic() if now is None else now
+        expired = []
+        with self._lock:
+            self._last_sweep = now
+            for key, pool in list(self._pools.items()):
+                keep = [(a, since) for a, since in pool.idle if now - since <= pool.idle_timeout]
+                evicted = [a for a, since in pool.idle if now - since > pool.idle_timeout]
+                pool.idle = keep
+                pool.counters['evicted'] += len(evicted)
+                expired.extend(evicted)
+                if not pool.idle and not pool.in_use and now - pool.last_used > pool.idle_timeout:
+                    del self._pools[key]
+
+        for adapter in expired:
+            self._disconnect(adapter)
+        return len(expired)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Usage counters per pool, keyed by a short configuration hash."""
+        with self._lock:
+            return {key[:12]: pool.stats() for key, pool in self._pools.items()}
+
+    def close_all(self) -> None:
+        """Disconnect every idle adapter and forget all pools."""
+        with self._lock:
+            idle = [adapter for pool in self._pools.values() for adapter, _ in pool.idle]
+            self._pools.clear()
+        for adapter in idle:
+            self._disconnect(adapter)
+
+    @staticmethod
+    def _disconnect(adapter: DatabaseAdapter) -> None:
+        try:
+            adapter.disconnect()
+        except Exception as e:
+            logger.warning(f"Failed to disconnect pooled adapter: {e}")
+
+
+# Global pool registry instance
+adapter_pools = AdapterPoolRegistry()
@@ -5,7 +5,8 @@ PostgreSQL database adapter.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import uuid
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     import psycopg2
@@ -15,6 +16,7 @@ except ImportError:
     psycopg2 = None
 
 from .base import (
+    DEFAULT_STREAM_BATCH_SIZE,
     DatabaseAdapter,
     ConnectionConfig,
     QueryResult,
@@ -117,6 +119,54 @@ class PostgreSQLAdapter(DatabaseAdapter):
             if conn:
                 self.pool.putconn(conn)
 
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a SELECT through a named (server-side) cursor.
+
+        Only batch_size rows are transferred per round trip. Outside a
+        transaction the cursor runs in its own read transaction on a
+        pooled connection, which is rolled back and returned when the
+        iterator is exhausted or closed.
+        """
+        if not self.pool:
+            raise ConnectionException("Not connected to database")
+
+        conn = self.connection if self._in_transaction else self.pool.getconn()
+        cursor = None
+        try:
+            cursor = conn.cursor(
+                name=f"webops_stream_{uuid.uuid4().hex}",
+                cursor_factory=RealDictCursor
+            )
+            cursor.itersize = batch_size
+            cursor.execute(query, parameters or {})
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+
+        except psycopg2.Error as e:
+            logger.error(f"Query execution failed: {e}")
+            raise QueryExecutionException(f"PostgreSQL query failed: {e}")
+
+        finally:
+            if cursor is not None and not conn.closed:
+                try:
+                    cursor.close()
+                except psycopg2.Error:
+                    pass
+            if not self._in_transaction:
+                if not conn.closed:
+                    conn.rollback()
+                self.pool.putconn(conn)
+
     def start_transaction(self) -> None:
         """Begin transaction."""
         if self._in_transaction:
@@ -6,7 +6,7 @@ SQLite database adapter.
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 try:
     import sqlite3
@@ -14,6 +14,7 @@ except ImportError:
     sqlite3 = None
 
 from .base import (
+    DEFAULT_STREAM_BATCH_SIZE,
     DatabaseAdapter,
     ConnectionConfig,
     QueryResult,
@@ -31,6 +32,8 @@ class SQLiteAdapter(DatabaseAdapter):
     DEPENDENCIES = []  # SQLite is built into Python
     INSTALL_COMMAND = ""
     DESCRIPTION = "Lightweight file-based database (ideal for development and small applications)"
+    # sqlite3 connections are bound to the thread that opened them
+    POOLABLE = False
 
     def __init__(self, config: ConnectionConfig):
         """Initialize SQLite adapter."""
@@ -113,6 +116,38 @@ class SQLiteAdapter(DatabaseAdapter):
             logger.error(f"Query execution failed: {e}")
             raise QueryExecutionException(f"SQLite query failed: {e}")
 
+    def stream_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream a SELECT, stepping the SQLite cursor batch_size rows at a time."""
+        if not self.connection:
+            raise ConnectionException("Not connected to database")
+
+        cursor = None
+        try:
+            cursor = self.connection.cursor()
+            if parameters:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
+
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+
+        except sqlite3.Error as e:
+            logger.error(f"Query execution failed: {e}")
+            raise QueryExecutionException(f"SQLite query failed: {e}")
+
+        finally:
+            if cursor:
+                cursor.close()
+
     def start_transaction(self) -> None:
         """Begin transaction."""
         if self._in_transaction:
@@ -0,0 +1,176 @@
+"""
+Pooled PostgreSQL admin connections for WebOps.
+
+"Database Management" section
+
+DatabaseService used to open (and authenticate) a new connection for
+every statement, so provisioning one database cost five or more
+handshakes. This module keeps a small pool of autocommit connections per
+target (host, port, user, database):
+- Pools are bounded; callers wait for a free connection up to a timeout
+- Connections idle for longer than the health check interval are checked
+  with ``SELECT 1`` before reuse, and replaced if the check fails
+- Broken connections are discarded instead of returned to the pool
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+from django.conf import settings
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+HEALTH_CHECK_INTERVAL = 30.0
+
+
+class PoolExhausted(Exception):
+    """No admin connection became free within the acquire timeout."""
+    pass
+
+
+class AdminConnectionPool:
+    """Bounded pool of autocommit admin connections to one database."""
+
+    def __init__(
+        self,
+        connection_params: Dict[str, Any],
+        max_size: int = DEFAULT_POOL_SIZE,
+        acquire_timeout: float = DEFAULT_ACQUIRE_TIMEOUT,
+        health_check_interval: float = HEALTH_CHECK_INTERVAL,
+    ):
+        self.connection_params = dict(connection_params)
+        self.max_size = max_size
+        self.acquire_timeout = acquire_timeout
+        self.health_check_interval = health_check_interval
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._idle: List[Tuple[Any, float]] = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        conn = psycopg2.connect(**self.connection_params)
+        # CREATE/DROP DATABASE cannot run inside a transaction block
+        conn.autocommit = True
+        return conn
+
+    def _is_healthy(self, conn, idle_since: float) -> bool:
+        if conn.closed:
+            return False
+        if time.monotonic() - idle_since < self.health_check_interval:
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _checkout(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn, idle_since = self._idle.pop()
+            if self._is_healthy(conn, idle_since):
+                return conn
+            logger.info("Discarding stale admin database connection")
+            self._close(conn)
+        return self._connect()
+
+    def _checkin(self, conn) -> None:
+        if conn.closed:
+            return
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    @staticmethod
+    def _close(conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """
+        Borrow a connection for the duration of the block.
+
+        Raises:
+            PoolExhausted: If all connections stay busy for acquire_timeout
+            psycopg2.Error: If a new connection cannot be opened
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise PoolExhausted(
+                f"No admin connection to {self.connection_params.get('database')} "
+                f"free after {self.acquire_timeout}s"
+            )
+        try:
+            conn = self._checkout()
+        except Exception:
+            self._slots.release()
+            raise
+
+        try:
+            yield conn
+        except BaseException:
+            # The connection may be unusable (or mid-transaction); never
+            # hand it out again
+            self._close(conn)
+            raise
+        else:
+            self._checkin(conn)
+        finally:
+            self._slots.release()
+
+    def close_all(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._close(conn)
+
+
+_pools: Dict[Tuple, AdminConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_admin_pool(connection_params: Dict[str, Any]) -> AdminConnectionPool:
+    """
+    Shared pool for a connection target.
+
+    Args:
+        connection_params: psycopg2.connect() keyword arguments
+
+    Returns:
+        The process-wide pool for (host, port, user, database)
+    """
+    key = tuple(connection_params.get(name) for name in ('host', 'port', 'user', 'database'))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.connection_params != connection_params:
+            if pool is not None:
+                pool.close_all()
+            pool = AdminConnectionPool(
+                connection_params,
+                max_size=getattr(settings, 'DATABASE_ADMIN_POOL_SIZE', DEFAULT_POOL_SIZE),
+            )
+            _pools[key] = pool
+        return pool
+
+
+def close_admin_pools() -> None:
+    """Close every pooled admin connection."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close_all()
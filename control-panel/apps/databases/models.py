@@ -9,7 +9,7 @@ from django.core.exceptions import ValidationError
 from apps.core.common.models import BaseModel
 from apps.deployments.models import BaseDeployment
 from apps.addons.models import Addon
-from .adapters.base import DatabaseType
+from .adapters.base import ConnectionConfig, DatabaseType
 from .installer import DatabaseInstaller
 
 
@@ -144,6 +144,29 @@ class Database(BaseModel):
 
         return "Connection string not available"
 
+    def get_connection_config(self, decrypted_password: str = None) -> ConnectionConfig:
+        """
+        Build the adapter configuration for this database.
+
+        Args:
+            decrypted_password: Decrypted password
+
+        Returns:
+            ConnectionConfig for DatabaseFactory.create_adapter()
+        """
+        return ConnectionConfig(
+            db_type=DatabaseType(self.db_type),
+            host=self.host or None,
+            port=self.port,
+            database=self.database_name or None,
+            username=self.username or None,
+            password=decrypted_password,
+            uri=self.connection_uri or None,
+            ssl_enabled=self.ssl_enabled,
+            connection_timeout=self.connection_timeout,
+            pool_size=self.pool_size,
+        )
+
     def get_dependency_status(self):
         """
         Get dependency status for this database.
@@ -8,14 +8,16 @@ This module implements database operations:
 - User management
 - Privilege granting
 - Credential encryption
+- Batched provisioning over pooled admin connections
 """
 
 import logging
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from django.conf import settings
 
 from apps.core.utils import generate_password, encrypt_password, decrypt_password
+from .connection_pool import get_admin_pool
 from .models import Database
 
 # Import psycopg2 for database operations
@@ -135,42 +137,33 @@ class DatabaseService:
             logger.info(f"[DEV MODE] Would execute SQL: {sql}")
             return True, "Development mode: SQL simulated"
 
-        conn = None
         try:
             # Update database parameter for connection
             conn_params = self.connection_params.copy()
             conn_params['database'] = database
-            conn = psycopg2.connect(**conn_params)
-            
-            with conn.cursor() as cursor:
-                if params:
-                    cursor.execute(sql, params)
-                else:
-                    cursor.execute(sql)
-                conn.commit()
-                
-                # For SELECT queries, fetch results
-                if cursor.description:
-                    result = cursor.fetchall()
-                    return True, str(result)
-                else:
-                    return True, f"Query executed successfully. Rows affected: {cursor.rowcount}"
-                    
+
+            with get_admin_pool(conn_params).connection() as conn:
+                with conn.cursor() as cursor:
+                    if params:
+                        cursor.execute(sql, params)
+                    else:
+                        cursor.execute(sql)
+
+                    # For SELECT queries, fetch results
+                    if cursor.description:
+                        result = cursor.fetchall()
+                        return True, str(result)
+                    else:
+                        return True, f"Query executed successfully. Rows affected: {cursor.rowcount}"
+
         except psycopg2.Error as e:
             # Log error without exposing sensitive data
             logger.error(f"SQL execution failed: {type(e).__name__}")
-            if conn:
-                conn.rollback()
             return False, "Database operation failed"
         except Exception as e:
             # Log error without exposing sensitive data
             logger.error(f"Unexpected error during SQL execution: {type(e).__name__}")
-            if conn:
-                conn.rollback()
             return False, "Database operation failed"
-        finally:
-            if conn:
-                conn.close()
 
     def database_exists(self, db_name: str) -> bool:
         """
@@ -328,6 +321,127 @@ class DatabaseService:
         else:
             return False, f"Failed to grant privileges: {output}"
 
+    def provision_databases(
+        self,
+        specs: List[Tuple[str, str, str]]
+    ) -> Dict[str, tuple[bool, str]]:
+        """
+        Create users and their databases over one pooled admin connection.
+
+        Existence of all databases and users is checked with two queries,
+        then each user, database (owned by the user) and grant is created
+        in turn. Databases are created one at a time on purpose: concurrent
+        CREATE DATABASE statements conflict on the template database.
+        If a database cannot be created, its new user is dropped again.
+
+        Args:
+            specs: (db_name, username, password) tuples
+
+        Returns:
+            Dict mapping each db_name to (success, message)
+        """
+        results: Dict[str, tuple[bool, str]] = {}
+        pending = []
+        for db_name, username, password in specs:
+            if not self._validate_identifier(db_name):
+                results[db_name] = (False, f"Invalid database name: {db_name}")
+            elif not self._validate_identifier(username):
+                results[db_name] = (False, f"Invalid username: {username}")
+            else:
+                pending.append((db_name, username, password))
+
+        if not pending:
+            return results
+
+        db_names = [spec[0] for spec in pending]
+        usernames = [spec[1] for spec in pending]
+
+        # Development mode: Check our database model instead
+        if getattr(settings, 'DEBUG', False):
+            existing_dbs = set(Database.objects.filter(name__in=db_names).values_list('name', flat=True))
+            existing_users = set(Database.objects.filter(username__in=usernames).values_list('username', flat=True))
+            for db_name, username, _ in pending:
+                if db_name in existing_dbs:
+                    results[db_name] = (False, f"Database {db_name} already exists")
+                elif username in existing_users:
+                    results[db_name] = (False, f"User {username} already exists")
+                else:
+                    logger.info(f"[DEV MODE] Would provision database {db_name} for {username}")
+                    results[db_name] = (True, "Development mode: provisioning simulated")
+            return results
+
+        from psycopg2 import sql
+        try:
+            with get_admin_pool(self.connection_params).connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT datname FROM pg_database WHERE datname = ANY(%s)", (db_names,))
+                    existing_dbs = {row[0] for row in cursor.fetchall()}
+                    cursor.execute("SELECT rolname FROM pg_roles WHERE rolname = ANY(%s)", (usernames,))
+                    existing_users = {row[0] for row in cursor.fetchall()}
+
+                    for db_name, username, password in pending:
+                        if db_name in existing_dbs:
+                            results[db_name] = (False, f"Database {db_name} already exists")
+                            continue
+                        if username in existing_users:
+                            results[db_name] = (False, f"User {username} already exists")
+                            continue
+                        results[db_name] = self._provision_one(cursor, sql, db_name, username, password)
+                        if conn.closed:
+                            raise psycopg2.OperationalError("Admin connection lost")
+
+        except Exception as e:
+            # Log error without exposing sensitive data
+            logger.error(f"Database provisioning failed: {type(e).__name__}")
+            for db_name in db_names:
+                results.setdefault(db_name, (False, "Database operation failed"))
+
+        return results
+
+    def _provision_one(self, cursor, sql, db_name: str, username: str, password: str) -> tuple[bool, str]:
+        """Create one user, its database and grant, on an open admin cursor."""
+        try:
+            cursor.execute(
+                sql.SQL("CREATE USER {} WITH PASSWORD %s").format(sql.Identifier(username)),
+                (password,)
+            )
+        except psycopg2.Error as e:
+            logger.error(f"Failed to create user {username}: {type(e).__name__}")
+            return False, "Failed to create user: Database operation failed"
+
+        try:
+            cursor.execute(
+                sql.SQL("CREATE DATABASE {} WITH OWNER {}").format(
+                    sql.Identifier(db_name),
+                    sql.Identifier(username)
+                )
+            )
+        except psycopg2.Error as e:
+            logger.error(f"Failed to create database {db_name}: {type(e).__name__}")
+            try:
+                cursor.execute(sql.SQL("DROP USER {}").format(sql.Identifier(username)))
+            except psycopg2.Error:
+                logger.warning(f"Failed to clean up user {username}")
+            return False, "Failed to create database: Database operation failed"
+
+        try:
+            cursor.execute(
+                sql.SQL("GRANT ALL PRIVILEGES ON DATABASE {} TO {}").format(
+                    sql.Identifier(db_name),
+                    sql.Identifier(username)
+                )
+            )
+        except psycopg2.Error as e:
+            logger.warning(f"Failed to grant privileges on {db_name}: {type(e).__name__}")
+
+        logger.info(f"Provisioned database {db_name} for user {username}")
+        return True, f"Database {db_name} created successfully"
+
+    def _deployment_db_names(self, deployment, db_name: Optional[str] = None) -> Tuple[str, str]:
+        if db_name is None:
+            db_name = f"{deployment.name.replace('-', '_')}_db"
+        return db_name, f"{deployment.name.replace('-', '_')}_user"
+
     def create_database_for_deployment(
         self,
         deployment,
@@ -343,31 +457,14 @@ class DatabaseService:
         Returns:
             Database instance or None if failed
         """
-        if db_name is None:
-            db_name = f"{deployment.name.replace('-', '_')}_db"
-
-        username = f"{deployment.name.replace('-', '_')}_user"
+        db_name, username = self._deployment_db_names(deployment, db_name)
         password = generate_password(32)
 
-        # Create user
-        success, message = self.create_user(username, password)
-        if not success:
-            logger.error(f"Failed to create user for {deployment.name}: {message}")
-            return None
-
-        # Create database
-        success, message = self.create_database(db_name, owner=username)
+        success, message = self.provision_databases([(db_name, username, password)])[db_name]
         if not success:
             logger.error(f"Failed to create database for {deployment.name}: {message}")
-            # TODO #16: Clean up database user on deletion
-            # See: docs/TODO_TRACKING.md for details
             return None
 
-        # Grant privileges
-        success, message = self.grant_privileges(db_name, username)
-        if not success:
-            logger.warning(f"Failed to grant privileges: {message}")
-
         # Encrypt password and save to database
         encrypted_password = encrypt_password(password)
 
@@ -383,6 +480,44 @@ class DatabaseService:
         logger.info(f"Created database {db_name} for deployment {deployment.name}")
         return db
 
+    def create_databases_for_deployments(self, deployments) -> List[Database]:
+        """
+        Create one database per deployment in a single provisioning batch.
+
+        Args:
+            deployments: Deployment instances
+
+        Returns:
+            Database instances of the deployments that were provisioned
+        """
+        specs = {}
+        for deployment in deployments:
+            db_name, username = self._deployment_db_names(deployment)
+            specs[db_name] = (deployment, username, generate_password(32))
+
+        results = self.provision_databases(
+            [(db_name, username, password) for db_name, (_, username, password) in specs.items()]
+        )
+
+        databases = []
+        for db_name, (deployment, username, password) in specs.items():
+            success, message = results[db_name]
+            if not success:
+                logger.error(f"Failed to create database for {deployment.name}: {message}")
+                continue
+            databases.append(Database(
+                name=db_name,
+                username=username,
+                password=encrypt_password(password),
+                host='localhost',
+                port=5432,
+                deployment=deployment
+            ))
+
+        Database.objects.bulk_create(databases)
+        logger.info(f"Created {len(databases)} of {len(specs)} deployment databases")
+        return databases
+
     def get_connection_string(
         self,
         database: Database,
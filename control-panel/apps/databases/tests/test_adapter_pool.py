@@ -0,0 +1,138 @@
+"""
+Tests for the process-wide adapter pool registry.
+"""
+
+from django.test import SimpleTestCase
+
+from apps.databases.adapters.base import (
+    ConnectionConfig,
+    ConnectionException,
+    DatabaseAdapter,
+    DatabaseType,
+    QueryExecutionException,
+    QueryResult,
+)
+from apps.databases.adapters.pool import AdapterPoolRegistry
+
+
+class FakeAdapter(DatabaseAdapter):
+    """Adapter recording its connection lifecycle."""
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.connected = False
+        self.healthy = True
+
+    def connect(self):
+        self.connected = True
+
+    def disconnect(self):
+        self.connected = False
+
+    def execute_query(self, query, parameters=None):
+        return QueryResult(success=True)
+
+    def start_transaction(self):
+        self._in_transaction = True
+
+    def commit_transaction(self):
+        self._in_transaction = False
+
+    def rollback_transaction(self):
+        self._in_transaction = False
+
+    def health_check(self):
+        return self.healthy
+
+    def get_metadata(self):
+        return {}
+
+
+def make_config(database='app'):
+    return ConnectionConfig(
+        db_type=DatabaseType.POSTGRESQL, host='db.internal', port=5432,
+        database=database, username='app', password='secret'
+    )
+
+
+class AdapterPoolRegistryTest(SimpleTestCase):
+    """Test leasing, reuse and eviction of pooled adapters."""
+
+    def setUp(self):
+        self.pools = AdapterPoolRegistry(max_idle=2, idle_timeout=300, health_check_interval=30)
+        self.addCleanup(self.pools.close_all)
+
+    def _stats(self):
+        (stats,) = self.pools.stats().values()
+        return stats
+
+    def test_adapter_reused_for_same_config(self):
+        """A released adapter is handed out again without reconnecting."""
+        with self.pools.lease(make_config(), FakeAdapter) as first:
+            self.assertTrue(first.connected)
+        with self.pools.lease(make_config(), FakeAdapter) as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertTrue(second.connected)
+        stats = self._stats()
+        self.assertEqual((stats['created'], stats['reused'], stats['idle'], stats['in_use']), (1, 1, 1, 0))
+
+    def test_different_configs_use_different_pools(self):
+        """Pools are keyed by the whole configuration."""
+        with self.pools.lease(make_config('one'), FakeAdapter) as first:
+            pass
+        with self.pools.lease(make_config('two'), FakeAdapter) as second:
+            pass
+
+        self.assertIsNot(first, second)
+        self.assertEqual(len(self.pools.stats()), 2)
+
+    def test_unhealthy_adapter_replaced(self):
+        """Adapters idle past the health check interval are checked before reuse."""
+        pools = AdapterPoolRegistry(max_idle=2, idle_timeout=300, health_check_interval=0)
+        first = pools.acquire(make_config(), FakeAdapter)
+        pools.release(first)
+        first.healthy = False
+
+        second = pools.acquire(make_config(), FakeAdapter)
+
+        self.assertIsNot(first, second)
+        self.assertFalse(first.connected)
+        (stats,) = pools.stats().values()
+        self.assertEqual(stats['failed_health_checks'], 1)
+
+    def test_connection_errors_discard_adapter(self):
+        """Only query errors keep the adapter for reuse."""
+        with self.assertRaises(QueryExecutionException):
+            with self.pools.lease(make_config(), FakeAdapter) as kept:
+                raise QueryExecutionException("syntax error")
+        with self.assertRaises(ConnectionException):
+            with self.pools.lease(make_config(), FakeAdapter) as discarded:
+                raise ConnectionException("server closed the connection")
+
+        self.assertIs(kept, discarded)
+        self.assertFalse(discarded.connected)
+        self.assertEqual(self._stats()['idle'], 0)
+
+    def test_open_transaction_rolled_back_on_release(self):
+        """An adapter never returns to the pool inside a transaction."""
+        adapter = self.pools.acquire(make_config(), FakeAdapter)
+        adapter.start_transaction()
+        self.pools.release(adapter)
+
+        self.assertFalse(adapter._in_transaction)
+
+    def test_idle_limit_and_eviction(self):
+        """At most max_idle adapters are kept, and only until idle_timeout."""
+        adapters = [self.pools.acquire(make_config(), FakeAdapter) for _ in range(3)]
+        for adapter in adapters:
+            self.pools.release(adapter)
+
+        self.assertEqual(self._stats()['idle'], 2)
+        self.assertFalse(adapters[2].connected)
+
+        evicted = self.pools.evict_idle(now=self.pools._last_sweep + 10 ** 6)
+        self.assertEqual(evicted, 2)
+        self.assertEqual(self.pools.stats(), {})
+        self.assertFalse(any(adapter.connected for adapter in adapters))
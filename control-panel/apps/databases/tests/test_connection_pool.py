@@ -0,0 +1,142 @@
+"""
+Tests for pooled admin connections and batched provisioning.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from apps.databases.connection_pool import AdminConnectionPool, PoolExhausted, close_admin_pools
+from apps.databases.services import DatabaseService
+
+PARAMS = {'host': 'localhost', 'port': 5432, 'user': 'postgres', 'password': None, 'database': 'postgres'}
+
+
+def make_connection():
+    conn = MagicMock()
+    conn.closed = 0
+    return conn
+
+
+class AdminConnectionPoolTest(SimpleTestCase):
+    """Test AdminConnectionPool reuse and health checks."""
+
+    @patch('apps.databases.connection_pool.psycopg2.connect')
+    def test_connection_reused_between_blocks(self, mock_connect):
+        """One handshake serves consecutive borrowers."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        pool = AdminConnectionPool(PARAMS)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            pass
+
+        self.assertIs(first, second)
+        self.assertTrue(first.autocommit)
+        mock_connect.assert_called_once_with(**PARAMS)
+
+    @patch('apps.databases.connection_pool.psycopg2.connect')
+    def test_stale_connection_replaced(self, mock_connect):
+        """An idle connection failing its health check is not reused."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        pool = AdminConnectionPool(PARAMS, health_check_interval=0)
+
+        with pool.connection() as first:
+            pass
+        first.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.OperationalError()
+
+        with pool.connection() as second:
+            pass
+
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+
+    @patch('apps.databases.connection_pool.psycopg2.connect')
+    def test_connection_discarded_after_error(self, mock_connect):
+        """A connection that raised a database error is closed, not pooled."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        pool = AdminConnectionPool(PARAMS)
+
+        with self.assertRaises(psycopg2.OperationalError):
+            with pool.connection() as conn:
+                raise psycopg2.OperationalError()
+
+        conn.close.assert_called_once()
+        self.assertEqual(pool._idle, [])
+
+    @patch('apps.databases.connection_pool.psycopg2.connect')
+    def test_connection_discarded_after_any_exception(self, mock_connect):
+        """A block failing for a non-database reason does not leak its connection."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        pool = AdminConnectionPool(PARAMS, max_size=1)
+
+        with self.assertRaises(ValueError):
+            with pool.connection() as conn:
+                raise ValueError()
+
+        conn.close.assert_called_once()
+        self.assertEqual(pool._idle, [])
+        with pool.connection() as replacement:
+            self.assertIsNot(replacement, conn)
+
+    @patch('apps.databases.connection_pool.psycopg2.connect')
+    def test_pool_is_bounded(self, mock_connect):
+        """Borrowers beyond max_size time out instead of connecting."""
+        mock_connect.side_effect = lambda **kwargs: make_connection()
+        pool = AdminConnectionPool(PARAMS, max_size=1, acquire_timeout=0.01)
+
+        with pool.connection():
+            with self.assertRaises(PoolExhausted):
+                with pool.connection():
+                    pass
+
+        self.assertEqual(mock_connect.call_count, 1)
+
+
+@override_settings(DEBUG=False)
+class ProvisionDatabasesTest(TestCase):
+    """Test DatabaseService.provision_databases."""
+
+    def setUp(self):
+        self.db_service = DatabaseService()
+        self.addCleanup(close_admin_pools)
+
+    @patch('apps.databases.connection_pool.psycopg2.connect')
+    def test_batch_uses_one_connection(self, mock_connect):
+        """All checks, creates and grants of a batch share one connection."""
+        conn = make_connection()
+        mock_connect.return_value = conn
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.side_effect = [[('taken_db',)], []]
+
+        results = self.db_service.provision_databases([
+            ('app_one_db', 'app_one_user', 'secret1'),
+            ('app_two_db', 'app_two_user', 'secret2'),
+            ('taken_db', 'taken_user', 'secret3'),
+            ('bad-name', 'bad_user', 'secret4'),
+        ])
+
+        mock_connect.assert_called_once()
+        self.assertEqual(results['app_one_db'][0], True)
+        self.assertEqual(results['app_two_db'][0], True)
+        self.assertEqual(results['taken_db'], (False, 'Database taken_db already exists'))
+        self.assertFalse(results['bad-name'][0])
+        # Two existence queries, then user, database and grant per new database
+        self.assertEqual(cursor.execute.call_count, 2 + 3 * 2)
+
+    @patch('apps.databases.connection_pool.psycopg2.connect')
+    def test_user_dropped_when_database_creation_fails(self, mock_connect):
+        """A failed CREATE DATABASE does not leave its user behind."""
+        conn = make_connection()
+        mock_connect.return_value = conn
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.side_effect = [[], []]
+        cursor.execute.side_effect = [None, None, None, psycopg2.ProgrammingError(), None]
+
+        results = self.db_service.provision_databases([('app_db', 'app_user', 'secret')])
+
+        self.assertFalse(results['app_db'][0])
+        dropped = cursor.execute.call_args_list[-1][0][0]
+        self.assertIn('DROP USER', repr(dropped))
@@ -0,0 +1,157 @@
+"""
+Tests for streaming query results and table exports.
+"""
+
+import csv
+import io
+import json
+import os
+import sqlite3
+import tempfile
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from apps.databases.adapters.base import ConnectionConfig, DatabaseType, QueryResult
+from apps.databases.adapters.postgresql import PostgreSQLAdapter
+from apps.databases.adapters.sqlite import SQLiteAdapter
+from apps.databases.models import Database
+from apps.databases.views import database_export
+from apps.deployments.models import ApplicationDeployment
+
+
+def create_sqlite_file(rows=5):
+    fd, path = tempfile.mkstemp(suffix='.sqlite3')
+    os.close(fd)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, note TEXT)")
+    conn.executemany(
+        "INSERT INTO items (name, note) VALUES (?, ?)",
+        [(f'item {i}', None if i % 2 else 'a, "quoted" note') for i in range(rows)]
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+class StreamQueryTest(SimpleTestCase):
+    """Test stream_query/iter_query on the adapters."""
+
+    def setUp(self):
+        self.path = create_sqlite_file()
+        self.addCleanup(os.remove, self.path)
+
+    def test_sqlite_streams_in_batches(self):
+        """Rows arrive batch_size at a time, as dicts."""
+        with SQLiteAdapter(ConnectionConfig(db_type=DatabaseType.SQLITE, database=self.path)) as adapter:
+            batches = list(adapter.stream_query("SELECT id, name FROM items ORDER BY id", batch_size=2))
+            rows = list(adapter.iter_query("SELECT name FROM items WHERE id > :id", {'id': 3}))
+
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual(batches[0][0], {'id': 1, 'name': 'item 0'})
+        self.assertEqual(rows, [{'name': 'item 3'}, {'name': 'item 4'}])
+
+    def test_base_implementation_splits_execute_query(self):
+        """Adapters without a streaming cursor fall back to execute_query."""
+        adapter = SQLiteAdapter(ConnectionConfig(db_type=DatabaseType.SQLITE, database=self.path))
+        data = [{'id': i} for i in range(5)]
+        with patch.object(adapter, 'execute_query', return_value=QueryResult(success=True, data=data)):
+            batches = list(super(SQLiteAdapter, adapter).stream_query("SELECT 1", batch_size=3))
+
+        self.assertEqual(batches, [data[:3], data[3:]])
+
+    def test_postgresql_uses_named_cursor(self):
+        """PostgreSQL fetches through a server-side cursor and returns the connection."""
+        adapter = PostgreSQLAdapter(ConnectionConfig(
+            db_type=DatabaseType.POSTGRESQL, host='localhost', port=5432,
+            database='app', username='app', password='secret'
+        ))
+        adapter.pool = MagicMock()
+        conn = adapter.pool.getconn.return_value
+        conn.closed = 0
+        cursor = conn.cursor.return_value
+        cursor.fetchmany.side_effect = [[{'id': 1}, {'id': 2}], [{'id': 3}], []]
+
+        batches = list(adapter.stream_query("SELECT id FROM items", batch_size=2))
+
+        self.assertEqual(batches, [[{'id': 1}, {'id': 2}], [{'id': 3}]])
+        self.assertTrue(conn.cursor.call_args.kwargs['name'].startswith('webops_stream_'))
+        self.assertEqual(cursor.itersize, 2)
+        cursor.close.assert_called_once()
+        conn.rollback.assert_called_once()
+        adapter.pool.putconn.assert_called_once_with(conn)
+
+
+class DatabaseExportViewTest(TestCase):
+    """Test the streaming table export endpoint."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        deployment = ApplicationDeployment.objects.create(
+            name='my-app',
+            deployed_by=self.user,
+            project_type='django',
+            repo_url='https://github.com/example/app',
+            branch='main',
+        )
+        self.path = create_sqlite_file()
+        self.addCleanup(os.remove, self.path)
+        self.database = Database.objects.create(
+            name='my_app_db',
+            db_type='sqlite',
+            database_name=self.path,
+            deployment=deployment,
+        )
+
+    def _export(self, **params):
+        request = self.factory.get(f'/databases/{self.database.pk}/export/', params)
+        request.user = self.user
+        return database_export(request, pk=self.database.pk)
+
+    def test_csv_export(self):
+        """CSV exports start with a header row and quote values."""
+        response = self._export(table='items', batch_size=2)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.reader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(rows[0], ['id', 'name', 'note'])
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[1], ['1', 'item 0', 'a, "quoted" note'])
+
+    def test_ndjson_export(self):
+        """NDJSON exports one object per row."""
+        response = self._export(table='items', format='ndjson')
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(json.loads(lines[1]), {'id': 2, 'name': 'item 1', 'note': None})
+        self.assertEqual(len(lines), 5)
+
+    def test_adapter_released_when_body_never_iterated(self):
+        """Closing an unread response still returns the adapter to its pool."""
+        with patch('apps.databases.views.DatabaseFactory.release_adapter', autospec=True) as release:
+            response = self._export(table='items')
+            release.assert_not_called()
+            response.close()
+            response.close()
+
+        release.assert_called_once()
+        self.assertFalse(release.call_args.kwargs['discard'])
+
+    def test_adapter_released_once_after_full_read(self):
+        """A fully read response releases its adapter exactly once."""
+        with patch('apps.databases.views.DatabaseFactory.release_adapter', autospec=True) as release:
+            response = self._export(table='items')
+            b''.join(response.streaming_content)
+            response.close()
+
+        release.assert_called_once()
+
+    def test_invalid_requests_rejected(self):
+        """Unsafe table names, unknown formats and missing tables are errors."""
+        self.assertEqual(self._export(table='items; DROP TABLE items').status_code, 400)
+        self.assertEqual(self._export(table='items', format='xml').status_code, 400)
+        self.assertEqual(self._export(table='missing').status_code, 400)
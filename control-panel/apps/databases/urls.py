@@ -9,6 +9,7 @@ urlpatterns = [
     path('<int:pk>/', views.database_detail, name='database_detail'),
     path('<int:pk>/delete/', views.database_delete, name='database_delete'),
     path('<int:pk>/credentials/', views.database_credentials_json, name='database_credentials_json'),
+    path('<int:pk>/export/', views.database_export, name='database_export'),
     path('check-dependencies/', views.check_dependencies, name='check_dependencies'),
     path('<int:pk>/check-dependencies/', views.check_dependencies, name='database_check_dependencies'),
     path('install-dependencies/', views.install_dependencies_ajax, name='install_dependencies_ajax'),
@@ -4,12 +4,16 @@ Views for Databases app.
 "Django App Structure" section
 """
 
+import csv
+import json
 import logging
+import re
+from itertools import chain
 
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.generic import CreateView, ListView
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.decorators.http import require_http_methods
@@ -17,7 +21,7 @@ from .models import Database
 from .services import DatabaseService
 from .forms import DatabaseForm
 from .adapters.factory import DatabaseFactory
-from .adapters.base import DatabaseType
+from .adapters.base import DEFAULT_STREAM_BATCH_SIZE, DatabaseException, DatabaseType
 from .installer import DatabaseInstaller, DatabaseServiceInstaller
 from apps.core.utils import decrypt_password, encrypt_password
 from apps.addons.models import Addon
@@ -323,6 +327,150 @@ def database_credentials_json(request, pk):
     })
 
 
+EXPORT_CONTENT_TYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+MAX_EXPORT_BATCH_SIZE = 10000
+TABLE_NAME_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$')
+
+
+class _Echo:
+    """File-like object that hands each CSV line back to the writer's caller."""
+
+    def write(self, value):
+        return value
+
+
+def _export_query(db_type: DatabaseType, table: str) -> str:
+    """Query selecting every row of a (validated) table or collection."""
+    if db_type == DatabaseType.MONGODB:
+        return json.dumps({'operation': 'find', 'collection': table})
+    quote = '`' if db_type == DatabaseType.MYSQL else '"'
+    return 'SELECT * FROM ' + '.'.join(f'{quote}{part}{quote}' for part in table.split('.'))
+
+
+class _ExportStream:
+    """
+    Export body that encodes streamed rows as CSV or NDJSON.
+
+    The adapter goes back to the pool from ``close()``, which Django calls
+    on the response whether or not the body was ever iterated (e.g. the
+    client disconnected before the first chunk), so a lease and its open
+    cursor are never left behind.
+    """
+
+    def __init__(self, factory, adapter, source, rows, export_format: str):
+        self.factory = factory
+        self.adapter = adapter
+        self.source = source
+        self.rows = rows
+        self.export_format = export_format
+        self._released = False
+
+    def __iter__(self):
+        try:
+            yield from self._lines()
+        except DatabaseException:
+            self.close(discard=True)
+            raise
+        self.close()
+
+    def _lines(self):
+        if self.export_format == 'ndjson':
+            for row in self.rows:
+                yield json.dumps(row, default=str) + '\n'
+            return
+
+        writer = csv.writer(_Echo())
+        header = None
+        for row in self.rows:
+            if header is None:
+                header = list(row.keys())
+                yield writer.writerow(header)
+            yield writer.writerow([row.get(column) for column in header])
+
+    def close(self, discard: bool = False) -> None:
+        """Close the cursor and return the adapter to its pool (once)."""
+        if self._released:
+            return
+        self._released = True
+        try:
+            # Close the cursor before the adapter goes back to the pool
+            self.source.close()
+        finally:
+            self.factory.release_adapter(self.adapter, discard=discard)
+
+
+@login_required
+@database_read_rate_limit
+@database_rate_limit_by_database('read')
+@require_http_methods(["GET"])
+def database_export(request, pk):
+    """
+    Stream a table (or MongoDB collection) as CSV or NDJSON.
+
+    Query parameters:
+        table: Table or collection name (optionally schema.table)
+        format: 'csv' (default) or 'ndjson'
+        batch_size: Rows fetched per round trip
+
+    Rows are read through the adapter's server-side cursor and written
+    as they arrive, so exports of any size use constant memory.
+    """
+    database = get_object_or_404(Database, pk=pk, deployment__deployed_by=request.user)
+
+    table = request.GET.get('table', '')
+    export_format = request.GET.get('format', 'csv')
+    if not TABLE_NAME_PATTERN.match(table):
+        return JsonResponse({'error': 'A valid table name is required'}, status=400)
+    if export_format not in EXPORT_CONTENT_TYPES:
+        return JsonResponse({'error': f'Unsupported format: {export_format}'}, status=400)
+    try:
+        batch_size = int(request.GET.get('batch_size', DEFAULT_STREAM_BATCH_SIZE))
+    except ValueError:
+        return JsonResponse({'error': 'batch_size must be an integer'}, status=400)
+    batch_size = max(1, min(batch_size, MAX_EXPORT_BATCH_SIZE))
+
+    factory = DatabaseFactory()
+    try:
+        password = decrypt_password(database.password) if database.password else None
+        config = database.get_connection_config(password)
+        adapter = factory.acquire_adapter(config)
+    except (DatabaseException, ValueError) as e:
+        logger.warning(f"Export of {database.name} failed to connect: {e}")
+        return JsonResponse({'error': 'Could not connect to database'}, status=502)
+
+    # Run the query and fetch the first batch before the response starts,
+    # so a bad table name is still reported as an error status
+    source = adapter.iter_query(_export_query(config.db_type, table), batch_size=batch_size)
+    try:
+        first = next(source, None)
+    except DatabaseException as e:
+        factory.release_adapter(adapter)
+        logger.warning(f"Export of {database.name}.{table} failed: {e}")
+        return JsonResponse({'error': 'Query failed'}, status=400)
+
+    logger.info(
+        "Database table exported",
+        extra={
+            'user_id': request.user.id,
+            'database_id': database.id,
+            'table': table,
+            'format': export_format,
+        }
+    )
+
+    rows = chain([first], source) if first is not None else iter(())
+    response = StreamingHttpResponse(
+        _ExportStream(factory, adapter, source, rows, export_format),
+        content_type=EXPORT_CONTENT_TYPES[export_format]
+    )
+    filename = f"{database.name}-{table}.{export_format}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 @login_required
 @database_admin_rate_limit
 @require_http_methods(["GET", "POST"])
@@ -9,8 +9,10 @@ This module implements REST API endpoints for:
 - Log retrieval
 """
 
-from typing import Dict, Any
-from django.http import JsonResponse
+from typing import Dict, Any, Iterator, Optional
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.views.decorators.http import require_http_methods
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth.decorators import login_required
@@ -160,34 +162,150 @@ def create_deployment(request) -> JsonResponse:
         return JsonResponse({'error': str(e)}, status=500)
 
 
+LOG_PAGE_SIZE = 1000
+MAX_LOG_PAGE_SIZE = 10000
+LOG_STREAM_BATCH_SIZE = 2000
+LOG_FIELDS = ('id', 'level', 'message', 'created_at')
+
+
+def _serialize_log(log: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'id': log['id'],
+        'level': log['level'],
+        'message': log['message'],
+        'created_at': log['created_at'].isoformat(),
+    }
+
+
+def _positive_int(value: Optional[str], name: str, maximum: Optional[int] = None) -> Optional[int]:
+    if value in (None, ''):
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an integer")
+    if number < 0 or (name != 'after_id' and number == 0):
+        raise ValueError(f"'{name}' must be positive")
+    return min(number, maximum) if maximum else number
+
+
+def _parse_time(value: Optional[str], name: str):
+    if not value:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"'{name}' must be an ISO 8601 datetime")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _stream_logs(queryset, after_id: int, limit: Optional[int]) -> Iterator[str]:
+    """NDJSON lines of logs after ``after_id``, fetched in keyset batches."""
+    sent = 0
+    while limit is None or sent < limit:
+        batch_size = LOG_STREAM_BATCH_SIZE if limit is None else min(LOG_STREAM_BATCH_SIZE, limit - sent)
+        batch = list(queryset.filter(id__gt=after_id).order_by('id').values(*LOG_FIELDS)[:batch_size])
+        for log in batch:
+            yield json.dumps(_serialize_log(log)) + '\n'
+        sent += len(batch)
+        if len(batch) < batch_size:
+            break
+        after_id = batch[-1]['id']
+
+
 @login_required
 @require_http_methods(["GET"])
-def get_deployment_logs(request, name: str) -> JsonResponse:
-    """Get deployment logs."""
+def get_deployment_logs(request, name: str) -> HttpResponse:
+    """
+    Get deployment logs, oldest first.
+
+    Query parameters:
+        after_id: Only logs with a larger id (forward paging, following)
+        before_id: Only logs with a smaller id (backward paging)
+        tail: The last N logs (before before_id, if given)
+        limit: Page size for after_id paging (default 1000, max 10000)
+        level: Comma-separated levels to include
+        since, until: ISO 8601 bounds on created_at
+        format: 'ndjson' to stream one JSON object per line
+
+    JSON responses carry ``next_after_id`` (poll with it to follow),
+    ``has_more`` for further forward pages and ``next_before_id`` when
+    older logs exist.
+    """
     try:
         # SECURITY FIX: Filter by user to prevent IDOR vulnerability
         deployment = ApplicationDeployment.objects.get(name=name, deployed_by=request.user)
+    except ApplicationDeployment.DoesNotExist:
+        return JsonResponse({'error': f'Deployment {name} not found'}, status=404)
 
-        tail = request.GET.get('tail')
-        queryset = DeploymentLog.objects.filter(deployment=deployment)
-
-        if tail:
-            queryset = queryset[:int(tail)]
-
-        logs = [
-            {
-                'id': log.id,
-                'level': log.level,
-                'message': log.message,
-                'created_at': log.created_at.isoformat(),
-            }
-            for log in queryset
-        ]
+    try:
+        after_id = _positive_int(request.GET.get('after_id'), 'after_id')
+        before_id = _positive_int(request.GET.get('before_id'), 'before_id')
+        tail = _positive_int(request.GET.get('tail'), 'tail', MAX_LOG_PAGE_SIZE)
+        limit = _positive_int(request.GET.get('limit'), 'limit', MAX_LOG_PAGE_SIZE)
+        since = _parse_time(request.GET.get('since'), 'since')
+        until = _parse_time(request.GET.get('until'), 'until')
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    queryset = DeploymentLog.objects.filter(deployment=deployment)
+
+    levels = [level for level in request.GET.get('level', '').split(',') if level]
+    if levels:
+        queryset = queryset.filter(level__in=levels)
+    if since:
+        queryset = queryset.filter(created_at__gte=since)
+    if until:
+        queryset = queryset.filter(created_at__lte=until)
+
+    backward = tail is not None or before_id is not None
+    streaming = (
+        request.GET.get('format') == 'ndjson'
+        or request.META.get('HTTP_ACCEPT', '').startswith('application/x-ndjson')
+    )
+
+    if streaming and not backward:
+        return StreamingHttpResponse(
+            _stream_logs(queryset, after_id or 0, limit),
+            content_type='application/x-ndjson'
+        )
 
-        return JsonResponse({'logs': logs})
+    if backward:
+        # Newest page first, then returned in chronological order
+        size = tail or limit or LOG_PAGE_SIZE
+        if before_id is not None:
+            queryset = queryset.filter(id__lt=before_id)
+        if after_id is not None:
+            queryset = queryset.filter(id__gt=after_id)
+        rows = list(queryset.order_by('-id').values(*LOG_FIELDS)[:size + 1])
+        has_older = len(rows) > size
+        rows = rows[:size][::-1]
+        has_more = False
+        next_before_id = rows[0]['id'] if has_older and rows else None
+    else:
+        size = limit or LOG_PAGE_SIZE
+        if after_id is not None:
+            queryset = queryset.filter(id__gt=after_id)
+        rows = list(queryset.order_by('id').values(*LOG_FIELDS)[:size + 1])
+        has_more = len(rows) > size
+        rows = rows[:size]
+        next_before_id = None
+
+    logs = [_serialize_log(log) for log in rows]
+
+    if streaming:
+        return StreamingHttpResponse(
+            (json.dumps(log) + '\n' for log in logs),
+            content_type='application/x-ndjson'
+        )
 
-    except ApplicationDeployment.DoesNotExist:
-        return JsonResponse({'error': f'Deployment {name} not found'}, status=404)
+    return JsonResponse({
+        'logs': logs,
+        'has_more': has_more,
+        'next_after_id': logs[-1]['id'] if logs else after_id,
+        'next_before_id': next_before_id,
+    })
 
 
 @login_required
@@ -241,6 +241,15 @@ class DeploymentStatusConsumer(AsyncWebsocketConsumer):
             }))
             return
 
+        if event_type == 'log_entries':
+            await self.send(text_data=json.dumps({
+                'type': 'deployment_logs',
+                'deployment_id': self.deployment_id,
+                'logs': payload.get('logs', []),
+                'timestamp': payload.get('timestamp'),
+            }))
+            return
+
         if event_type in ('deployment_created', 'deployment_updated'):
             dep = payload.get('deployment', {})
             await self.send(text_data=json.dumps({
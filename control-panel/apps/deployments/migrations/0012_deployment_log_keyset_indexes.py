@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('deployments', '0011_add_llm_auto_detection_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='deploymentlog',
+            index=models.Index(fields=['deployment', 'id'], name='deployment_logs_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='deploymentlog',
+            index=models.Index(fields=['deployment', 'level', 'id'], name='deployment_logs_level_idx'),
+        ),
+    ]
@@ -116,6 +116,9 @@ class DeploymentLog(BaseModel):
         indexes = [
             models.Index(fields=['deployment', '-created_at']),
             models.Index(fields=['level', '-created_at']),
+            # Keyset pagination of a deployment's logs, optionally by level
+            models.Index(fields=['deployment', 'id'], name='deployment_logs_keyset_idx'),
+            models.Index(fields=['deployment', 'level', 'id'], name='deployment_logs_level_idx'),
         ]
 
 
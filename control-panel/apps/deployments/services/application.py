@@ -15,22 +15,29 @@ This module implements the core deployment logic:
 import os
 import subprocess
 import shutil
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, Set, Tuple
 from django.conf import settings
-from git import Repo, GitCommandError
+from django.db import connection
+from git import GitCommandError
 from jinja2 import Environment, FileSystemLoader
 import logging
 
 from apps.core.utils import generate_port, validate_repo_url, generate_secret_key
 from apps.core.security.command_execution import safe_run_install_command, safe_run_build_command
 from ..models import BaseDeployment, ApplicationDeployment, DeploymentLog
+from ..shared import build_cache, dependency_cache
+from ..shared.build_cache import StepCache, StepTimings
+from ..shared.repo_index import get_repo_index, invalidate_repo_index
+from ..shared.repo_mirror import RepoMirror
+from ..shared.log_sink import LogSinkMixin
 from ..shared.validators import validate_project
 
 logger = logging.getLogger(__name__)
 
 
-class DeploymentService:
+class DeploymentService(LogSinkMixin):
     """Service for managing application deployments."""
 
     def __init__(self):
@@ -46,6 +53,10 @@ class DeploymentService:
         from template_registry import template_registry
         self.template_registry = template_registry
 
+        # Per-deployment state of the deploy in progress
+        self._step_timings: Dict[int, StepTimings] = {}
+        self._rendered_configs: Dict[int, Future] = {}
+
     def ensure_base_path(self) -> bool:
         """
         Ensure base deployment path exists.
@@ -211,16 +222,14 @@ class DeploymentService:
         """
         Log a deployment message.
 
+        Entries are buffered and written in batches (see ``shared/log_sink.py``).
+
         Args:
             deployment: Deployment instance
             message: Log message
             level: Log level (info, warning, error, success)
         """
-        DeploymentLog.objects.create(
-            deployment=deployment,
-            level=level,
-            message=message
-        )
+        self.get_log_sink(deployment).write(message, level)
         logger.info(f"[{deployment.name}] {message}")
 
     def validate_repo_url(self, repo_url: str) -> bool:
@@ -278,7 +287,10 @@ class DeploymentService:
         force: bool = False
     ) -> Path:
         """
-        Clone Git repository with improved error handling.
+        Clone or update the Git repository through the host mirror cache.
+
+        The repository is fetched incrementally into a shared bare mirror
+        (see ``shared/repo_mirror.py``) and checked out from there.
 
         Args:
             deployment: Deployment instance
@@ -304,112 +316,80 @@ class DeploymentService:
             self.log(deployment, f"Removing existing repository at {repo_path}")
             shutil.rmtree(repo_path)
 
-        # Clone repository
-        if not repo_path.exists():
+        # Handle private repositories that might need authentication
+        repo_url = deployment.repo_url
+        if repo_url.startswith('https://github.com/') and not repo_url.endswith('.git'):
+            repo_url += '.git'
+
+        is_update = repo_path.exists()
+        if is_update:
+            self.log(deployment, "Repository already exists, pulling latest changes")
+        else:
             self.log(deployment, f"Cloning repository: {deployment.repo_url}")
-            
-            # Handle private repositories that might need authentication
-            repo_url = deployment.repo_url
-            if repo_url.startswith('https://github.com/') and not repo_url.endswith('.git'):
-                repo_url += '.git'
-            
-            try:
-                # For public repositories, try HTTPS first
-                repo = Repo.clone_from(
-                    repo_url,
-                    repo_path,
-                    branch=deployment.branch,
-                    depth=1  # Shallow clone for faster cloning
-                )
-                self.log(
-                    deployment,
-                    f"Repository cloned successfully (branch: {deployment.branch})",
-                    DeploymentLog.Level.SUCCESS
-                )
-                return repo_path
-                
-            except GitCommandError as e:
-                error_msg = str(e)
-                
-                # Handle common errors with helpful messages
-                if "could not read Username" in error_msg:
-                    self.log(
-                        deployment,
-                        "Repository appears to be private or requires authentication. "
-                        "For private repos, ensure you've added a GitHub token in settings.",
-                        DeploymentLog.Level.ERROR
-                    )
-                elif "Repository not found" in error_msg:
-                    self.log(
-                        deployment,
-                        "Repository not found. Check the URL is correct and the repository is public.",
-                        DeploymentLog.Level.ERROR
+
+        mirror = RepoMirror(repo_url)
+        try:
+            with mirror.lock():
+                if mirror.sync():
+                    self.log(deployment, "Repository mirror cache hit, fetched incremental changes")
+                else:
+                    self.log(deployment, "Created repository mirror cache")
+
+                branch = mirror.resolve_branch(deployment.branch)
+                if branch is None:
+                    raise GitCommandError(
+                        ['git', 'checkout', deployment.branch], 1,
+                        stderr=f"Remote branch '{deployment.branch}' not found (nor 'main' or 'master')"
                     )
-                elif "branch" in error_msg.lower() and deployment.branch not in ['main', 'master']:
+                if branch != deployment.branch:
                     self.log(
                         deployment,
-                        f"Branch '{deployment.branch}' not found. Trying 'main' branch instead.",
+                        f"Branch '{deployment.branch}' not found. Using '{branch}' branch instead.",
                         DeploymentLog.Level.WARNING
                     )
-                    try:
-                        repo = Repo.clone_from(repo_url, repo_path, branch='main', depth=1)
-                        deployment.branch = 'main'
-                        deployment.save(update_fields=['branch'])
-                        self.log(
-                            deployment,
-                            "Repository cloned successfully using 'main' branch",
-                            DeploymentLog.Level.SUCCESS
-                        )
-                        return repo_path
-                    except GitCommandError:
-                        self.log(
-                            deployment,
-                            f"Branch 'main' also not found. Trying 'master' branch.",
-                            DeploymentLog.Level.WARNING
-                        )
-                        try:
-                            repo = Repo.clone_from(repo_url, repo_path, branch='master', depth=1)
-                            deployment.branch = 'master'
-                            deployment.save(update_fields=['branch'])
-                            self.log(
-                                deployment,
-                                "Repository cloned successfully using 'master' branch",
-                                DeploymentLog.Level.SUCCESS
-                            )
-                            return repo_path
-                        except GitCommandError as final_error:
-                            self.log(
-                                deployment,
-                                f"Failed to clone repository with any branch: {final_error}",
-                                DeploymentLog.Level.ERROR
-                            )
-                            raise final_error
-                else:
-                    self.log(
-                        deployment,
-                        f"Failed to clone repository: {error_msg}",
-                        DeploymentLog.Level.ERROR
-                    )
-                    raise e
-        else:
-            self.log(deployment, "Repository already exists, pulling latest changes")
-            try:
-                repo = Repo(repo_path)
-                origin = repo.remotes.origin
-                origin.pull()
+                    deployment.branch = branch
+                    deployment.save(update_fields=['branch'])
+
+                commit = mirror.checkout(repo_path, branch)
+                invalidate_repo_index(repo_path)
+
+        except GitCommandError as e:
+            error_msg = str(e)
+
+            # Handle common errors with helpful messages
+            if "could not read Username" in error_msg:
                 self.log(
                     deployment,
-                    "Repository updated successfully",
-                    DeploymentLog.Level.SUCCESS
+                    "Repository appears to be private or requires authentication. "
+                    "For private repos, ensure you've added a GitHub token in settings.",
+                    DeploymentLog.Level.ERROR
                 )
-                return repo_path
-            except GitCommandError as e:
+            elif "Repository not found" in error_msg:
+                self.log(
+                    deployment,
+                    "Repository not found. Check the URL is correct and the repository is public.",
+                    DeploymentLog.Level.ERROR
+                )
+            elif is_update:
                 self.log(
                     deployment,
                     f"Failed to update repository: {e}",
                     DeploymentLog.Level.ERROR
                 )
-                raise
+            else:
+                self.log(
+                    deployment,
+                    f"Failed to clone repository: {error_msg}",
+                    DeploymentLog.Level.ERROR
+                )
+            raise
+
+        if is_update:
+            message = f"Repository updated successfully (branch: {branch}, commit: {commit[:7]})"
+        else:
+            message = f"Repository cloned successfully (branch: {branch}, commit: {commit[:7]})"
+        self.log(deployment, message, DeploymentLog.Level.SUCCESS)
+        return repo_path
 
     def detect_project_type(self, deployment: ApplicationDeployment) -> str:
         """
@@ -422,31 +402,16 @@ class DeploymentService:
             Project type ('django' or 'static')
         """
         repo_path = self.get_repo_path(deployment)
+        index = get_repo_index(repo_path)
 
-        # Check for Django project - multiple indicators
-        manage_py = repo_path / "manage.py"
-        settings_py_patterns = [
-            repo_path / "settings.py",
-            repo_path / "*/settings.py",
-            repo_path / "config/settings.py",
-            repo_path / "**/settings/*.py"
-        ]
-        
         # Check requirements.txt for Django
-        requirements_file = repo_path / "requirements.txt"
-        has_django_in_requirements = False
-        
-        if requirements_file.exists():
-            try:
-                content = requirements_file.read_text()
-                has_django_in_requirements = 'django' in content.lower()
-            except:
-                pass
+        content = index.read_text('requirements.txt') or ''
+        has_django_in_requirements = 'django' in content.lower()
 
-        if manage_py.exists() or has_django_in_requirements:
+        # Check for Django project - multiple indicators
+        if index.exists('manage.py') or has_django_in_requirements:
             # Additional validation for Django structure
-            import glob
-            settings_files = glob.glob(str(repo_path / "**/settings.py"), recursive=True)
+            settings_files = index.find('settings.py')
             if settings_files or has_django_in_requirements:
                 self.log(deployment, "Detected Django project")
                 return ApplicationDeployment.ProjectType.DJANGO
@@ -461,21 +426,21 @@ class DeploymentService:
         ]
         
         for static_file in static_files:
-            if static_file.exists():
+            if index.exists(static_file):
                 self.log(deployment, f"Detected static site ({static_file.name} found)")
                 return ApplicationDeployment.ProjectType.STATIC
 
         # Check if it's a Django project without manage.py (some tutorials)
-        wsgi_files = list(repo_path.glob("**/wsgi.py"))
-        asgi_files = list(repo_path.glob("**/asgi.py"))
+        wsgi_files = index.find("wsgi.py")
+        asgi_files = index.find("asgi.py")
         
         if wsgi_files or asgi_files:
             self.log(deployment, "Detected Django project (WSGI/ASGI files found)")
             return ApplicationDeployment.ProjectType.DJANGO
 
         # Default to Django for repositories with Python files and no clear static indicators
-        python_files = list(repo_path.glob("**/*.py"))
-        if python_files and not any(static_file.exists() for static_file in static_files):
+        python_files = index.find("*.py")
+        if python_files and not any(index.exists(static_file) for static_file in static_files):
             self.log(
                 deployment,
                 "Detected Python files, defaulting to Django project type",
@@ -581,13 +546,44 @@ class DeploymentService:
             )
             return True
 
+        fingerprint = dependency_cache.requirements_fingerprint(requirements_file, venv_path)
+        if dependency_cache.venv_matches(venv_path, fingerprint):
+            self.log(
+                deployment,
+                "Dependency cache hit: requirements unchanged since last install, reusing virtual environment",
+                DeploymentLog.Level.SUCCESS
+            )
+            return True
+
+        # Invalidate until this install succeeds
+        dependency_cache.clear_venv_mark(venv_path)
+
+        source_venv = dependency_cache.find_venv(fingerprint, exclude=venv_path)
+        if source_venv:
+            try:
+                dependency_cache.clone_venv(source_venv, venv_path)
+                dependency_cache.mark_venv(venv_path, fingerprint)
+                self.log(
+                    deployment,
+                    f"Dependency cache hit: cloned packages from {source_venv}",
+                    DeploymentLog.Level.SUCCESS
+                )
+                return True
+            except Exception as e:
+                self.log(
+                    deployment,
+                    f"Failed to clone cached environment, installing instead: {e}",
+                    DeploymentLog.Level.WARNING
+                )
+
         pip_path = venv_path / "bin" / "pip"
         self.log(deployment, "Upgrading pip first")
         
         # Upgrade pip first
         try:
             subprocess.run(
-                [str(pip_path), "install", "--upgrade", "pip"],
+                [str(pip_path), "install", "--upgrade", "pip",
+                 "--cache-dir", str(dependency_cache.get_pip_cache_dir())],
                 check=True,
                 capture_output=True,
                 text=True,
@@ -600,18 +596,31 @@ class DeploymentService:
                 DeploymentLog.Level.WARNING
             )
 
-        self.log(deployment, "Installing dependencies from requirements.txt")
+        self.log(deployment, "Installing dependencies through the shared wheel cache")
 
         try:
-            # Install with better error handling and timeout
-            result = subprocess.run(
-                [str(pip_path), "install", "-r", str(requirements_file), "--no-cache-dir"],
-                check=True,
-                capture_output=True,
-                text=True,
-                cwd=str(repo_path),
-                timeout=600  # 10 minute timeout
-            )
+            try:
+                stats = dependency_cache.install_with_wheel_cache(
+                    pip_path, requirements_file, cwd=repo_path, timeout=600
+                )
+                self.log(deployment, f"Dependency cache: {stats}")
+            except subprocess.CalledProcessError as e:
+                # Some requirements cannot be built as wheels; install directly
+                self.log(
+                    deployment,
+                    f"Wheel cache build failed, installing directly: {e.stderr.strip()[-500:]}",
+                    DeploymentLog.Level.WARNING
+                )
+                subprocess.run(
+                    [str(pip_path), "install", "-r", str(requirements_file),
+                     "--cache-dir", str(dependency_cache.get_pip_cache_dir())],
+                    check=True,
+                    capture_output=True,
+                    text=True,
+                    cwd=str(repo_path),
+                    timeout=600  # 10 minute timeout
+                )
+            dependency_cache.mark_venv(venv_path, fingerprint)
             self.log(
                 deployment,
                 "Dependencies installed successfully",
@@ -826,7 +835,7 @@ LOG_DIR={logs_dir}
         repo_path = self.get_repo_path(deployment)
         
         # Find all settings.py files
-        settings_files = list(repo_path.rglob("settings.py"))
+        settings_files = get_repo_index(repo_path).find("settings.py")
         
         if not settings_files:
             self.log(
@@ -1037,6 +1046,22 @@ LOG_DIR={logs_dir}
         if not settings_module:
             settings_module = self.detect_django_settings_module(deployment)
 
+        # Skip when migrations, installed packages and database settings are unchanged
+        step_cache = StepCache(repo_path)
+        migrate_key = build_cache.migrations_key(
+            project_root,
+            settings_module or '',
+            build_cache.file_digest(venv_path / dependency_cache.MARKER_FILE),
+            build_cache.env_digest(repo_path / ".env", prefixes=('DATABASE', 'DB_')),
+        )
+        if step_cache.is_fresh('migrate', migrate_key):
+            self.log(
+                deployment,
+                "Migrations unchanged since last deploy, skipping migrate",
+                DeploymentLog.Level.SUCCESS
+            )
+            return True
+
         # Enhanced environment variables
         env = {
             **os.environ,
@@ -1054,6 +1079,7 @@ LOG_DIR={logs_dir}
                 env=env,
                 timeout=300  # 5 minute timeout
             )
+            step_cache.record('migrate', migrate_key)
             self.log(
                 deployment,
                 "Migrations completed successfully",
@@ -1163,6 +1189,20 @@ LOG_DIR={logs_dir}
         venv_path = self.get_venv_path(deployment)
         python_path = venv_path / "bin" / "python"
 
+        # Skip when static sources and installed packages are unchanged
+        step_cache = StepCache(self.get_repo_path(deployment))
+        static_key = build_cache.static_key(
+            project_root,
+            build_cache.file_digest(venv_path / dependency_cache.MARKER_FILE),
+        )
+        if step_cache.is_fresh('collectstatic', static_key):
+            self.log(
+                deployment,
+                "Static files unchanged since last deploy, skipping collectstatic",
+                DeploymentLog.Level.SUCCESS
+            )
+            return True
+
         self.log(deployment, "Collecting static files")
 
         try:
@@ -1174,6 +1214,7 @@ LOG_DIR={logs_dir}
                 cwd=str(project_root),
                 env={**os.environ, "PYTHONPATH": str(project_root)}
             )
+            step_cache.record('collectstatic', static_key)
             self.log(
                 deployment,
                 "Static files collected successfully",
@@ -1307,9 +1348,10 @@ LOG_DIR={logs_dir}
         if not asgi_module and not wsgi_module:
             excluded_dirs = {'migrations', 'tests', 'test', 'venv', 'env', '__pycache__', '.git'}
 
+            index = get_repo_index(repo_path)
+
             def _find_module(filename: str):
-                files = list(repo_path.rglob(filename))
-                valid = [f for f in files if not any(part in excluded_dirs for part in f.relative_to(repo_path).parts)]
+                valid = index.find(filename, exclude=excluded_dirs)
                 if not valid:
                     return None
                 rel = valid[0].relative_to(repo_path)
@@ -1631,6 +1673,11 @@ LOG_DIR={logs_dir}
         Returns:
             Tuple of (success, error_message)
         """
+        # Runs steps that do not depend on each other alongside the main sequence
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='deploy-step')
+        timings = self.get_step_timings(deployment)
+        venv_future: Optional[Future] = None
+
         try:
             # Trigger pre-deployment hooks
             try:
@@ -1651,10 +1698,18 @@ LOG_DIR={logs_dir}
             deployment.save(update_fields=['status'])
 
             # Clone repository
-            repo_path = self.clone_repository(deployment)
+            with timings.step('clone'):
+                repo_path = self.clone_repository(deployment)
+
+            # Create the virtualenv of likely Python projects while detection runs
+            if self._looks_like_python(repo_path):
+                venv_future = self._run_step_in_background(
+                    pool, deployment, 'venv', self.create_virtualenv, deployment
+                )
 
             # 🆕 NEW: Use buildpack auto-detection
-            buildpack_detected = self.detect_with_buildpacks(deployment)
+            with timings.step('detect'):
+                buildpack_detected = self.detect_with_buildpacks(deployment)
 
             # Fall back to old detection if buildpacks fail
             if not buildpack_detected:
@@ -1684,26 +1739,36 @@ LOG_DIR={logs_dir}
 
             # Handle different project types
             if deployment.project_type == ApplicationDeployment.ProjectType.DJANGO:
+                # Service configs only depend on detection and the port;
+                # render them while dependencies install
+                self._rendered_configs[deployment.pk] = self._run_step_in_background(
+                    pool, deployment, 'render_configs', self._render_service_configs, deployment
+                )
+
                 # Django-specific setup
-                self.create_virtualenv(deployment)
+                self._ensure_virtualenv(deployment, venv_future)
 
                 # Install dependencies
-                if not self.install_dependencies(deployment):
-                    return False, "Failed to install dependencies"
+                with timings.step('install'):
+                    if not self.install_dependencies(deployment):
+                        return False, "Failed to install dependencies"
 
                 # Run migrations
-                if not self.run_django_migrations(deployment):
-                    return False, "Failed to run migrations"
+                with timings.step('migrate'):
+                    if not self.run_django_migrations(deployment):
+                        return False, "Failed to run migrations"
 
                 # Collect static files
-                self.collect_static_files(deployment)
+                with timings.step('collectstatic'):
+                    self.collect_static_files(deployment)
 
             elif deployment.project_type == ApplicationDeployment.ProjectType.PYTHON:
                 # Generic Python (FastAPI, Flask, etc.)
-                self.create_virtualenv(deployment)
+                self._ensure_virtualenv(deployment, venv_future)
                 if deployment.install_command:
-                    if not self._run_install_command(deployment):
-                        return False, "Failed to install dependencies"
+                    with timings.step('install'):
+                        if not self._run_install_command(deployment):
+                            return False, "Failed to install dependencies"
 
             elif deployment.project_type in [
                 ApplicationDeployment.ProjectType.NODEJS,
@@ -1756,7 +1821,94 @@ LOG_DIR={logs_dir}
             deployment.save(update_fields=['status'])
             return False, error_msg
 
+        finally:
+            pool.shutdown(wait=True)
+
+    def get_step_timings(self, deployment: ApplicationDeployment) -> StepTimings:
+        """Step timings of the deploy in progress for a deployment."""
+        if deployment.pk not in self._step_timings:
+            self._step_timings[deployment.pk] = StepTimings()
+        return self._step_timings[deployment.pk]
+
+    def _run_step_in_background(
+        self,
+        pool: ThreadPoolExecutor,
+        deployment: ApplicationDeployment,
+        name: str,
+        func,
+        *args
+    ) -> Future:
+        """Run a deploy step on the pool, timing it under ``name``."""
+        timings = self.get_step_timings(deployment)
+
+        def run():
+            try:
+                with timings.step(name):
+                    return func(*args)
+            finally:
+                # Each pool thread owns its own database connection
+                connection.close()
+
+        return pool.submit(run)
+
+    def _looks_like_python(self, repo_path: Path) -> bool:
+        """Whether the checkout will most likely need a virtualenv."""
+        markers = ('requirements.txt', 'pyproject.toml', 'Pipfile', 'setup.py', 'manage.py')
+        return any(
+            (repo_path / directory / marker).exists()
+            for directory in ('', 'backend')
+            for marker in markers
+        )
+
+    def _ensure_virtualenv(self, deployment: ApplicationDeployment, venv_future: Optional[Future]) -> None:
+        """Wait for the background virtualenv, or create it now."""
+        if venv_future is not None:
+            venv_future.result()
+            return
+        with self.get_step_timings(deployment).step('venv'):
+            self.create_virtualenv(deployment)
+
+    def _render_service_configs(self, deployment: ApplicationDeployment) -> Dict[str, str]:
+        return {
+            'nginx': self.render_nginx_config(deployment),
+            'systemd': self.render_systemd_service(deployment),
+        }
+
+    def _take_rendered_config(self, deployment: ApplicationDeployment, kind: str) -> str:
+        """Use the config rendered during preparation, rendering it now if that failed."""
+        future = self._rendered_configs.get(deployment.pk)
+        if future is not None:
+            try:
+                return future.result()[kind]
+            except Exception:
+                pass
+        if kind == 'nginx':
+            return self.render_nginx_config(deployment)
+        return self.render_systemd_service(deployment)
+
     def deploy(self, deployment: ApplicationDeployment) -> Dict[str, Any]:
+        """
+        Run the complete deployment process.
+
+        Buffered log entries are flushed when the deployment completes or fails.
+        Step timings are logged and kept with the checkout's build cache.
+        """
+        timings = self._step_timings[deployment.pk] = StepTimings()
+        try:
+            result = self._deploy(deployment)
+            result['step_timings'] = timings.as_dict()
+            return result
+        finally:
+            self.log(deployment, timings.summary())
+            try:
+                StepCache(self.get_repo_path(deployment)).record_timings(timings.as_dict())
+            except OSError:
+                pass
+            self._step_timings.pop(deployment.pk, None)
+            self._rendered_configs.pop(deployment.pk, None)
+            self.flush_logs(deployment)
+
+    def _deploy(self, deployment: ApplicationDeployment) -> Dict[str, Any]:
         """
         Complete deployment process.
 
@@ -1783,7 +1935,8 @@ LOG_DIR={logs_dir}
         # Run project validation before creating services
         try:
             repo_path = self.get_repo_path(deployment)
-            all_passed, results = validate_project(repo_path)
+            with self.get_step_timings(deployment).step('validate'):
+                all_passed, results = validate_project(repo_path)
 
             # Log all validation results
             for r in results:
@@ -1818,7 +1971,7 @@ LOG_DIR={logs_dir}
         if deployment.project_type == ApplicationDeployment.ProjectType.DJANGO:
             # Create Nginx configuration
             self.log(deployment, "Creating Nginx configuration")
-            nginx_config = self.render_nginx_config(deployment)
+            nginx_config = self._take_rendered_config(deployment, 'nginx')
             nginx_success, nginx_msg = service_manager.install_nginx_config(
                 deployment,
                 nginx_config
@@ -1836,7 +1989,7 @@ LOG_DIR={logs_dir}
 
             # Create systemd service
             self.log(deployment, "Creating systemd service")
-            service_config = self.render_systemd_service(deployment)
+            service_config = self._take_rendered_config(deployment, 'systemd')
             service_success, service_msg = service_manager.install_service(
                 deployment,
                 service_config
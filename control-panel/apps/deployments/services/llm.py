@@ -26,11 +26,12 @@ from ..models import BaseDeployment, ApplicationDeployment, LLMDeployment, Deplo
 from .prerequisites import SystemPrerequisitesInstaller
 from .autohealing import autohealer, RetryConfig, RetryStrategy
 from ..shared.llm_detection import detect_model
+from ..shared.log_sink import LogSinkMixin
 
 logger = logging.getLogger(__name__)
 
 
-class LLMDeploymentService:
+class LLMDeploymentService(LogSinkMixin):
     """Service for managing LLM model deployments with vLLM."""
 
     def __init__(self):
@@ -86,16 +87,14 @@ class LLMDeploymentService:
         """
         Log a deployment message.
 
+        Entries are buffered and written in batches (see ``shared/log_sink.py``).
+
         Args:
             deployment: Deployment instance
             message: Log message
             level: Log level (info, warning, error, success)
         """
-        DeploymentLog.objects.create(
-            deployment=deployment,
-            level=level,
-            message=message
-        )
+        self.get_log_sink(deployment).write(message, level)
         logger.info(f"[LLM:{deployment.name}] {message}")
 
     def run_command_with_progress(
@@ -1304,6 +1303,17 @@ except Exception as e:
             return False, error_msg
 
     def deploy_llm(self, deployment: LLMDeployment) -> Dict[str, Any]:
+        """
+        Run the complete LLM deployment process.
+
+        Buffered log entries are flushed when the deployment completes or fails.
+        """
+        try:
+            return self._deploy_llm(deployment)
+        finally:
+            self.flush_logs(deployment)
+
+    def _deploy_llm(self, deployment: LLMDeployment) -> Dict[str, Any]:
         """
         Complete LLM deployment process.
 
@@ -16,11 +16,12 @@ import logging
 from apps.core.utils import generate_port
 from apps.core.integrations.services import HuggingFaceIntegrationService
 from ..models import LLMDeployment, DeploymentLog
+from ..shared.log_sink import LogSinkMixin
 
 logger = logging.getLogger(__name__)
 
 
-class TransformersLLMService:
+class TransformersLLMService(LogSinkMixin):
     """Service for deploying LLMs using Transformers backend."""
 
     def __init__(self):
@@ -51,11 +52,7 @@ class TransformersLLMService:
         level: str = DeploymentLog.Level.INFO
     ) -> None:
         """Log a deployment message."""
-        DeploymentLog.objects.create(
-            deployment=deployment,
-            level=level,
-            message=message
-        )
+        self.get_log_sink(deployment).write(message, level)
         logger.info(f"[Transformers:{deployment.name}] {message}")
 
     def create_transformers_environment(self, deployment: LLMDeployment) -> bool:
@@ -372,6 +369,17 @@ print("Model downloaded successfully!")
             return False
 
     def deploy_transformers(self, deployment: LLMDeployment) -> Dict[str, Any]:
+        """
+        Run the complete Transformers deployment process.
+
+        Buffered log entries are flushed when the deployment completes or fails.
+        """
+        try:
+            return self._deploy_transformers(deployment)
+        finally:
+            self.flush_logs(deployment)
+
+    def _deploy_transformers(self, deployment: LLMDeployment) -> Dict[str, Any]:
         """
         Complete Transformers deployment process.
 
@@ -0,0 +1,168 @@
+"""
+Build step cache and timings for deployments.
+
+Each cacheable deploy step (migrations, collectstatic) is keyed by a
+content hash of its inputs. The key of the last successful run is stored
+in the checkout's ``.git`` directory, so it survives redeploys of new
+commits but disappears with the checkout itself (e.g. a forced re-clone).
+A step whose key is unchanged is skipped.
+
+Step timings of the last deploy are stored alongside, so it is visible
+where deploy time goes.
+"""
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+CACHE_FILE = 'webops-build-cache.json'
+
+# Directories never holding build inputs
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'venv', '.venv', 'staticfiles', 'media'}
+
+
+def _iter_files(root: Path, include: Callable[[str, str], bool]) -> Iterator[str]:
+    """Relative paths of files under ``root`` accepted by ``include(relative_dir, name)``, sorted."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        relative_dir = os.path.relpath(dirpath, root)
+        for name in filenames:
+            if include(relative_dir, name):
+                found.append(os.path.join(relative_dir, name))
+    return iter(sorted(found))
+
+
+def hash_files(root: Path, include: Callable[[str, str], bool], extra: Iterable[str] = ()) -> str:
+    """
+    Content hash of the selected files under ``root`` plus extra inputs.
+
+    Paths are part of the hash, so renames and deletions change it too.
+    """
+    digest = hashlib.sha256()
+    for value in extra:
+        digest.update(value.encode())
+        digest.update(b'\0')
+    for relative in _iter_files(root, include):
+        digest.update(relative.encode())
+        digest.update(b'\0')
+        try:
+            with open(root / relative, 'rb') as f:
+                for block in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(block)
+        except OSError:
+            continue
+    return digest.hexdigest()
+
+
+def _is_migration(relative_dir: str, name: str) -> bool:
+    return name.endswith('.py') and os.path.basename(relative_dir) == 'migrations'
+
+
+def _is_static_source(relative_dir: str, name: str) -> bool:
+    return 'static' in Path(relative_dir).parts
+
+
+def migrations_key(project_root: Path, *inputs: str) -> str:
+    """Key for ``migrate``: all migration files plus e.g. settings and requirements."""
+    return hash_files(project_root, _is_migration, inputs)
+
+
+def static_key(project_root: Path, *inputs: str) -> str:
+    """Key for ``collectstatic``: all static source files plus e.g. requirements."""
+    return hash_files(project_root, _is_static_source, inputs)
+
+
+def file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return ''
+
+
+def env_digest(path: Path, prefixes: Iterable[str]) -> str:
+    """Hash only the .env lines whose keys start with one of ``prefixes``.
+
+    Generated values such as SECRET_KEY change on every deploy and must not
+    invalidate steps that do not depend on them.
+    """
+    prefixes = tuple(prefixes)
+    try:
+        lines = path.read_text(errors='replace').splitlines()
+    except OSError:
+        return ''
+    selected = sorted(line.strip() for line in lines if line.strip().startswith(prefixes))
+    return hashlib.sha256('\n'.join(selected).encode()).hexdigest()
+
+
+class StepCache:
+    """Keys of the last successful run of each step, stored in the checkout."""
+
+    def __init__(self, repo_path: Path) -> None:
+        self.path = repo_path / '.git' / CACHE_FILE
+        self._data: Optional[Dict] = None
+
+    def _load(self) -> Dict:
+        if self._data is None:
+            try:
+                self._data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                self._data = {}
+        return self._data
+
+    def _save(self) -> None:
+        if not self.path.parent.is_dir():
+            return
+        tmp = self.path.with_suffix('.tmp')
+        tmp.write_text(json.dumps(self._load(), indent=2))
+        os.replace(tmp, self.path)
+
+    def is_fresh(self, step: str, key: str) -> bool:
+        return self._load().get('steps', {}).get(step) == key
+
+    def record(self, step: str, key: str) -> None:
+        self._load().setdefault('steps', {})[step] = key
+        self._save()
+
+    def invalidate(self, step: str) -> None:
+        if self._load().get('steps', {}).pop(step, None) is not None:
+            self._save()
+
+    def record_timings(self, timings: Dict[str, float]) -> None:
+        self._load()['last_timings'] = timings
+        self._save()
+
+    @property
+    def last_timings(self) -> Dict[str, float]:
+        return self._load().get('last_timings', {})
+
+
+class StepTimings:
+    """Wall-clock duration of each deploy step, in the order they ran."""
+
+    def __init__(self) -> None:
+        self.steps: Dict[str, float] = {}
+        self._started = time.monotonic()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.steps[name] = round(self.steps.get(name, 0.0) + time.monotonic() - start, 2)
+
+    @property
+    def total(self) -> float:
+        return round(time.monotonic() - self._started, 2)
+
+    def summary(self) -> str:
+        parts = [f"{name} {seconds:.1f}s" for name, seconds in self.steps.items()]
+        return f"Step timings (total {self.total:.1f}s): " + ', '.join(parts)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {**self.steps, 'total': self.total}
@@ -67,9 +67,13 @@ def detect_project(repo_path: str) -> BuildpackResult:
         BuildpackResult with detected configuration
     """
     from pathlib import Path
+    from ..repo_index import get_repo_index
 
     repo = Path(repo_path)
 
+    # One walk of the checkout answers every buildpack's file probes
+    get_repo_index(repo)
+
     for buildpack in ALL_BUILDPACKS:
         result = buildpack.detect(repo)
         if result.detected:
@@ -5,6 +5,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
 
+from ..repo_index import get_repo_index, path_exists, read_repo_file
+
 
 @dataclass
 class BuildpackResult:
@@ -49,46 +51,30 @@ class Buildpack(ABC):
 
     def _file_exists(self, repo_path: Path, *paths: str) -> bool:
         """Check if file exists in repo."""
-        for path in paths:
-            if (repo_path / path).exists():
-                return True
-        return False
+        index = get_repo_index(repo_path)
+        return any(index.exists(path) for path in paths)
+
+    def _path_exists(self, path: Path) -> bool:
+        """Check if a path inside an indexed repo exists."""
+        return path_exists(path)
 
     def _read_file(self, file_path: Path) -> Optional[str]:
         """Safely read file contents."""
-        try:
-            return file_path.read_text()
-        except Exception:
-            return None
+        return read_repo_file(file_path)
 
-    def _find_files(self, repo_path: Path, pattern: str, max_depth: int = 3) -> List[Path]:
+    def _find_files(self, repo_path: Path, pattern: str, max_depth: Optional[int] = 3) -> List[Path]:
         """
         Find files matching pattern.
 
+        Vendored and generated directories (.git, node_modules,
+        virtualenvs, ...) are never searched.
+
         Args:
             repo_path: Repository path
-            pattern: Glob pattern
-            max_depth: Maximum search depth
+            pattern: Glob pattern matched against file names
+            max_depth: Maximum search depth (None for the index's bound)
 
         Returns:
-            List of matching file paths
+            List of matching file paths, shallowest first
         """
-        excluded_dirs = {'.git', 'node_modules', 'venv', '.venv', 'env', '__pycache__', '.tox'}
-        results = []
-
-        for file in repo_path.rglob(pattern):
-            # Check depth
-            try:
-                relative = file.relative_to(repo_path)
-                if len(relative.parts) > max_depth:
-                    continue
-
-                # Check excluded dirs
-                if any(excluded in relative.parts for excluded in excluded_dirs):
-                    continue
-
-                results.append(file)
-            except ValueError:
-                continue
-
-        return results
+        return get_repo_index(repo_path).find(pattern, max_depth=max_depth)
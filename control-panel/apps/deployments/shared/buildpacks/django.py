@@ -98,7 +98,7 @@ class DjangoBuildpack(Buildpack):
 
         for req_file in req_files:
             path = repo_path / req_file
-            if path.exists():
+            if self._path_exists(path):
                 content = self._read_file(path)
                 if content and 'django' in content.lower():
                     return True
@@ -142,7 +142,7 @@ class DjangoBuildpack(Buildpack):
         """Detect Python version from runtime.txt or pyproject.toml."""
         # Check runtime.txt (Heroku style)
         runtime_txt = repo_path / 'runtime.txt'
-        if runtime_txt.exists():
+        if self._path_exists(runtime_txt):
             content = self._read_file(runtime_txt)
             if content:
                 # Format: python-3.11.0
@@ -151,7 +151,7 @@ class DjangoBuildpack(Buildpack):
 
         # Check pyproject.toml
         pyproject = repo_path / 'pyproject.toml'
-        if pyproject.exists():
+        if self._path_exists(pyproject):
             content = self._read_file(pyproject)
             if content and 'python' in content:
                 # Try to extract version
@@ -165,11 +165,11 @@ class DjangoBuildpack(Buildpack):
 
     def _detect_dependency_manager(self, repo_path: Path) -> str:
         """Detect Python dependency manager."""
-        if (repo_path / 'poetry.lock').exists():
+        if self._file_exists(repo_path, 'poetry.lock'):
             return 'poetry'
-        if (repo_path / 'Pipfile.lock').exists():
+        if self._file_exists(repo_path, 'Pipfile.lock'):
             return 'pipenv'
-        if (repo_path / 'pdm.lock').exists():
+        if self._file_exists(repo_path, 'pdm.lock'):
             return 'pdm'
         return 'pip'
 
@@ -183,11 +183,11 @@ class DjangoBuildpack(Buildpack):
             return 'pdm install --prod'
         else:  # pip
             # Find requirements file
-            if (repo_path / 'requirements.txt').exists():
+            if self._file_exists(repo_path, 'requirements.txt'):
                 return 'pip install -r requirements.txt'
-            elif (repo_path / 'requirements' / 'production.txt').exists():
+            elif self._file_exists(repo_path, 'requirements/production.txt'):
                 return 'pip install -r requirements/production.txt'
-            elif (repo_path / 'requirements' / 'base.txt').exists():
+            elif self._file_exists(repo_path, 'requirements/base.txt'):
                 return 'pip install -r requirements/base.txt'
             else:
                 return 'pip install -r requirements.txt'
@@ -12,7 +12,7 @@ class DockerBuildpack(Buildpack):
         dockerfile = repo_path / 'Dockerfile'
         docker_compose = repo_path / 'docker-compose.yml'
 
-        if not dockerfile.exists():
+        if not self._path_exists(dockerfile):
             return BuildpackResult(detected=False, buildpack_name=self.name,
                                    project_type='docker', confidence=0.0)
 
@@ -25,10 +25,10 @@ class DockerBuildpack(Buildpack):
             start_command='docker run -p $PORT:$PORT app',
             install_command='',
             dockerfile_path='Dockerfile',
-            docker_compose_path='docker-compose.yml' if docker_compose.exists() else None,
+            docker_compose_path='docker-compose.yml' if self._path_exists(docker_compose) else None,
             port=8080,
             env_vars={},
             metadata={
-                'has_compose': docker_compose.exists()
+                'has_compose': self._path_exists(docker_compose)
             }
         )
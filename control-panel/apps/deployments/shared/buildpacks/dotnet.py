@@ -14,8 +14,8 @@ class DotNetBuildpack(Buildpack):
     def detect(self, repo_path: Path) -> BuildpackResult:
         """Detect .NET project."""
         # Look for .csproj or .sln files
-        csproj_files = list(repo_path.glob('*.csproj')) + list(repo_path.glob('**/*.csproj'))
-        sln_files = list(repo_path.glob('*.sln'))
+        csproj_files = self._find_files(repo_path, '*.csproj', max_depth=None)
+        sln_files = self._find_files(repo_path, '*.sln', max_depth=1)
 
         if not csproj_files and not sln_files:
             return BuildpackResult(
@@ -14,7 +14,7 @@ class ElixirBuildpack(Buildpack):
         """Detect Elixir project."""
         mix_exs = repo_path / 'mix.exs'
 
-        if not mix_exs.exists():
+        if not self._path_exists(mix_exs):
             return BuildpackResult(
                 detected=False,
                 buildpack_name=self.name,
@@ -93,7 +93,7 @@ class ElixirBuildpack(Buildpack):
         """Detect Elixir version."""
         # Check .tool-versions (asdf)
         tool_versions = repo_path / '.tool-versions'
-        if tool_versions.exists():
+        if self._path_exists(tool_versions):
             content = self._read_file(tool_versions)
             if content:
                 import re
@@ -103,7 +103,7 @@ class ElixirBuildpack(Buildpack):
 
         # Check elixir_buildpack.config
         buildpack_config = repo_path / 'elixir_buildpack.config'
-        if buildpack_config.exists():
+        if self._path_exists(buildpack_config):
             content = self._read_file(buildpack_config)
             if content:
                 import re
@@ -118,7 +118,7 @@ class ElixirBuildpack(Buildpack):
         """Detect Erlang/OTP version."""
         # Check .tool-versions (asdf)
         tool_versions = repo_path / '.tool-versions'
-        if tool_versions.exists():
+        if self._path_exists(tool_versions):
             content = self._read_file(tool_versions)
             if content:
                 import re
@@ -128,7 +128,7 @@ class ElixirBuildpack(Buildpack):
 
         # Check elixir_buildpack.config
         buildpack_config = repo_path / 'elixir_buildpack.config'
-        if buildpack_config.exists():
+        if self._path_exists(buildpack_config):
             content = self._read_file(buildpack_config)
             if content:
                 import re
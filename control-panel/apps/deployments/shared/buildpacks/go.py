@@ -14,7 +14,7 @@ class GoBuildpack(Buildpack):
         """Detect Go project."""
         go_mod = repo_path / 'go.mod'
 
-        if not go_mod.exists():
+        if not self._path_exists(go_mod):
             return BuildpackResult(detected=False, buildpack_name=self.name,
                                    project_type='go', confidence=0.0)
 
@@ -63,6 +63,6 @@ class GoBuildpack(Buildpack):
         """Find main.go file."""
         candidates = ['main.go', 'cmd/main.go', 'cmd/server/main.go']
         for candidate in candidates:
-            if (repo_path / candidate).exists():
+            if self._file_exists(repo_path, candidate):
                 return candidate
         return 'main.go'
@@ -14,9 +14,9 @@ class JavaBuildpack(Buildpack):
     def detect(self, repo_path: Path) -> BuildpackResult:
         """Detect Java project."""
         # Check for build files
-        has_maven = (repo_path / 'pom.xml').exists()
-        has_gradle = (repo_path / 'build.gradle').exists() or (repo_path / 'build.gradle.kts').exists()
-        has_gradlew = (repo_path / 'gradlew').exists()
+        has_maven = self._file_exists(repo_path, 'pom.xml')
+        has_gradle = self._file_exists(repo_path, 'build.gradle', 'build.gradle.kts')
+        has_gradlew = self._file_exists(repo_path, 'gradlew')
 
         if not (has_maven or has_gradle):
             return BuildpackResult(
@@ -35,8 +35,8 @@ class JavaBuildpack(Buildpack):
         # Determine build tool
         if has_maven:
             build_tool = 'maven'
-            install_cmd = './mvnw clean install -DskipTests' if (repo_path / 'mvnw').exists() else 'mvn clean install -DskipTests'
-            build_cmd = './mvnw package -DskipTests' if (repo_path / 'mvnw').exists() else 'mvn package -DskipTests'
+            install_cmd = './mvnw clean install -DskipTests' if self._file_exists(repo_path, 'mvnw') else 'mvn clean install -DskipTests'
+            build_cmd = './mvnw package -DskipTests' if self._file_exists(repo_path, 'mvnw') else 'mvn package -DskipTests'
         else:
             build_tool = 'gradle'
             install_cmd = './gradlew build -x test' if has_gradlew else 'gradle build -x test'
@@ -71,7 +71,7 @@ class JavaBuildpack(Buildpack):
             },
             metadata={
                 'build_tool': build_tool,
-                'has_wrapper': has_gradlew or (repo_path / 'mvnw').exists(),
+                'has_wrapper': has_gradlew or self._file_exists(repo_path, 'mvnw'),
             }
         )
 
@@ -92,7 +92,7 @@ class JavaBuildpack(Buildpack):
         if has_gradle:
             for gradle_file in ['build.gradle', 'build.gradle.kts']:
                 gradle_path = repo_path / gradle_file
-                if gradle_path.exists():
+                if self._path_exists(gradle_path):
                     gradle_content = self._read_file(gradle_path)
                     if gradle_content:
                         if 'org.springframework.boot' in gradle_content:
@@ -125,7 +125,7 @@ class JavaBuildpack(Buildpack):
         if has_gradle:
             for gradle_file in ['build.gradle', 'build.gradle.kts']:
                 gradle_path = repo_path / gradle_file
-                if gradle_path.exists():
+                if self._path_exists(gradle_path):
                     gradle_content = self._read_file(gradle_path)
                     if gradle_content:
                         import re
@@ -16,7 +16,7 @@ class NodeJSBuildpack(Buildpack):
         """Detect Node.js project."""
         package_json = repo_path / 'package.json'
 
-        if not package_json.exists():
+        if not self._path_exists(package_json):
             return BuildpackResult(
                 detected=False,
                 buildpack_name=self.name,
@@ -76,7 +76,7 @@ class NodeJSBuildpack(Buildpack):
     def _read_package_json(self, path: Path) -> Optional[dict]:
         """Read and parse package.json."""
         try:
-            return json.loads(path.read_text())
+            return json.loads(self._read_file(path))
         except Exception:
             return None
 
@@ -157,11 +157,11 @@ class NodeJSBuildpack(Buildpack):
 
     def _detect_package_manager(self, repo_path: Path) -> str:
         """Detect package manager (npm, yarn, pnpm, bun)."""
-        if (repo_path / 'pnpm-lock.yaml').exists():
+        if self._file_exists(repo_path, 'pnpm-lock.yaml'):
             return 'pnpm'
-        if (repo_path / 'yarn.lock').exists():
+        if self._file_exists(repo_path, 'yarn.lock'):
             return 'yarn'
-        if (repo_path / 'bun.lockb').exists():
+        if self._file_exists(repo_path, 'bun.lockb'):
             return 'bun'
         return 'npm'
 
@@ -174,7 +174,7 @@ class NodeJSBuildpack(Buildpack):
             'bun': 'bun.lockb'
         }
         lock_file = lock_files.get(package_manager, 'package-lock.json')
-        return (repo_path / lock_file).exists()
+        return self._file_exists(repo_path, lock_file)
 
     def _get_install_command(self, package_manager: str) -> str:
         """Get install command for package manager."""
@@ -240,7 +240,7 @@ class NodeJSBuildpack(Buildpack):
 
         for entry_file in entry_files:
             file_path = repo_path / entry_file
-            if file_path.exists():
+            if self._path_exists(file_path):
                 content = self._read_file(file_path)
                 if content:
                     # Look for common port patterns
@@ -19,9 +19,9 @@ class PythonBuildpack(Buildpack):
                                    project_type='python', confidence=0.0)
 
         # Check for dependency files
-        has_requirements = (repo_path / 'requirements.txt').exists()
-        has_pyproject = (repo_path / 'pyproject.toml').exists()
-        has_pipfile = (repo_path / 'Pipfile').exists()
+        has_requirements = self._file_exists(repo_path, 'requirements.txt')
+        has_pyproject = self._file_exists(repo_path, 'pyproject.toml')
+        has_pipfile = self._file_exists(repo_path, 'Pipfile')
 
         if not (has_requirements or has_pyproject or has_pipfile):
             return BuildpackResult(detected=False, buildpack_name=self.name,
@@ -53,7 +53,7 @@ class PythonBuildpack(Buildpack):
     def _detect_framework(self, repo_path: Path) -> tuple[str, float]:
         """Detect Python web framework."""
         req_content = ''
-        if (repo_path / 'requirements.txt').exists():
+        if self._file_exists(repo_path, 'requirements.txt'):
             req_content = self._read_file(repo_path / 'requirements.txt') or ''
 
         # FastAPI
@@ -70,9 +70,9 @@ class PythonBuildpack(Buildpack):
 
     def _detect_dependency_manager(self, repo_path: Path) -> str:
         """Detect dependency manager."""
-        if (repo_path / 'poetry.lock').exists():
+        if self._file_exists(repo_path, 'poetry.lock'):
             return 'poetry'
-        if (repo_path / 'Pipfile.lock').exists():
+        if self._file_exists(repo_path, 'Pipfile.lock'):
             return 'pipenv'
         return 'pip'
 
@@ -88,7 +88,7 @@ class PythonBuildpack(Buildpack):
         """Get start command."""
         if framework == 'fastapi':
             # Look for main.py or app.py
-            if (repo_path / 'main.py').exists():
+            if self._file_exists(repo_path, 'main.py'):
                 return 'uvicorn main:app --host 0.0.0.0 --port $PORT'
             return 'uvicorn app:app --host 0.0.0.0 --port $PORT'
         elif framework == 'flask':
@@ -10,14 +10,14 @@ class RubyBuildpack(Buildpack):
 
     def detect(self, repo_path: Path) -> BuildpackResult:
         gemfile = repo_path / 'Gemfile'
-        if not gemfile.exists():
+        if not self._path_exists(gemfile):
             return BuildpackResult(detected=False, buildpack_name=self.name,
                                    project_type='ruby', confidence=0.0)
 
         framework = 'ruby'
-        if (repo_path / 'config.ru').exists():
+        if self._file_exists(repo_path, 'config.ru'):
             framework = 'rack'
-        if (repo_path / 'config' / 'application.rb').exists():
+        if self._file_exists(repo_path, 'config/application.rb'):
             framework = 'rails'
 
         start_cmd = 'bundle exec puma -C config/puma.rb' if framework == 'rails' else 'bundle exec rackup -o 0.0.0.0 -p $PORT'
@@ -9,7 +9,7 @@ class RustBuildpack(Buildpack):
     display_name = 'Rust'
 
     def detect(self, repo_path: Path) -> BuildpackResult:
-        if not (repo_path / 'Cargo.toml').exists():
+        if not self._file_exists(repo_path, 'Cargo.toml'):
             return BuildpackResult(detected=False, buildpack_name=self.name,
                                    project_type='rust', confidence=0.0)
 
@@ -20,16 +20,16 @@ class StaticBuildpack(Buildpack):
             repo_path / 'build' / 'index.html',
         ]
 
-        has_static = any(path.exists() for path in static_indicators)
+        has_static = any(self._path_exists(path) for path in static_indicators)
 
         if not (html_files or has_static):
             return BuildpackResult(detected=False, buildpack_name=self.name,
                                    project_type='static', confidence=0.0)
 
         # Determine static site root
-        static_root = 'public' if (repo_path / 'public' / 'index.html').exists() else \
-                      'dist' if (repo_path / 'dist' / 'index.html').exists() else \
-                      'build' if (repo_path / 'build' / 'index.html').exists() else '.'
+        static_root = 'public' if self._file_exists(repo_path, 'public/index.html') else \
+                      'dist' if self._file_exists(repo_path, 'dist/index.html') else \
+                      'build' if self._file_exists(repo_path, 'build/index.html') else '.'
 
         return BuildpackResult(
             detected=True, buildpack_name=self.name, project_type='static',
@@ -0,0 +1,235 @@
+"""
+Host-level Python dependency cache for deployments.
+
+Shared by every application deployment on the host:
+- A wheel directory: each requirement is built into a wheel once and then
+  installed offline by every deployment that needs the same version
+- pip's HTTP cache, so downloads are content-addressed and reused
+- A requirements fingerprint stored in each virtual environment after a
+  successful install. An unchanged fingerprint means the venv can be
+  reused as is, and a venv built for the same fingerprint elsewhere can be
+  cloned with hard links instead of installing again
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Set
+
+from django.conf import settings
+
+MARKER_FILE = '.webops-requirements.sha256'
+
+# Options inside a requirements file that pull in other files
+INCLUDE_PATTERN = re.compile(r'^\s*(?:-r|--requirement|-c|--constraint)[\s=]+(\S+)')
+
+
+@dataclass
+class CacheStats:
+    """Wheel cache usage for one install."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def __str__(self) -> str:
+        return f"{self.hits} cached, {self.misses} built"
+
+
+def get_cache_root() -> Path:
+    """Root directory of the host-level cache."""
+    return Path(settings.WEBOPS_CACHE_PATH)
+
+
+def get_wheel_dir() -> Path:
+    return get_cache_root() / 'wheels'
+
+
+def get_pip_cache_dir() -> Path:
+    return get_cache_root() / 'pip'
+
+
+def _venv_index_path(fingerprint: str) -> Path:
+    return get_cache_root() / 'venvs' / f'{fingerprint}.json'
+
+
+def _requirements_files(requirements_file: Path, seen: Optional[Set[Path]] = None) -> List[Path]:
+    """The requirements file and every file it includes, in order."""
+    seen = seen if seen is not None else set()
+    path = requirements_file.resolve()
+    if path in seen or not path.is_file():
+        return []
+    seen.add(path)
+
+    files = [path]
+    for line in path.read_text(errors='replace').splitlines():
+        match = INCLUDE_PATTERN.match(line)
+        if match:
+            files.extend(_requirements_files(path.parent / match.group(1), seen))
+    return files
+
+
+def _python_version(venv_path: Path) -> str:
+    """Interpreter version recorded in the venv's pyvenv.cfg."""
+    try:
+        for line in (venv_path / 'pyvenv.cfg').read_text().splitlines():
+            key, _, value = line.partition('=')
+            if key.strip() in ('version', 'version_info'):
+                return value.strip()
+    except OSError:
+        pass
+    return ''
+
+
+def requirements_fingerprint(requirements_file: Path, venv_path: Path) -> str:
+    """
+    Hash the requirements (including -r/-c includes) and the interpreter version.
+
+    Args:
+        requirements_file: Top-level requirements file
+        venv_path: Virtual environment the requirements are installed into
+
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    digest = hashlib.sha256()
+    digest.update(_python_version(venv_path).encode())
+    for path in _requirements_files(requirements_file):
+        digest.update(b'\0')
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def venv_matches(venv_path: Path, fingerprint: str) -> bool:
+    """Whether the venv was last successfully installed from this fingerprint."""
+    try:
+        return (venv_path / MARKER_FILE).read_text().strip() == fingerprint
+    except OSError:
+        return False
+
+
+def mark_venv(venv_path: Path, fingerprint: str) -> None:
+    """Record a successful install and index the venv for cloning."""
+    (venv_path / MARKER_FILE).write_text(fingerprint)
+
+    index = _venv_index_path(fingerprint)
+    index.parent.mkdir(parents=True, exist_ok=True)
+    index.write_text(json.dumps({'venv': str(venv_path)}))
+
+
+def clear_venv_mark(venv_path: Path) -> None:
+    try:
+        (venv_path / MARKER_FILE).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def find_venv(fingerprint: str, exclude: Optional[Path] = None) -> Optional[Path]:
+    """Find another venv that was installed from this fingerprint."""
+    try:
+        source = Path(json.loads(_venv_index_path(fingerprint).read_text())['venv'])
+    except (OSError, ValueError, KeyError):
+        return None
+
+    if exclude is not None and source == exclude:
+        return None
+    # The venv may have been reinstalled with other requirements since
+    if not venv_matches(source, fingerprint):
+        return None
+    return source
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def clone_venv(source: Path, target: Path) -> None:
+    """
+    Clone installed packages from ``source`` into the fresh venv ``target``.
+
+    site-packages is hard-linked file by file (copied across filesystems).
+    pip replaces files rather than writing into them, so later installs in
+    either venv never affect the other. Console scripts are copied with
+    their shebang pointed at the target interpreter.
+    """
+    for source_site in source.glob('lib/python*/site-packages'):
+        target_site = target / source_site.relative_to(source)
+        shutil.rmtree(target_site, ignore_errors=True)
+        shutil.copytree(source_site, target_site, symlinks=True, copy_function=_link_or_copy)
+
+    source_prefix = str(source).encode()
+    target_prefix = str(target).encode()
+    for script in (source / 'bin').iterdir():
+        target_script = target / 'bin' / script.name
+        if script.is_symlink() or not script.is_file() or target_script.exists():
+            continue
+        content = script.read_bytes()
+        if content.startswith(b'#!'):
+            shebang, newline, rest = content.partition(b'\n')
+            content = shebang.replace(source_prefix, target_prefix) + newline + rest
+        target_script.write_bytes(content)
+        shutil.copymode(script, target_script)
+
+
+def _cached_wheels() -> Set[str]:
+    wheel_dir = get_wheel_dir()
+    if not wheel_dir.is_dir():
+        return set()
+    return {path.name for path in wheel_dir.glob('*.whl')}
+
+
+def install_with_wheel_cache(
+    pip_path: Path,
+    requirements_file: Path,
+    cwd: Path,
+    timeout: int = 600
+) -> CacheStats:
+    """
+    Install requirements through the shared wheel cache.
+
+    ``pip wheel`` only builds wheels missing from the cache, then the venv
+    is installed offline from the cache.
+
+    Raises:
+        subprocess.CalledProcessError: If building or installing fails
+        subprocess.TimeoutExpired: If a step exceeds ``timeout``
+    """
+    wheel_dir = get_wheel_dir()
+    wheel_dir.mkdir(parents=True, exist_ok=True)
+    get_pip_cache_dir().mkdir(parents=True, exist_ok=True)
+    cache_args = ['--cache-dir', str(get_pip_cache_dir())]
+
+    before = _cached_wheels()
+    subprocess.run(
+        [str(pip_path), 'wheel', '-r', str(requirements_file),
+         '--wheel-dir', str(wheel_dir), '--find-links', str(wheel_dir), *cache_args],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=str(cwd),
+        timeout=timeout
+    )
+    built = _cached_wheels() - before
+
+    result = subprocess.run(
+        [str(pip_path), 'install', '-r', str(requirements_file),
+         '--no-index', '--find-links', str(wheel_dir), *cache_args],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=str(cwd),
+        timeout=timeout
+    )
+
+    installed = sum(
+        1 for line in result.stdout.splitlines()
+        if line.lstrip().startswith('Processing ') and line.rstrip().endswith('.whl')
+    )
+    return CacheStats(hits=max(installed - len(built), 0), misses=len(built))
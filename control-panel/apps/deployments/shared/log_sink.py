@@ -0,0 +1,200 @@
+"""
+Buffered deployment log writer.
+
+Deployment services log hundreds to thousands of lines per deploy (build
+output, download progress). Instead of one INSERT and two Channels sends
+per line, entries are buffered per deployment and written with one
+``bulk_create`` per batch. The same batch is sent to the deployment's
+WebSocket group as one message.
+
+A batch is flushed when:
+- ``max_entries`` entries are buffered
+- ``flush_interval`` seconds have passed since the first buffered entry
+- an ERROR entry is written, so failures are visible immediately
+- the owner calls ``flush()`` (on completion or failure of an operation)
+"""
+
+import atexit
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from ..models import BaseDeployment, DeploymentLog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 100
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+# Live sinks, flushed at interpreter exit so short-lived processes
+# (management commands) never drop a pending batch
+_sinks: 'weakref.WeakSet[DeploymentLogSink]' = weakref.WeakSet()
+
+
+def _serialize(entry: DeploymentLog) -> Dict[str, Any]:
+    return {
+        'id': entry.pk,
+        'level': entry.level,
+        'message': entry.message,
+        'created_at': entry.created_at.isoformat() if entry.created_at else None,
+    }
+
+
+def broadcast_log_batch(deployment: BaseDeployment, entries: List[DeploymentLog]) -> None:
+    """Send a batch of log entries to WebSocket clients as one message."""
+    from ..signals import broadcast_to_websocket
+
+    message = {
+        'type': 'log_entries',
+        'deployment_name': deployment.name,
+        'logs': [_serialize(entry) for entry in entries],
+        'timestamp': timezone.now().isoformat(),
+    }
+
+    # Broadcast to all deployments group
+    broadcast_to_websocket('deployments', message)
+
+    # Broadcast to specific deployment group
+    broadcast_to_websocket(f'deployment_{deployment.name}', message)
+
+
+class DeploymentLogSink:
+    """
+    Buffers DeploymentLog entries for one deployment and writes them in batches.
+
+    Thread-safe: deployment services log from helper threads (output
+    readers, progress monitors) as well as the task thread. A timer flushes
+    a partial batch after ``flush_interval`` so live viewers never wait on
+    a long silent build step.
+    """
+
+    def __init__(
+        self,
+        deployment: BaseDeployment,
+        max_entries: Optional[int] = None,
+        flush_interval: Optional[float] = None
+    ) -> None:
+        self.deployment = deployment
+        self.max_entries = max_entries or getattr(settings, 'DEPLOYMENT_LOG_BATCH_SIZE', DEFAULT_MAX_ENTRIES)
+        self.flush_interval = (
+            flush_interval if flush_interval is not None
+            else getattr(settings, 'DEPLOYMENT_LOG_FLUSH_INTERVAL', DEFAULT_FLUSH_INTERVAL)
+        )
+        self._buffer: List[DeploymentLog] = []
+        self._lock = threading.Lock()
+        # Serializes flushes so batches are written in order
+        self._flush_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        _sinks.add(self)
+
+    def write(self, message: str, level: str = DeploymentLog.Level.INFO) -> None:
+        """Buffer one entry, flushing if a threshold is reached."""
+        entry = DeploymentLog(
+            deployment=self.deployment,
+            level=level,
+            message=message,
+            created_at=timezone.now()
+        )
+
+        with self._lock:
+            self._buffer.append(entry)
+            flush_now = (
+                len(self._buffer) >= self.max_entries
+                or level == DeploymentLog.Level.ERROR
+                or self.flush_interval <= 0
+            )
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write buffered entries and send them to live viewers.
+
+        Returns:
+            Number of entries written
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._buffer = self._buffer, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+
+            if not batch:
+                return 0
+
+            DeploymentLog.objects.bulk_create(batch)
+
+            try:
+                broadcast_log_batch(self.deployment, batch)
+            except Exception as e:
+                logger.warning(f"Failed to broadcast logs for {self.deployment.name}: {e}")
+
+            return len(batch)
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush deployment logs for {self.deployment.name}: {e}")
+        finally:
+            # The timer thread owns its own database connection
+            connection.close()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> 'DeploymentLogSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class LogSinkMixin:
+    """
+    Gives a deployment service buffered per-deployment logging.
+
+    ``log()`` implementations write to ``get_log_sink(deployment)``; the
+    service calls ``flush_logs(deployment)`` when an operation completes
+    or fails.
+    """
+
+    _log_sinks: Dict[int, DeploymentLogSink]
+
+    def get_log_sink(self, deployment: BaseDeployment) -> DeploymentLogSink:
+        if not hasattr(self, '_log_sinks'):
+            self._log_sinks = {}
+        sink = self._log_sinks.get(deployment.pk)
+        if sink is None:
+            sink = self._log_sinks[deployment.pk] = DeploymentLogSink(deployment)
+        return sink
+
+    def flush_logs(self, deployment: Optional[BaseDeployment] = None) -> None:
+        """Flush one deployment's buffered logs, or all of them."""
+        sinks = getattr(self, '_log_sinks', {})
+        if deployment is not None:
+            targets = [sinks[deployment.pk]] if deployment.pk in sinks else []
+        else:
+            targets = list(sinks.values())
+        for sink in targets:
+            sink.flush()
+
+
+@atexit.register
+def _flush_all_sinks() -> None:
+    for sink in list(_sinks):
+        try:
+            sink.flush()
+        except Exception:
+            pass
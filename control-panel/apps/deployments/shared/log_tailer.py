@@ -9,6 +9,9 @@ Design goals:
 - Comprehensive error handling (file rotation, permission, transient errors)
 - Efficient memory usage for sustained operation
 - Modular components for future extensions
+- Event-driven reads: inotify wakes a reader only on writes or rotation,
+  with polling as the fallback where inotify is unavailable
+- One reader per log file, shared by every subscribed WebSocket group
 
 Primary use: stream vLLM service logs to WebSocket groups for real-time visibility.
 
@@ -18,10 +21,15 @@ from __future__ import annotations
 
 import os
 import io
+import sys
 import time
+import ctypes
+import ctypes.util
+import struct
 import asyncio
+import weakref
 from dataclasses import dataclass
-from typing import List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set
 from collections import deque
 
 from asgiref.sync import async_to_sync
@@ -119,6 +127,12 @@ class ChunkAggregator:
             return self.flush()
         return None
 
+    def seconds_until_flush(self) -> Optional[float]:
+        """Time until the pending chunk is due, or None if nothing is pending."""
+        if self._created_at is None:
+            return None
+        return max(0.0, self.flush_interval - (time.monotonic() - self._created_at))
+
     def maybe_flush_by_time(self) -> Optional[Chunk]:
         if self._created_at is None:
             return None
@@ -137,7 +151,148 @@ class ChunkAggregator:
 
 
 # -----------------------
-# File Tailer (blocking reader run in thread)
+# inotify Watcher (event-driven wakeups, Linux only)
+# -----------------------
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+
+# Watch the directory so creation and rotation of the file are seen too
+INOTIFY_DIR_MASK = (
+    IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+
+_INOTIFY_EVENT = struct.Struct('iIII')
+
+
+class InotifyWatcher:
+    """Single inotify instance per event loop that wakes tailers on file changes.
+
+    Watches the parent directory of every registered file and sets the
+    asyncio.Event of each waiter whose file was written, created, moved or
+    deleted. The inotify fd is driven by ``loop.add_reader`` so no thread
+    or timer is involved.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        libc_name = ctypes.util.find_library('c') or 'libc.so.6'
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self._fd = fd
+        self._loop = loop
+        self._dir_wds: Dict[str, int] = {}
+        self._wd_dirs: Dict[int, str] = {}
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+        loop.add_reader(fd, self._on_readable)
+
+    def register(self, path: str) -> asyncio.Event:
+        """Return an event that is set whenever ``path`` changes."""
+        path = os.path.abspath(path)
+        directory = os.path.dirname(path)
+
+        if directory not in self._dir_wds:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), INOTIFY_DIR_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+            self._dir_wds[directory] = wd
+            self._wd_dirs[wd] = directory
+
+        event = asyncio.Event()
+        self._waiters.setdefault(path, set()).add(event)
+        return event
+
+    def unregister(self, path: str, event: asyncio.Event) -> None:
+        path = os.path.abspath(path)
+        waiters = self._waiters.get(path)
+        if waiters is None:
+            return
+        waiters.discard(event)
+        if waiters:
+            return
+        del self._waiters[path]
+
+        # Drop the directory watch once no file in it is watched
+        directory = os.path.dirname(path)
+        if not any(os.path.dirname(other) == directory for other in self._waiters):
+            wd = self._dir_wds.pop(directory, None)
+            if wd is not None:
+                self._wd_dirs.pop(wd, None)
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def _wake_all(self, directory: Optional[str] = None) -> None:
+        for path, waiters in self._waiters.items():
+            if directory is None or os.path.dirname(path) == directory:
+                for event in waiters:
+                    event.set()
+
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except (BlockingIOError, InterruptedError):
+            return
+
+        offset = 0
+        while offset + _INOTIFY_EVENT.size <= len(data):
+            wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(data, offset)
+            name_start = offset + _INOTIFY_EVENT.size
+            name = data[name_start:name_start + length].rstrip(b'\0')
+            offset = name_start + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were dropped; let every tailer re-check its file
+                self._wake_all()
+                continue
+
+            directory = self._wd_dirs.get(wd)
+            if directory is None:
+                continue
+
+            if mask & IN_IGNORED:
+                # Directory went away; waiters fall back to their recheck timeout
+                self._dir_wds.pop(directory, None)
+                self._wd_dirs.pop(wd, None)
+                self._wake_all(directory)
+                continue
+
+            for event in self._waiters.get(os.path.join(directory, os.fsdecode(name)), ()):
+                event.set()
+
+    def close(self) -> None:
+        try:
+            self._loop.remove_reader(self._fd)
+        finally:
+            os.close(self._fd)
+
+
+_inotify_watchers: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Optional[InotifyWatcher]]' = weakref.WeakKeyDictionary()
+
+
+def get_inotify_watcher() -> Optional[InotifyWatcher]:
+    """Return the running loop's inotify watcher, or None where inotify is unavailable."""
+    loop = asyncio.get_running_loop()
+    if loop not in _inotify_watchers:
+        watcher = None
+        if sys.platform.startswith('linux'):
+            try:
+                watcher = InotifyWatcher(loop)
+            except (OSError, AttributeError, NotImplementedError):
+                watcher = None
+        _inotify_watchers[loop] = watcher
+    return _inotify_watchers[loop]
+
+
+# -----------------------
+# File Tailer (event-driven reader, polling fallback)
 # -----------------------
 
 class FileTailer:
@@ -145,6 +300,11 @@ class FileTailer:
 
     Handles rotation, truncation, and transient errors by reopening with backoff.
     Emits lines into an asyncio.Queue for downstream processing without threads.
+
+    New data is read in large binary blocks and split into lines. At EOF the
+    tailer sleeps until inotify reports a change to the file (re-checking at
+    least every ``recheck_interval``); where inotify is unavailable it polls
+    every ``poll_interval``.
     """
 
     def __init__(
@@ -156,6 +316,9 @@ class FileTailer:
         backoff_initial: float = 0.5,
         backoff_max: float = 10.0,
         encoding: str = 'utf-8',
+        read_size: int = 64 * 1024,
+        recheck_interval: float = 5.0,
+        use_inotify: bool = True,
     ) -> None:
         self.path = path
         self.queue = queue
@@ -164,13 +327,20 @@ class FileTailer:
         self.backoff_initial = backoff_initial
         self.backoff_max = backoff_max
         self.encoding = encoding
+        self.read_size = read_size
+        self.recheck_interval = recheck_interval
+        self.use_inotify = use_inotify
+        self.max_pending_bytes = read_size * 16
         self._stop = asyncio.Event()
+        self._changed: Optional[asyncio.Event] = None
 
     def stop(self) -> None:
         self._stop.set()
+        if self._changed is not None:
+            self._changed.set()
 
-    def _open(self) -> io.TextIOWrapper:
-        return open(self.path, 'r', encoding=self.encoding, errors='replace')
+    def _open(self) -> io.BufferedReader:
+        return open(self.path, 'rb', buffering=self.read_size)
 
     def _stat(self) -> Optional[os.stat_result]:
         try:
@@ -178,70 +348,119 @@ class FileTailer:
         except FileNotFoundError:
             return None
 
+    async def _wait(self, timeout: float) -> None:
+        """Sleep until the file changes (inotify) or ``timeout`` elapses."""
+        if self._changed is None:
+            await asyncio.sleep(timeout)
+            return
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=max(timeout, self.recheck_interval))
+        except asyncio.TimeoutError:
+            pass
+        self._changed.clear()
+
+    async def _emit(self, lines: List[bytes]) -> None:
+        for raw in lines:
+            line = raw.decode(self.encoding, errors='replace').rstrip('\r')
+            try:
+                self.queue.put_nowait(line)
+            except asyncio.QueueFull:
+                # Enqueue with backpressure (awaits when full)
+                await self.queue.put(line)
+
+    async def _read_available(self, fp: io.BufferedReader, pending: bytearray) -> bool:
+        """Read everything currently available. Returns False at EOF with no data."""
+        got_data = False
+        while not self._stop.is_set():
+            data = fp.read(self.read_size)
+            if not data:
+                break
+            got_data = True
+            pending.extend(data)
+            if b'\n' not in data and len(pending) < self.max_pending_bytes:
+                continue
+
+            *lines, rest = bytes(pending).split(b'\n')
+            pending[:] = rest
+            if len(pending) >= self.max_pending_bytes:
+                # Emit an overlong unterminated line rather than buffering forever
+                lines.append(bytes(pending))
+                pending.clear()
+            await self._emit(lines)
+        return got_data
+
     async def run(self) -> None:
         """Run the tailer in the event loop (non-blocking read pattern)."""
+        watcher = get_inotify_watcher() if self.use_inotify else None
+        if watcher is not None:
+            try:
+                self._changed = watcher.register(self.path)
+            except OSError:
+                self._changed = None
+
         backoff = self.backoff_initial
-        fp: Optional[io.TextIOWrapper] = None
+        fp: Optional[io.BufferedReader] = None
+        pending = bytearray()
         last_inode: Optional[int] = None
         last_size: Optional[int] = None
 
-        while not self._stop.is_set():
-            try:
-                st = self._stat()
-                if st is None:
-                    await asyncio.sleep(backoff)
-                    backoff = min(self.backoff_max, backoff * 1.5)
-                    continue
-
-                if fp is None:
-                    fp = self._open()
-                    # Seek to end or beginning
-                    if self.start_at_end:
-                        fp.seek(0, os.SEEK_END)
-                    last_inode = st.st_ino
-                    last_size = st.st_size
-                    backoff = self.backoff_initial
-
-                # Detect rotation/truncation
-                if st.st_ino != last_inode or (last_size is not None and st.st_size < last_size):
+        try:
+            while not self._stop.is_set():
+                try:
+                    st = self._stat()
+                    if st is None:
+                        await self._wait(backoff)
+                        backoff = min(self.backoff_max, backoff * 1.5)
+                        continue
+
+                    if fp is None:
+                        fp = self._open()
+                        # Seek to end or beginning
+                        if self.start_at_end:
+                            fp.seek(0, os.SEEK_END)
+                        last_inode = st.st_ino
+                        last_size = st.st_size
+                        backoff = self.backoff_initial
+
+                    # Detect rotation/truncation
+                    if st.st_ino != last_inode or (last_size is not None and st.st_size < last_size):
+                        if st.st_ino != last_inode:
+                            # Finish the rotated file before switching
+                            await self._read_available(fp, pending)
+                        pending.clear()
+                        try:
+                            fp.close()
+                        except Exception:
+                            pass
+                        fp = self._open()
+                        last_inode = st.st_ino
+
+                    got_data = await self._read_available(fp, pending)
+                    last_size = fp.tell()
+
+                    if not got_data:
+                        # No new data; wait for the next write
+                        await self._wait(self.poll_interval)
+
+                except Exception:
+                    # On any error, close and backoff
                     try:
-                        fp.close()
+                        if fp:
+                            fp.close()
                     except Exception:
                         pass
-                    fp = self._open()
-                    last_inode = st.st_ino
-                    last_size = st.st_size
-
-                # Read available lines
-                # At EOF, readline() returns "" quickly, so we can poll without blocking
-                while not self._stop.is_set():
-                    pos = fp.tell()
-                    line = fp.readline()
-                    if not line:
-                        # No new data; sleep briefly
-                        await asyncio.sleep(self.poll_interval)
-                        break
-                    # Update last_size to current position
-                    last_size = pos + len(line)
-                    # Enqueue with backpressure (awaits when full)
-                    await self.queue.put(line.rstrip('\n'))
-
+                    fp = None
+                    pending.clear()
+                    await asyncio.sleep(backoff)
+                    backoff = min(self.backoff_max, backoff * 1.5)
+        finally:
+            try:
+                if fp:
+                    fp.close()
             except Exception:
-                # On any error, close and backoff
-                try:
-                    if fp:
-                        fp.close()
-                except Exception:
-                    pass
-                fp = None
-                await asyncio.sleep(backoff)
-                backoff = min(self.backoff_max, backoff * 1.5)
-
-        try:
-            if fp:
-                fp.close()
-        except Exception:
-            pass
+                pass
+            if watcher is not None and self._changed is not None:
+                watcher.unregister(self.path, self._changed)
 
 
 # -----------------------
@@ -274,21 +493,18 @@ class ChannelsDispatcher:
 
 
 # -----------------------
-# Tailer Orchestrator
+# Shared Tail (one reader per file, fanned out to groups)
 # -----------------------
 
-class LogTailer:
-    """High-level orchestrator: read file -> aggregate -> rate limit -> dispatch.
+class SharedTail:
+    """One reader, aggregator and rate limiter per log file.
 
-    Backpressure is enforced via a bounded asyncio.Queue. The reader blocks when the
-    queue is full; the aggregator consumes and dispatches chunks subject to a rate
-    limiter to avoid overwhelming the system.
+    Every chunk is sent to all subscribed dispatchers, so any number of
+    WebSocket groups watching the same file cost a single reader.
     """
 
     def __init__(
         self,
-        deployment_id: int,
-        deployment_name: str,
         file_path: str,
         *,
         queue_maxsize: int = 1000,
@@ -299,8 +515,6 @@ class LogTailer:
         rate_chunks_per_sec: float = 10.0,
         rate_burst: int = 20,
     ) -> None:
-        self.deployment_id = deployment_id
-        self.deployment_name = deployment_name
         self.file_path = file_path
         self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_maxsize)
         self.aggregator = ChunkAggregator(
@@ -310,45 +524,190 @@ class LogTailer:
             max_line_bytes=max_line_bytes,
         )
         self.rate_limiter = RateLimiter(rate_per_sec=rate_chunks_per_sec, burst=rate_burst)
-        self.dispatcher = ChannelsDispatcher(deployment_id, deployment_name)
-        self._stop = asyncio.Event()
+        self.dispatchers: Dict[str, ChannelsDispatcher] = {}
+        self._subscribers: Dict[str, int] = {}
         self._reader = FileTailer(path=file_path, queue=self.queue)
-
-    async def start(self) -> None:
-        """Start reader and processing tasks."""
-        reader_task = asyncio.create_task(self._reader.run())
-        processor_task = asyncio.create_task(self._process_loop())
-        try:
-            await asyncio.wait([reader_task, processor_task], return_when=asyncio.FIRST_COMPLETED)
-        finally:
-            self._reader.stop()
-            self._stop.set()
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(self._subscribers.values())
+
+    def subscribe(self, dispatcher: ChannelsDispatcher) -> None:
+        # Subscriptions are counted per group so each group gets a chunk once
+        self.dispatchers.setdefault(dispatcher.group, dispatcher)
+        self._subscribers[dispatcher.group] = self._subscribers.get(dispatcher.group, 0) + 1
+
+    def unsubscribe(self, dispatcher: ChannelsDispatcher) -> None:
+        count = self._subscribers.get(dispatcher.group, 0) - 1
+        if count > 0:
+            self._subscribers[dispatcher.group] = count
+        else:
+            self._subscribers.pop(dispatcher.group, None)
+            self.dispatchers.pop(dispatcher.group, None)
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._reader.run()),
+                asyncio.create_task(self._process_loop()),
+            ]
+
+    async def stop(self) -> None:
+        self._reader.stop()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _dispatch(self, chunk: Chunk) -> None:
+        await self.rate_limiter.acquire(1.0)
+        await asyncio.gather(
+            *(dispatcher.send_chunk(chunk) for dispatcher in list(self.dispatchers.values())),
+            return_exceptions=True,
+        )
 
     async def _process_loop(self) -> None:
-        """Consume lines, aggregate chunks, and dispatch respecting rate limits."""
-        while not self._stop.is_set():
+        """Consume lines, aggregate chunks, and dispatch respecting rate limits.
+
+        Blocks on the queue while no chunk is pending, and otherwise only
+        until the pending chunk is due for its time-based flush.
+        """
+        while True:
             try:
-                # Wait for at least one line or timeout to consider time-based flush
                 try:
-                    line = await asyncio.wait_for(self.queue.get(), timeout=0.2)
+                    line = await asyncio.wait_for(
+                        self.queue.get(), timeout=self.aggregator.seconds_until_flush()
+                    )
+                except asyncio.TimeoutError:
+                    line = None
+
+                # Drain whatever else is already queued in one go
+                while line is not None:
                     chunk = self.aggregator.add_line(line)
                     if chunk:
-                        await self.rate_limiter.acquire(1.0)
-                        await self.dispatcher.send_chunk(chunk)
-                except asyncio.TimeoutError:
-                    pass
+                        await self._dispatch(chunk)
+                    try:
+                        line = self.queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        line = None
 
                 # Time-based flush to avoid latency
                 timed_chunk = self.aggregator.maybe_flush_by_time()
                 if timed_chunk:
-                    await self.rate_limiter.acquire(1.0)
-                    await self.dispatcher.send_chunk(timed_chunk)
+                    await self._dispatch(timed_chunk)
 
+            except asyncio.CancelledError:
+                raise
             except Exception:
                 # In case of any processing error, continue after a brief pause
                 await asyncio.sleep(0.1)
 
 
+class TailHub:
+    """Registry of shared tails for one event loop, keyed by absolute path."""
+
+    def __init__(self) -> None:
+        self._tails: Dict[str, SharedTail] = {}
+
+    def get(self, file_path: str) -> Optional[SharedTail]:
+        return self._tails.get(os.path.abspath(file_path))
+
+    def subscribe(self, file_path: str, dispatcher: ChannelsDispatcher, **options) -> SharedTail:
+        """Subscribe a dispatcher to a file, starting its reader if needed.
+
+        Options only apply to the subscriber that starts the reader.
+        """
+        path = os.path.abspath(file_path)
+        tail = self._tails.get(path)
+        if tail is None:
+            tail = SharedTail(path, **options)
+            self._tails[path] = tail
+            tail.start()
+        tail.subscribe(dispatcher)
+        return tail
+
+    async def unsubscribe(self, file_path: str, dispatcher: ChannelsDispatcher) -> None:
+        """Unsubscribe a dispatcher; the reader stops with its last subscriber."""
+        path = os.path.abspath(file_path)
+        tail = self._tails.get(path)
+        if tail is None:
+            return
+        tail.unsubscribe(dispatcher)
+        if tail.subscriber_count == 0:
+            del self._tails[path]
+            await tail.stop()
+
+
+_tail_hubs: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, TailHub]' = weakref.WeakKeyDictionary()
+
+
+def get_tail_hub() -> TailHub:
+    """Return the tail hub of the running event loop."""
+    loop = asyncio.get_running_loop()
+    hub = _tail_hubs.get(loop)
+    if hub is None:
+        hub = _tail_hubs[loop] = TailHub()
+    return hub
+
+
+# -----------------------
+# Tailer Orchestrator
+# -----------------------
+
+class LogTailer:
+    """High-level orchestrator: read file -> aggregate -> rate limit -> dispatch.
+
+    Backpressure is enforced via a bounded asyncio.Queue. The reader blocks when the
+    queue is full; the aggregator consumes and dispatches chunks subject to a rate
+    limiter to avoid overwhelming the system.
+
+    Tailers of the same file share one reader through the loop's TailHub;
+    each tailer only adds its deployment's group as a subscriber.
+    """
+
+    def __init__(
+        self,
+        deployment_id: int,
+        deployment_name: str,
+        file_path: str,
+        *,
+        queue_maxsize: int = 1000,
+        chunk_max_lines: int = 200,
+        chunk_max_bytes: int = 64 * 1024,
+        flush_interval: float = 0.5,
+        max_line_bytes: int = 16 * 1024,
+        rate_chunks_per_sec: float = 10.0,
+        rate_burst: int = 20,
+    ) -> None:
+        self.deployment_id = deployment_id
+        self.deployment_name = deployment_name
+        self.file_path = file_path
+        self.options = {
+            'queue_maxsize': queue_maxsize,
+            'chunk_max_lines': chunk_max_lines,
+            'chunk_max_bytes': chunk_max_bytes,
+            'flush_interval': flush_interval,
+            'max_line_bytes': max_line_bytes,
+            'rate_chunks_per_sec': rate_chunks_per_sec,
+            'rate_burst': rate_burst,
+        }
+        self.dispatcher = ChannelsDispatcher(deployment_id, deployment_name)
+        self._stop = asyncio.Event()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    async def start(self) -> None:
+        """Subscribe to the shared reader and stream until stopped or cancelled."""
+        hub = get_tail_hub()
+        hub.subscribe(self.file_path, self.dispatcher, **self.options)
+        try:
+            await self._stop.wait()
+        finally:
+            await hub.unsubscribe(self.file_path, self.dispatcher)
+
+
 # -----------------------
 # Utilities to build tailers for LLM deployments
 # -----------------------
@@ -393,5 +752,5 @@ async def run_tailers_for_deployment(
         for p in paths
     ]
 
-    # Run all tailers concurrently; each tailer owns its reader and processor
+    # Run all tailers concurrently; readers are shared per file via the TailHub
     await asyncio.gather(*(t.start() for t in tailers))
\ No newline at end of file
@@ -7,6 +7,9 @@ Intelligently detects Django project structure including:
 - Requirements files
 - WSGI/ASGI modules
 - Static/media directories
+
+All lookups go through the checkout's cached ``RepoIndex``, so detection
+walks the tree once no matter how many questions it asks.
 """
 
 import os
@@ -14,6 +17,8 @@ from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 import logging
 
+from .repo_index import RepoIndex, get_repo_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +34,14 @@ class ProjectStructureDetector:
         """
         self.repo_path = Path(repo_path)
         self.structure = {}
+        self._index: Optional[RepoIndex] = None
+
+    @property
+    def index(self) -> RepoIndex:
+        """File index of the repository, built on first use."""
+        if self._index is None:
+            self._index = get_repo_index(self.repo_path)
+        return self._index
 
     def detect_all(self) -> Dict[str, Any]:
         """
@@ -66,24 +79,12 @@ class ProjectStructureDetector:
 
     def _detect_manage_py(self) -> None:
         """Find manage.py in the repository."""
-        # Search for manage.py anywhere in the repo
-        manage_py_files = list(self.repo_path.rglob('manage.py'))
-
-        if not manage_py_files:
-            logger.warning(f"No manage.py found in {self.repo_path}")
-            return
-
-        # Filter out files in venv, .git, node_modules, etc.
-        excluded_dirs = {'venv', 'env', '.venv', '.git', 'node_modules', '__pycache__', '.tox'}
-        valid_manage_files = []
-
-        for manage_file in manage_py_files:
-            parts = manage_file.relative_to(self.repo_path).parts
-            if not any(excluded in parts for excluded in excluded_dirs):
-                valid_manage_files.append(manage_file)
+        # Search for manage.py anywhere in the repo (venv, .git,
+        # node_modules, etc. are never indexed)
+        valid_manage_files = self.index.find('manage.py')
 
         if not valid_manage_files:
-            logger.warning("manage.py found only in excluded directories")
+            logger.warning(f"No manage.py found in {self.repo_path}")
             return
 
         # If multiple manage.py files, choose the most likely one
@@ -116,20 +117,15 @@ class ProjectStructureDetector:
             return
 
         project_root = Path(self.structure['project_root'])
-        settings_files = []
-
-        # Search for settings files
-        for pattern in ['**/settings.py', '**/settings/*.py', '**/settings/base.py']:
-            settings_files.extend(project_root.glob(pattern))
-
-        # Filter out excluded directories
         excluded_dirs = {'migrations', 'tests', 'test', 'venv', 'env', '__pycache__', '.git'}
-        valid_settings = []
 
-        for settings_file in settings_files:
-            parts = settings_file.relative_to(project_root).parts
-            if not any(excluded in parts for excluded in excluded_dirs):
-                valid_settings.append(settings_file)
+        # Search for settings.py modules and settings packages
+        valid_settings = self.index.find('settings.py', under=project_root, exclude=excluded_dirs)
+        valid_settings.extend(
+            settings_file
+            for settings_file in self.index.find('*.py', under=project_root, exclude=excluded_dirs)
+            if settings_file.parent.name == 'settings'
+        )
 
         if not valid_settings:
             logger.warning("No settings.py found in project")
@@ -165,7 +161,7 @@ class ProjectStructureDetector:
             # Check for split settings (development, production, etc.)
             if best_settings.parent.name == 'settings':
                 # It's a settings package
-                env_settings = list(best_settings.parent.glob('*.py'))
+                env_settings = self.index.list_dir(best_settings.parent, '*.py')
                 env_names = [f.stem for f in env_settings if f.stem not in ['__init__', 'base']]
                 if env_names:
                     self.structure['settings_environments'] = env_names
@@ -210,7 +206,7 @@ class ProjectStructureDetector:
 
             # Prefer if it has __init__.py in same directory (proper package)
             init_file = settings_file.parent / '__init__.py'
-            if init_file.exists():
+            if self.index.exists(init_file):
                 score += 3
 
             if score > best_score:
@@ -228,11 +224,7 @@ class ProjectStructureDetector:
         excluded_dirs = {'migrations', 'tests', 'test', 'venv', 'env', '__pycache__', '.git'}
 
         # Find ASGI files
-        asgi_files = list(project_root.rglob('asgi.py'))
-        valid_asgi = [
-            f for f in asgi_files
-            if not any(excluded in f.relative_to(project_root).parts for excluded in excluded_dirs)
-        ]
+        valid_asgi = self.index.find('asgi.py', under=project_root, exclude=excluded_dirs)
 
         if valid_asgi:
             asgi_file = valid_asgi[0]
@@ -243,11 +235,7 @@ class ProjectStructureDetector:
             logger.info(f"Detected ASGI module: {asgi_module}")
 
         # Find WSGI files
-        wsgi_files = list(project_root.rglob('wsgi.py'))
-        valid_wsgi = [
-            f for f in wsgi_files
-            if not any(excluded in f.relative_to(project_root).parts for excluded in excluded_dirs)
-        ]
+        valid_wsgi = self.index.find('wsgi.py', under=project_root, exclude=excluded_dirs)
 
         if valid_wsgi:
             wsgi_file = valid_wsgi[0]
@@ -271,7 +259,7 @@ class ProjectStructureDetector:
         for search_path in search_paths:
             # Standard requirements.txt
             req_file = search_path / 'requirements.txt'
-            if req_file.exists():
+            if self.index.is_file(req_file):
                 requirements_files.append({
                     'path': str(req_file),
                     'type': 'main',
@@ -280,10 +268,10 @@ class ProjectStructureDetector:
 
             # Requirements directory (Django Cookiecutter pattern)
             req_dir = search_path / 'requirements'
-            if req_dir.exists() and req_dir.is_dir():
+            if self.index.is_dir(req_dir):
                 for req in ['base.txt', 'production.txt', 'local.txt', 'development.txt']:
                     req_path = req_dir / req
-                    if req_path.exists():
+                    if self.index.exists(req_path):
                         requirements_files.append({
                             'path': str(req_path),
                             'type': req.replace('.txt', ''),
@@ -305,26 +293,18 @@ class ProjectStructureDetector:
             # Check for Django REST Framework
             if self.structure['requirements_files']:
                 req_file = self.structure['requirements_files'][0]['path']
-                try:
-                    with open(req_file, 'r') as f:
-                        content = f.read().lower()
-                        if 'djangorestframework' in content or 'rest_framework' in content:
-                            self.structure['project_type'] = 'django_rest'
-                except Exception:
-                    pass
+                content = (self.index.read_text(req_file) or '').lower()
+                if 'djangorestframework' in content or 'rest_framework' in content:
+                    self.structure['project_type'] = 'django_rest'
 
         # Check for other project types
         project_root = Path(self.structure['project_root']) if self.structure['project_root'] else self.repo_path
 
         # Check for FastAPI
-        if (project_root / 'main.py').exists():
-            try:
-                with open(project_root / 'main.py', 'r') as f:
-                    content = f.read()
-                    if 'fastapi' in content.lower():
-                        self.structure['project_type'] = 'fastapi'
-            except Exception:
-                pass
+        if self.index.exists(project_root / 'main.py'):
+            content = self.index.read_text(project_root / 'main.py') or ''
+            if 'fastapi' in content.lower():
+                self.structure['project_type'] = 'fastapi'
 
     def get_project_root(self) -> Optional[Path]:
         """Get the detected project root."""
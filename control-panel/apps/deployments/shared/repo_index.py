@@ -0,0 +1,295 @@
+"""
+In-memory file index of a deployment checkout.
+
+Project detection asks many small questions about a checkout: does
+``manage.py`` exist, where are the ``settings.py`` files, what does
+``requirements.txt`` say. Each buildpack and detector used to answer them
+with its own ``exists()`` probes and ``rglob`` walks, so one detection
+walked the tree a dozen times (including ``node_modules`` and virtualenvs,
+pruned only after the fact).
+
+A ``RepoIndex`` walks the checkout once:
+- depth-bounded (``max_depth`` path components, file name included)
+- pruning vendored and generated directories while walking
+- indexing relative paths, file names and directories
+- reading small files on demand and caching their contents
+
+Indexes are cached per checkout and rebuilt when the checkout changes
+(its root directory or git index/HEAD is modified), or explicitly with
+``invalidate_repo_index`` after a clone or pull.
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_DEPTH = 8
+
+# Never part of a project's own sources; pruned during the walk
+EXCLUDED_DIRS = frozenset({
+    '.git', 'node_modules', 'venv', '.venv', 'env', '__pycache__', '.tox',
+    '.mypy_cache', '.pytest_cache',
+})
+
+# Files larger than this are read from disk on every request
+MAX_CACHED_FILE_BYTES = 256 * 1024
+
+MAX_CACHED_INDEXES = 16
+
+PathLike = Union[str, Path]
+
+
+class RepoIndex:
+    """
+    File index of one checkout, built by a single directory walk.
+
+    Paths are stored relative to ``root`` with ``/`` separators. Query
+    methods return absolute ``Path`` objects so callers can use them like
+    the results of ``Path.rglob``.
+    """
+
+    def __init__(self, root: PathLike, max_depth: int = DEFAULT_MAX_DEPTH) -> None:
+        self.root = Path(root)
+        self.max_depth = max_depth
+        self.files: List[str] = []
+        self.dirs: Set[str] = {''}
+        self.by_name: Dict[str, List[str]] = {}
+        self._file_set: Set[str] = set()
+        self._contents: Dict[str, Optional[str]] = {}
+        self._contents_lock = threading.Lock()
+        self._scan()
+
+    def _scan(self) -> None:
+        root = str(self.root)
+        for dirpath, dirnames, filenames in os.walk(root):
+            relative_dir = os.path.relpath(dirpath, root)
+            relative_dir = '' if relative_dir == '.' else relative_dir.replace(os.sep, '/')
+            depth = relative_dir.count('/') + 1 if relative_dir else 0
+
+            for name in dirnames:
+                self.dirs.add(f"{relative_dir}/{name}" if relative_dir else name)
+
+            if depth + 1 >= self.max_depth:
+                # Files here are at max_depth; deeper directories are not walked
+                dirnames[:] = []
+            else:
+                dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS)
+
+            for name in sorted(filenames):
+                relative = f"{relative_dir}/{name}" if relative_dir else name
+                self.files.append(relative)
+                self.by_name.setdefault(name, []).append(relative)
+
+        self._file_set = set(self.files)
+
+    def relative(self, path: PathLike) -> Optional[str]:
+        """Relative ``/``-separated form of ``path``, or None if outside the checkout."""
+        path = Path(path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(self.root)
+            except ValueError:
+                return None
+        relative = path.as_posix()
+        return '' if relative == '.' else relative
+
+    def _beyond_scan(self, relative: str) -> bool:
+        """True if ``relative`` lies where the walk did not look."""
+        parts = relative.split('/')
+        return len(parts) > self.max_depth or any(part in EXCLUDED_DIRS for part in parts[:-1])
+
+    def exists(self, path: PathLike) -> bool:
+        relative = self.relative(path)
+        if relative is None:
+            return Path(path).exists()
+        if relative in self._file_set or relative in self.dirs:
+            return True
+        if self._beyond_scan(relative):
+            return (self.root / relative).exists()
+        return False
+
+    def is_file(self, path: PathLike) -> bool:
+        relative = self.relative(path)
+        if relative is None or self._beyond_scan(relative):
+            return Path(path if relative is None else self.root / relative).is_file()
+        return relative in self._file_set
+
+    def is_dir(self, path: PathLike) -> bool:
+        relative = self.relative(path)
+        if relative is None or self._beyond_scan(relative):
+            return Path(path if relative is None else self.root / relative).is_dir()
+        return relative in self.dirs
+
+    def find(
+        self,
+        pattern: str,
+        max_depth: Optional[int] = None,
+        under: Optional[PathLike] = None,
+        exclude: Iterable[str] = ()
+    ) -> List[Path]:
+        """
+        Files whose name matches a glob pattern, shallowest first.
+
+        Args:
+            pattern: Glob pattern matched against file names (e.g. '*.csproj')
+            max_depth: Maximum path components below ``under``, file name included
+            under: Directory to search in (default: the checkout root)
+            exclude: Directory names that must not appear below ``under``
+
+        Returns:
+            Absolute paths, ordered by depth then path
+        """
+        base = self.relative(under) if under is not None else ''
+        if base is None:
+            return []
+        prefix = f"{base}/" if base else ''
+        exclude = set(exclude)
+
+        if any(ch in pattern for ch in '*?['):
+            names = [name for name in self.by_name if fnmatch.fnmatchcase(name, pattern)]
+        else:
+            names = [pattern] if pattern in self.by_name else []
+
+        matches: List[Tuple[int, str]] = []
+        for name in names:
+            for relative in self.by_name[name]:
+                if not relative.startswith(prefix):
+                    continue
+                parts = relative[len(prefix):].split('/')
+                if max_depth is not None and len(parts) > max_depth:
+                    continue
+                if exclude and any(part in exclude for part in parts[:-1]):
+                    continue
+                matches.append((len(parts), relative))
+
+        return [self.root / relative for _, relative in sorted(matches)]
+
+    def list_dir(self, path: PathLike, pattern: str = '*') -> List[Path]:
+        """Files directly inside a directory whose name matches ``pattern``."""
+        relative = self.relative(path)
+        if relative is None:
+            return []
+        depth = relative.count('/') + 2 if relative else 1
+        return [
+            p for p in self.find(pattern, under=relative)
+            if len(self.relative(p).split('/')) == depth
+        ]
+
+    def read_text(self, path: PathLike) -> Optional[str]:
+        """
+        Contents of a file, or None if it cannot be read.
+
+        Files up to ``MAX_CACHED_FILE_BYTES`` are read once and cached.
+        """
+        relative = self.relative(path)
+        if relative is None:
+            return _read(Path(path))
+
+        with self._contents_lock:
+            if relative in self._contents:
+                return self._contents[relative]
+
+        file_path = self.root / relative
+        content = _read(file_path)
+        try:
+            cacheable = content is None or file_path.stat().st_size <= MAX_CACHED_FILE_BYTES
+        except OSError:
+            cacheable = True
+        if cacheable:
+            with self._contents_lock:
+                self._contents[relative] = content
+        return content
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text()
+    except Exception:
+        return None
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _signature(root: Path) -> Tuple[int, int, int]:
+    """Changes whenever a checkout, pull or top-level edit changes the tree."""
+    git_dir = root / '.git'
+    return _mtime_ns(root), _mtime_ns(git_dir / 'index'), _mtime_ns(git_dir / 'HEAD')
+
+
+_cache: 'OrderedDict[str, Tuple[Tuple[int, int, int], RepoIndex]]' = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_repo_index(repo_path: PathLike, max_depth: int = DEFAULT_MAX_DEPTH) -> RepoIndex:
+    """
+    Cached index of a checkout, rebuilt if the checkout changed.
+
+    Args:
+        repo_path: Repository root
+        max_depth: Depth bound of the walk
+
+    Returns:
+        RepoIndex for the checkout
+    """
+    root = Path(repo_path)
+    key = str(root)
+    signature = _signature(root)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[0] == signature and cached[1].max_depth >= max_depth:
+            _cache.move_to_end(key)
+            return cached[1]
+
+    index = RepoIndex(root, max_depth=max_depth)
+    logger.debug(f"Indexed {len(index.files)} files in {root}")
+
+    with _cache_lock:
+        _cache[key] = (signature, index)
+        _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_INDEXES:
+            _cache.popitem(last=False)
+    return index
+
+
+def cached_index_for(path: PathLike) -> Optional[RepoIndex]:
+    """The cached index containing ``path``, without validating it."""
+    path = Path(path)
+    with _cache_lock:
+        indexes = [index for _, index in _cache.values()]
+    for index in indexes:
+        if path == index.root or index.root in path.parents:
+            return index
+    return None
+
+
+def invalidate_repo_index(repo_path: Optional[PathLike] = None) -> None:
+    """Drop the cached index of one checkout, or all of them."""
+    with _cache_lock:
+        if repo_path is None:
+            _cache.clear()
+        else:
+            _cache.pop(str(Path(repo_path)), None)
+
+
+def path_exists(path: PathLike) -> bool:
+    """``Path.exists`` answered from a cached index when one covers ``path``."""
+    index = cached_index_for(path)
+    return index.exists(path) if index else Path(path).exists()
+
+
+def read_repo_file(path: PathLike) -> Optional[str]:
+    """Read a file through a cached index when one covers ``path``."""
+    index = cached_index_for(path)
+    return index.read_text(path) if index else _read(Path(path))
@@ -0,0 +1,196 @@
+"""
+Host-level git mirror cache for deployments.
+
+Each repository URL gets one bare mirror under ``WEBOPS_CACHE_PATH/git``:
+- The first deploy fetches the repository into the mirror once
+- Later deploys (of this or any other deployment of the same repository)
+  only fetch new objects into the mirror
+- Deployment checkouts are local clones of the mirror, so objects are
+  hard-linked rather than downloaded, and redeploys fetch from the mirror
+- Branch fallbacks (main/master) are resolved against the mirror's refs
+  without another network round-trip
+
+Mirrors are evicted least-recently-used first once the cache grows past
+its size limit, or when unused for too long (see ``collect_garbage``).
+"""
+
+import fcntl
+import hashlib
+import os
+import shutil
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from django.conf import settings
+from git import Repo
+
+
+def get_mirror_root() -> Path:
+    return Path(settings.WEBOPS_CACHE_PATH) / 'git'
+
+
+@contextmanager
+def _mirror_lock(key: str, blocking: bool = True) -> Iterator[None]:
+    """
+    Exclusive lock on one mirror, shared between processes.
+
+    Raises:
+        BlockingIOError: If ``blocking`` is False and the mirror is in use
+    """
+    root = get_mirror_root()
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / f'{key}.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class RepoMirror:
+    """Bare mirror of one remote repository."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.key = hashlib.sha256(url.encode()).hexdigest()[:24]
+        self.path = get_mirror_root() / f'{self.key}.git'
+
+    @property
+    def exists(self) -> bool:
+        return (self.path / 'HEAD').exists()
+
+    def lock(self, blocking: bool = True):
+        return _mirror_lock(self.key, blocking)
+
+    def sync(self) -> bool:
+        """
+        Create the mirror or fetch new objects into it. Call with the lock held.
+
+        Only branches and tags are mirrored; refs such as pull requests are
+        never fetched.
+
+        Returns:
+            True if the mirror already existed (incremental fetch)
+
+        Raises:
+            GitCommandError: If the fetch fails
+        """
+        existed = self.exists
+        if existed:
+            repo = Repo(self.path)
+        else:
+            shutil.rmtree(self.path, ignore_errors=True)
+            repo = Repo.init(self.path, bare=True)
+            repo.git.remote('add', 'origin', self.url)
+            repo.git.config('remote.origin.fetch', '+refs/heads/*:refs/heads/*')
+
+        try:
+            repo.git.fetch('--prune', '--tags', 'origin')
+        except Exception:
+            if not existed:
+                shutil.rmtree(self.path, ignore_errors=True)
+            raise
+
+        # Lock file mtime is the last-used time for garbage collection
+        os.utime(get_mirror_root() / f'{self.key}.lock')
+        return existed
+
+    def branches(self) -> List[str]:
+        output = Repo(self.path).git.for_each_ref('--format=%(refname:short)', 'refs/heads')
+        return output.split()
+
+    def resolve_branch(self, branch: str, fallbacks: Sequence[str] = ('main', 'master')) -> Optional[str]:
+        """The requested branch if mirrored, otherwise the first fallback that is."""
+        branches = set(self.branches())
+        for candidate in (branch, *fallbacks):
+            if candidate in branches:
+                return candidate
+        return None
+
+    def checkout(self, repo_path: Path, branch: str) -> str:
+        """
+        Check out ``branch`` from the mirror into ``repo_path``.
+
+        A new checkout is a local clone (objects hard-linked from the mirror,
+        so it stays valid after the mirror is evicted) with ``origin`` pointed
+        at the real URL. An existing checkout fetches the branch from the
+        mirror and is reset to it, like a pull without local changes.
+
+        Returns:
+            Checked out commit SHA
+        """
+        if not repo_path.exists():
+            repo = Repo.clone_from(str(self.path), repo_path, branch=branch)
+            repo.git.remote('set-url', 'origin', self.url)
+        else:
+            repo = Repo(repo_path)
+            repo.git.fetch(str(self.path), f'+refs/heads/{branch}:refs/remotes/origin/{branch}')
+            repo.git.checkout('-f', '-B', branch, f'origin/{branch}')
+        return repo.head.commit.hexsha
+
+
+def _directory_size(path: Path) -> int:
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+def collect_garbage(
+    max_bytes: Optional[int] = None,
+    max_age: Optional[timedelta] = None,
+    now: Optional[float] = None
+) -> Dict[str, int]:
+    """
+    Evict mirrors least-recently-used first.
+
+    Mirrors unused for longer than ``max_age`` are removed, then the oldest
+    are removed until the cache is under ``max_bytes``. Mirrors locked by a
+    running deploy are skipped.
+
+    Returns:
+        Dict with removed count, freed_bytes and remaining_bytes
+    """
+    root = get_mirror_root()
+    now = now if now is not None else time.time()
+
+    mirrors = []
+    for path in root.glob('*.git'):
+        lock_path = root / f'{path.stem}.lock'
+        try:
+            last_used = (lock_path if lock_path.exists() else path).stat().st_mtime
+        except OSError:
+            continue
+        mirrors.append((last_used, path, _directory_size(path)))
+    mirrors.sort()
+
+    total = sum(size for _, _, size in mirrors)
+    removed = freed = 0
+    for last_used, path, size in mirrors:
+        expired = max_age is not None and now - last_used > max_age.total_seconds()
+        oversized = max_bytes is not None and total > max_bytes
+        if not (expired or oversized):
+            # Oldest first: every remaining mirror is newer
+            break
+        try:
+            with _mirror_lock(path.stem, blocking=False):
+                shutil.rmtree(path)
+        except BlockingIOError:
+            continue
+        total -= size
+        freed += size
+        removed += 1
+
+    return {'removed': removed, 'freed_bytes': freed, 'remaining_bytes': total}
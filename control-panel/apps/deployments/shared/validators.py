@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Dict, List, Tuple, Any
 from dataclasses import dataclass
 
+from .repo_index import RepoIndex, get_repo_index
+
 
 @dataclass
 class ValidationResult:
@@ -30,6 +32,14 @@ class ProjectValidator:
     def __init__(self, repo_path: Path):
         self.repo_path = repo_path
         self.results: List[ValidationResult] = []
+        self._index = None
+
+    @property
+    def index(self) -> RepoIndex:
+        """File index of the repository, built on first use."""
+        if self._index is None:
+            self._index = get_repo_index(self.repo_path)
+        return self._index
 
     def validate_all(self) -> Tuple[bool, List[ValidationResult]]:
         """
@@ -67,13 +77,13 @@ class ProjectValidator:
 
     def is_django_project(self) -> bool:
         """Check if this is a Django project."""
-        return (self.repo_path / "manage.py").exists()
+        return self.index.exists("manage.py")
 
     def validate_project_structure(self) -> None:
         """Validate basic project structure."""
         # Check for essential files
         if self.is_django_project():
-            if (self.repo_path / "manage.py").exists():
+            if self.index.exists("manage.py"):
                 self.results.append(ValidationResult(
                     passed=True,
                     message="Django project detected (manage.py found)",
@@ -82,7 +92,7 @@ class ProjectValidator:
                 ))
 
             # Check for requirements.txt
-            if not (self.repo_path / "requirements.txt").exists():
+            if not self.index.exists("requirements.txt"):
                 self.results.append(ValidationResult(
                     passed=False,
                     message="requirements.txt not found - dependencies won't be installed",
@@ -91,7 +101,7 @@ class ProjectValidator:
                 ))
         else:
             # Static site checks
-            if (self.repo_path / "index.html").exists():
+            if self.index.exists("index.html"):
                 self.results.append(ValidationResult(
                     passed=True,
                     message="Static site detected (index.html found)",
@@ -109,7 +119,7 @@ class ProjectValidator:
         """Validate requirements.txt if present."""
         req_file = self.repo_path / "requirements.txt"
 
-        if not req_file.exists():
+        if not self.index.exists(req_file):
             return
 
         try:
@@ -154,9 +164,8 @@ class ProjectValidator:
 
             # ASGI detection: require uvicorn if asgi.py is present
             try:
-                asgi_files = list(self.repo_path.rglob("asgi.py"))
                 excluded_dirs = {'migrations', 'tests', 'test', 'venv', 'env', '__pycache__', '.git'}
-                valid_asgi = [f for f in asgi_files if not any(part in excluded_dirs for part in f.relative_to(self.repo_path).parts)]
+                valid_asgi = self.index.find("asgi.py", exclude=excluded_dirs)
 
                 if valid_asgi:
                     if 'uvicorn' not in deps:
@@ -246,7 +255,7 @@ class ProjectValidator:
             The Django settings module path (e.g., 'myproject.settings')
         """
         # Find all settings.py files
-        settings_files = list(self.repo_path.rglob("settings.py"))
+        settings_files = self.index.find("settings.py")
         
         if not settings_files:
             return "settings"  # Fallback
@@ -292,7 +301,7 @@ class ProjectValidator:
             
             # Check if there's an __init__.py in the same directory (proper Python package)
             init_file = settings_file.parent / "__init__.py"
-            if init_file.exists():
+            if self.index.exists(init_file):
                 score += 3
             
             if score > best_score:
@@ -320,7 +329,7 @@ class ProjectValidator:
         settings_module = self.detect_django_settings_module()
         
         # Find the actual settings file
-        settings_files = list(self.repo_path.rglob("settings.py"))
+        settings_files = self.index.find("settings.py")
         
         # Filter out excluded directories
         valid_settings = []
@@ -405,7 +414,7 @@ class ProjectValidator:
 
     def validate_django_wsgi(self) -> None:
         """Validate WSGI configuration for Django."""
-        wsgi_files = list(self.repo_path.rglob("wsgi.py"))
+        wsgi_files = self.index.find("wsgi.py")
 
         if not wsgi_files:
             self.results.append(ValidationResult(
@@ -424,7 +433,7 @@ class ProjectValidator:
     def check_common_issues(self) -> None:
         """Check for common deployment issues."""
         # Check for __pycache__ and .pyc files (should be in .gitignore)
-        pycache_dirs = list(self.repo_path.rglob("__pycache__"))
+        pycache_dirs = [d for d in self.index.dirs if d.rsplit('/', 1)[-1] == "__pycache__"]
         if pycache_dirs:
             self.results.append(ValidationResult(
                 passed=False,
@@ -433,7 +442,7 @@ class ProjectValidator:
             ))
 
         # Check for .gitignore
-        if not (self.repo_path / ".gitignore").exists():
+        if not self.index.exists(".gitignore"):
             self.results.append(ValidationResult(
                 passed=False,
                 message="No .gitignore file found",
@@ -442,14 +451,13 @@ class ProjectValidator:
 
         # Check for very large files (>10MB)
         large_files = []
-        for file in self.repo_path.rglob("*"):
-            if file.is_file():
-                try:
-                    size_mb = file.stat().st_size / (1024 * 1024)
-                    if size_mb > 10:
-                        large_files.append((str(file.relative_to(self.repo_path)), size_mb))
-                except:
-                    pass
+        for relative in self.index.files:
+            try:
+                size_mb = (self.repo_path / relative).stat().st_size / (1024 * 1024)
+                if size_mb > 10:
+                    large_files.append((relative, size_mb))
+            except:
+                pass
 
         if large_files:
             self.results.append(ValidationResult(
@@ -460,7 +468,7 @@ class ProjectValidator:
             ))
 
         # Check for database files (should not be committed)
-        db_files = list(self.repo_path.glob("*.sqlite*")) + list(self.repo_path.glob("*.db"))
+        db_files = self.index.find("*.sqlite*", max_depth=1) + self.index.find("*.db", max_depth=1)
         if db_files:
             self.results.append(ValidationResult(
                 passed=False,
@@ -15,6 +15,7 @@ from .health import (
     run_health_check,
     run_all_health_checks,
     cleanup_old_health_records,
+    cleanup_repo_mirrors,
 )
 
 __all__ = [
@@ -29,4 +30,5 @@ __all__ = [
     'run_health_check',
     'run_all_health_checks',
     'cleanup_old_health_records',
+    'cleanup_repo_mirrors',
 ]
@@ -170,3 +170,32 @@ def cleanup_old_health_records(days: int = 30) -> Dict[str, Any]:
         error_msg = f"Failed to cleanup health records: {exc}"
         logger.error(error_msg)
         return {'success': False, 'error': str(exc)}
+
+
+@shared_task(name='apps.deployments.tasks.cleanup_repo_mirrors')
+def cleanup_repo_mirrors() -> Dict[str, Any]:
+    """
+    Evict git mirrors over the cache size limit or unused for too long.
+
+    Returns:
+        Dictionary with cleanup results
+    """
+    from datetime import timedelta
+    from django.conf import settings
+    from ..shared.repo_mirror import collect_garbage
+
+    try:
+        result = collect_garbage(
+            max_bytes=settings.WEBOPS_GIT_CACHE_MAX_MB * 1024 * 1024,
+            max_age=timedelta(days=settings.WEBOPS_GIT_CACHE_MAX_AGE_DAYS)
+        )
+        logger.info(
+            f"Removed {result['removed']} repository mirrors, "
+            f"{result['remaining_bytes'] // (1024 * 1024)} MB cached"
+        )
+        return {'success': True, **result}
+
+    except Exception as exc:
+        error_msg = f"Failed to cleanup repository mirrors: {exc}"
+        logger.error(error_msg)
+        return {'success': False, 'error': str(exc)}
@@ -0,0 +1,109 @@
+"""
+Tests for the build step cache.
+
+Tests content-hash keys for migrations and static files, the step cache
+stored in the checkout, and step timings.
+"""
+
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from apps.deployments.shared import build_cache
+from apps.deployments.shared.build_cache import StepCache, StepTimings
+
+
+class BuildCacheKeyTests(SimpleTestCase):
+    """Test the content-hash keys of cacheable steps."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        (self.root / 'blog' / 'migrations').mkdir(parents=True)
+        (self.root / 'blog' / 'migrations' / '0001_initial.py').write_text('operations = []\n')
+        (self.root / 'blog' / 'views.py').write_text('def index(request): pass\n')
+        (self.root / 'blog' / 'static' / 'blog').mkdir(parents=True)
+        (self.root / 'blog' / 'static' / 'blog' / 'site.css').write_text('body {}\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_migrations_key_ignores_other_code(self):
+        """Only migration files (and extra inputs) change the migrate key."""
+        key = build_cache.migrations_key(self.root, 'config.settings')
+
+        (self.root / 'blog' / 'views.py').write_text('def index(request): return None\n')
+        self.assertEqual(key, build_cache.migrations_key(self.root, 'config.settings'))
+        self.assertNotEqual(key, build_cache.migrations_key(self.root, 'config.settings.prod'))
+
+        (self.root / 'blog' / 'migrations' / '0002_post.py').write_text('operations = []\n')
+        self.assertNotEqual(key, build_cache.migrations_key(self.root, 'config.settings'))
+
+    def test_static_key_follows_static_sources(self):
+        """Static sources change the collectstatic key; collected output does not."""
+        key = build_cache.static_key(self.root)
+
+        (self.root / 'staticfiles').mkdir()
+        (self.root / 'staticfiles' / 'site.css').write_text('collected\n')
+        self.assertEqual(key, build_cache.static_key(self.root))
+
+        (self.root / 'blog' / 'static' / 'blog' / 'site.css').write_text('body { margin: 0 }\n')
+        self.assertNotEqual(key, build_cache.static_key(self.root))
+
+    def test_env_digest_ignores_generated_secrets(self):
+        """Regenerated secrets do not change the database part of .env."""
+        env = self.root / '.env'
+        env.write_text('SECRET_KEY=abc\nDATABASE_URL=postgresql://app@localhost/app\n')
+        digest = build_cache.env_digest(env, prefixes=('DATABASE', 'DB_'))
+
+        env.write_text('SECRET_KEY=xyz\nDATABASE_URL=postgresql://app@localhost/app\n')
+        self.assertEqual(digest, build_cache.env_digest(env, prefixes=('DATABASE', 'DB_')))
+
+        env.write_text('SECRET_KEY=xyz\nDATABASE_URL=postgresql://app@db/app\n')
+        self.assertNotEqual(digest, build_cache.env_digest(env, prefixes=('DATABASE', 'DB_')))
+
+
+class StepCacheTests(SimpleTestCase):
+    """Test the per-checkout step cache and timings."""
+
+    def setUp(self):
+        self.repo = Path(tempfile.mkdtemp())
+        (self.repo / '.git').mkdir()
+
+    def tearDown(self):
+        shutil.rmtree(self.repo, ignore_errors=True)
+
+    def test_recorded_step_is_fresh_across_instances(self):
+        """A recorded key persists in .git until the step's inputs change."""
+        StepCache(self.repo).record('migrate', 'abc')
+
+        cache = StepCache(self.repo)
+        self.assertTrue(cache.is_fresh('migrate', 'abc'))
+        self.assertFalse(cache.is_fresh('migrate', 'def'))
+        self.assertFalse(cache.is_fresh('collectstatic', 'abc'))
+
+        cache.invalidate('migrate')
+        self.assertFalse(StepCache(self.repo).is_fresh('migrate', 'abc'))
+
+    def test_cache_is_not_written_without_checkout(self):
+        """Without a .git directory nothing is cached."""
+        shutil.rmtree(self.repo / '.git')
+        StepCache(self.repo).record('migrate', 'abc')
+
+        self.assertFalse(StepCache(self.repo).is_fresh('migrate', 'abc'))
+
+    def test_timings_recorded_per_step(self):
+        """Step durations are accumulated and summarised."""
+        timings = StepTimings()
+        with timings.step('clone'):
+            pass
+        with timings.step('install'):
+            pass
+
+        self.assertEqual(list(timings.steps), ['clone', 'install'])
+        self.assertIn('total', timings.as_dict())
+        self.assertTrue(timings.summary().startswith('Step timings (total'))
+
+        StepCache(self.repo).record_timings(timings.as_dict())
+        self.assertEqual(set(StepCache(self.repo).last_timings), {'clone', 'install', 'total'})
@@ -0,0 +1,94 @@
+"""
+Tests for the host-level dependency cache.
+
+Tests requirements fingerprints, venv reuse markers and hard-link cloning.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+
+from apps.deployments.shared import dependency_cache
+
+
+class DependencyCacheTests(SimpleTestCase):
+    """Test fingerprinting, reuse and cloning of virtual environments."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.settings_override = override_settings(WEBOPS_CACHE_PATH=str(self.root / 'cache'))
+        self.settings_override.enable()
+
+        self.repo = self.root / 'repo'
+        (self.repo / 'requirements').mkdir(parents=True)
+        (self.repo / 'requirements' / 'base.txt').write_text('Django==5.0.1\n')
+        self.requirements = self.repo / 'requirements.txt'
+        self.requirements.write_text('-r requirements/base.txt\nrequests==2.31.0\n')
+
+        self.venv = self._make_venv('app-venv')
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _make_venv(self, name):
+        venv = self.root / name
+        (venv / 'bin').mkdir(parents=True)
+        (venv / 'lib' / 'python3.11' / 'site-packages').mkdir(parents=True)
+        (venv / 'pyvenv.cfg').write_text('home = /usr/bin\nversion = 3.11.4\n')
+        return venv
+
+    def test_fingerprint_covers_included_files(self):
+        """Changing an included requirements file changes the fingerprint."""
+        before = dependency_cache.requirements_fingerprint(self.requirements, self.venv)
+        self.assertEqual(before, dependency_cache.requirements_fingerprint(self.requirements, self.venv))
+
+        (self.repo / 'requirements' / 'base.txt').write_text('Django==5.0.2\n')
+        self.assertNotEqual(before, dependency_cache.requirements_fingerprint(self.requirements, self.venv))
+
+    def test_fingerprint_covers_python_version(self):
+        """A venv on another interpreter version does not match."""
+        other = self._make_venv('other-venv')
+        (other / 'pyvenv.cfg').write_text('home = /usr/bin\nversion = 3.12.1\n')
+
+        self.assertNotEqual(
+            dependency_cache.requirements_fingerprint(self.requirements, self.venv),
+            dependency_cache.requirements_fingerprint(self.requirements, other)
+        )
+
+    def test_marked_venv_is_reused_and_found(self):
+        """A marked venv matches its fingerprint and is indexed for cloning."""
+        fingerprint = dependency_cache.requirements_fingerprint(self.requirements, self.venv)
+        self.assertFalse(dependency_cache.venv_matches(self.venv, fingerprint))
+
+        dependency_cache.mark_venv(self.venv, fingerprint)
+
+        self.assertTrue(dependency_cache.venv_matches(self.venv, fingerprint))
+        self.assertEqual(dependency_cache.find_venv(fingerprint), self.venv)
+        self.assertIsNone(dependency_cache.find_venv(fingerprint, exclude=self.venv))
+
+        dependency_cache.clear_venv_mark(self.venv)
+        self.assertIsNone(dependency_cache.find_venv(fingerprint))
+
+    def test_clone_links_packages_and_rewrites_scripts(self):
+        """Cloning hard-links site-packages and repoints console scripts."""
+        package = self.venv / 'lib' / 'python3.11' / 'site-packages' / 'django'
+        package.mkdir()
+        (package / '__init__.py').write_text('VERSION = (5, 0, 1)\n')
+        script = self.venv / 'bin' / 'django-admin'
+        script.write_text(f'#!{self.venv}/bin/python\nimport django\n')
+        script.chmod(0o755)
+
+        target = self._make_venv('clone-venv')
+        dependency_cache.clone_venv(self.venv, target)
+
+        cloned = target / 'lib' / 'python3.11' / 'site-packages' / 'django' / '__init__.py'
+        self.assertEqual(os.stat(cloned).st_ino, os.stat(package / '__init__.py').st_ino)
+        self.assertEqual(
+            (target / 'bin' / 'django-admin').read_text(),
+            f'#!{target}/bin/python\nimport django\n'
+        )
+        self.assertTrue(os.access(target / 'bin' / 'django-admin', os.X_OK))
@@ -0,0 +1,112 @@
+"""
+Tests for the deployment logs API.
+
+Tests tail and keyset paging, level filtering, parameter validation and
+NDJSON streaming.
+"""
+
+import json
+
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase
+
+from apps.deployments.api.deployments import get_deployment_logs
+from apps.deployments.models import ApplicationDeployment, DeploymentLog
+
+
+class DeploymentLogsAPITests(TestCase):
+    """Test get_deployment_logs."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.deployment = ApplicationDeployment.objects.create(
+            name='my-django-app',
+            deployed_by=self.user,
+            project_type='django',
+            repo_url='https://github.com/example/django-app',
+            branch='main',
+        )
+        DeploymentLog.objects.bulk_create([
+            DeploymentLog(
+                deployment=self.deployment,
+                level='error' if i % 3 == 0 else 'info',
+                message=f'line {i}',
+            )
+            for i in range(10)
+        ])
+        self.ids = list(
+            DeploymentLog.objects.filter(deployment=self.deployment).order_by('id').values_list('id', flat=True)
+        )
+
+    def _get(self, **params):
+        request = self.factory.get('/api/deployments/my-django-app/logs/', params)
+        request.user = self.user
+        return get_deployment_logs(request, 'my-django-app')
+
+    def _json(self, **params):
+        response = self._get(**params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def _messages(self, data):
+        return [log['message'] for log in data['logs']]
+
+    def test_tail_returns_latest_logs_in_order(self):
+        """tail returns the newest logs, oldest first."""
+        data = self._json(tail=3)
+
+        self.assertEqual(self._messages(data), ['line 7', 'line 8', 'line 9'])
+        self.assertEqual(data['next_after_id'], self.ids[-1])
+        self.assertEqual(data['next_before_id'], self.ids[7])
+
+    def test_after_id_pages_forward(self):
+        """limit and next_after_id walk the log in keyset pages."""
+        first = self._json(limit=4)
+        self.assertEqual(self._messages(first), ['line 0', 'line 1', 'line 2', 'line 3'])
+        self.assertTrue(first['has_more'])
+
+        rest = self._json(after_id=first['next_after_id'], limit=10)
+        self.assertEqual(self._messages(rest), [f'line {i}' for i in range(4, 10)])
+        self.assertFalse(rest['has_more'])
+
+        empty = self._json(after_id=rest['next_after_id'])
+        self.assertEqual(empty['logs'], [])
+        self.assertEqual(empty['next_after_id'], self.ids[-1])
+
+    def test_before_id_pages_backward(self):
+        """before_id returns the page of logs preceding a log."""
+        data = self._json(before_id=self.ids[5], limit=2)
+
+        self.assertEqual(self._messages(data), ['line 3', 'line 4'])
+        self.assertEqual(data['next_before_id'], self.ids[3])
+
+    def test_level_filter(self):
+        """level accepts a comma-separated list."""
+        data = self._json(level='error')
+        self.assertEqual(self._messages(data), ['line 0', 'line 3', 'line 6', 'line 9'])
+
+        data = self._json(level='error,info', after_id=self.ids[7])
+        self.assertEqual(self._messages(data), ['line 8', 'line 9'])
+
+    def test_invalid_parameters_rejected(self):
+        """Malformed ids and times are a 400, not a 500."""
+        self.assertEqual(self._get(after_id='abc').status_code, 400)
+        self.assertEqual(self._get(tail=0).status_code, 400)
+        self.assertEqual(self._get(since='yesterday').status_code, 400)
+
+    def test_ndjson_stream(self):
+        """format=ndjson streams one log object per line."""
+        response = self._get(format='ndjson', after_id=self.ids[1])
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)['message'] for line in lines], [f'line {i}' for i in range(2, 10)])
+
+    def test_other_users_deployment_not_found(self):
+        """Logs of another user's deployment are not exposed."""
+        request = self.factory.get('/api/deployments/my-django-app/logs/')
+        request.user = User.objects.create_user(username='other', password='testpass')
+
+        self.assertEqual(get_deployment_logs(request, 'my-django-app').status_code, 404)
@@ -0,0 +1,90 @@
+"""
+Tests for the buffered deployment log writer.
+
+Tests batching thresholds, flush on error and batched WebSocket fan-out.
+"""
+
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+from apps.deployments.models import ApplicationDeployment, DeploymentLog
+from apps.deployments.shared.log_sink import DeploymentLogSink, LogSinkMixin
+
+
+class DeploymentLogSinkTests(TestCase):
+    """Test DeploymentLogSink batching."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.deployment = ApplicationDeployment.objects.create(
+            name='my-django-app',
+            deployed_by=self.user,
+            project_type='django',
+            repo_url='https://github.com/example/django-app',
+            branch='main',
+        )
+        broadcast = patch('apps.deployments.signals.broadcast_to_websocket')
+        self.broadcast = broadcast.start()
+        self.addCleanup(broadcast.stop)
+
+    def _logs(self):
+        return list(DeploymentLog.objects.filter(deployment=self.deployment).values_list('message', flat=True))
+
+    def test_entries_buffered_until_flush(self):
+        """Entries are written in one batch, in order, on flush."""
+        sink = DeploymentLogSink(self.deployment, flush_interval=60)
+        for i in range(3):
+            sink.write(f'line {i}')
+
+        self.assertEqual(self._logs(), [])
+        self.assertIsNotNone(sink._timer)
+
+        self.assertEqual(sink.flush(), 3)
+        self.assertEqual(self._logs(), ['line 0', 'line 1', 'line 2'])
+        self.assertIsNone(sink._timer)
+        self.assertEqual(sink.flush(), 0)
+
+    def test_batch_size_triggers_flush(self):
+        """Reaching max_entries writes the batch immediately."""
+        sink = DeploymentLogSink(self.deployment, max_entries=2, flush_interval=60)
+        sink.write('one')
+        sink.write('two')
+        sink.write('three')
+
+        self.assertEqual(self._logs(), ['one', 'two'])
+        sink.flush()
+
+    def test_error_flushes_immediately(self):
+        """Errors are never held back in the buffer."""
+        sink = DeploymentLogSink(self.deployment, flush_interval=60)
+        sink.write('building')
+        sink.write('build failed', DeploymentLog.Level.ERROR)
+
+        self.assertEqual(self._logs(), ['building', 'build failed'])
+
+    def test_batch_broadcast_once_per_group(self):
+        """A batch is one WebSocket message per group, not one per line."""
+        sink = DeploymentLogSink(self.deployment, flush_interval=60)
+        for i in range(5):
+            sink.write(f'line {i}')
+        sink.flush()
+
+        groups = [call.args[0] for call in self.broadcast.call_args_list]
+        self.assertEqual(groups, ['deployments', 'deployment_my-django-app'])
+        message = self.broadcast.call_args.args[1]
+        self.assertEqual(message['type'], 'log_entries')
+        self.assertEqual([log['message'] for log in message['logs']], [f'line {i}' for i in range(5)])
+
+    def test_mixin_keeps_one_sink_per_deployment(self):
+        """Services reuse a deployment's sink and flush it on demand."""
+        service = LogSinkMixin()
+        sink = service.get_log_sink(self.deployment)
+        self.assertIs(service.get_log_sink(self.deployment), sink)
+
+        sink.flush_interval = 60
+        sink.write('queued')
+        service.flush_logs(self.deployment)
+
+        self.assertEqual(self._logs(), ['queued'])
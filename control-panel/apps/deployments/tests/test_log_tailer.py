@@ -0,0 +1,154 @@
+"""
+Tests for the event-driven log tailer.
+
+Tests FileTailer reads (inotify and polling), rotation, and sharing one
+reader between groups through the TailHub.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+
+from django.test import SimpleTestCase
+
+from apps.deployments.shared.log_tailer import (
+    FileTailer,
+    TailHub,
+    get_inotify_watcher,
+)
+
+
+class RecordingDispatcher:
+    """Stands in for ChannelsDispatcher and records the chunks it gets."""
+
+    def __init__(self, group):
+        self.group = group
+        self.lines = []
+
+    async def send_chunk(self, chunk):
+        self.lines.extend(chunk.lines)
+
+
+class FileTailerTests(SimpleTestCase):
+    """Test FileTailer reading, rotation and wakeups."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'app.log')
+        with open(self.path, 'w') as f:
+            f.write('old line\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _append(self, text):
+        with open(self.path, 'a') as f:
+            f.write(text)
+
+    async def _collect(self, queue, count, timeout=3.0):
+        lines = []
+        while len(lines) < count:
+            lines.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+        return lines
+
+    async def _tail(self, use_inotify, poll_interval=0.05):
+        queue = asyncio.Queue()
+        tailer = FileTailer(self.path, queue, poll_interval=poll_interval, use_inotify=use_inotify)
+        task = asyncio.create_task(tailer.run())
+        await asyncio.sleep(0.1)
+        return tailer, task, queue
+
+    def test_reads_appended_lines_with_polling(self):
+        """New complete lines are emitted; existing content is skipped."""
+        async def scenario():
+            tailer, task, queue = await self._tail(use_inotify=False)
+            self._append('first\nsecond\npart')
+            lines = await self._collect(queue, 2)
+            self._append('ial\n')
+            lines += await self._collect(queue, 1)
+            tailer.stop()
+            await task
+            return lines
+
+        self.assertEqual(asyncio.run(scenario()), ['first', 'second', 'partial'])
+
+    def test_inotify_wakes_reader_on_write(self):
+        """With inotify the reader wakes on writes, not on the poll interval."""
+        async def scenario():
+            if get_inotify_watcher() is None:
+                return None
+            # A poll interval this long would time out the collect below
+            tailer, task, queue = await self._tail(use_inotify=True, poll_interval=30)
+            self._append('hello\n')
+            lines = await self._collect(queue, 1, timeout=2.0)
+            tailer.stop()
+            await asyncio.wait_for(task, timeout=2.0)
+            return lines
+
+        lines = asyncio.run(scenario())
+        if lines is None:
+            self.skipTest('inotify is not available')
+        self.assertEqual(lines, ['hello'])
+
+    def test_follows_rotation(self):
+        """Lines from the rotated file are drained before switching to the new one."""
+        async def scenario():
+            tailer, task, queue = await self._tail(use_inotify=True, poll_interval=0.05)
+            self._append('before\n')
+            lines = await self._collect(queue, 1)
+            os.rename(self.path, self.path + '.1')
+            with open(self.path, 'w') as f:
+                f.write('after\n')
+            lines += await self._collect(queue, 1)
+            tailer.stop()
+            await task
+            return lines
+
+        self.assertEqual(asyncio.run(scenario()), ['before', 'after'])
+
+
+class TailHubTests(SimpleTestCase):
+    """Test sharing one reader per file across groups."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'vllm.log')
+        open(self.path, 'w').close()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_one_reader_fans_out_to_all_groups(self):
+        """Subscribers of the same file share one tail and each group gets every line once."""
+        async def scenario():
+            hub = TailHub()
+            first = RecordingDispatcher('deployment_a')
+            second = RecordingDispatcher('deployment_b')
+            duplicate = RecordingDispatcher('deployment_a')
+            options = {'flush_interval': 0.05}
+
+            tail = hub.subscribe(self.path, first, **options)
+            self.assertIs(hub.subscribe(self.path, second, **options), tail)
+            self.assertIs(hub.subscribe(self.path, duplicate, **options), tail)
+            await asyncio.sleep(0.1)
+
+            with open(self.path, 'a') as f:
+                f.write('one\ntwo\n')
+            for _ in range(60):
+                if len(first.lines) >= 2 and len(second.lines) >= 2:
+                    break
+                await asyncio.sleep(0.05)
+
+            await hub.unsubscribe(self.path, first)
+            await hub.unsubscribe(self.path, second)
+            still_running = hub.get(self.path) is tail
+            await hub.unsubscribe(self.path, duplicate)
+            return first, second, duplicate, still_running, hub.get(self.path)
+
+        first, second, duplicate, still_running, remaining = asyncio.run(scenario())
+        self.assertEqual(first.lines, ['one', 'two'])
+        self.assertEqual(second.lines, ['one', 'two'])
+        self.assertEqual(duplicate.lines, [])
+        self.assertTrue(still_running)
+        self.assertIsNone(remaining)
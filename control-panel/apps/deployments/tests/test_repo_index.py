@@ -0,0 +1,105 @@
+"""
+Tests for the repository file index.
+
+Tests depth bounds and exclusions of the single walk, cached lookups and
+content reads, and that project detection walks a checkout only once.
+"""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from apps.deployments.shared import repo_index
+from apps.deployments.shared.buildpacks import detect_project
+from apps.deployments.shared.project_detector import ProjectStructureDetector
+from apps.deployments.shared.repo_index import RepoIndex, get_repo_index, invalidate_repo_index
+
+
+class RepoIndexTests(SimpleTestCase):
+    """Test RepoIndex queries."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self._write('manage.py', 'import django\n')
+        self._write('requirements.txt', 'Django>=4.2\ngunicorn\n')
+        self._write('config/__init__.py')
+        self._write('config/settings.py', 'DEBUG = False\n')
+        self._write('config/wsgi.py')
+        self._write('blog/tests/settings.py')
+        self._write('node_modules/pkg/settings.py')
+        self._write('venv/lib/site.py')
+        self._write('a/b/c/d/deep.py')
+
+    def tearDown(self):
+        invalidate_repo_index(self.root)
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _write(self, relative, content=''):
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def test_find_skips_excluded_dirs_and_orders_by_depth(self):
+        """Vendored directories are never indexed; results are shallowest first."""
+        index = RepoIndex(self.root)
+
+        self.assertEqual(index.find('settings.py'), [
+            self.root / 'config/settings.py',
+            self.root / 'blog/tests/settings.py',
+        ])
+        self.assertEqual(index.find('settings.py', exclude={'tests'}), [self.root / 'config/settings.py'])
+        self.assertEqual(index.find('*.py', max_depth=1), [self.root / 'manage.py'])
+        self.assertEqual(index.find('*.py', under=self.root / 'config'), [
+            self.root / 'config/__init__.py',
+            self.root / 'config/settings.py',
+            self.root / 'config/wsgi.py',
+        ])
+        self.assertNotIn(self.root / 'venv/lib/site.py', index.find('*.py'))
+
+    def test_depth_bound_and_fallback_lookups(self):
+        """Files beyond max_depth are not indexed but exists() still answers."""
+        index = RepoIndex(self.root, max_depth=3)
+
+        self.assertEqual(index.find('deep.py'), [])
+        self.assertTrue(index.exists('a/b/c/d/deep.py'))
+        self.assertTrue(index.exists('node_modules'))
+        self.assertTrue(index.exists(self.root / 'venv' / 'lib' / 'site.py'))
+        self.assertTrue(index.is_dir('config'))
+        self.assertFalse(index.exists('config/asgi.py'))
+
+    def test_read_text_is_cached(self):
+        """Small files are read from disk once."""
+        index = RepoIndex(self.root)
+
+        self.assertIn('Django', index.read_text('requirements.txt'))
+        (self.root / 'requirements.txt').write_text('flask\n')
+        self.assertIn('Django', index.read_text(self.root / 'requirements.txt'))
+        self.assertIsNone(index.read_text('missing.txt'))
+
+    def test_cached_index_rebuilt_when_checkout_changes(self):
+        """get_repo_index reuses an index until the tree changes."""
+        index = get_repo_index(self.root)
+        self.assertIs(get_repo_index(self.root), index)
+
+        self._write('Dockerfile', 'FROM python\n')
+        stat = (self.root / 'Dockerfile').stat()
+        os.utime(self.root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+        rebuilt = get_repo_index(self.root)
+        self.assertIsNot(rebuilt, index)
+        self.assertTrue(rebuilt.exists('Dockerfile'))
+
+    def test_detection_walks_tree_once(self):
+        """Buildpacks and the structure detector share one walk."""
+        with patch.object(repo_index.os, 'walk', wraps=os.walk) as walk:
+            result = detect_project(str(self.root))
+            structure = ProjectStructureDetector(self.root).detect_all()
+
+        self.assertEqual(walk.call_count, 1)
+        self.assertEqual(result.project_type, 'django')
+        self.assertEqual(structure['settings_module'], 'config.settings')
+        self.assertEqual(structure['wsgi_module'], 'config.wsgi:application')
@@ -0,0 +1,143 @@
+"""
+Tests for the git mirror cache.
+
+Tests mirror creation, incremental updates, branch fallback and LRU eviction
+against local repositories.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.test import SimpleTestCase, override_settings
+from git import Actor, Repo
+
+from apps.deployments.shared.repo_mirror import RepoMirror, collect_garbage, get_mirror_root
+
+AUTHOR = Actor('WebOps Tests', 'tests@webops.local')
+
+
+class RepoMirrorTests(SimpleTestCase):
+    """Test syncing mirrors and checking out deployments from them."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.settings_override = override_settings(WEBOPS_CACHE_PATH=str(self.root / 'cache'))
+        self.settings_override.enable()
+
+        self.upstream = Repo.init(self.root / 'upstream', initial_branch='main')
+        self._commit('app.py', 'print("v1")\n')
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _commit(self, name, content):
+        path = Path(self.upstream.working_tree_dir) / name
+        path.write_text(content)
+        self.upstream.index.add([name])
+        return self.upstream.index.commit(f'Update {name}', author=AUTHOR, committer=AUTHOR).hexsha
+
+    def _deploy(self, repo_path, branch='main'):
+        mirror = RepoMirror(self.upstream.working_tree_dir)
+        with mirror.lock():
+            existed = mirror.sync()
+            resolved = mirror.resolve_branch(branch)
+            commit = mirror.checkout(repo_path, resolved)
+        return existed, resolved, commit
+
+    def test_first_deploy_creates_mirror_and_checkout(self):
+        """The first deploy fetches into a new mirror; origin keeps the real URL."""
+        repo_path = self.root / 'deployments' / 'app' / 'repo'
+
+        existed, branch, commit = self._deploy(repo_path)
+
+        self.assertFalse(existed)
+        self.assertEqual(branch, 'main')
+        self.assertEqual(commit, self.upstream.head.commit.hexsha)
+        self.assertEqual((repo_path / 'app.py').read_text(), 'print("v1")\n')
+        self.assertEqual(Repo(repo_path).remotes.origin.url, self.upstream.working_tree_dir)
+
+    def test_redeploy_fetches_incrementally(self):
+        """Redeploys update the mirror and reset the checkout to the new commit."""
+        repo_path = self.root / 'repo'
+        self._deploy(repo_path)
+        (repo_path / '.env').write_text('SECRET=1\n')
+        new_commit = self._commit('app.py', 'print("v2")\n')
+
+        existed, _, commit = self._deploy(repo_path)
+
+        self.assertTrue(existed)
+        self.assertEqual(commit, new_commit)
+        self.assertEqual((repo_path / 'app.py').read_text(), 'print("v2")\n')
+        self.assertTrue((repo_path / '.env').exists())
+
+    def test_missing_branch_falls_back_to_main(self):
+        """A missing branch resolves to main from the mirror's refs."""
+        _, branch, _ = self._deploy(self.root / 'repo', branch='release')
+        self.assertEqual(branch, 'main')
+
+    def test_deployments_share_one_mirror(self):
+        """Two deployments of one repository use the same mirror."""
+        self._deploy(self.root / 'first')
+        existed, _, _ = self._deploy(self.root / 'second')
+
+        self.assertTrue(existed)
+        self.assertEqual(len(list(get_mirror_root().glob('*.git'))), 1)
+
+
+class MirrorGarbageCollectionTests(SimpleTestCase):
+    """Test LRU and age-based eviction."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.settings_override = override_settings(WEBOPS_CACHE_PATH=str(self.root / 'cache'))
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _fake_mirror(self, key, size, last_used):
+        root = get_mirror_root()
+        path = root / f'{key}.git'
+        path.mkdir(parents=True)
+        (path / 'pack').write_bytes(b'x' * size)
+        lock = root / f'{key}.lock'
+        lock.touch()
+        os.utime(lock, (last_used, last_used))
+        return path
+
+    def test_evicts_least_recently_used_until_under_limit(self):
+        """Oldest mirrors go first until the cache fits."""
+        now = time.time()
+        oldest = self._fake_mirror('a', 1000, now - 300)
+        middle = self._fake_mirror('b', 1000, now - 200)
+        newest = self._fake_mirror('c', 1000, now - 100)
+
+        result = collect_garbage(max_bytes=1500, now=now)
+
+        self.assertEqual(result['removed'], 2)
+        self.assertFalse(oldest.exists())
+        self.assertFalse(middle.exists())
+        self.assertTrue(newest.exists())
+
+    def test_evicts_expired_and_skips_locked(self):
+        """Unused mirrors expire unless a deploy holds their lock."""
+        now = time.time()
+        expired = self._fake_mirror('a', 10, now - 40 * 86400)
+        in_use = self._fake_mirror('b', 10, now - 40 * 86400)
+        recent = self._fake_mirror('c', 10, now)
+
+        mirror = RepoMirror('unused')
+        mirror.key = 'b'
+        with mirror.lock():
+            result = collect_garbage(max_age=timedelta(days=30), now=now)
+
+        self.assertEqual(result['removed'], 1)
+        self.assertFalse(expired.exists())
+        self.assertTrue(in_use.exists())
+        self.assertTrue(recent.exists())
@@ -6,7 +6,7 @@ Django admin configuration for services app.
 
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import ServiceStatus, ResourceUsage, Alert, HealthCheck
+from .models import ServiceStatus, ResourceUsage, MetricRollup, Alert, HealthCheck
 from .restart_policy import RestartPolicy, RestartAttempt
 
 
@@ -61,6 +61,19 @@ class ResourceUsageAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(MetricRollup)
+class MetricRollupAdmin(admin.ModelAdmin):
+    """Admin for downsampled metrics."""
+
+    list_display = ['bucket_start', 'resolution', 'sample_count', 'cpu_percent_max', 'memory_percent_max', 'disk_percent_max']
+    list_filter = ['resolution']
+    ordering = ['-bucket_start']
+
+    def has_add_permission(self, request):
+        """Disable manual addition."""
+        return False
+
+
 @admin.register(Alert)
 class AlertAdmin(admin.ModelAdmin):
     """Admin for alerts."""
@@ -0,0 +1,174 @@
+"""
+Fleet-wide service probing for WebOps.
+
+"Services" section
+Architecture: Batched systemd queries and concurrent HTTP probes
+
+This module provides the primitives SystemMonitor uses to sweep every
+deployment at once instead of one service at a time:
+- One batched systemd read for many units
+- Process sampling with a single shared CPU measurement window
+- Concurrent HTTP probes over a pooled session with a concurrency limit
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Hashable, Iterable, List
+import logging
+import threading
+import time
+
+import psutil
+import requests
+from requests.adapters import HTTPAdapter
+
+from .systemd import UnitState, get_unit_states
+
+logger = logging.getLogger(__name__)
+
+# CPU sampling window shared by every process in a sweep
+CPU_SAMPLE_INTERVAL = 0.1
+
+PROBE_TIMEOUT = 10
+PROBE_CONCURRENCY = 20
+
+
+@dataclass
+class ProcessSample:
+    """Resource usage of a service's main process."""
+
+    memory_mb: float = 0.0
+    cpu_percent: float = 0.0
+    uptime_seconds: int = 0
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one HTTP health probe."""
+
+    url: str
+    status_code: int
+    response_time_ms: int
+    error: str = ''
+
+    @property
+    def is_healthy(self) -> bool:
+        return not self.error and 200 <= self.status_code < 500
+
+
+def query_unit_states(service_names: Iterable[str]) -> Dict[str, UnitState]:
+    """
+    Get the state of many systemd units in one batched read.
+
+    Uses the persistent D-Bus connection when available, otherwise batched
+    ``systemctl show`` calls (see ``systemd.py``).
+
+    Returns:
+        Dict mapping each requested service name to its UnitState. Units
+        that could not be queried are missing from the result.
+    """
+    return get_unit_states(service_names)
+
+
+def sample_processes(pids: Iterable[int]) -> Dict[int, ProcessSample]:
+    """
+    Sample memory, CPU and uptime for many processes.
+
+    CPU usage is measured over one shared ``CPU_SAMPLE_INTERVAL`` window
+    rather than blocking once per process.
+    """
+    processes = {}
+    for pid in set(pids):
+        try:
+            process = psutil.Process(pid)
+            process.cpu_percent(None)
+            processes[pid] = process
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    if processes:
+        time.sleep(CPU_SAMPLE_INTERVAL)
+
+    now = time.time()
+    samples = {}
+    for pid, process in processes.items():
+        try:
+            with process.oneshot():
+                samples[pid] = ProcessSample(
+                    memory_mb=process.memory_info().rss / (1024 * 1024),
+                    cpu_percent=process.cpu_percent(None),
+                    uptime_seconds=int(now - process.create_time())
+                )
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+
+    return samples
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """
+    Get the shared probe session.
+
+    The session's connection pool is thread-safe and sized for
+    ``PROBE_CONCURRENCY``, so keep-alive connections are reused across
+    probes and sweeps.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=PROBE_CONCURRENCY, pool_maxsize=PROBE_CONCURRENCY)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
+
+def probe_url(url: str, timeout: float = PROBE_TIMEOUT) -> ProbeResult:
+    """Probe a single URL."""
+    start = time.monotonic()
+    try:
+        response = _get_session().get(url, timeout=timeout)
+        response.close()
+        return ProbeResult(
+            url=url,
+            status_code=response.status_code,
+            response_time_ms=int((time.monotonic() - start) * 1000)
+        )
+    except requests.Timeout:
+        return ProbeResult(url=url, status_code=0, response_time_ms=int(timeout * 1000), error='Request timeout')
+    except requests.RequestException as e:
+        return ProbeResult(url=url, status_code=0, response_time_ms=0, error=str(e))
+
+
+def probe_urls(
+    urls: Dict[Hashable, str],
+    max_workers: int = PROBE_CONCURRENCY,
+    timeout: float = PROBE_TIMEOUT
+) -> Dict[Hashable, ProbeResult]:
+    """
+    Probe many URLs concurrently.
+
+    A sweep takes roughly the slowest probe per ``max_workers`` URLs
+    instead of the sum of all probes.
+
+    Args:
+        urls: Dict mapping a caller key (e.g. deployment id) to the URL
+        max_workers: Maximum probes in flight
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Dict mapping each key to its ProbeResult
+    """
+    if not urls:
+        return {}
+
+    keys: List[Hashable] = list(urls)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(keys)), thread_name_prefix='health-probe') as pool:
+        results = pool.map(lambda key: probe_url(urls[key], timeout), keys)
+        return dict(zip(keys, results))
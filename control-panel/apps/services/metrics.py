@@ -0,0 +1,250 @@
+"""
+System metrics sampling and time-series rollups for WebOps.
+
+"Services" section
+Architecture: Non-blocking sampler feeding a downsampled metrics store
+
+This module provides:
+- MetricsSampler: computes CPU usage from the delta against the previous
+  sample (kept in the shared cache) instead of sleeping for a measurement
+  window, and counts sockets from /proc instead of enumerating them
+- record_rollups: folds a sample into 1 minute, 15 minute and 1 hour
+  buckets with min/avg/max per gauge
+- get_metrics_series: serves a time range from the finest resolution
+  that keeps the number of points bounded, so long ranges stay cheap
+"""
+
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, List, Optional
+import logging
+
+import psutil
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
+
+from .models import MetricRollup
+
+logger = logging.getLogger(__name__)
+
+CPU_STATE_CACHE_KEY = 'services:metrics:cpu_times'
+CPU_STATE_TTL = 24 * 60 * 60
+
+RESOLUTION_SECONDS = {
+    MetricRollup.Resolution.MINUTE: 60,
+    MetricRollup.Resolution.QUARTER_HOUR: 15 * 60,
+    MetricRollup.Resolution.HOUR: 60 * 60,
+}
+
+# Raw ResourceUsage snapshots are only kept for this long; older history
+# is served from the rollups
+RAW_RETENTION = timedelta(days=2)
+
+# How long each resolution is kept
+RETENTION = {
+    MetricRollup.Resolution.MINUTE: timedelta(days=2),
+    MetricRollup.Resolution.QUARTER_HOUR: timedelta(days=35),
+    MetricRollup.Resolution.HOUR: timedelta(days=400),
+}
+
+# Longest range served from each resolution (finest first)
+MAX_RANGE = [
+    (MetricRollup.Resolution.MINUTE, timedelta(hours=6)),
+    (MetricRollup.Resolution.QUARTER_HOUR, timedelta(days=7)),
+    (MetricRollup.Resolution.HOUR, None),
+]
+
+
+@dataclass
+class MetricsSample:
+    """One snapshot of system-wide resource usage."""
+
+    cpu_percent: float
+    memory_percent: float
+    memory_used_mb: int
+    memory_total_mb: int
+    disk_percent: float
+    disk_used_gb: float
+    disk_total_gb: float
+    network_sent_mb: float
+    network_recv_mb: float
+    active_connections: int
+    load_average_1m: float
+    load_average_5m: float
+    load_average_15m: float
+
+    def as_dict(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+def count_tcp_sockets() -> int:
+    """
+    Count TCP sockets in use from /proc/net/sockstat.
+
+    Much cheaper than ``psutil.net_connections()``, which walks every
+    process's file descriptors. Returns 0 where /proc is unavailable.
+    """
+    total = 0
+    for path in ('/proc/net/sockstat', '/proc/net/sockstat6'):
+        try:
+            with open(path) as sockstat:
+                for line in sockstat:
+                    if line.startswith(('TCP:', 'TCP6:')):
+                        fields = line.split()
+                        total += int(fields[fields.index('inuse') + 1])
+        except (OSError, ValueError, IndexError):
+            continue
+    return total
+
+
+class MetricsSampler:
+    """
+    Non-blocking system metrics sampler.
+
+    CPU usage is the busy share of CPU time since the previous sample. The
+    previous CPU times are kept in the shared cache so the delta spans the
+    sampling interval no matter which process took the last sample. The
+    first sample ever measures since boot.
+    """
+
+    def _cpu_percent(self) -> float:
+        times = psutil.cpu_times()
+        # Guest time is already included in user/nice on Linux
+        total = sum(times) - getattr(times, 'guest', 0.0) - getattr(times, 'guest_nice', 0.0)
+        idle = times.idle + getattr(times, 'iowait', 0.0)
+        busy = total - idle
+
+        previous = cache.get(CPU_STATE_CACHE_KEY)
+        cache.set(CPU_STATE_CACHE_KEY, (busy, total), CPU_STATE_TTL)
+
+        if previous:
+            previous_busy, previous_total = previous
+            if total > previous_total:
+                busy, total = busy - previous_busy, total - previous_total
+
+        if total <= 0:
+            return 0.0
+        return round(min(max(busy / total * 100, 0.0), 100.0), 1)
+
+    def sample(self) -> MetricsSample:
+        """Take a sample without blocking."""
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        network = psutil.net_io_counters()
+
+        # Load average (Unix only)
+        try:
+            load_average_1m, load_average_5m, load_average_15m = psutil.getloadavg()
+        except (AttributeError, OSError):
+            load_average_1m = load_average_5m = load_average_15m = 0.0
+
+        return MetricsSample(
+            cpu_percent=self._cpu_percent(),
+            memory_percent=memory.percent,
+            memory_used_mb=memory.used // (1024 * 1024),
+            memory_total_mb=memory.total // (1024 * 1024),
+            disk_percent=disk.percent,
+            disk_used_gb=disk.used / (1024 * 1024 * 1024),
+            disk_total_gb=disk.total / (1024 * 1024 * 1024),
+            network_sent_mb=network.bytes_sent / (1024 * 1024),
+            network_recv_mb=network.bytes_recv / (1024 * 1024),
+            active_connections=count_tcp_sockets(),
+            load_average_1m=load_average_1m,
+            load_average_5m=load_average_5m,
+            load_average_15m=load_average_15m,
+        )
+
+
+def bucket_start(timestamp: datetime, resolution: str) -> datetime:
+    """Start of the bucket containing ``timestamp``."""
+    seconds = RESOLUTION_SECONDS[resolution]
+    epoch = int(timestamp.timestamp())
+    return datetime.fromtimestamp(epoch - epoch % seconds, tz=timestamp.tzinfo or dt_timezone.utc)
+
+
+def record_rollups(sample: MetricsSample, timestamp: Optional[datetime] = None) -> None:
+    """
+    Fold a sample into its bucket at every resolution.
+
+    Buckets are updated in place with F-expressions, so concurrent samplers
+    never lose samples.
+    """
+    timestamp = timestamp or timezone.now()
+    values = {gauge: getattr(sample, gauge) for gauge in MetricRollup.GAUGES}
+
+    for resolution in RESOLUTION_SECONDS:
+        start = bucket_start(timestamp, resolution)
+
+        updates = {
+            'sample_count': F('sample_count') + 1,
+            'network_sent_mb': Greatest(F('network_sent_mb'), sample.network_sent_mb),
+            'network_recv_mb': Greatest(F('network_recv_mb'), sample.network_recv_mb),
+        }
+        for gauge, value in values.items():
+            updates[f'{gauge}_min'] = Least(F(f'{gauge}_min'), value)
+            updates[f'{gauge}_sum'] = F(f'{gauge}_sum') + value
+            updates[f'{gauge}_max'] = Greatest(F(f'{gauge}_max'), value)
+
+        bucket = MetricRollup.objects.filter(resolution=resolution, bucket_start=start)
+        if bucket.update(**updates):
+            continue
+
+        initial = {
+            'sample_count': 1,
+            'network_sent_mb': sample.network_sent_mb,
+            'network_recv_mb': sample.network_recv_mb,
+        }
+        for gauge, value in values.items():
+            initial[f'{gauge}_min'] = initial[f'{gauge}_sum'] = initial[f'{gauge}_max'] = value
+
+        try:
+            with transaction.atomic():
+                MetricRollup.objects.create(resolution=resolution, bucket_start=start, **initial)
+        except IntegrityError:
+            # Another sampler created the bucket first
+            bucket.update(**updates)
+
+
+def choose_resolution(span: timedelta) -> str:
+    """Finest resolution that serves ``span`` with a bounded number of points."""
+    for resolution, max_range in MAX_RANGE:
+        if max_range is None or span <= max_range:
+            return resolution
+    return MetricRollup.Resolution.HOUR
+
+
+def get_metrics_series(hours: int = 24, resolution: Optional[str] = None) -> List[MetricRollup]:
+    """
+    Get pre-aggregated metrics for the last ``hours`` hours.
+
+    Args:
+        hours: Length of the range
+        resolution: Force a resolution instead of choosing by range
+
+    Returns:
+        MetricRollup buckets in chronological order
+    """
+    span = timedelta(hours=hours)
+    resolution = resolution or choose_resolution(span)
+    cutoff = timezone.now() - span
+
+    return list(MetricRollup.objects.filter(
+        resolution=resolution,
+        bucket_start__gte=bucket_start(cutoff, resolution)
+    ).order_by('bucket_start'))
+
+
+def prune_rollups(now: Optional[datetime] = None) -> int:
+    """Delete buckets older than their resolution's retention."""
+    now = now or timezone.now()
+    deleted = 0
+    for resolution, retention in RETENTION.items():
+        count, _ = MetricRollup.objects.filter(
+            resolution=resolution,
+            bucket_start__lt=now - retention
+        ).delete()
+        deleted += count
+    return deleted
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-16 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0004_alert_deleted_at_alert_deleted_by_alert_is_deleted_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetricRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resolution', models.CharField(choices=[('1m', '1 Minute'), ('15m', '15 Minutes'), ('1h', '1 Hour')], max_length=3)),
+                ('bucket_start', models.DateTimeField()),
+                ('sample_count', models.IntegerField(default=0)),
+                ('cpu_percent_min', models.FloatField(default=0.0)),
+                ('cpu_percent_sum', models.FloatField(default=0.0)),
+                ('cpu_percent_max', models.FloatField(default=0.0)),
+                ('memory_percent_min', models.FloatField(default=0.0)),
+                ('memory_percent_sum', models.FloatField(default=0.0)),
+                ('memory_percent_max', models.FloatField(default=0.0)),
+                ('disk_percent_min', models.FloatField(default=0.0)),
+                ('disk_percent_sum', models.FloatField(default=0.0)),
+                ('disk_percent_max', models.FloatField(default=0.0)),
+                ('load_average_1m_min', models.FloatField(default=0.0)),
+                ('load_average_1m_sum', models.FloatField(default=0.0)),
+                ('load_average_1m_max', models.FloatField(default=0.0)),
+                ('network_sent_mb', models.FloatField(default=0.0)),
+                ('network_recv_mb', models.FloatField(default=0.0)),
+            ],
+            options={
+                'verbose_name': 'Metric Rollup',
+                'verbose_name_plural': 'Metric Rollups',
+                'db_table': 'metric_rollups',
+                'ordering': ['resolution', 'bucket_start'],
+                'constraints': [models.UniqueConstraint(fields=('resolution', 'bucket_start'), name='unique_metric_rollup_bucket')],
+            },
+        ),
+    ]
@@ -78,6 +78,77 @@ class ResourceUsage(BaseModel):
         return f"Resources @ {self.created_at.strftime('%Y-%m-%d %H:%M:%S')}"
 
 
+class MetricRollup(models.Model):
+    """
+    Downsampled system metrics for one time bucket.
+
+    One row per (resolution, bucket) holds min/sum/max for each gauge so
+    buckets can be updated incrementally as samples arrive; the average is
+    ``sum / sample_count``. Network counters keep the latest value.
+    """
+
+    class Resolution(models.TextChoices):
+        MINUTE = '1m', '1 Minute'
+        QUARTER_HOUR = '15m', '15 Minutes'
+        HOUR = '1h', '1 Hour'
+
+    GAUGES = ('cpu_percent', 'memory_percent', 'disk_percent', 'load_average_1m')
+
+    resolution = models.CharField(max_length=3, choices=Resolution.choices)
+    bucket_start = models.DateTimeField()
+    sample_count = models.IntegerField(default=0)
+
+    cpu_percent_min = models.FloatField(default=0.0)
+    cpu_percent_sum = models.FloatField(default=0.0)
+    cpu_percent_max = models.FloatField(default=0.0)
+    memory_percent_min = models.FloatField(default=0.0)
+    memory_percent_sum = models.FloatField(default=0.0)
+    memory_percent_max = models.FloatField(default=0.0)
+    disk_percent_min = models.FloatField(default=0.0)
+    disk_percent_sum = models.FloatField(default=0.0)
+    disk_percent_max = models.FloatField(default=0.0)
+    load_average_1m_min = models.FloatField(default=0.0)
+    load_average_1m_sum = models.FloatField(default=0.0)
+    load_average_1m_max = models.FloatField(default=0.0)
+
+    network_sent_mb = models.FloatField(default=0.0)
+    network_recv_mb = models.FloatField(default=0.0)
+
+    class Meta:
+        db_table = 'metric_rollups'
+        verbose_name = 'Metric Rollup'
+        verbose_name_plural = 'Metric Rollups'
+        ordering = ['resolution', 'bucket_start']
+        constraints = [
+            models.UniqueConstraint(fields=['resolution', 'bucket_start'], name='unique_metric_rollup_bucket'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.resolution} @ {self.bucket_start.strftime('%Y-%m-%d %H:%M')}"
+
+    def average(self, gauge: str) -> float:
+        """Average of a gauge over the bucket."""
+        if not self.sample_count:
+            return 0.0
+        return getattr(self, f'{gauge}_sum') / self.sample_count
+
+    @property
+    def cpu_percent(self) -> float:
+        return self.average('cpu_percent')
+
+    @property
+    def memory_percent(self) -> float:
+        return self.average('memory_percent')
+
+    @property
+    def disk_percent(self) -> float:
+        return self.average('disk_percent')
+
+    @property
+    def load_average_1m(self) -> float:
+        return self.average('load_average_1m')
+
+
 class Alert(BaseModel):
     """System alerts for monitoring thresholds."""
 
@@ -5,13 +5,12 @@ System monitoring service for WebOps.
 Architecture: Real-time system monitoring using psutil
 """
 
-from typing import Dict, Any, List, Optional
-import psutil
-import subprocess
+from typing import Dict, Any, Iterable, List, Optional
 from django.utils import timezone
-from .models import ResourceUsage, ServiceStatus, Alert, HealthCheck
+from .models import ResourceUsage, MetricRollup, ServiceStatus, Alert, HealthCheck
+from .metrics import RAW_RETENTION, MetricsSampler, get_metrics_series, prune_rollups, record_rollups
+from .fleet import PROBE_CONCURRENCY, probe_urls, query_unit_states, sample_processes
 from apps.deployments.models import BaseDeployment, ApplicationDeployment
-import requests
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,7 @@ class SystemMonitor:
     """Monitor system resources and health."""
 
     def __init__(self):
+        self.sampler = MetricsSampler()
         self.alert_thresholds = {
             'cpu_percent': 80.0,
             'memory_percent': 85.0,
@@ -28,56 +28,17 @@ class SystemMonitor:
         }
 
     def collect_metrics(self) -> ResourceUsage:
-        """Collect current system metrics."""
-        # CPU
-        cpu_percent = psutil.cpu_percent(interval=1)
-
-        # Memory
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
-        memory_used_mb = memory.used // (1024 * 1024)
-        memory_total_mb = memory.total // (1024 * 1024)
-
-        # Disk
-        disk = psutil.disk_usage('/')
-        disk_percent = disk.percent
-        disk_used_gb = disk.used / (1024 * 1024 * 1024)
-        disk_total_gb = disk.total / (1024 * 1024 * 1024)
-
-        # Network
-        network = psutil.net_io_counters()
-        network_sent_mb = network.bytes_sent / (1024 * 1024)
-        network_recv_mb = network.bytes_recv / (1024 * 1024)
-
-        # Connections
-        try:
-            active_connections = len(psutil.net_connections())
-        except (PermissionError, psutil.AccessDenied):
-            active_connections = 0
-
-        # Load average (Unix only)
-        try:
-            load_avg = psutil.getloadavg()
-            load_average_1m, load_average_5m, load_average_15m = load_avg
-        except (AttributeError, OSError):
-            load_average_1m = load_average_5m = load_average_15m = 0.0
+        """
+        Collect current system metrics.
+
+        Sampling does not block; the sample is stored as a raw snapshot
+        and folded into the 1m/15m/1h rollups.
+        """
+        sample = self.sampler.sample()
 
         # Create usage record
-        usage = ResourceUsage.objects.create(
-            cpu_percent=cpu_percent,
-            memory_percent=memory_percent,
-            memory_used_mb=memory_used_mb,
-            memory_total_mb=memory_total_mb,
-            disk_percent=disk_percent,
-            disk_used_gb=disk_used_gb,
-            disk_total_gb=disk_total_gb,
-            network_sent_mb=network_sent_mb,
-            network_recv_mb=network_recv_mb,
-            active_connections=active_connections,
-            load_average_1m=load_average_1m,
-            load_average_5m=load_average_5m,
-            load_average_15m=load_average_15m,
-        )
+        usage = ResourceUsage.objects.create(**sample.as_dict())
+        record_rollups(sample, usage.created_at)
 
         # Check thresholds and create alerts
         self._check_thresholds(usage)
@@ -149,177 +110,168 @@ class SystemMonitor:
         """Get the most recent resource usage snapshot."""
         return ResourceUsage.objects.first()
 
-    def get_metrics_history(self, hours: int = 24) -> List[ResourceUsage]:
-        """Get resource usage history for specified hours."""
-        cutoff = timezone.now() - timezone.timedelta(hours=hours)
-        return list(ResourceUsage.objects.filter(created_at__gte=cutoff))
+    def get_metrics_history(self, hours: int = 24, resolution: Optional[str] = None) -> List[MetricRollup]:
+        """
+        Get pre-aggregated resource usage history for specified hours.
+
+        The resolution is chosen from the range (1m up to 6 hours, 15m up
+        to a week, 1h beyond) unless given.
+        """
+        return get_metrics_series(hours=hours, resolution=resolution)
 
     def check_service_status(self, deployment: BaseDeployment) -> ServiceStatus:
         """Check status of a deployed service."""
-        service_name = f"webops-{deployment.name}"
-
-        try:
-            # Check systemd service status
-            result = subprocess.run(
-                ['systemctl', 'is-active', service_name],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        return self.check_service_statuses([deployment])[deployment.id]
+
+    def check_service_statuses(self, deployments: Iterable[BaseDeployment]) -> Dict[int, ServiceStatus]:
+        """
+        Check status of many deployed services in one sweep.
+
+        All units are queried with batched ``systemctl show`` calls, CPU is
+        sampled over one shared window, and ServiceStatus rows are written
+        with one bulk update and one bulk insert.
+
+        Returns:
+            Dict mapping deployment id to its ServiceStatus
+        """
+        deployments = list(deployments)
+        if not deployments:
+            return {}
+
+        service_names = {deployment.id: f"webops-{deployment.name}" for deployment in deployments}
+        unit_states = query_unit_states(service_names.values())
+
+        pids = [
+            state.main_pid for state in unit_states.values()
+            if state.is_active and state.main_pid
+        ]
+        samples = sample_processes(pids)
+
+        now = timezone.now()
+        existing = {
+            status.deployment_id: status
+            for status in ServiceStatus.objects.filter(deployment_id__in=service_names)
+        }
+        to_create = []
+        to_update = []
+        statuses = {}
 
-            is_active = result.stdout.strip() == 'active'
-
-            # Get service details if running
-            pid = None
-            memory_mb = 0.0
-            cpu_percent = 0.0
-            uptime_seconds = 0
-
-            if is_active:
-                # Get PID
-                pid_result = subprocess.run(
-                    ['systemctl', 'show', service_name, '--property=MainPID'],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                pid_line = pid_result.stdout.strip()
-                if pid_line.startswith('MainPID='):
-                    pid = int(pid_line.split('=')[1])
-
-                # Get process stats if we have PID
-                if pid and pid > 0:
-                    try:
-                        process = psutil.Process(pid)
-                        memory_mb = process.memory_info().rss / (1024 * 1024)
-                        cpu_percent = process.cpu_percent(interval=0.1)
-                        uptime_seconds = int(timezone.now().timestamp() - process.create_time())
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-
-            # Determine status
-            if is_active:
+        for deployment in deployments:
+            state = unit_states.get(service_names[deployment.id])
+            sample = None
+
+            if state is None:
+                logger.error(f"Could not query service status for {service_names[deployment.id]}")
+                status = ServiceStatus.Status.FAILED
+            elif state.is_active:
                 status = ServiceStatus.Status.RUNNING
+                sample = samples.get(state.main_pid)
+            elif state.is_failed:
+                status = ServiceStatus.Status.FAILED
             else:
-                # Check if it's failed
-                result = subprocess.run(
-                    ['systemctl', 'is-failed', service_name],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                status = ServiceStatus.Status.FAILED if result.stdout.strip() == 'failed' else ServiceStatus.Status.STOPPED
-
-            # Get or create status record
-            service_status, created = ServiceStatus.objects.get_or_create(
-                deployment=deployment,
-                defaults={
-                    'status': status,
-                    'pid': pid,
-                    'memory_mb': memory_mb,
-                    'cpu_percent': cpu_percent,
-                    'uptime_seconds': uptime_seconds,
-                }
+                status = ServiceStatus.Status.STOPPED
+
+            service_status = existing.get(deployment.id)
+            if service_status is None:
+                service_status = ServiceStatus(deployment=deployment)
+                to_create.append(service_status)
+            else:
+                to_update.append(service_status)
+
+            service_status.status = status
+            if state is not None:
+                service_status.pid = state.main_pid if state.is_active else None
+                service_status.memory_mb = sample.memory_mb if sample else 0.0
+                service_status.cpu_percent = sample.cpu_percent if sample else 0.0
+                service_status.uptime_seconds = sample.uptime_seconds if sample else 0
+            service_status.last_checked = now
+            service_status.updated_at = now
+            statuses[deployment.id] = service_status
+
+        sweep_fields = ['status', 'pid', 'memory_mb', 'cpu_percent', 'uptime_seconds', 'last_checked', 'updated_at']
+        if to_update:
+            ServiceStatus.objects.bulk_update(to_update, sweep_fields)
+        if to_create:
+            # A concurrent sweep may have created the row since we looked
+            ServiceStatus.objects.bulk_create(
+                to_create,
+                update_conflicts=True,
+                unique_fields=['deployment'],
+                update_fields=sweep_fields,
             )
 
-            if not created:
-                # Update existing
-                service_status.status = status
-                service_status.pid = pid
-                service_status.memory_mb = memory_mb
-                service_status.cpu_percent = cpu_percent
-                service_status.uptime_seconds = uptime_seconds
-                service_status.save()
-
-            return service_status
-
-        except subprocess.TimeoutExpired:
-            logger.error(f"Timeout checking service status for {service_name}")
-            return self._get_or_create_failed_status(deployment, "Timeout checking service")
-        except Exception as e:
-            logger.error(f"Error checking service status for {service_name}: {e}")
-            return self._get_or_create_failed_status(deployment, str(e))
-
-    def _get_or_create_failed_status(self, deployment: BaseDeployment, error: str) -> ServiceStatus:
-        """Get or create a failed status record."""
-        service_status, _ = ServiceStatus.objects.get_or_create(
-            deployment=deployment,
-            defaults={'status': ServiceStatus.Status.FAILED}
-        )
-        service_status.status = ServiceStatus.Status.FAILED
-        service_status.save()
-        return service_status
+        return statuses
 
     def perform_health_check(self, deployment: BaseDeployment) -> Optional[HealthCheck]:
         """Perform HTTP health check on deployment."""
-        if not deployment.domain and not deployment.port:
-            return None
-
-        # Construct URL
-        if deployment.domain:
-            url = f"http://{deployment.domain}/"
-        else:
-            url = f"http://localhost:{deployment.port}/"
-
-        try:
-            start_time = timezone.now()
-            response = requests.get(url, timeout=10)
-            end_time = timezone.now()
-
-            response_time_ms = int((end_time - start_time).total_seconds() * 1000)
-            is_healthy = 200 <= response.status_code < 500
-
-            health_check = HealthCheck.objects.create(
-                deployment=deployment,
-                url=url,
-                status_code=response.status_code,
-                response_time_ms=response_time_ms,
-                is_healthy=is_healthy,
-                error_message='' if is_healthy else f'HTTP {response.status_code}'
+        return self.perform_health_checks([deployment]).get(deployment.id)
+
+    def perform_health_checks(
+        self,
+        deployments: Iterable[BaseDeployment],
+        max_workers: int = PROBE_CONCURRENCY
+    ) -> Dict[int, HealthCheck]:
+        """
+        Perform HTTP health checks on many deployments concurrently.
+
+        Probes share a pooled HTTP session, at most ``max_workers`` run at
+        once, and the HealthCheck rows are written with one bulk insert.
+
+        Returns:
+            Dict mapping deployment id to its HealthCheck (deployments with
+            neither domain nor port are skipped)
+        """
+        urls = {}
+        by_id = {}
+        for deployment in deployments:
+            if not deployment.domain and not deployment.port:
+                continue
+
+            # Construct URL
+            if deployment.domain:
+                urls[deployment.id] = f"http://{deployment.domain}/"
+            else:
+                urls[deployment.id] = f"http://localhost:{deployment.port}/"
+            by_id[deployment.id] = deployment
+
+        probes = probe_urls(urls, max_workers=max_workers)
+
+        health_checks = {
+            deployment_id: HealthCheck(
+                deployment=by_id[deployment_id],
+                url=probe.url,
+                status_code=probe.status_code,
+                response_time_ms=probe.response_time_ms,
+                is_healthy=probe.is_healthy,
+                error_message=probe.error or ('' if probe.is_healthy else f'HTTP {probe.status_code}')
             )
+            for deployment_id, probe in probes.items()
+        }
+        HealthCheck.objects.bulk_create(health_checks.values())
 
-            # Create alert if service is down
-            if not is_healthy:
+        # Create alerts for services that are down
+        for deployment_id, probe in probes.items():
+            deployment = by_id[deployment_id]
+            if probe.error == 'Request timeout':
+                self._create_alert(
+                    alert_type=Alert.AlertType.SERVICE_DOWN,
+                    severity=Alert.Severity.ERROR,
+                    title=f'Service Timeout: {deployment.name}',
+                    message=f'Health check timeout for {deployment.name}',
+                    metadata={'url': probe.url},
+                    deployment=deployment
+                )
+            elif not probe.error and not probe.is_healthy:
                 self._create_alert(
                     alert_type=Alert.AlertType.SERVICE_DOWN,
                     severity=Alert.Severity.ERROR,
                     title=f'Service Health Check Failed: {deployment.name}',
-                    message=f'Health check failed for {deployment.name} with status {response.status_code}',
-                    metadata={'url': url, 'status_code': response.status_code},
+                    message=f'Health check failed for {deployment.name} with status {probe.status_code}',
+                    metadata={'url': probe.url, 'status_code': probe.status_code},
                     deployment=deployment
                 )
 
-            return health_check
-
-        except requests.Timeout:
-            health_check = HealthCheck.objects.create(
-                deployment=deployment,
-                url=url,
-                status_code=0,
-                response_time_ms=10000,
-                is_healthy=False,
-                error_message='Request timeout'
-            )
-            self._create_alert(
-                alert_type=Alert.AlertType.SERVICE_DOWN,
-                severity=Alert.Severity.ERROR,
-                title=f'Service Timeout: {deployment.name}',
-                message=f'Health check timeout for {deployment.name}',
-                metadata={'url': url},
-                deployment=deployment
-            )
-            return health_check
-
-        except requests.RequestException as e:
-            health_check = HealthCheck.objects.create(
-                deployment=deployment,
-                url=url,
-                status_code=0,
-                response_time_ms=0,
-                is_healthy=False,
-                error_message=str(e)
-            )
-            return health_check
+        return health_checks
 
     def get_system_summary(self) -> Dict[str, Any]:
         """Get comprehensive system summary."""
@@ -331,12 +283,9 @@ class SystemMonitor:
         all_unacked_alerts = Alert.objects.filter(is_acknowledged=False)
 
         # Get service statuses
-        deployments = ApplicationDeployment.objects.all()
-        service_statuses = []
-        for deployment in deployments:
-            status = ServiceStatus.objects.filter(deployment=deployment).first()
-            if status:
-                service_statuses.append(status)
+        service_statuses = list(ServiceStatus.objects.filter(
+            deployment_id__in=ApplicationDeployment.objects.values('pk')
+        ))
 
         return {
             'resources': {
@@ -372,8 +321,10 @@ class SystemMonitor:
         """Clean up old monitoring data."""
         cutoff = timezone.now() - timezone.timedelta(days=days)
 
-        # Delete old resource usage
-        deleted_usage = ResourceUsage.objects.filter(created_at__lt=cutoff).delete()
+        # Delete old raw resource usage (history is served from rollups)
+        raw_cutoff = max(cutoff, timezone.now() - RAW_RETENTION)
+        deleted_usage = ResourceUsage.objects.filter(created_at__lt=raw_cutoff).delete()
+        deleted_rollups = prune_rollups()
 
         # Delete old acknowledged alerts
         deleted_alerts = Alert.objects.filter(
@@ -384,4 +335,4 @@ class SystemMonitor:
         # Delete old health checks
         deleted_health = HealthCheck.objects.filter(created_at__lt=cutoff).delete()
 
-        logger.info(f"Cleaned up old data: {deleted_usage[0]} usage records, {deleted_alerts[0]} alerts, {deleted_health[0]} health checks")
+        logger.info(f"Cleaned up old data: {deleted_usage[0]} usage records, {deleted_rollups} metric rollups, {deleted_alerts[0]} alerts, {deleted_health[0]} health checks")
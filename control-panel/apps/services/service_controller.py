@@ -15,6 +15,7 @@ This module provides:
 from typing import Dict, Any, List, Optional, Tuple
 import subprocess
 import logging
+import time
 import psutil
 from django.conf import settings
 from django.utils import timezone
@@ -22,11 +23,15 @@ from datetime import timedelta
 
 from .models import ServiceStatus, Alert, ResourceUsage
 from .monitoring import SystemMonitor
-from apps.deployments.models import BaseDeployment, ApplicationDeployment
+from .systemd import SystemdError, get_systemd_backend, get_unit_states
+from apps.deployments.models import BaseDeployment, ApplicationDeployment, DeploymentLog
 from apps.deployments.shared import ServiceManager
 
 logger = logging.getLogger(__name__)
 
+# Time a started or restarted service gets before its status is checked
+SERVICE_SETTLE_SECONDS = 2
+
 
 class ServiceControlError(Exception):
     """Base exception for service control errors."""
@@ -52,138 +57,190 @@ class ServiceController:
     # DEPLOYMENT SERVICE CONTROL
     # =========================================================================
 
-    def start_service(self, deployment: BaseDeployment) -> Dict[str, Any]:
+    def _control_unit(self, action: str, deployment: BaseDeployment) -> None:
         """
-        Start a deployment service.
-
-        Args:
-            deployment: BaseDeployment instance to start
+        Start, stop or restart a deployment's unit.
 
-        Returns:
-            Result dict with success status and details
+        Uses the persistent D-Bus connection when available and falls back
+        to ServiceManager (systemctl) otherwise or when systemd refuses.
+        Both paths record the action in the deployment's log.
         """
-        try:
-            logger.info(f"Starting service for deployment: {deployment.name}")
-
-            # Use ServiceManager to start
-            self.service_manager.start_service(deployment)
+        backend = get_systemd_backend()
+        if backend.supports_control:
+            try:
+                backend.manage_unit(action, deployment.name)
+                gerund = {'start': 'Starting', 'stop': 'Stopping', 'restart': 'Restarting'}[action]
+                past = {'start': 'started', 'stop': 'stopped', 'restart': 'restarted'}[action]
+                # Same entries ServiceManager writes, so live log viewers see them
+                DeploymentLog.objects.create(
+                    deployment=deployment,
+                    level=DeploymentLog.Level.INFO,
+                    message=f"{gerund} service {deployment.name}"
+                )
+                DeploymentLog.objects.create(
+                    deployment=deployment,
+                    level=DeploymentLog.Level.SUCCESS,
+                    message=f"Service {deployment.name} {past} successfully"
+                )
+                return
+            except SystemdError as e:
+                logger.warning(f"D-Bus {action} failed for {deployment.name}, falling back to systemctl: {e}")
+
+        getattr(self.service_manager, f'{action}_service')(deployment)
+
+    def _operation_result(
+        self,
+        action: str,
+        deployment: BaseDeployment,
+        status: Optional[ServiceStatus] = None,
+        error: Optional[Exception] = None
+    ) -> Dict[str, Any]:
+        """
+        Record the outcome of a start/stop/restart and build its result dict.
 
-            # Wait a moment for service to stabilize
-            import time
-            time.sleep(2)
+        Args:
+            action: 'start', 'stop' or 'restart'
+            deployment: BaseDeployment the action ran on
+            status: ServiceStatus checked after the action
+            error: Exception raised by the action, if any
+        """
+        past = {'start': 'started', 'stop': 'stopped', 'restart': 'restarted'}[action]
 
-            # Check if it's actually running
-            status = self.system_monitor.check_service_status(deployment)
+        try:
+            if error is not None:
+                raise error
 
-            if status.status == ServiceStatus.Status.RUNNING:
+            if action == 'stop':
                 # Update deployment status
-                deployment.status = BaseDeployment.Status.RUNNING
+                deployment.status = BaseDeployment.Status.STOPPED
                 deployment.save(update_fields=['status'])
 
-                logger.info(f"Service started successfully: {deployment.name}")
+                logger.info(f"Service stopped successfully: {deployment.name}")
                 return {
                     'success': True,
-                    'message': f'Service {deployment.name} started successfully',
-                    'status': status.status,
-                    'pid': status.pid
+                    'message': f'Service {deployment.name} stopped successfully',
+                    'status': status.status
                 }
+
+            if status.status != ServiceStatus.Status.RUNNING:
+                raise ServiceControlError(f"Service failed to {action}: {status.status}")
+
+            # Update deployment status
+            deployment.status = BaseDeployment.Status.RUNNING
+            deployment.save(update_fields=['status'])
+
+            result = {
+                'success': True,
+                'message': f'Service {deployment.name} {past} successfully',
+                'status': status.status,
+            }
+
+            if action == 'restart':
+                # Increment restart count
+                status.restart_count += 1
+                status.save(update_fields=['restart_count'])
+                result['restart_count'] = status.restart_count
             else:
-                raise ServiceControlError(f"Service failed to start: {status.status}")
+                result['pid'] = status.pid
+
+            logger.info(f"Service {past} successfully: {deployment.name}")
+            return result
 
         except Exception as e:
-            logger.error(f"Failed to start service {deployment.name}: {e}")
+            logger.error(f"Failed to {action} service {deployment.name}: {e}")
             return {
                 'success': False,
                 'error': str(e),
-                'message': f'Failed to start service: {e}'
+                'message': f'Failed to {action} service: {e}'
             }
 
-    def stop_service(self, deployment: BaseDeployment) -> Dict[str, Any]:
-        """
-        Stop a deployment service.
-
-        Args:
-            deployment: BaseDeployment instance to stop
-
-        Returns:
-            Result dict with success status
-        """
+    def _run_operation(self, action: str, deployment: BaseDeployment) -> Dict[str, Any]:
+        """Run a start/stop/restart on a single deployment."""
         try:
-            logger.info(f"Stopping service for deployment: {deployment.name}")
+            gerund = {'start': 'Starting', 'stop': 'Stopping', 'restart': 'Restarting'}[action]
+            logger.info(f"{gerund} service for deployment: {deployment.name}")
 
-            self.service_manager.stop_service(deployment)
+            self._control_unit(action, deployment)
 
-            # Update deployment status
-            deployment.status = BaseDeployment.Status.STOPPED
-            deployment.save(update_fields=['status'])
+            if action != 'stop':
+                # Wait a moment for service to stabilize
+                time.sleep(SERVICE_SETTLE_SECONDS)
 
-            # Update service status
             status = self.system_monitor.check_service_status(deployment)
+        except Exception as e:
+            return self._operation_result(action, deployment, error=e)
 
-            logger.info(f"Service stopped successfully: {deployment.name}")
-            return {
-                'success': True,
-                'message': f'Service {deployment.name} stopped successfully',
-                'status': status.status
-            }
+        return self._operation_result(action, deployment, status)
+
+    def _run_bulk_operation(self, action: str, deployments: List[BaseDeployment]) -> List[Dict[str, Any]]:
+        """
+        Run a start/stop/restart on many deployments.
+
+        All unit jobs are queued first, then the services get one shared
+        settle period and are checked in a single status sweep.
+        """
+        errors = {}
+        for deployment in deployments:
+            try:
+                self._control_unit(action, deployment)
+            except Exception as e:
+                errors[deployment.id] = e
 
+        controlled = [deployment for deployment in deployments if deployment.id not in errors]
+        if controlled and action != 'stop':
+            time.sleep(SERVICE_SETTLE_SECONDS)
+
+        try:
+            statuses = self.system_monitor.check_service_statuses(controlled)
         except Exception as e:
-            logger.error(f"Failed to stop service {deployment.name}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'message': f'Failed to stop service: {e}'
+            statuses = {}
+            errors.update({deployment.id: e for deployment in controlled})
+
+        return [
+            {
+                'deployment': deployment.name,
+                'result': self._operation_result(
+                    action, deployment, statuses.get(deployment.id), errors.get(deployment.id)
+                )
             }
+            for deployment in deployments
+        ]
 
-    def restart_service(self, deployment: BaseDeployment) -> Dict[str, Any]:
+    def start_service(self, deployment: BaseDeployment) -> Dict[str, Any]:
         """
-        Restart a deployment service.
+        Start a deployment service.
 
         Args:
-            deployment: BaseDeployment instance to restart
+            deployment: BaseDeployment instance to start
 
         Returns:
-            Result dict with success status
+            Result dict with success status and details
         """
-        try:
-            logger.info(f"Restarting service for deployment: {deployment.name}")
+        return self._run_operation('start', deployment)
 
-            self.service_manager.restart_service(deployment)
-
-            # Wait for service to stabilize
-            import time
-            time.sleep(2)
+    def stop_service(self, deployment: BaseDeployment) -> Dict[str, Any]:
+        """
+        Stop a deployment service.
 
-            # Check status
-            status = self.system_monitor.check_service_status(deployment)
+        Args:
+            deployment: BaseDeployment instance to stop
 
-            if status.status == ServiceStatus.Status.RUNNING:
-                # Update deployment status
-                deployment.status = BaseDeployment.Status.RUNNING
-                deployment.save(update_fields=['status'])
+        Returns:
+            Result dict with success status
+        """
+        return self._run_operation('stop', deployment)
 
-                # Increment restart count
-                if hasattr(status, 'restart_count'):
-                    status.restart_count += 1
-                    status.save(update_fields=['restart_count'])
+    def restart_service(self, deployment: BaseDeployment) -> Dict[str, Any]:
+        """
+        Restart a deployment service.
 
-                logger.info(f"Service restarted successfully: {deployment.name}")
-                return {
-                    'success': True,
-                    'message': f'Service {deployment.name} restarted successfully',
-                    'status': status.status,
-                    'restart_count': status.restart_count
-                }
-            else:
-                raise ServiceControlError(f"Service failed to restart: {status.status}")
+        Args:
+            deployment: BaseDeployment instance to restart
 
-        except Exception as e:
-            logger.error(f"Failed to restart service {deployment.name}: {e}")
-            return {
-                'success': False,
-                'error': str(e),
-                'message': f'Failed to restart service: {e}'
-            }
+        Returns:
+            Result dict with success status
+        """
+        return self._run_operation('restart', deployment)
 
     def get_service_status(self, deployment: BaseDeployment) -> Dict[str, Any]:
         """
@@ -293,7 +350,6 @@ class ServiceController:
             )
 
             # Wait for graceful shutdown
-            import time
             time.sleep(3)
 
             # Start workers using the start script
@@ -347,13 +403,7 @@ class ServiceController:
             status__in=[BaseDeployment.Status.STOPPED, BaseDeployment.Status.FAILED]
         )
 
-        results = []
-        for deployment in deployments:
-            result = self.start_service(deployment)
-            results.append({
-                'deployment': deployment.name,
-                'result': result
-            })
+        results = self._run_bulk_operation('start', list(deployments))
 
         success_count = len([r for r in results if r['result']['success']])
 
@@ -374,13 +424,7 @@ class ServiceController:
         """
         deployments = ApplicationDeployment.objects.filter(status=ApplicationDeployment.Status.RUNNING)
 
-        results = []
-        for deployment in deployments:
-            result = self.stop_service(deployment)
-            results.append({
-                'deployment': deployment.name,
-                'result': result
-            })
+        results = self._run_bulk_operation('stop', list(deployments))
 
         success_count = len([r for r in results if r['result']['success']])
 
@@ -401,13 +445,7 @@ class ServiceController:
         """
         deployments = ApplicationDeployment.objects.filter(status=ApplicationDeployment.Status.RUNNING)
 
-        results = []
-        for deployment in deployments:
-            result = self.restart_service(deployment)
-            results.append({
-                'deployment': deployment.name,
-                'result': result
-            })
+        results = self._run_bulk_operation('restart', list(deployments))
 
         success_count = len([r for r in results if r['result']['success']])
 
@@ -433,17 +471,18 @@ class ServiceController:
         Returns:
             Health check results
         """
-        deployments = ApplicationDeployment.objects.filter(status=ApplicationDeployment.Status.RUNNING)
+        deployments = list(ApplicationDeployment.objects.filter(status=ApplicationDeployment.Status.RUNNING))
+
+        # Sweep all services at once: batched systemd query, concurrent HTTP probes
+        statuses = self.system_monitor.check_service_statuses(deployments)
+        health_checks = self.system_monitor.perform_health_checks(deployments)
 
         results = []
         unhealthy = []
 
         for deployment in deployments:
-            # Check service status
-            status = self.system_monitor.check_service_status(deployment)
-
-            # Perform HTTP health check if applicable
-            health_check = self.system_monitor.perform_health_check(deployment)
+            status = statuses[deployment.id]
+            health_check = health_checks.get(deployment.id)
 
             is_healthy = (
                 status.status == ServiceStatus.Status.RUNNING and
@@ -553,23 +592,26 @@ class ServiceController:
         services = ['nginx', 'postgresql', 'redis-server']
         statuses = {}
 
+        # One batched read for all units
+        try:
+            unit_states = get_unit_states(services)
+            error = None
+        except Exception as e:
+            unit_states = {}
+            error = str(e)
+
         for service in services:
-            try:
-                result = subprocess.run(
-                    ['systemctl', 'is-active', service],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
+            state = unit_states.get(service)
+            if state is not None:
                 statuses[service] = {
-                    'active': result.stdout.strip() == 'active',
-                    'status': result.stdout.strip()
+                    'active': state.is_active,
+                    'status': state.active_state
                 }
-            except Exception as e:
+            else:
                 statuses[service] = {
                     'active': False,
                     'status': 'error',
-                    'error': str(e)
+                    'error': error or 'Unit state unavailable'
                 }
 
         all_healthy = all(s['active'] for s in statuses.values())
@@ -0,0 +1,393 @@
+"""
+systemd access for WebOps services.
+
+"Services" section
+Architecture: Persistent D-Bus connection to systemd with systemctl fallback
+
+This module provides:
+- DBusSystemdBackend: one long-lived system bus connection used for unit
+  control (Start/Stop/RestartUnit) and batched state reads
+  (ListUnitsByNames), plus a watcher thread subscribed to unit
+  PropertiesChanged signals that keeps known unit states current
+- SystemctlBackend: batched ``systemctl show`` reads, used when D-Bus is
+  unavailable (no ``jeepney`` installed, no system bus, access denied)
+- get_systemd_backend: process-wide backend selection
+
+The D-Bus backend requires the optional ``jeepney`` package. Select the
+backend with the ``SYSTEMD_BACKEND`` setting: ``auto`` (default), ``dbus``
+or ``systemctl``.
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional
+import logging
+import subprocess
+import threading
+import time
+
+from django.conf import settings
+
+try:
+    from jeepney import (
+        DBusAddress,
+        DBusErrorResponse,
+        HeaderFields,
+        MatchRule,
+        Properties,
+        new_method_call,
+        unwrap_msg,
+    )
+    from jeepney.bus_messages import message_bus
+    from jeepney.io.blocking import open_dbus_connection
+except ImportError:
+    open_dbus_connection = None
+
+logger = logging.getLogger(__name__)
+
+SYSTEMD_BUS_NAME = 'org.freedesktop.systemd1'
+SYSTEMD_PATH = '/org/freedesktop/systemd1'
+MANAGER_INTERFACE = 'org.freedesktop.systemd1.Manager'
+UNIT_INTERFACE = 'org.freedesktop.systemd1.Unit'
+SERVICE_INTERFACE = 'org.freedesktop.systemd1.Service'
+PROPERTIES_INTERFACE = 'org.freedesktop.DBus.Properties'
+
+DBUS_TIMEOUT = 10
+
+# Units per systemctl invocation (keeps argv well below system limits)
+SYSTEMCTL_BATCH_SIZE = 200
+SYSTEMCTL_TIMEOUT = 15
+
+# How long to wait before trying D-Bus again after it failed
+DBUS_RETRY_SECONDS = 300
+
+
+class SystemdError(Exception):
+    """Raised when a systemd operation fails."""
+    pass
+
+
+@dataclass
+class UnitState:
+    """State of a systemd unit."""
+
+    name: str
+    active_state: str
+    main_pid: Optional[int] = None
+
+    @property
+    def is_active(self) -> bool:
+        return self.active_state == 'active'
+
+    @property
+    def is_failed(self) -> bool:
+        return self.active_state == 'failed'
+
+
+def unit_name(service_name: str) -> str:
+    """Normalise a service name to its full unit name."""
+    return service_name if '.' in service_name else f'{service_name}.service'
+
+
+def parse_systemctl_show(output: str) -> Dict[str, UnitState]:
+    """
+    Parse ``systemctl show`` output for several units.
+
+    Each unit is a block of ``Key=Value`` lines separated by a blank line.
+    """
+    states = {}
+    for block in output.strip().split('\n\n'):
+        properties = {}
+        for line in block.splitlines():
+            key, sep, value = line.partition('=')
+            if sep:
+                properties[key] = value
+
+        name = properties.get('Id')
+        if not name:
+            continue
+
+        try:
+            main_pid = int(properties.get('MainPID', '0')) or None
+        except ValueError:
+            main_pid = None
+
+        states[name] = UnitState(
+            name=name,
+            active_state=properties.get('ActiveState', 'unknown'),
+            main_pid=main_pid
+        )
+    return states
+
+
+class SystemctlBackend:
+    """Read unit states by running ``systemctl show``."""
+
+    name = 'systemctl'
+    supports_control = False
+
+    def get_unit_states(self, service_names: Iterable[str]) -> Dict[str, UnitState]:
+        """
+        Get the state of many units with batched ``systemctl show`` calls.
+
+        Returns:
+            Dict mapping each requested service name to its UnitState. Units
+            that could not be queried are missing from the result.
+        """
+        requested = {unit_name(name): name for name in service_names}
+        units = list(requested)
+        states = {}
+
+        for start in range(0, len(units), SYSTEMCTL_BATCH_SIZE):
+            chunk = units[start:start + SYSTEMCTL_BATCH_SIZE]
+            try:
+                result = subprocess.run(
+                    ['systemctl', 'show', '--property=Id,ActiveState,MainPID', *chunk],
+                    capture_output=True,
+                    text=True,
+                    timeout=SYSTEMCTL_TIMEOUT
+                )
+            except (subprocess.TimeoutExpired, OSError) as e:
+                logger.error(f"Error querying {len(chunk)} systemd units: {e}")
+                continue
+
+            for name, state in parse_systemctl_show(result.stdout).items():
+                if name in requested:
+                    states[requested[name]] = state
+
+        return states
+
+    def manage_unit(self, action: str, service_name: str) -> None:
+        raise SystemdError("systemctl backend does not control units; use ServiceManager")
+
+    def close(self) -> None:
+        pass
+
+
+class UnitStateWatcher(threading.Thread):
+    """
+    Keep states of known units current from systemd signals.
+
+    Runs on its own bus connection, subscribes to systemd and listens for
+    PropertiesChanged on unit objects. Only units previously read through
+    the backend are tracked.
+    """
+
+    def __init__(self):
+        super().__init__(name='systemd-unit-watcher', daemon=True)
+        self._lock = threading.Lock()
+        self._by_path: Dict[str, UnitState] = {}
+        self._by_name: Dict[str, UnitState] = {}
+        self._connection = None
+        self.alive = False
+
+    def track(self, path: str, state: UnitState) -> None:
+        with self._lock:
+            self._by_path[path] = state
+            self._by_name[state.name] = state
+
+    def get_states(self, units: Iterable[str]) -> Dict[str, UnitState]:
+        """Get copies of the tracked states for ``units`` (full unit names)."""
+        if not self.alive:
+            return {}
+        with self._lock:
+            return {unit: replace(self._by_name[unit]) for unit in units if unit in self._by_name}
+
+    def run(self) -> None:
+        try:
+            connection = self._connection = open_dbus_connection(bus='SYSTEM')
+            manager = DBusAddress(SYSTEMD_PATH, bus_name=SYSTEMD_BUS_NAME, interface=MANAGER_INTERFACE)
+            unwrap_msg(connection.send_and_get_reply(new_method_call(manager, 'Subscribe'), timeout=DBUS_TIMEOUT))
+
+            rule = MatchRule(
+                type='signal',
+                sender=SYSTEMD_BUS_NAME,
+                interface=PROPERTIES_INTERFACE,
+                member='PropertiesChanged',
+                path_namespace=f'{SYSTEMD_PATH}/unit'
+            )
+            unwrap_msg(connection.send_and_get_reply(message_bus.AddMatch(rule), timeout=DBUS_TIMEOUT))
+
+            with connection.filter(rule) as queue:
+                self.alive = True
+                while True:
+                    self._handle(connection.recv_until_filtered(queue))
+        except Exception as e:
+            logger.warning(f"systemd signal watcher stopped: {e}")
+        finally:
+            self.alive = False
+
+    def stop(self) -> None:
+        """Stop watching by closing the connection the thread blocks on."""
+        self.alive = False
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                pass
+
+    def _handle(self, message) -> None:
+        interface, changed, _invalidated = message.body
+        path = message.header.fields.get(HeaderFields.path)
+
+        with self._lock:
+            state = self._by_path.get(path)
+            if state is None:
+                return
+            if interface == UNIT_INTERFACE and 'ActiveState' in changed:
+                state.active_state = changed['ActiveState'][1]
+            elif interface == SERVICE_INTERFACE and 'MainPID' in changed:
+                state.main_pid = changed['MainPID'][1] or None
+
+
+class DBusSystemdBackend:
+    """Talk to systemd over one long-lived system bus connection."""
+
+    name = 'dbus'
+    supports_control = True
+
+    def __init__(self):
+        if open_dbus_connection is None:
+            raise SystemdError("jeepney is not installed. Install with: pip install jeepney")
+
+        try:
+            self._connection = open_dbus_connection(bus='SYSTEM')
+        except Exception as e:
+            raise SystemdError(f"Cannot connect to the system bus: {e}")
+
+        self._lock = threading.Lock()
+        self._manager = DBusAddress(SYSTEMD_PATH, bus_name=SYSTEMD_BUS_NAME, interface=MANAGER_INTERFACE)
+        self.watcher = UnitStateWatcher()
+        self.watcher.start()
+
+    def _call(self, message) -> tuple:
+        """Send a method call on the shared connection and return the reply body."""
+        try:
+            with self._lock:
+                reply = self._connection.send_and_get_reply(message, timeout=DBUS_TIMEOUT)
+            return unwrap_msg(reply)
+        except DBusErrorResponse as e:
+            raise SystemdError(f"{e.name}: {e.data[0] if e.data else ''}")
+        except Exception as e:
+            raise SystemdError(f"D-Bus call failed: {e}")
+
+    def manage_unit(self, action: str, service_name: str) -> None:
+        """
+        Queue a start, stop or restart job for a unit.
+
+        Raises:
+            SystemdError: If systemd rejects the job (e.g. access denied)
+        """
+        methods = {'start': 'StartUnit', 'stop': 'StopUnit', 'restart': 'RestartUnit'}
+        if action not in methods:
+            raise SystemdError(f"Unsupported unit action: {action}")
+
+        self._call(new_method_call(self._manager, methods[action], 'ss', (unit_name(service_name), 'replace')))
+
+    def _get_main_pid(self, path: str) -> Optional[int]:
+        service = DBusAddress(path, bus_name=SYSTEMD_BUS_NAME, interface=SERVICE_INTERFACE)
+        (value,) = self._call(Properties(service).get('MainPID'))
+        return value[1] or None
+
+    def get_unit_states(self, service_names: Iterable[str]) -> Dict[str, UnitState]:
+        """
+        Get the state of many units.
+
+        Units already tracked by the signal watcher are answered from
+        memory; the rest are read with one ListUnitsByNames call.
+        """
+        requested = {unit_name(name): name for name in service_names}
+        states = {
+            requested[unit]: state
+            for unit, state in self.watcher.get_states(requested).items()
+        }
+
+        missing: List[str] = [unit for unit in requested if requested[unit] not in states]
+        if missing:
+            (units,) = self._call(new_method_call(self._manager, 'ListUnitsByNames', 'as', (missing,)))
+            for name, _description, _load_state, active_state, _sub_state, _following, path, *_job in units:
+                if name not in requested:
+                    continue
+                main_pid = self._get_main_pid(path) if active_state == 'active' else None
+                state = UnitState(name=name, active_state=active_state, main_pid=main_pid)
+                self.watcher.track(path, state)
+                states[requested[name]] = replace(state)
+
+        return states
+
+    def close(self) -> None:
+        self.watcher.stop()
+        try:
+            self._connection.close()
+        except Exception:
+            pass
+
+
+_backend = None
+_backend_lock = threading.Lock()
+_dbus_failed_at: Optional[float] = None
+
+
+def _dbus_due(preference: str) -> bool:
+    if preference == 'systemctl':
+        return False
+    return _dbus_failed_at is None or time.monotonic() - _dbus_failed_at > DBUS_RETRY_SECONDS
+
+
+def get_systemd_backend():
+    """
+    Get the process-wide systemd backend.
+
+    With ``SYSTEMD_BACKEND = 'auto'`` the D-Bus backend is used when it can
+    connect; otherwise systemctl is used and D-Bus is retried after
+    ``DBUS_RETRY_SECONDS``.
+    """
+    global _backend, _dbus_failed_at
+
+    preference = getattr(settings, 'SYSTEMD_BACKEND', 'auto')
+    with _backend_lock:
+        dbus_due = _dbus_due(preference)
+        if _backend is not None and (_backend.name == 'dbus' or not dbus_due):
+            return _backend
+
+        if dbus_due:
+            try:
+                _backend = DBusSystemdBackend()
+                logger.info("Using D-Bus systemd backend")
+                return _backend
+            except SystemdError as e:
+                _dbus_failed_at = time.monotonic()
+                if preference == 'dbus':
+                    logger.error(f"D-Bus systemd backend unavailable: {e}")
+                else:
+                    logger.debug(f"D-Bus systemd backend unavailable, using systemctl: {e}")
+
+        _backend = SystemctlBackend()
+        return _backend
+
+
+def reset_systemd_backend() -> None:
+    """Drop the current backend (e.g. after its connection broke)."""
+    global _backend, _dbus_failed_at
+
+    with _backend_lock:
+        if _backend is not None:
+            _backend.close()
+            if _backend.name == 'dbus':
+                _dbus_failed_at = time.monotonic()
+        _backend = None
+
+
+def get_unit_states(service_names: Iterable[str]) -> Dict[str, UnitState]:
+    """
+    Get the state of many units through the active backend.
+
+    Falls back to systemctl if the D-Bus backend fails mid-call.
+    """
+    service_names = list(service_names)
+    backend = get_systemd_backend()
+    try:
+        return backend.get_unit_states(service_names)
+    except SystemdError as e:
+        logger.warning(f"{backend.name} backend failed reading unit states, falling back to systemctl: {e}")
+        reset_systemd_backend()
+        return SystemctlBackend().get_unit_states(service_names)
@@ -26,7 +26,7 @@ def collect_system_metrics() -> Dict[str, Any]:
     """
     Collect system resource metrics.
 
-    Scheduled to run every 5 minutes via Celery Beat.
+    Scheduled to run every minute via Celery Beat.
 
     Returns:
         Dict with metrics
@@ -74,11 +74,14 @@ def check_all_service_statuses() -> Dict[str, Any]:
 
     try:
         monitor = SystemMonitor()
-        deployments = ApplicationDeployment.objects.all()
+        deployments = list(ApplicationDeployment.objects.all())
+
+        # One batched sweep over every unit
+        statuses = monitor.check_service_statuses(deployments)
 
         results = []
         for deployment in deployments:
-            status = monitor.check_service_status(deployment)
+            status = statuses[deployment.id]
             results.append({
                 'deployment': deployment.name,
                 'status': status.status,
@@ -1,10 +1,20 @@
 from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.utils import timezone
 from unittest import mock
+from datetime import timedelta
 import time
 
-from apps.deployments.models import BaseDeployment
+from apps.deployments.models import BaseDeployment, ApplicationDeployment, DeploymentLog
+from apps.services.models import ServiceStatus, HealthCheck
+from apps.services.monitoring import SystemMonitor
+from apps.services.fleet import ProbeResult
+from apps.services.systemd import UnitState, UnitStateWatcher, parse_systemctl_show
+from apps.services import systemd
+from apps.services.service_controller import ServiceController
+from apps.services.models import MetricRollup
+from apps.services.metrics import MetricsSampler, MetricsSample, get_metrics_series, record_rollups
 from apps.services.background import factory as bg_factory
 from apps.services.background.memory_adapter import InMemoryBackgroundProcessor
 
@@ -86,3 +96,208 @@ class ServiceControlAdapterTests(TestCase):
         resp = self.client.post(url, data={'background': 'true'})
         self.assertIn(resp.status_code, (302, 200))
         self.assertTrue(self._wait_for('restart', dep.id))
+
+
+class FleetSweepTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='sweeper', password='pass1234')
+        self.deployments = [
+            ApplicationDeployment.objects.create(
+                name=f'app{index}',
+                repo_url='https://github.com/example/repo',
+                branch='main',
+                deployed_by=self.user,
+                port=9000 + index,
+            )
+            for index in range(3)
+        ]
+
+    def test_parse_systemctl_show_multiple_units(self):
+        output = (
+            "Id=webops-app0.service\nActiveState=active\nMainPID=42\n\n"
+            "Id=webops-app1.service\nActiveState=failed\nMainPID=0\n"
+        )
+        states = parse_systemctl_show(output)
+        self.assertEqual(states['webops-app0.service'].main_pid, 42)
+        self.assertTrue(states['webops-app0.service'].is_active)
+        self.assertTrue(states['webops-app1.service'].is_failed)
+        self.assertIsNone(states['webops-app1.service'].main_pid)
+
+    def test_status_sweep_queries_units_once_and_bulk_writes(self):
+        ServiceStatus.objects.create(deployment=self.deployments[0], status=ServiceStatus.Status.STOPPED)
+        unit_states = {
+            'webops-app0': UnitState('webops-app0.service', 'active', 42),
+            'webops-app1': UnitState('webops-app1.service', 'failed'),
+            'webops-app2': UnitState('webops-app2.service', 'inactive'),
+        }
+
+        with mock.patch('apps.services.monitoring.query_unit_states', return_value=unit_states) as query, \
+                mock.patch('apps.services.monitoring.sample_processes', return_value={}):
+            statuses = SystemMonitor().check_service_statuses(self.deployments)
+
+        query.assert_called_once()
+        self.assertEqual(
+            [statuses[d.id].status for d in self.deployments],
+            [ServiceStatus.Status.RUNNING, ServiceStatus.Status.FAILED, ServiceStatus.Status.STOPPED]
+        )
+        self.assertEqual(ServiceStatus.objects.count(), 3)
+        self.assertEqual(ServiceStatus.objects.get(deployment=self.deployments[0]).pid, 42)
+
+    def test_status_sweep_tolerates_concurrently_created_rows(self):
+        ServiceStatus.objects.create(deployment=self.deployments[0], status=ServiceStatus.Status.STOPPED, restart_count=2)
+        unit_states = {'webops-app0': UnitState('webops-app0.service', 'active', 42)}
+
+        # The other sweep inserted the row after this one looked for it
+        with mock.patch('apps.services.monitoring.query_unit_states', return_value=unit_states), \
+                mock.patch('apps.services.monitoring.sample_processes', return_value={}), \
+                mock.patch.object(ServiceStatus.objects, 'filter', return_value=[]):
+            SystemMonitor().check_service_statuses(self.deployments[:1])
+
+        status = ServiceStatus.objects.get(deployment=self.deployments[0])
+        self.assertEqual(status.status, ServiceStatus.Status.RUNNING)
+        self.assertEqual(status.pid, 42)
+        self.assertEqual(status.restart_count, 2)
+
+    def test_health_sweep_probes_concurrently_and_bulk_inserts(self):
+        def fake_probe(url, timeout):
+            time.sleep(0.2)
+            return ProbeResult(url=url, status_code=200, response_time_ms=200)
+
+        started = time.monotonic()
+        with mock.patch('apps.services.fleet.probe_url', side_effect=fake_probe):
+            checks = SystemMonitor().perform_health_checks(self.deployments)
+        elapsed = time.monotonic() - started
+
+        self.assertLess(elapsed, 0.5)
+        self.assertEqual(len(checks), 3)
+        self.assertTrue(all(check.is_healthy for check in checks.values()))
+        self.assertEqual(HealthCheck.objects.count(), 3)
+
+
+class MetricsRollupTests(TestCase):
+    def _sample(self, cpu):
+        return MetricsSample(
+            cpu_percent=cpu, memory_percent=50.0, memory_used_mb=1, memory_total_mb=2,
+            disk_percent=10.0, disk_used_gb=1.0, disk_total_gb=10.0,
+            network_sent_mb=1.0, network_recv_mb=2.0, active_connections=0,
+            load_average_1m=0.5, load_average_5m=0.5, load_average_15m=0.5,
+        )
+
+    def test_sampler_does_not_block(self):
+        started = time.monotonic()
+        sample = MetricsSampler().sample()
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertGreaterEqual(sample.cpu_percent, 0.0)
+        self.assertLessEqual(sample.cpu_percent, 100.0)
+
+    def test_collect_metrics_records_raw_snapshot_and_rollups(self):
+        usage = SystemMonitor().collect_metrics()
+
+        self.assertIsNotNone(usage.pk)
+        self.assertEqual(MetricRollup.objects.count(), 3)
+
+    def test_samples_fold_into_every_resolution(self):
+        now = timezone.now().replace(minute=7, second=30)
+        for cpu in (10.0, 30.0, 20.0):
+            record_rollups(self._sample(cpu), now)
+        record_rollups(self._sample(90.0), now + timedelta(minutes=1))
+
+        minute = MetricRollup.objects.filter(resolution=MetricRollup.Resolution.MINUTE).order_by('bucket_start')
+        self.assertEqual([bucket.sample_count for bucket in minute], [3, 1])
+        self.assertEqual(minute[0].cpu_percent_min, 10.0)
+        self.assertEqual(minute[0].cpu_percent_max, 30.0)
+        self.assertAlmostEqual(minute[0].cpu_percent, 20.0)
+
+        hour = MetricRollup.objects.get(resolution=MetricRollup.Resolution.HOUR)
+        self.assertEqual(hour.sample_count, 4)
+        self.assertEqual(hour.cpu_percent_max, 90.0)
+
+    def test_series_resolution_follows_range(self):
+        record_rollups(self._sample(10.0))
+
+        self.assertEqual(get_metrics_series(hours=1)[0].resolution, MetricRollup.Resolution.MINUTE)
+        self.assertEqual(get_metrics_series(hours=24)[0].resolution, MetricRollup.Resolution.QUARTER_HOUR)
+        self.assertEqual(get_metrics_series(hours=24 * 30)[0].resolution, MetricRollup.Resolution.HOUR)
+
+
+class SystemdBackendTests(TestCase):
+    def setUp(self):
+        systemd.reset_systemd_backend()
+        self.addCleanup(systemd.reset_systemd_backend)
+
+    def test_falls_back_to_systemctl_without_dbus(self):
+        with mock.patch.object(systemd, 'open_dbus_connection', None):
+            backend = systemd.get_systemd_backend()
+
+        self.assertEqual(backend.name, 'systemctl')
+        self.assertFalse(backend.supports_control)
+
+    def test_watcher_applies_property_changes_to_tracked_units(self):
+        watcher = UnitStateWatcher()
+        watcher.alive = True
+        path = '/org/freedesktop/systemd1/unit/webops_2dapp_2eservice'
+        watcher.track(path, UnitState('webops-app.service', 'active', 42))
+
+        header_fields = mock.Mock(path='path')
+        message = mock.Mock()
+        message.header.fields = {'path': path}
+
+        with mock.patch.object(systemd, 'HeaderFields', header_fields, create=True):
+            message.body = (systemd.UNIT_INTERFACE, {'ActiveState': ('s', 'failed')}, [])
+            watcher._handle(message)
+            message.body = (systemd.SERVICE_INTERFACE, {'MainPID': ('u', 0)}, [])
+            watcher._handle(message)
+
+        state = watcher.get_states(['webops-app.service'])['webops-app.service']
+        self.assertTrue(state.is_failed)
+        self.assertIsNone(state.main_pid)
+
+
+class BulkServiceOperationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='bulk', password='pass1234')
+        for index in range(3):
+            ApplicationDeployment.objects.create(
+                name=f'bulk{index}',
+                repo_url='https://github.com/example/repo',
+                branch='main',
+                deployed_by=self.user,
+                status=ApplicationDeployment.Status.RUNNING,
+            )
+
+    def test_restart_all_waits_once_and_sweeps_once(self):
+        controller = ServiceController()
+        running = {
+            deployment.id: ServiceStatus(deployment=deployment, status=ServiceStatus.Status.RUNNING)
+            for deployment in ApplicationDeployment.objects.all()
+        }
+        for status in running.values():
+            status.save()
+
+        with mock.patch.object(controller, '_control_unit') as control, \
+                mock.patch.object(controller.system_monitor, 'check_service_statuses', return_value=running) as sweep, \
+                mock.patch('apps.services.service_controller.time.sleep') as sleep:
+            result = controller.restart_all_services()
+
+        self.assertEqual(control.call_count, 3)
+        sweep.assert_called_once()
+        sleep.assert_called_once()
+        self.assertEqual(result['restarted'], 3)
+        self.assertEqual(ServiceStatus.objects.filter(restart_count=1).count(), 3)
+
+    def test_dbus_control_writes_deployment_log(self):
+        controller = ServiceController()
+        deployment = ApplicationDeployment.objects.get(name='bulk0')
+        backend = mock.Mock(supports_control=True)
+
+        with mock.patch('apps.services.service_controller.get_systemd_backend', return_value=backend):
+            controller._control_unit('start', deployment)
+
+        backend.manage_unit.assert_called_once_with('start', 'bulk0')
+        self.assertEqual(
+            list(DeploymentLog.objects.filter(deployment=deployment).order_by('id').values_list('level', 'message')),
+            [
+                (DeploymentLog.Level.INFO, 'Starting service bulk0'),
+                (DeploymentLog.Level.SUCCESS, 'Service bulk0 started successfully'),
+            ]
+        )
@@ -12,7 +12,8 @@ from django.utils import timezone
 from django.db.models import Count, Avg
 from datetime import timedelta
 
-from .models import ServiceStatus, ResourceUsage, Alert, HealthCheck
+from .models import ServiceStatus, ResourceUsage, MetricRollup, Alert, HealthCheck
+from .metrics import choose_resolution
 from .monitoring import SystemMonitor
 from apps.deployments.models import BaseDeployment,ApplicationDeployment
 from apps.core.security.decorators import require_resource_ownership
@@ -39,13 +40,19 @@ def monitoring_dashboard(request):
 
     # Service statuses
     # SECURITY FIX: Filter by user to prevent IDOR vulnerability
-    deployments = ApplicationDeployment.objects.filter(deployed_by=request.user)
+    deployments = list(ApplicationDeployment.objects.filter(deployed_by=request.user))
+    statuses = {
+        status.deployment_id: status
+        for status in ServiceStatus.objects.filter(deployment__in=deployments)
+    }
+    # Create initial statuses by checking unchecked services in one sweep
+    unchecked = [deployment for deployment in deployments if deployment.id not in statuses]
+    if unchecked:
+        statuses.update(monitor.check_service_statuses(unchecked))
+
     service_statuses = []
     for deployment in deployments:
-        status = ServiceStatus.objects.filter(deployment=deployment).first()
-        if not status:
-            # Create initial status by checking
-            status = monitor.check_service_status(deployment)
+        status = statuses[deployment.id]
         service_statuses.append({
             'deployment': deployment,
             'status': status
@@ -142,19 +149,35 @@ def alert_acknowledge_all(request):
 def metrics_history(request):
     """Get metrics history as JSON for charts."""
     hours = int(request.GET.get('hours', 24))
+    resolution = request.GET.get('resolution')
+    if resolution not in MetricRollup.Resolution.values:
+        resolution = None
 
     monitor = SystemMonitor()
-    history = monitor.get_metrics_history(hours=hours)
+    history = monitor.get_metrics_history(hours=hours, resolution=resolution)
 
-    # Format for charts
+    # Format for charts (pre-aggregated buckets: averages plus min/max bands)
     data = {
-        'timestamps': [m.created_at.isoformat() for m in history],
+        'resolution': history[0].resolution if history else (resolution or choose_resolution(timedelta(hours=hours))),
+        'timestamps': [m.bucket_start.isoformat() for m in history],
         'cpu': [m.cpu_percent for m in history],
         'memory': [m.memory_percent for m in history],
         'disk': [m.disk_percent for m in history],
         'load_avg_1m': [m.load_average_1m for m in history],
         'network_sent': [m.network_sent_mb for m in history],
         'network_recv': [m.network_recv_mb for m in history],
+        'min': {
+            'cpu': [m.cpu_percent_min for m in history],
+            'memory': [m.memory_percent_min for m in history],
+            'disk': [m.disk_percent_min for m in history],
+            'load_avg_1m': [m.load_average_1m_min for m in history],
+        },
+        'max': {
+            'cpu': [m.cpu_percent_max for m in history],
+            'memory': [m.memory_percent_max for m in history],
+            'disk': [m.disk_percent_max for m in history],
+            'load_avg_1m': [m.load_average_1m_max for m in history],
+        },
     }
 
     return JsonResponse(data)
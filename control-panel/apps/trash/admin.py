@@ -3,6 +3,8 @@ from django.utils.html import format_html
 from django.urls import reverse
 from django.utils import timezone
 from .models import TrashItem, TrashSettings, TrashOperation
+from .trash_manager import TrashManager
+from .utils import coalesce_trash_usage_refresh
 
 
 @admin.register(TrashItem)
@@ -83,9 +85,10 @@ class TrashItemAdmin(admin.ModelAdmin):
 
     def mark_as_restored(self, request, queryset):
         updated = 0
-        for item in queryset.filter(is_restored=False, is_permanently_deleted=False):
-            item.restore(user=request.user)
-            updated += 1
+        with coalesce_trash_usage_refresh():
+            for item in queryset.filter(is_restored=False, is_permanently_deleted=False):
+                item.restore(user=request.user)
+                updated += 1
 
         self.message_user(
             request,
@@ -94,10 +97,7 @@ class TrashItemAdmin(admin.ModelAdmin):
     mark_as_restored.short_description = "Mark selected items as restored"
 
     def mark_as_permanently_deleted(self, request, queryset):
-        updated = 0
-        for item in queryset.filter(is_permanently_deleted=False):
-            item.permanent_delete(user=request.user)
-            updated += 1
+        updated = len(TrashManager.purge_items(queryset, user=request.user))
 
         self.message_user(
             request,
@@ -109,10 +109,11 @@ class TrashItemAdmin(admin.ModelAdmin):
         days = 30  # Default extension
         updated = 0
 
-        for item in queryset.filter(is_restored=False, is_permanently_deleted=False):
-            item.retention_days += days
-            item.save()
-            updated += 1
+        with coalesce_trash_usage_refresh():
+            for item in queryset.filter(is_restored=False, is_permanently_deleted=False):
+                item.retention_days += days
+                item.save()
+                updated += 1
 
         self.message_user(
             request,
@@ -0,0 +1,37 @@
+# Generated by Django 5.0.1 on 2026-10-16 12:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trash', '0002_trashitem_created_at_trashitem_is_deleted_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrashUsage',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trash_usage', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('item_count', models.IntegerField(default=0)),
+                ('total_size', models.BigIntegerField(default=0)),
+                ('by_type', models.JSONField(default=dict, help_text='Item count and size per item type')),
+                ('expiring_soon', models.IntegerField(default=0)),
+                ('expired', models.IntegerField(default=0)),
+                ('restored_last_7_days', models.IntegerField(default=0)),
+                ('purged_last_7_days', models.IntegerField(default=0)),
+                ('items_deleted_last_7_days', models.IntegerField(default=0)),
+                ('items_deleted_last_30_days', models.IntegerField(default=0)),
+                ('refreshed_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Trash Usage',
+                'verbose_name_plural': 'Trash Usage',
+            },
+        ),
+    ]
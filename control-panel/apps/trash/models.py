@@ -120,7 +120,9 @@ class TrashItem(BaseModel):
     def save(self, *args, **kwargs):
         # Set auto-delete timestamp if not set
         if not self.auto_delete_at:
-            self.auto_delete_at = self.deleted_at + timezone.timedelta(days=self.retention_days)
+            # deleted_at (auto_now_add) is only filled in by super().save()
+            deleted_at = self.deleted_at or timezone.now()
+            self.auto_delete_at = deleted_at + timezone.timedelta(days=self.retention_days)
 
         super().save(*args, **kwargs)
 
@@ -130,6 +132,10 @@ class TrashItem(BaseModel):
         self.restored_at = timezone.now()
         if user:
             self.restored_by = user
+        # The payload is live again; never let a later purge remove it
+        if self.metadata:
+            self.metadata.pop('payload_path', None)
+            self.metadata.pop('payload_stat', None)
         self.save()
 
     def permanent_delete(self, user=None):
@@ -178,6 +184,50 @@ class TrashItem(BaseModel):
         return json.dumps(display_metadata, indent=2) if display_metadata else "No displayable metadata"
 
 
+class TrashUsage(models.Model):
+    """
+    Materialised trash counters for one user.
+
+    Rebuilt by utils.refresh_trash_usage() whenever the user's trash
+    changes and by a periodic rollup, so the trash page, statistics and
+    quota checks read a single row instead of aggregating TrashItem.
+    Time-based counters (expiring soon, recent activity) are as fresh as
+    ``refreshed_at``.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='trash_usage'
+    )
+
+    # Items currently in trash
+    item_count = models.IntegerField(default=0)
+    total_size = models.BigIntegerField(default=0)
+    by_type = models.JSONField(
+        default=dict,
+        help_text="Item count and size per item type"
+    )
+    expiring_soon = models.IntegerField(default=0)
+    expired = models.IntegerField(default=0)
+
+    # Recent activity
+    restored_last_7_days = models.IntegerField(default=0)
+    purged_last_7_days = models.IntegerField(default=0)
+    items_deleted_last_7_days = models.IntegerField(default=0)
+    items_deleted_last_30_days = models.IntegerField(default=0)
+
+    refreshed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name = "Trash Usage"
+        verbose_name_plural = "Trash Usage"
+
+    def __str__(self):
+        return f"Trash usage for {self.user_id}: {self.item_count} items"
+
+
 class TrashSettings(BaseModel):
     """
     Global settings for trash functionality
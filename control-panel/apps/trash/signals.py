@@ -1,6 +1,6 @@
-from django.db.models.signals import post_migrate
+from django.db.models.signals import post_delete, post_migrate, post_save
 from django.dispatch import receiver
-from .models import TrashSettings
+from .models import TrashItem, TrashSettings
 
 
 @receiver(post_migrate)
@@ -10,3 +10,16 @@ def create_default_trash_settings(sender, **kwargs):
     """
     if sender.name == 'apps.trash':
         TrashSettings.objects.get_or_create(pk=1)
+
+
+@receiver(post_save, sender=TrashItem)
+@receiver(post_delete, sender=TrashItem)
+def refresh_trash_usage_on_change(sender, instance, **kwargs):
+    """
+    Rebuild the owner's trash counters once the change is committed
+
+    Bulk paths wrap their saves in coalesce_trash_usage_refresh() so each
+    owner is refreshed once instead of once per item.
+    """
+    from .utils import schedule_trash_usage_refresh
+    schedule_trash_usage_refresh(instance.deleted_by_id)
@@ -0,0 +1,86 @@
+"""
+Celery tasks for trash maintenance.
+
+This module implements:
+- Background size accounting for trashed directories
+- Periodic purge of expired trash items
+- Periodic rollup of per-user trash counters
+"""
+
+from typing import Optional
+
+from celery import shared_task
+from celery.utils.log import get_task_logger
+
+logger = get_task_logger(__name__)
+
+
+@shared_task(name='trash.calculate_item_size')
+def calculate_trash_item_size(item_id: int) -> Optional[int]:
+    """
+    Calculate and cache the size of a trashed directory.
+
+    The running total is written to TrashItem.size while the tree is
+    scanned, so large directories show a growing size instead of none.
+
+    Args:
+        item_id: TrashItem ID
+
+    Returns:
+        Size in bytes, or None if the item has no payload on disk
+    """
+    from .models import TrashItem
+    from .utils import calculate_directory_size, get_payload_path, refresh_trash_usage
+
+    items = TrashItem.objects.filter(pk=item_id)
+    item = items.only('metadata', 'deleted_by').first()
+    if item is None:
+        return None
+
+    path = get_payload_path(item.metadata)
+    if path is None:
+        return None
+
+    size = calculate_directory_size(path, progress=lambda total: items.update(size=total))
+
+    metadata = dict(item.metadata)
+    metadata.pop('size_pending', None)
+    items.update(size=size, metadata=metadata)
+    refresh_trash_usage([item.deleted_by_id])
+
+    logger.info(f"Calculated size of trash item {item_id}: {size} bytes")
+    return size
+
+
+@shared_task(name='trash.cleanup_expired_items')
+def cleanup_expired_trash_items() -> int:
+    """
+    Purge trash items past their retention period.
+
+    Scheduled to run daily via Celery Beat.
+
+    Returns:
+        Number of items purged
+    """
+    from .trash_manager import TrashManager
+
+    count = TrashManager.cleanup_expired_items()
+    if count:
+        logger.info(f"Purged {count} expired trash items")
+    return count
+
+
+@shared_task(name='trash.refresh_usage')
+def refresh_trash_usage_counters() -> int:
+    """
+    Rebuild every user's materialised trash counters.
+
+    Scheduled to run hourly via Celery Beat, so time-based counters such
+    as "expiring soon" stay current for trash that has not changed.
+
+    Returns:
+        Number of users refreshed
+    """
+    from .utils import refresh_all_trash_usage
+
+    return refresh_all_trash_usage()
@@ -0,0 +1,183 @@
+"""
+Tests for bulk trash purging and background size accounting.
+"""
+
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from apps.trash.models import TrashItem, TrashOperation
+from apps.trash.tasks import calculate_trash_item_size
+from apps.trash.trash_manager import TrashManager
+from apps.trash.utils import calculate_directory_size, get_payload_path, payload_fingerprint
+
+
+def write_file(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'x' * size)
+
+
+class CalculateDirectorySizeTest(SimpleTestCase):
+    """Test the scandir-based directory walk."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def test_nested_sizes_and_progress(self):
+        """Sizes of nested files are summed and reported as the walk goes."""
+        write_file(os.path.join(self.root, 'a.txt'), 10)
+        write_file(os.path.join(self.root, 'sub', 'b.txt'), 20)
+        write_file(os.path.join(self.root, 'sub', 'deeper', 'c.txt'), 30)
+        totals = []
+
+        size = calculate_directory_size(self.root, progress=totals.append, progress_interval=1)
+
+        self.assertEqual(size, 60)
+        self.assertEqual(len(totals), 3)
+        self.assertEqual(totals[-1], 60)
+
+    def test_symlinks_not_followed(self):
+        """A symlink to a large tree does not count that tree."""
+        outside = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, outside)
+        write_file(os.path.join(outside, 'big.bin'), 1000)
+        os.symlink(outside, os.path.join(self.root, 'link'))
+
+        self.assertLess(calculate_directory_size(self.root), 1000)
+
+    def test_payload_path_must_be_absolute(self):
+        """Relative paths and the filesystem root are never purge targets."""
+        self.assertIsNone(get_payload_path({'payload_path': 'relative/dir'}))
+        self.assertIsNone(get_payload_path({'payload_path': '/'}))
+        self.assertIsNone(get_payload_path({}))
+        self.assertEqual(get_payload_path({'payload_path': '/srv/trash/x/'}), '/srv/trash/x')
+
+
+class PurgeItemsTest(TestCase):
+    """Test TrashManager.purge_items and the callers built on it."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root, True)
+
+    def _item(self, name, payload=None, expired=False):
+        metadata = {'payload_path': payload} if payload else {}
+        if payload and os.path.exists(payload):
+            metadata['payload_stat'] = payload_fingerprint(payload)
+        item = TrashItem.objects.create(
+            item_name=name, item_type='file', original_path=f'/files/{name}',
+            deleted_by=self.user, metadata=metadata,
+        )
+        if expired:
+            TrashItem.objects.filter(pk=item.pk).update(auto_delete_at=timezone.now() - timedelta(days=1))
+        return item
+
+    def test_payloads_removed_and_rows_marked(self):
+        """Files and directories are deleted and rows are marked in batches."""
+        file_path = os.path.join(self.root, 'report.txt')
+        dir_path = os.path.join(self.root, 'site')
+        write_file(file_path, 5)
+        write_file(os.path.join(dir_path, 'index.html'), 5)
+        items = [
+            self._item('report.txt', file_path),
+            self._item('site', dir_path),
+            self._item('gone', os.path.join(self.root, 'missing')),
+            self._item('deployment'),
+        ]
+
+        purged = TrashManager.purge_items(TrashItem.objects.all(), user=self.user, batch_size=3, workers=2)
+
+        self.assertEqual(sorted(purged), sorted(item.pk for item in items))
+        self.assertFalse(os.path.exists(file_path))
+        self.assertFalse(os.path.exists(dir_path))
+        self.assertEqual(
+            TrashItem.objects.filter(is_permanently_deleted=True, permanently_deleted_by=self.user).count(), 4
+        )
+
+    def test_failed_payload_left_in_trash(self):
+        """An item whose payload cannot be deleted is retried later."""
+        kept = self._item('locked', os.path.join(self.root, 'locked'))
+        purged = self._item('other')
+
+        with patch('apps.trash.trash_manager.delete_payload', return_value=False):
+            result = TrashManager.purge_items(TrashItem.objects.all())
+
+        self.assertEqual(result, [purged.pk])
+        kept.refresh_from_db()
+        self.assertFalse(kept.is_permanently_deleted)
+
+    def test_changed_payload_left_on_disk(self):
+        """A path edited or recreated after it was trashed is not deleted."""
+        edited = os.path.join(self.root, 'edited.txt')
+        unfingerprinted = os.path.join(self.root, 'legacy.txt')
+        write_file(edited, 5)
+        write_file(unfingerprinted, 5)
+        items = [self._item('edited.txt', edited)]
+        stat = os.stat(edited)
+        os.utime(edited, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        items.append(TrashItem.objects.create(
+            item_name='legacy.txt', item_type='file', original_path='/files/legacy.txt',
+            deleted_by=self.user, metadata={'payload_path': unfingerprinted},
+        ))
+
+        purged = TrashManager.purge_items(TrashItem.objects.all())
+
+        self.assertEqual(sorted(purged), sorted(item.pk for item in items))
+        self.assertTrue(os.path.exists(edited))
+        self.assertTrue(os.path.exists(unfingerprinted))
+
+    def test_restored_item_not_purged(self):
+        """Purging a restored item leaves its live payload on disk."""
+        file_path = os.path.join(self.root, 'restored.txt')
+        write_file(file_path, 5)
+        item = self._item('restored.txt', file_path)
+        item.restore(user=self.user)
+
+        self.assertEqual(TrashManager.purge_items(TrashItem.objects.all()), [])
+
+        self.assertTrue(os.path.exists(file_path))
+        item.refresh_from_db()
+        self.assertFalse(item.is_permanently_deleted)
+        self.assertNotIn('payload_path', item.metadata)
+        self.assertNotIn('payload_stat', item.metadata)
+
+    def test_cleanup_expired_items(self):
+        """Only expired items are purged, and the cleanup is logged once."""
+        self._item('old', expired=True)
+        self._item('older', expired=True)
+        fresh = self._item('fresh')
+
+        self.assertEqual(TrashManager.cleanup_expired_items(), 2)
+
+        fresh.refresh_from_db()
+        self.assertFalse(fresh.is_permanently_deleted)
+        operation = TrashOperation.objects.get(operation='auto_cleanup')
+        self.assertEqual(operation.items_count, 2)
+
+    def test_directory_size_calculated_in_background(self):
+        """Trashing a directory defers its size to the background task."""
+        dir_path = os.path.join(self.root, 'uploads')
+        write_file(os.path.join(dir_path, 'a.bin'), 7)
+        write_file(os.path.join(dir_path, 'nested', 'b.bin'), 8)
+
+        with patch('apps.trash.tasks.calculate_trash_item_size.delay') as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                item = TrashManager.move_file_to_trash(dir_path, deleted_by=self.user)
+
+        self.assertIsNone(item.size)
+        self.assertTrue(item.metadata['size_pending'])
+        delay.assert_called_once_with(item.pk)
+
+        self.assertEqual(calculate_trash_item_size(item.pk), 15)
+        item.refresh_from_db()
+        self.assertEqual(item.size, 15)
+        self.assertNotIn('size_pending', item.metadata)
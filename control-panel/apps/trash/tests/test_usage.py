@@ -0,0 +1,113 @@
+"""
+Tests for materialised per-user trash counters.
+"""
+
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.trash.models import TrashItem, TrashUsage
+from apps.trash.trash_manager import TrashManager
+from apps.trash.utils import (
+    check_trash_limits,
+    get_trash_statistics,
+    import_trash_data,
+    refresh_all_trash_usage,
+    refresh_trash_usage,
+)
+
+
+class TrashUsageTest(TestCase):
+    """Test counter maintenance and the single-row read paths."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass')
+        self.other = User.objects.create_user(username='other', password='testpass')
+
+    def _item(self, name, item_type='file', size=100, user=None):
+        with self.captureOnCommitCallbacks(execute=True):
+            return TrashItem.objects.create(
+                item_name=name, item_type=item_type, original_path=f'/{name}',
+                deleted_by=user or self.user, size=size,
+            )
+
+    def test_counters_follow_item_changes(self):
+        """Creating and restoring items keeps the owner's counters exact."""
+        self._item('a.txt', size=100)
+        self._item('db', item_type='database', size=None)
+        restored = self._item('b.txt', size=50)
+        self._item('theirs.txt', size=999, user=self.other)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            restored.restore(user=self.user)
+
+        usage = TrashUsage.objects.get(user=self.user)
+        self.assertEqual((usage.item_count, usage.total_size), (2, 100))
+        self.assertEqual(usage.by_type, {
+            'file': {'count': 1, 'size': 100},
+            'database': {'count': 1, 'size': 0},
+        })
+        self.assertEqual(usage.restored_last_7_days, 1)
+        self.assertEqual(usage.items_deleted_last_7_days, 3)
+
+    def test_refresh_is_one_query_plus_upsert(self):
+        """All counters and breakdowns come from one aggregate query."""
+        for i in range(5):
+            self._item(f'{i}.txt', item_type='file' if i % 2 else 'deployment')
+
+        with self.assertNumQueries(2):
+            refresh_trash_usage([self.user.pk, self.other.pk])
+
+        self.assertEqual(TrashUsage.objects.get(user=self.other).item_count, 0)
+
+    def test_statistics_read_one_row(self):
+        """The dashboard and quota checks read the counters row only."""
+        self._item('a.txt', size=300)
+        self._item('b.txt', size=200)
+        self._item('site', item_type='deployment', size=None)
+
+        with self.assertNumQueries(1):
+            stats = get_trash_statistics(self.user)
+        with self.assertNumQueries(2):
+            limits = check_trash_limits(self.user, new_item_size=500)
+
+        self.assertEqual(stats['current']['total_items'], 3)
+        self.assertEqual(stats['current']['by_type'][0], {'item_type': 'file', 'count': 2, 'size': 500})
+        self.assertEqual(limits['current_size'], 500)
+        self.assertEqual(limits['projected_size'], 1000)
+
+    def test_purge_and_rollup_update_counters(self):
+        """Bulk purges refresh counters and the rollup recomputes expiry."""
+        item = self._item('a.txt')
+        self._item('b.txt')
+        # Time passing is not a model change, so only the rollup sees it
+        TrashItem.objects.filter(pk=item.pk).update(auto_delete_at=timezone.now() + timedelta(days=1))
+
+        usage = TrashUsage.objects.get(user=self.user)
+        self.assertEqual(usage.expiring_soon, 0)
+
+        self.assertEqual(refresh_all_trash_usage(), 1)
+        self.assertEqual(TrashUsage.objects.get(user=self.user).expiring_soon, 1)
+
+        TrashManager.empty_user_trash(self.user)
+        usage = TrashUsage.objects.get(user=self.user)
+        self.assertEqual((usage.item_count, usage.expiring_soon, usage.purged_last_7_days), (0, 0, 2))
+
+    def test_bulk_import_refreshes_counters_once(self):
+        """Importing many items rebuilds the owner's counters a single time."""
+        data = json.dumps([
+            {'item_name': f'{i}.txt', 'item_type': 'file', 'original_path': f'/{i}.txt', 'size': 10}
+            for i in range(5)
+        ])
+
+        with patch('apps.trash.utils.refresh_trash_usage', wraps=refresh_trash_usage) as refresh:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.assertEqual(import_trash_data(self.user, data), 5)
+
+        refresh.assert_called_once()
+        usage = TrashUsage.objects.get(user=self.user)
+        self.assertEqual((usage.item_count, usage.total_size), (5, 50))
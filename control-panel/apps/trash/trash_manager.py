@@ -1,12 +1,25 @@
 """
 Trash Manager - Utility for integrating trash functionality throughout WebOps
 """
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from .models import TrashItem
-from .utils import validate_trash_item_data, generate_trash_item_metadata
+from .utils import (
+    validate_trash_item_data, generate_trash_item_metadata,
+    get_payload_path, get_payload_fingerprint, payload_fingerprint,
+    delete_payload, refresh_trash_usage,
+)
 
 User = get_user_model()
+logger = logging.getLogger(__name__)
+
+PURGE_BATCH_SIZE = 500
+PURGE_WORKERS = 8
 
 
 class TrashManager:
@@ -138,17 +151,19 @@ class TrashManager:
         # Generate metadata
         metadata = generate_trash_item_metadata(file_path, item_type)
 
-        # Calculate size
-        if os.path.isfile(file_path):
-            size = os.path.getsize(file_path)
+        # Files are sized now; directories are sized in the background
+        metadata['payload_path'] = os.path.abspath(file_path)
+        metadata['payload_stat'] = payload_fingerprint(file_path)
+        if os.path.isdir(file_path):
+            size = None
+            metadata['size_pending'] = True
         else:
-            from .utils import calculate_directory_size
-            size = calculate_directory_size(file_path)
+            size = os.path.getsize(file_path)
 
         # Use original name or filename
         item_name = original_name or os.path.basename(file_path)
 
-        return TrashManager.move_to_trash(
+        trash_item = TrashManager.move_to_trash(
             item_name=item_name,
             item_type=item_type,
             original_path=file_path,
@@ -157,6 +172,12 @@ class TrashManager:
             metadata=metadata
         )
 
+        if size is None:
+            from .tasks import calculate_trash_item_size
+            transaction.on_commit(lambda: calculate_trash_item_size.delay(trash_item.pk))
+
+        return trash_item
+
     @staticmethod
     def get_user_trash_stats(user):
         """Get comprehensive trash statistics for a user"""
@@ -187,10 +208,7 @@ class TrashManager:
                 auto_delete_at__lte=timezone.now()
             )
 
-        count = 0
-        for item in expired_items:
-            item.permanent_delete()
-            count += 1
+        count = len(TrashManager.purge_items(expired_items))
 
         # Log the cleanup operation
         if count > 0:
@@ -214,14 +232,10 @@ class TrashManager:
             is_permanently_deleted=False
         )
 
-        count = items.count()
+        count = len(TrashManager.purge_items(items, user=user))
         if count == 0:
             return 0
 
-        # Permanently delete all items
-        for item in items:
-            item.permanent_delete(user=user)
-
         # Log the operation
         TrashOperation.objects.create(
             operation='empty_trash',
@@ -231,6 +245,73 @@ class TrashManager:
 
         return count
 
+    @staticmethod
+    def purge_items(items, user=None, batch_size=None, workers=None):
+        """
+        Permanently delete trash items in bulk
+
+        Items are processed in primary-key batches. The filesystem payloads
+        of a batch are removed concurrently by a thread pool, then the rows
+        whose payload is gone are marked deleted with a single UPDATE.
+        Items whose payload could not be removed stay in the trash so a
+        later run can retry them. Restored items are never purged, since
+        their payload is back in use, and a payload that changed on disk
+        after it was trashed is left in place (see ``delete_payload``).
+
+        Args:
+            items (QuerySet): TrashItem queryset to purge
+            user (User): User performing the purge (optional)
+            batch_size (int): Items per batch (defaults to TRASH_PURGE_BATCH_SIZE)
+            workers (int): Concurrent payload deletions (defaults to TRASH_PURGE_WORKERS)
+
+        Returns:
+            list: IDs of the purged items
+        """
+        batch_size = batch_size or getattr(settings, 'TRASH_PURGE_BATCH_SIZE', PURGE_BATCH_SIZE)
+        workers = workers or getattr(settings, 'TRASH_PURGE_WORKERS', PURGE_WORKERS)
+        items = items.filter(is_restored=False, is_permanently_deleted=False).order_by('pk')
+
+        purged = []
+        last_pk = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while True:
+                batch = list(
+                    items.filter(pk__gt=last_pk).values_list('pk', 'metadata', 'deleted_by_id')[:batch_size]
+                )
+                if not batch:
+                    break
+                last_pk = batch[-1][0]
+
+                payloads = {}
+                for pk, metadata, _ in batch:
+                    path = get_payload_path(metadata)
+                    if path:
+                        payloads[pk] = (path, get_payload_fingerprint(metadata))
+                deleted = dict(zip(payloads, executor.map(lambda p: delete_payload(*p), payloads.values())))
+
+                owners = {pk: owner for pk, _, owner in batch if deleted.get(pk, True)}
+                if not owners:
+                    continue
+
+                with transaction.atomic():
+                    # Skip rows restored while their payload was being removed
+                    ids = list(
+                        TrashItem.objects.select_for_update()
+                        .filter(pk__in=owners, is_restored=False, is_permanently_deleted=False)
+                        .values_list('pk', flat=True)
+                    )
+                    TrashItem.objects.filter(pk__in=ids, is_restored=False).update(
+                        is_permanently_deleted=True,
+                        permanently_deleted_at=timezone.now(),
+                        permanently_deleted_by=user,
+                    )
+                if ids:
+                    # update() skips the post_save counter refresh
+                    refresh_trash_usage({owners[pk] for pk in ids})
+                    purged.extend(ids)
+
+        return purged
+
     @staticmethod
     def restore_item(item_id, user):
         """Restore a specific item"""
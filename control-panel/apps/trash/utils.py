@@ -1,8 +1,22 @@
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Count, Q, Sum
 import os
 import json
-from typing import Dict, Any, Optional
+import logging
+import shutil
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Any, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+EXPIRING_SOON_DAYS = 3
+USAGE_REFRESH_BATCH_SIZE = 500
+
+# User ids collected by coalesce_trash_usage_refresh() on this thread
+_usage_refresh = threading.local()
 
 
 def get_client_ip(request) -> Optional[str]:
@@ -24,10 +38,10 @@ def format_file_size(size_bytes: int) -> str:
     if not size_bytes:
         return "0 B"
 
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
     return f"{size_bytes:.1f} PB"
 
 
@@ -83,30 +97,125 @@ def clean_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
     return cleaned
 
 
-def calculate_directory_size(path: str) -> int:
+def calculate_directory_size(path: str, progress: Optional[Callable[[int], None]] = None,
+                             progress_interval: int = 10000) -> int:
     """
     Calculate total size of a directory
-    """
-    total_size = 0
 
+    Walks the tree with os.scandir, so each file costs a single stat call.
+    Symlinks inside the tree are counted as links and not followed.
+
+    Args:
+        path: File or directory path
+        progress: Called with the running total every ``progress_interval`` files
+        progress_interval: Number of files between progress calls
+
+    Returns:
+        Total size in bytes
+    """
     if not os.path.exists(path):
         return 0
 
-    if os.path.isfile(path):
+    if not os.path.isdir(path):
         return os.path.getsize(path)
 
-    for dirpath, dirnames, filenames in os.walk(path):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            try:
-                total_size += os.path.getsize(filepath)
-            except (OSError, FileNotFoundError):
-                # Skip files that can't be accessed
-                continue
+    total_size = 0
+    file_count = 0
+    pending = [path]
+
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Skip directories that can't be accessed
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    total_size += entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    # Skip files that can't be accessed
+                    continue
+
+                file_count += 1
+                if progress and file_count % progress_interval == 0:
+                    progress(total_size)
 
     return total_size
 
 
+def get_payload_path(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Filesystem payload recorded for a trash item, if any
+
+    Only absolute paths below the filesystem root are returned, so a
+    malformed item can never purge "/" or a path relative to the worker.
+    """
+    path = (metadata or {}).get('payload_path')
+    if not isinstance(path, str) or not os.path.isabs(path):
+        return None
+
+    path = os.path.normpath(path)
+    if os.path.dirname(path) == path:
+        return None
+    return path
+
+
+def payload_fingerprint(path: str) -> List[int]:
+    """
+    Identity of a payload on disk: device, inode and mtime in nanoseconds
+
+    A path that was removed and recreated, or edited in place, after it
+    was trashed no longer matches, so purging never deletes newer data.
+    """
+    st = os.lstat(path)
+    return [st.st_dev, st.st_ino, st.st_mtime_ns]
+
+
+def get_payload_fingerprint(metadata: Optional[Dict[str, Any]]) -> Optional[List[int]]:
+    """
+    Fingerprint recorded for a trash item's payload, if any
+    """
+    fingerprint = (metadata or {}).get('payload_stat')
+    if not isinstance(fingerprint, list) or len(fingerprint) != 3:
+        return None
+    return fingerprint
+
+
+def delete_payload(path: str, fingerprint: Optional[List[int]] = None) -> bool:
+    """
+    Remove a trashed file or directory from disk
+
+    The payload is only removed while it still matches the fingerprint
+    taken when it was trashed. Anything else now living at the path is
+    left alone, and items without a fingerprint never touch the disk.
+
+    Returns:
+        True if the trashed payload is gone (including when it was already
+        missing or has been replaced)
+    """
+    try:
+        if fingerprint is None or payload_fingerprint(path) != list(fingerprint):
+            logger.info(f"Trash payload {path} changed since it was trashed; leaving it on disk")
+            return True
+
+        if os.path.isdir(path) and not os.path.islink(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+    except FileNotFoundError:
+        return True
+    except OSError as e:
+        logger.warning(f"Failed to delete trash payload {path}: {e}")
+        return False
+
+    return True
+
+
 def get_item_type_from_path(path: str) -> str:
     """
     Determine item type based on file path or extension
@@ -166,54 +275,192 @@ def create_trash_item(item_name: str, item_type: str, original_path: str,
     return trash_item
 
 
-def get_trash_statistics(user) -> Dict[str, Any]:
+def refresh_trash_usage(user_ids: Iterable[int]) -> int:
     """
-    Get comprehensive trash statistics for a user
+    Rebuild the materialised trash counters of the given users
+
+    All counters, including the per-type breakdown, come from a single
+    grouped query using conditional aggregation, and are written back
+    with one upsert.
+
+    Args:
+        user_ids: IDs of users whose TrashUsage should be rebuilt
+
+    Returns:
+        Number of users refreshed
     """
-    from .models import TrashItem
+    from .models import TrashItem, TrashUsage
 
-    base_queryset = TrashItem.objects.filter(deleted_by=user)
+    user_ids = {user_id for user_id in user_ids if user_id}
+    if not user_ids:
+        return 0
 
-    # Current trash items
-    current_items = base_queryset.filter(
-        is_restored=False,
-        is_permanently_deleted=False
+    now = timezone.now()
+    week_ago = now - timezone.timedelta(days=7)
+    current = Q(is_restored=False, is_permanently_deleted=False)
+
+    rows = TrashItem.objects.filter(deleted_by_id__in=user_ids).values(
+        'deleted_by_id', 'item_type'
+    ).annotate(
+        items=Count('id', filter=current),
+        size=Sum('size', filter=current),
+        expiring_soon=Count('id', filter=current & Q(
+            auto_delete_at__lte=now + timezone.timedelta(days=EXPIRING_SOON_DAYS)
+        )),
+        expired=Count('id', filter=current & Q(auto_delete_at__lte=now)),
+        restored=Count('id', filter=Q(is_restored=True, restored_at__gte=week_ago)),
+        purged=Count('id', filter=Q(is_permanently_deleted=True, permanently_deleted_at__gte=week_ago)),
+        deleted_7=Count('id', filter=Q(deleted_at__gte=week_ago)),
+        deleted_30=Count('id', filter=Q(deleted_at__gte=now - timezone.timedelta(days=30))),
+    ).order_by()
+
+    usage = {
+        user_id: TrashUsage(user_id=user_id, by_type={}, refreshed_at=now)
+        for user_id in user_ids
+    }
+    for row in rows:
+        counters = usage[row['deleted_by_id']]
+        size = row['size'] or 0
+        counters.item_count += row['items']
+        counters.total_size += size
+        counters.expiring_soon += row['expiring_soon']
+        counters.expired += row['expired']
+        counters.restored_last_7_days += row['restored']
+        counters.purged_last_7_days += row['purged']
+        counters.items_deleted_last_7_days += row['deleted_7']
+        counters.items_deleted_last_30_days += row['deleted_30']
+        if row['items']:
+            counters.by_type[row['item_type']] = {'count': row['items'], 'size': size}
+
+    TrashUsage.objects.bulk_create(
+        usage.values(),
+        update_conflicts=True,
+        unique_fields=['user'],
+        update_fields=[
+            'item_count', 'total_size', 'by_type', 'expiring_soon', 'expired',
+            'restored_last_7_days', 'purged_last_7_days',
+            'items_deleted_last_7_days', 'items_deleted_last_30_days', 'refreshed_at',
+        ],
     )
+    return len(usage)
+
+
+def schedule_trash_usage_refresh(user_id: Optional[int]) -> None:
+    """
+    Rebuild a user's trash counters once the current transaction commits
+
+    Inside coalesce_trash_usage_refresh() the user is only collected and
+    refreshed together with the others when the block ends.
+    """
+    if not user_id:
+        return
+
+    pending = getattr(_usage_refresh, 'user_ids', None)
+    if pending is not None:
+        pending.add(user_id)
+    else:
+        transaction.on_commit(lambda: refresh_trash_usage([user_id]))
+
+
+@contextmanager
+def coalesce_trash_usage_refresh():
+    """
+    Refresh the counters of every user touched in the block only once
 
-    # Recently restored items
-    restored_items = base_queryset.filter(
-        is_restored=True,
-        restored_at__gte=timezone.now() - timezone.timedelta(days=7)
+    Bulk paths that save many TrashItems would otherwise re-aggregate the
+    owner's items after each save.
+    """
+    if getattr(_usage_refresh, 'user_ids', None) is not None:
+        # Nested: the outermost block does the refresh
+        yield
+        return
+
+    _usage_refresh.user_ids = set()
+    try:
+        yield
+    finally:
+        user_ids, _usage_refresh.user_ids = _usage_refresh.user_ids, None
+        if user_ids:
+            transaction.on_commit(lambda: refresh_trash_usage(user_ids))
+
+
+def refresh_all_trash_usage(batch_size: int = USAGE_REFRESH_BATCH_SIZE) -> int:
+    """
+    Periodic rollup of every user's trash counters
+
+    Keeps time-based counters (expiring soon, recent activity) current for
+    users whose trash has not changed since their last refresh.
+
+    Returns:
+        Number of users refreshed
+    """
+    from .models import TrashItem, TrashUsage
+
+    user_ids = set(
+        TrashItem.objects.filter(deleted_by__isnull=False).values_list('deleted_by_id', flat=True).distinct()
     )
+    user_ids.update(TrashUsage.objects.values_list('user_id', flat=True))
+
+    user_ids = sorted(user_ids)
+    refreshed = 0
+    for start in range(0, len(user_ids), batch_size):
+        refreshed += refresh_trash_usage(user_ids[start:start + batch_size])
+    return refreshed
 
-    # Recently permanently deleted items
-    deleted_items = base_queryset.filter(
-        is_permanently_deleted=True,
-        permanently_deleted_at__gte=timezone.now() - timezone.timedelta(days=7)
+
+def get_trash_usage(user):
+    """
+    Materialised trash counters for a user, built on first access
+    """
+    from .models import TrashUsage
+
+    usage = TrashUsage.objects.filter(user=user).first()
+    if usage is None:
+        refresh_trash_usage([user.pk])
+        usage = TrashUsage.objects.get(user=user)
+    return usage
+
+
+def get_trash_summary(user) -> Dict[str, Any]:
+    """
+    Headline trash counters shown on the trash page
+    """
+    usage = get_trash_usage(user)
+    return {
+        'total_items': usage.item_count,
+        'total_size': usage.total_size,
+        'expiring_soon': usage.expiring_soon,
+    }
+
+
+def get_trash_statistics(user) -> Dict[str, Any]:
+    """
+    Get comprehensive trash statistics for a user
+    """
+    usage = get_trash_usage(user)
+    by_type = sorted(
+        ({'item_type': item_type, **counts} for item_type, counts in usage.by_type.items()),
+        key=lambda row: row['count'],
+        reverse=True
     )
 
     return {
         'current': {
-            'total_items': current_items.count(),
-            'total_size': current_items.aggregate(Sum('size'))['size__sum'] or 0,
-            'by_type': current_items.values('item_type').annotate(count=Count('id')).order_by('-count'),
-            'expiring_soon': current_items.filter(
-                auto_delete_at__lte=timezone.now() + timezone.timedelta(days=3)
-            ).count(),
-            'expired': current_items.filter(auto_delete_at__lte=timezone.now()).count(),
+            'total_items': usage.item_count,
+            'total_size': usage.total_size,
+            'by_type': by_type,
+            'expiring_soon': usage.expiring_soon,
+            'expired': usage.expired,
         },
         'recent_activity': {
-            'restored_count': restored_items.count(),
-            'deleted_count': deleted_items.count(),
+            'restored_count': usage.restored_last_7_days,
+            'deleted_count': usage.purged_last_7_days,
         },
         'trends': {
-            'items_deleted_last_7_days': base_queryset.filter(
-                deleted_at__gte=timezone.now() - timezone.timedelta(days=7)
-            ).count(),
-            'items_deleted_last_30_days': base_queryset.filter(
-                deleted_at__gte=timezone.now() - timezone.timedelta(days=30)
-            ).count(),
-        }
+            'items_deleted_last_7_days': usage.items_deleted_last_7_days,
+            'items_deleted_last_30_days': usage.items_deleted_last_30_days,
+        },
+        'refreshed_at': usage.refreshed_at,
     }
 
 
@@ -221,7 +468,7 @@ def check_trash_limits(user, new_item_size: int = 0) -> Dict[str, Any]:
     """
     Check if adding a new item would exceed trash limits
     """
-    from .models import TrashItem, TrashSettings
+    from .models import TrashSettings
 
     try:
         settings = TrashSettings.objects.get(pk=1)
@@ -229,13 +476,7 @@ def check_trash_limits(user, new_item_size: int = 0) -> Dict[str, Any]:
         # Use default limits if no settings configured
         settings = TrashSettings()
 
-    current_items = TrashItem.objects.filter(
-        deleted_by=user,
-        is_restored=False,
-        is_permanently_deleted=False
-    )
-
-    current_size = current_items.aggregate(Sum('size'))['size__sum'] or 0
+    current_size = get_trash_usage(user).total_size
     max_size_bytes = settings.max_trash_size_gb * 1024 * 1024 * 1024
 
     projected_size = current_size + new_item_size
@@ -330,7 +571,7 @@ def generate_trash_item_metadata(item_path: str, item_type: str) -> Dict[str, An
         metadata.update({
             'file_size': stat.st_size,
             'modified_time': stat.st_mtime,
-            'accessed_time': stat.st_access_time,
+            'accessed_time': stat.st_atime,
             'created_time': stat.st_ctime,
             'permissions': oct(stat.st_mode),
         })
@@ -420,19 +661,20 @@ def import_trash_data(user, data: str, format: str = 'json') -> int:
         else:
             raise ValueError(f"Unsupported import format: {format}")
 
-        for item_data in items_data:
-            # Create new trash item
-            TrashItem.objects.create(
-                item_name=item_data['item_name'],
-                item_type=item_data['item_type'],
-                original_path=item_data['original_path'],
-                deleted_by=user,
-                deleted_at=item_data.get('deleted_at'),
-                size=item_data.get('size'),
-                metadata=item_data.get('metadata', {}),
-                retention_days=item_data.get('retention_days', 30)
-            )
-            imported_count += 1
+        with coalesce_trash_usage_refresh():
+            for item_data in items_data:
+                # Create new trash item
+                TrashItem.objects.create(
+                    item_name=item_data['item_name'],
+                    item_type=item_data['item_type'],
+                    original_path=item_data['original_path'],
+                    deleted_by=user,
+                    deleted_at=item_data.get('deleted_at'),
+                    size=item_data.get('size'),
+                    metadata=item_data.get('metadata', {}),
+                    retention_days=item_data.get('retention_days', 30)
+                )
+                imported_count += 1
 
     except Exception as e:
         raise ValidationError(f"Failed to import trash data: {str(e)}")
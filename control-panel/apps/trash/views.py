@@ -6,14 +6,14 @@ from django.views.decorators.http import require_http_methods, require_POST
 from django.views.decorators.csrf import csrf_protect
 from django.http import JsonResponse, Http404, HttpResponseBadRequest
 from django.core.paginator import Paginator
-from django.db.models import Q, Count, Sum
-from django.utils import timezone
+from django.db.models import Q, Count
 from django.urls import reverse
 from django.views.generic import ListView, DetailView, View
 from django.contrib.auth import get_user_model
 
 from .models import TrashItem, TrashSettings, TrashOperation
-from .utils import get_client_ip
+from .trash_manager import TrashManager
+from .utils import coalesce_trash_usage_refresh, get_client_ip, get_trash_summary
 
 User = get_user_model()
 
@@ -82,19 +82,7 @@ class TrashListView(LoginRequiredMixin, ListView):
 
     def get_trash_stats(self):
         """Get trash statistics for the current user"""
-        queryset = TrashItem.objects.filter(
-            deleted_by=self.request.user,
-            is_restored=False,
-            is_permanently_deleted=False
-        )
-
-        return {
-            'total_items': queryset.count(),
-            'total_size': queryset.aggregate(Sum('size'))['size__sum'] or 0,
-            'expiring_soon': queryset.filter(
-                auto_delete_at__lte=timezone.now() + timezone.timedelta(days=3)
-            ).count(),
-        }
+        return get_trash_summary(self.request.user)
 
 
 class TrashDetailView(LoginRequiredMixin, DetailView):
@@ -165,7 +153,8 @@ def permanent_delete_item(request, pk):
     )
 
     try:
-        item.permanent_delete(user=request.user)
+        if not TrashManager.purge_items(TrashItem.objects.filter(pk=item.pk), user=request.user):
+            raise OSError('the item could not be removed from disk')
 
         # Log the operation
         operation = TrashOperation.objects.create(
@@ -210,9 +199,10 @@ def bulk_restore_items(request):
         )
 
         restored_count = 0
-        for item in items:
-            item.restore(user=request.user)
-            restored_count += 1
+        with coalesce_trash_usage_refresh():
+            for item in items:
+                item.restore(user=request.user)
+                restored_count += 1
 
         # Log the operation
         operation = TrashOperation.objects.create(
@@ -251,10 +241,8 @@ def bulk_permanent_delete_items(request):
             is_permanently_deleted=False
         )
 
-        deleted_count = 0
-        for item in items:
-            item.permanent_delete(user=request.user)
-            deleted_count += 1
+        deleted_ids = TrashManager.purge_items(items, user=request.user)
+        deleted_count = len(deleted_ids)
 
         # Log the operation
         operation = TrashOperation.objects.create(
@@ -264,7 +252,7 @@ def bulk_permanent_delete_items(request):
             details={'item_ids': item_ids},
             ip_address=get_client_ip(request)
         )
-        operation.items_affected.set(items)
+        operation.items_affected.set(deleted_ids)
 
         messages.success(request, f'{deleted_count} items permanently deleted.')
         return redirect('trash:list')
@@ -286,14 +274,12 @@ def empty_trash(request):
             is_permanently_deleted=False
         )
 
-        count = items.count()
-        if count == 0:
+        if not items.exists():
             messages.info(request, 'Trash is already empty.')
             return redirect('trash:list')
 
-        # Permanently delete all items
-        for item in items:
-            item.permanent_delete(user=request.user)
+        deleted_ids = TrashManager.purge_items(items, user=request.user)
+        count = len(deleted_ids)
 
         # Log the operation
         operation = TrashOperation.objects.create(
@@ -302,7 +288,7 @@ def empty_trash(request):
             items_count=count,
             ip_address=get_client_ip(request)
         )
-        operation.items_affected.set(items)
+        operation.items_affected.set(deleted_ids)
 
         messages.success(request, f'All {count} items permanently deleted from trash.')
         return redirect('trash:list')
@@ -316,7 +302,7 @@ def empty_trash(request):
 def get_trash_stats_api(request):
     """API endpoint for trash statistics"""
     try:
-        stats = TrashListView().get_trash_stats()
+        stats = get_trash_summary(request.user)
         return JsonResponse({
             'success': True,
             'stats': stats
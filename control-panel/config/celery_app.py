@@ -49,12 +49,17 @@ app.conf.beat_schedule = {
         'kwargs': {'days': 30}
     },
 
+    'cleanup-repo-mirrors-daily': {
+        'task': 'apps.deployments.tasks.cleanup_repo_mirrors',
+        'schedule': crontab(hour=2, minute=30),
+    },
+
     # =========================================================================
     # SERVICE MONITORING (apps.services.tasks)
     # =========================================================================
-    'collect-system-metrics-every-5-minutes': {
+    'collect-system-metrics-every-minute': {
         'task': 'services.collect_system_metrics',
-        'schedule': 300.0,  # 5 minutes
+        'schedule': 60.0,  # 1 minute (sampling is non-blocking)
     },
 
     'check-service-statuses-every-2-minutes': {
@@ -83,6 +88,14 @@ app.conf.beat_schedule = {
         'schedule': 600.0,  # 10 minutes
     },
 
+    # =========================================================================
+    # AUTOMATION
+    # =========================================================================
+    'fold-workflow-statistics-every-minute': {
+        'task': 'apps.automation.tasks.fold_workflow_statistics',
+        'schedule': 60.0,  # 1 minute
+    },
+
     # =========================================================================
     # DATA CLEANUP
     # =========================================================================
@@ -92,6 +105,16 @@ app.conf.beat_schedule = {
         'kwargs': {'days': 7}
     },
 
+    'cleanup-expired-trash-daily': {
+        'task': 'trash.cleanup_expired_items',
+        'schedule': crontab(hour=3, minute=30),  # 3:30 AM daily
+    },
+
+    'refresh-trash-usage-hourly': {
+        'task': 'trash.refresh_usage',
+        'schedule': crontab(minute=15),  # Every hour at :15
+    },
+
     # =========================================================================
     # REPORTING
     # =========================================================================
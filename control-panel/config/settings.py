@@ -170,9 +170,13 @@ if 'test' in sys.argv:
 # WebOps-specific settings
 WEBOPS_INSTALL_PATH = config('WEBOPS_INSTALL_PATH', default='/opt/webops')
 WEBOPS_USER = config('WEBOPS_USER', default='webops')
+WEBOPS_CACHE_PATH = config('WEBOPS_CACHE_PATH', default=os.path.join(WEBOPS_INSTALL_PATH, 'cache'))
+WEBOPS_GIT_CACHE_MAX_MB = config('WEBOPS_GIT_CACHE_MAX_MB', default=5120, cast=int)
+WEBOPS_GIT_CACHE_MAX_AGE_DAYS = config('WEBOPS_GIT_CACHE_MAX_AGE_DAYS', default=30, cast=int)
 MIN_PORT = config('MIN_PORT', default=8001, cast=int)
 MAX_PORT = config('MAX_PORT', default=9000, cast=int)
 ENCRYPTION_KEY = config('ENCRYPTION_KEY', default='')
+SYSTEMD_BACKEND = config('SYSTEMD_BACKEND', default='auto')  # auto, dbus or systemctl
 GITHUB_TOKEN = config('GITHUB_TOKEN', default='')
 
 # OAuth Configuration - Dynamic settings with database fallback